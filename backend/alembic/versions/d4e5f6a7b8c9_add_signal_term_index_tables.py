@@ -0,0 +1,59 @@
+"""Add ``signal_term_docs`` and ``signal_term_counts``.
+
+Incremental document-frequency index for the task-type and domain signal
+extractors (``app/services/signal_term_index.py``). Both tables start
+empty; the first extraction after upgrade indexes the existing history
+once, and later refreshes only process new, deleted or reclassified
+optimizations.
+
+Forward-only, idempotent via inspector guard.
+
+Revision ID: d4e5f6a7b8c9
+Revises: c7d8e9f0a1b2
+Create Date: 2026-10-18
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "d4e5f6a7b8c9"
+down_revision = "c7d8e9f0a1b2"
+branch_labels = None
+depends_on = None
+
+
+def _table_exists(bind, name: str) -> bool:
+    insp = sa.inspect(bind)
+    return name in insp.get_table_names()
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if not _table_exists(bind, "signal_term_docs"):
+        op.create_table(
+            "signal_term_docs",
+            sa.Column("optimization_id", sa.String(), primary_key=True),
+            sa.Column("task_type", sa.String(), nullable=True),
+            sa.Column("cluster_id", sa.String(), nullable=True),
+            sa.Column("terms", sa.Text(), nullable=False),
+        )
+
+    if not _table_exists(bind, "signal_term_counts"):
+        op.create_table(
+            "signal_term_counts",
+            sa.Column("scope", sa.String(), primary_key=True),
+            sa.Column("key", sa.String(), primary_key=True),
+            sa.Column("term", sa.String(), primary_key=True),
+            sa.Column("doc_count", sa.Integer(), nullable=False),
+        )
+        op.create_index(
+            "ix_signal_term_counts_scope_term",
+            "signal_term_counts",
+            ["scope", "term"],
+        )
+
+
+def downgrade() -> None:
+    raise NotImplementedError("Forward-only migration")
@@ -0,0 +1,98 @@
+"""Split optimization vectors into ``optimization_embeddings`` + query indexes.
+
+The four vector blobs (``embedding``, ``optimized_embedding``,
+``transformation_embedding``, ``qualifier_embedding``) move from
+``optimizations`` into a one-row-per-optimization side table, so history
+listing, score distribution and reconcile scans stop paging ~6 KB of
+vectors per row. Existing blobs are copied before the columns are dropped
+(batch mode — SQLite rebuilds the table once).
+
+Adds composite indexes matched to the hot ``optimizations`` queries and
+drops the single-column ``ix_optimizations_project_id`` that
+``(project_id, created_at)`` now covers.
+
+Forward-only, idempotent via inspector guard.
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-19
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "e5f6a7b8c9d0"
+down_revision = "d4e5f6a7b8c9"
+branch_labels = None
+depends_on = None
+
+_VECTOR_COLUMNS = (
+    "embedding",
+    "optimized_embedding",
+    "transformation_embedding",
+    "qualifier_embedding",
+)
+
+_INDEXES = {
+    "ix_optimizations_created_at": ["created_at"],
+    "ix_optimizations_status_created": ["status", "created_at"],
+    "ix_optimizations_cluster_created": ["cluster_id", "created_at"],
+    "ix_optimizations_cluster_score": ["cluster_id", "overall_score"],
+    "ix_optimizations_project_created": ["project_id", "created_at"],
+    "ix_optimizations_trace_id": ["trace_id"],
+}
+
+
+def _table_exists(bind, name: str) -> bool:
+    insp = sa.inspect(bind)
+    return name in insp.get_table_names()
+
+
+def _columns(bind, table: str) -> set[str]:
+    insp = sa.inspect(bind)
+    return {c["name"] for c in insp.get_columns(table)}
+
+
+def _indexes(bind, table: str) -> set[str]:
+    insp = sa.inspect(bind)
+    return {ix["name"] for ix in insp.get_indexes(table)}
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    if not _table_exists(bind, "optimization_embeddings"):
+        op.create_table(
+            "optimization_embeddings",
+            sa.Column(
+                "optimization_id",
+                sa.String(),
+                sa.ForeignKey("optimizations.id", ondelete="CASCADE"),
+                primary_key=True,
+            ),
+            *(sa.Column(name, sa.LargeBinary(), nullable=True) for name in _VECTOR_COLUMNS),
+        )
+
+    inline = [c for c in _VECTOR_COLUMNS if c in _columns(bind, "optimizations")]
+    if inline:
+        cols = ", ".join(inline)
+        any_set = " OR ".join(f"{c} IS NOT NULL" for c in inline)
+        op.execute(
+            f"INSERT OR IGNORE INTO optimization_embeddings (optimization_id, {cols}) "
+            f"SELECT id, {cols} FROM optimizations WHERE {any_set}"
+        )
+        with op.batch_alter_table("optimizations") as batch:
+            for name in inline:
+                batch.drop_column(name)
+
+    existing = _indexes(bind, "optimizations")
+    if "ix_optimizations_project_id" in existing:
+        op.drop_index("ix_optimizations_project_id", table_name="optimizations")
+    for name, columns in _INDEXES.items():
+        if name not in existing:
+            op.create_index(name, "optimizations", columns)
+
+
+def downgrade() -> None:
+    raise NotImplementedError("Forward-only migration")
@@ -32,6 +32,17 @@ class Settings(BaseSettings):
     ANTHROPIC_API_KEY: str = Field(
         default="", description="Anthropic API key (starts with 'sk-'). Optional if using Claude CLI.",
     )
+    CLAUDE_CLI_POOL_SIZE: int = Field(
+        default=0, ge=0, le=32,
+        description="Warm pre-spawned claude CLI processes kept ready for repeat calls (0 = spawn per call).",
+    )
+    CLAUDE_CLI_POOL_MAX_IDLE_SECONDS: int = Field(
+        default=300, ge=5, description="Discard warm CLI workers idle longer than this.",
+    )
+    CLAUDE_CLI_POOL_MAX_COMMANDS: int = Field(
+        default=4, ge=1, le=32,
+        description="Distinct CLI command lines (model, system prompt, schema, effort) kept warm.",
+    )
 
     # --- GitHub OAuth ---
     # Official Project Synthesis GitHub App (public, device flow — no secret needed)
@@ -114,6 +125,14 @@ class Settings(BaseSettings):
     REPO_INDEX_REFRESH_CONCURRENCY: int = Field(
         default=5, description="Max concurrent GitHub API calls per repo during incremental refresh.",
     )
+    INDEX_BULK_INGEST_MIN_FILES: int = Field(
+        default=200, ge=0,
+        description="Fetch one repo tarball instead of per-file contents API reads at or above "
+        "this many files (0 = always).",
+    )
+    INDEX_EMBED_BATCH_SIZE: int = Field(
+        default=256, ge=1, description="Files per embedding batch during repo indexing.",
+    )
     INDEX_OUTLINE_MAX_CHARS: int = Field(
         default=2000, description="Maximum characters per file outline in RepoIndexService.",
     )
@@ -142,6 +161,24 @@ class Settings(BaseSettings):
         description="Additional multiplier for .github/ community files (stacks with source-type weight).",
     )
 
+    # --- Context Enrichment ---
+    ENRICHMENT_SOURCE_BUDGETS: dict = Field(
+        default={
+            "heuristic_analysis": 10.0,
+            "optimization_count": 2.0,
+            "explore_synthesis": 2.0,
+            "repo_relevance": 3.0,
+            "curated_index": 8.0,
+            "workspace_guidance": 3.0,
+            "strategy_intelligence": 3.0,
+            "applied_patterns": 5.0,
+        },
+        description=(
+            "Per-source deadline in seconds for context enrichment. Sources run "
+            "concurrently; one that misses its budget degrades to empty."
+        ),
+    )
+
     # --- Network ---
     TRUSTED_PROXIES: str = Field(
         default="127.0.0.1", description="Comma-separated trusted proxy IPs for X-Forwarded-For.",
@@ -166,6 +203,58 @@ class Settings(BaseSettings):
     EXPLORE_RESULT_CACHE_TTL: int = Field(
         default=3600, description="Explore result cache TTL in seconds.",
     )
+    EXPLORE_SEMANTIC_CACHE_ENABLED: bool = Field(
+        default=False,
+        description="Reuse a cached explore result for a rephrased prompt on the same repo HEAD.",
+    )
+    EXPLORE_SEMANTIC_CACHE_THRESHOLD: float = Field(
+        default=0.92, ge=0.0, le=1.0,
+        description="Minimum prompt-embedding cosine similarity for a semantic explore cache hit.",
+    )
+
+    # --- LLM Response Cache ---
+    LLM_RESPONSE_CACHE_ENABLED: bool = Field(
+        default=False,
+        description="Serve identical analyze/score requests from a local response cache.",
+    )
+    LLM_RESPONSE_CACHE_TTL: int = Field(
+        default=86400, ge=1, description="LLM response cache entry TTL in seconds.",
+    )
+    LLM_RESPONSE_CACHE_MAX_ENTRIES: int = Field(
+        default=5000, ge=1, description="Maximum LLM response cache entries (LRU eviction).",
+    )
+    LLM_RESPONSE_CACHE_PATH: str = Field(
+        default="", description="SQLite file for the response cache (default: data/llm_response_cache.db).",
+    )
+
+    # --- LLM Concurrency ---
+    LLM_CONCURRENCY_ENABLED: bool = Field(
+        default=True,
+        description="Route every provider call through the shared adaptive concurrency controller.",
+    )
+    LLM_CONCURRENCY_INITIAL: int = Field(
+        default=10, ge=1, description="Starting in-flight provider call limit.",
+    )
+    LLM_CONCURRENCY_MIN: int = Field(
+        default=1, ge=1, description="Floor the adaptive limit never shrinks below.",
+    )
+    LLM_CONCURRENCY_MAX: int = Field(
+        default=32, ge=1, description="Ceiling the adaptive limit never grows above.",
+    )
+    LLM_CONCURRENCY_DECREASE: float = Field(
+        default=0.5, gt=0.0, lt=1.0,
+        description="Multiplicative limit decrease on a rate-limit or overload error.",
+    )
+
+    # --- Refinement ---
+    REFINE_REUSE_TTL: int = Field(
+        default=600, ge=1,
+        description="Seconds context enrichment and an unclaimed speculative analyze/refine result stay reusable.",
+    )
+    REFINE_SPECULATION_ENABLED: bool = Field(
+        default=False,
+        description="Precompute the next refinement turn for the top suggestion in the background.",
+    )
 
     # --- Models ---
     MODEL_SONNET: str = Field(
@@ -188,6 +277,21 @@ class Settings(BaseSettings):
     TRACE_RETENTION_DAYS: int = Field(
         default=30, description="Number of days to retain JSONL trace files before cleanup.",
     )
+    JSONL_WRITER_QUEUE_SIZE: int = Field(
+        default=10_000,
+        description="Max trace/taxonomy-event JSONL lines buffered for the background writer; "
+        "lines beyond this are dropped and counted.",
+    )
+    JSONL_FSYNC_INTERVAL_SECONDS: float = Field(
+        default=1.0,
+        description="Minimum seconds between fsyncs per JSONL file (0 = every write burst, "
+        "negative = never fsync).",
+    )
+    PROFILING_ENABLED: bool = Field(
+        default=False,
+        description="Record per-request profiling spans (wall/CPU time, DB statements, embeds) "
+        "and write them to the request's trace.",
+    )
 
     # --- Audit ---
     AUDIT_RETENTION_DAYS: int = Field(
@@ -199,6 +303,21 @@ class Settings(BaseSettings):
         default=300, description="Warm-path re-clustering interval in seconds (5 minutes default).",
     )
 
+    # --- Workers ---
+    API_WORKERS: int = Field(
+        default=1, ge=1, le=16,
+        description=(
+            "Uvicorn worker processes. Above 1, one worker is elected taxonomy "
+            "leader and events are relayed between workers through a shared journal."
+        ),
+    )
+    EVENT_RELAY_POLL_MS: int = Field(
+        default=100, ge=10, description="How often each worker polls the event journal (multi-worker only).",
+    )
+    EVENT_RELAY_RETENTION_SECONDS: int = Field(
+        default=600, ge=60, description="Seconds relayed events are kept in the event journal.",
+    )
+
     # --- Database ---
     DATABASE_URL: str = Field(
         default=f"sqlite+aiosqlite:///{DATA_DIR / 'synthesis.db'}",
@@ -1,10 +1,13 @@
 """Async database session factory and FastAPI dependency."""
 
+import time
 from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.config import settings
+from app.services.metrics import observe
+from app.services.profiling import install_db_hook
 
 # busy_timeout=10000 (10s) prevents "database is locked" errors when
 # the MCP server and backend warm path write concurrently to SQLite.
@@ -13,6 +16,7 @@ engine = create_async_engine(
     echo=False,
     connect_args={"timeout": 30},
 )
+install_db_hook(engine.sync_engine)
 
 async_session_factory = async_sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
@@ -21,8 +25,12 @@ async_session_factory = async_sessionmaker(
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """FastAPI dependency — yields an async session, auto-closes on exit."""
-    async with async_session_factory() as session:
-        yield session
+    t0 = time.perf_counter()
+    try:
+        async with async_session_factory() as session:
+            yield session
+    finally:
+        observe("db_session_duration_seconds", time.perf_counter() - t0, source="request")
 
 
 async def dispose() -> None:
@@ -3,7 +3,9 @@
 import asyncio
 import logging
 import time
+from collections.abc import Awaitable, Callable, Coroutine
 from contextlib import asynccontextmanager
+from typing import Any
 
 import aiosqlite
 from fastapi import FastAPI
@@ -11,6 +13,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app._version import __version__
 from app.config import DATA_DIR, PROJECT_ROOT, PROMPTS_DIR, settings
+from app.providers.concurrency import Priority, llm_priority
 from app.services.event_bus import event_bus
 from app.services.file_watcher import watch_strategy_files
 from app.services.taxonomy._constants import EXCLUDED_STRUCTURAL_STATES
@@ -28,6 +31,51 @@ logger = logging.getLogger(__name__)
 # schedule or immediately when signaled.
 _warm_path_pending = asyncio.Event()
 
+# Follower workers check the leader's index cache files this often.
+_FOLLOWER_INDEX_POLL_SECONDS = 30
+
+_INDEX_CACHE_FILES = (
+    "embedding_index.pkl",
+    "transformation_index.pkl",
+    "optimized_index.pkl",
+    "qualifier_index.pkl",
+)
+
+
+async def _leader_only(coordinator, factory: Callable[[], Awaitable[None]]) -> None:
+    """Run ``factory()`` once this worker owns the taxonomy.
+
+    Immediate for a single worker or the elected leader; a follower waits
+    until it takes over leadership (see ``worker_coordination``).
+    """
+    await coordinator.wait_for_leadership()
+    await factory()
+
+
+def _created_optimization_ids(event: dict[str, Any]) -> list[str]:
+    """Optimization ids announced by an ``optimization_created`` event or by
+    batch seeding's aggregated ``optimization_batch_created`` (one per row)."""
+    data = event.get("data") or {}
+    if event.get("event") == "optimization_batch_created":
+        return [o["id"] for o in data.get("optimizations", []) if o.get("id")]
+    opt_id = data.get("id")
+    return [opt_id] if opt_id else []
+
+
+def _spawn_background_task(
+    coro: Coroutine[Any, Any, None], *, name: str, tasks: set[asyncio.Task[None]],
+) -> asyncio.Task[None]:
+    """Start *coro* as a tracked task whose LLM calls run at BACKGROUND priority.
+
+    ``create_task`` copies the current context, so the priority set here is
+    what hot-path extraction, labeling and requested reclusters see.
+    """
+    with llm_priority(Priority.BACKGROUND):
+        task = asyncio.create_task(coro, name=name)
+    tasks.add(task)
+    task.add_done_callback(tasks.discard)
+    return task
+
 
 async def _backfill_project_ids(db) -> None:
     """Backfill Optimization.project_id from cluster ancestry (2 hops: cluster->domain->project)."""
@@ -147,6 +195,35 @@ async def lifespan(app: FastAPI):
     _error_logger = ErrorLogger(DATA_DIR / "errors")
     set_error_logger(_error_logger)
 
+    # Multi-worker coordination: elect the taxonomy leader and relay events
+    # between workers. A no-op with API_WORKERS=1. Started before anything
+    # publishes so every event goes through the relay.
+    from app.services.worker_coordination import WorkerCoordinator
+
+    def _apply_peer_event(event_type: str, data: Any) -> None:
+        """Mirror process-local state another worker updated with this event."""
+        if not isinstance(data, dict):
+            return
+        if event_type == "routing_state_changed":
+            routing = getattr(app.state, "routing", None)
+            if routing is not None:
+                routing.sync_from_event(data, broadcast=False)
+        elif event_type == "taxonomy_activity":
+            from app.services.taxonomy.event_logger import get_event_logger
+            try:
+                get_event_logger().record_external(data)
+            except RuntimeError:
+                pass  # Logger not initialized yet
+
+    coordinator = WorkerCoordinator(
+        DATA_DIR,
+        settings.API_WORKERS,
+        poll_interval=settings.EVENT_RELAY_POLL_MS / 1000,
+        retention_seconds=settings.EVENT_RELAY_RETENTION_SECONDS,
+    )
+    await coordinator.start(event_bus, on_peer_event=_apply_peer_event)
+    app.state.worker_coordinator = coordinator
+
     db_path = DATA_DIR / "synthesis.db"
     if db_path.exists():
         async with aiosqlite.connect(str(db_path)) as db:
@@ -187,38 +264,49 @@ async def lifespan(app: FastAPI):
         # Don't prevent startup — log error but continue
         # (templates might be updated before first request)
 
-    # Clean up orphaned strategy affinities (strategies deleted from disk)
-    try:
-        from app.database import async_session_factory
-        from app.services.adaptation_tracker import AdaptationTracker
-        async with async_session_factory() as db:  # type: ignore[assignment]
-            tracker = AdaptationTracker(db)  # type: ignore[arg-type]
-            await tracker.cleanup_orphaned_affinities()
-    except Exception as exc:
-        logger.debug("Strategy affinity cleanup skipped: %s", exc)
+    # Startup maintenance is the taxonomy leader's job (single worker: always)
+    if coordinator.is_leader:
+        # Clean up orphaned strategy affinities (strategies deleted from disk)
+        try:
+            from app.database import async_session_factory
+            from app.services.adaptation_tracker import AdaptationTracker
+            async with async_session_factory() as db:  # type: ignore[assignment]
+                tracker = AdaptationTracker(db)  # type: ignore[arg-type]
+                await tracker.cleanup_orphaned_affinities()
+        except Exception as exc:
+            logger.debug("Strategy affinity cleanup skipped: %s", exc)
 
-    # Startup garbage collection — clean dead records from the DB
-    try:
-        from app.database import async_session_factory
-        from app.services.gc import run_startup_gc
-        async with async_session_factory() as db:  # type: ignore[assignment]
-            await run_startup_gc(db)  # type: ignore[arg-type]
-    except Exception as exc:
-        logger.debug("Startup GC skipped: %s", exc)
+        # Startup garbage collection — clean dead records from the DB
+        try:
+            from app.database import async_session_factory
+            from app.services.gc import run_startup_gc
+            async with async_session_factory() as db:  # type: ignore[assignment]
+                await run_startup_gc(db)  # type: ignore[arg-type]
+        except Exception as exc:
+            logger.debug("Startup GC skipped: %s", exc)
 
     # Start strategy file watcher
-    watcher_task = asyncio.create_task(
-        watch_strategy_files(PROMPTS_DIR / "strategies")
-    )
+    # (leader only — every worker would publish the same change events)
+    watcher_task = asyncio.create_task(_leader_only(
+        coordinator, lambda: watch_strategy_files(PROMPTS_DIR / "strategies"),
+    ))
     app.state.watcher_task = watcher_task
 
     # Start seed agent file watcher
     from app.services.file_watcher import watch_seed_agent_files
-    agent_watcher_task = asyncio.create_task(
-        watch_seed_agent_files(PROMPTS_DIR / "seed-agents")
-    )
+    agent_watcher_task = asyncio.create_task(_leader_only(
+        coordinator, lambda: watch_seed_agent_files(PROMPTS_DIR / "seed-agents"),
+    ))
     app.state.agent_watcher_task = agent_watcher_task
 
+    # Start config file watcher — invalidates cached templates, strategies
+    # and preferences so reads on the hot path skip the filesystem
+    from app.services.file_watcher import watch_config_files
+    config_watcher_task = asyncio.create_task(
+        watch_config_files(PROMPTS_DIR, DATA_DIR)
+    )
+    app.state.config_watcher_task = config_watcher_task
+
     # Start update checker (background — non-blocking)
     from app.services.update_service import UpdateService
     _update_svc = UpdateService(project_root=PROJECT_ROOT)
@@ -245,6 +333,62 @@ async def lifespan(app: FastAPI):
     from app.services.embedding_service import EmbeddingService
     _shared_embedding_service = EmbeddingService()
 
+    async def _follow_taxonomy(engine) -> None:
+        """Follower worker: keep read-side taxonomy state in step with the leader.
+
+        Domain caches reload on ``domain_created`` / ``taxonomy_changed``
+        (relayed from the leader); index caches reload whenever the leader
+        rewrites their files (every warm cycle).
+        """
+        from app.database import async_session_factory
+
+        def _cache_mtimes() -> dict[str, float]:
+            out: dict[str, float] = {}
+            for name in _INDEX_CACHE_FILES:
+                try:
+                    out[name] = (DATA_DIR / name).stat().st_mtime
+                except OSError:
+                    out[name] = 0.0
+            return out
+
+        seen = _cache_mtimes()
+
+        async def _reload_index_caches() -> None:
+            nonlocal seen
+            current = _cache_mtimes()
+            changed = [name for name in _INDEX_CACHE_FILES if current[name] != seen[name]]
+            if not changed:
+                return
+            seen = current
+            if "embedding_index.pkl" in changed:
+                await engine.embedding_index.load_cache(DATA_DIR / "embedding_index.pkl")
+            if any(name != "embedding_index.pkl" for name in changed):
+                await engine.load_index_caches(DATA_DIR)
+            logger.info("Follower reloaded index caches: %s", ", ".join(changed))
+
+        async def _poll_index_caches() -> None:
+            while True:
+                await asyncio.sleep(_FOLLOWER_INDEX_POLL_SECONDS)
+                try:
+                    await _reload_index_caches()
+                except Exception:
+                    logger.warning("Follower index cache reload failed", exc_info=True)
+
+        poll_task = asyncio.create_task(_poll_index_caches())
+        try:
+            async for event in event_bus.subscribe():
+                if event.get("event") not in ("domain_created", "taxonomy_changed"):
+                    continue
+                try:
+                    async with async_session_factory() as _reload_db:
+                        await app.state.domain_resolver.load(_reload_db)
+                        await app.state.signal_loader.load(_reload_db)
+                    await _reload_index_caches()
+                except Exception:
+                    logger.error("Follower taxonomy cache reload failed", exc_info=True)
+        finally:
+            poll_task.cancel()
+
     # Start taxonomy engine subscriber (replaces PatternExtractorService)
     async def _taxonomy_extraction_listener():
         """Subscribe to optimization_created events and run taxonomy hot path."""
@@ -290,16 +434,26 @@ async def lifespan(app: FastAPI):
             logger.info("Domain services initialized")
 
             # Extract dynamic task-type signals from optimization history
+            # (a follower worker loads the leader's persisted copy instead)
             try:
+                import json as _tt_json
+
                 from app.services.heuristic_analyzer import set_task_type_signals
                 from app.services.task_type_signal_extractor import extract_task_type_signals
-                async with async_session_factory() as _tt_db:
-                    tt_signals = await extract_task_type_signals(_tt_db)
+                _tt_cache = DATA_DIR / "task_type_signals.json"
+                if not coordinator.is_leader:
+                    if _tt_cache.exists():
+                        _tt_raw = _tt_json.loads(_tt_cache.read_text())
+                        set_task_type_signals(
+                            {k: [(kw, w) for kw, w in v] for k, v in _tt_raw.items()}
+                        )
+                        logger.info("TaskTypeSignals loaded from leader cache (%d types)", len(_tt_raw))
+                else:
+                    async with async_session_factory() as _tt_db:
+                        tt_signals = await extract_task_type_signals(_tt_db)
                     if tt_signals:
                         set_task_type_signals(tt_signals)
-                        # Persist for MCP cold-start
-                        import json as _tt_json
-                        _tt_cache = DATA_DIR / "task_type_signals.json"
+                        # Persist for MCP cold-start and follower workers
                         try:
                             _tt_cache.write_text(_tt_json.dumps(
                                 {k: [[kw, w] for kw, w in v] for k, v in tt_signals.items()},
@@ -366,7 +520,8 @@ async def lifespan(app: FastAPI):
                                 except (ValueError, TypeError):
                                     continue
                         await engine.embedding_index.rebuild(_centroids)
-                        await engine.embedding_index.save_cache(_index_cache_path)
+                        if coordinator.is_leader:
+                            await engine.embedding_index.save_cache(_index_cache_path)
                         logger.info(
                             "EmbeddingIndex warm-loaded: %d centroids",
                             len(_centroids),
@@ -379,6 +534,17 @@ async def lifespan(app: FastAPI):
             # Warm-load TransformationIndex + OptimizedEmbeddingIndex from disk cache
             await engine.load_index_caches(DATA_DIR)
 
+            # Follower worker: stay a read-only mirror of the leader's
+            # taxonomy until this worker takes over, then continue below
+            # exactly like a freshly started leader.
+            if not coordinator.is_leader:
+                follower_task = asyncio.create_task(_follow_taxonomy(engine))
+                try:
+                    await coordinator.wait_for_leadership()
+                finally:
+                    follower_task.cancel()
+                    await asyncio.gather(follower_task, return_exceptions=True)
+
             # Startup: ensure routing_tier column exists (SQLite ALTER TABLE)
             # SQLAlchemy create_all() only creates new tables, not new columns
             # on existing tables. This is idempotent — duplicate ADD COLUMN
@@ -433,23 +599,6 @@ async def lifespan(app: FastAPI):
             except Exception:
                 pass  # Column already exists
 
-            # Startup: ensure optimized_embedding + transformation_embedding columns exist
-            try:
-                async with async_session_factory() as _emb_db:
-                    await _emb_db.execute(
-                        _text_gsc("ALTER TABLE optimizations ADD COLUMN optimized_embedding BLOB")
-                    )
-                    await _emb_db.commit()
-            except Exception:
-                pass
-            try:
-                async with async_session_factory() as _emb_db2:
-                    await _emb_db2.execute(
-                        _text_gsc("ALTER TABLE optimizations ADD COLUMN transformation_embedding BLOB")
-                    )
-                    await _emb_db2.commit()
-            except Exception:
-                pass
             # Startup: ensure phase_weights_json column exists on optimizations
             try:
                 async with async_session_factory() as _pw_db:
@@ -669,6 +818,7 @@ async def lifespan(app: FastAPI):
             # One-time backfill: embed optimized_prompt + transformation for existing rows
             import numpy as np
             from sqlalchemy import select as _bf_select
+            from sqlalchemy.orm import selectinload as _bf_selectinload
 
             from app.models import Optimization as _bf_Opt
 
@@ -692,7 +842,7 @@ async def lifespan(app: FastAPI):
                                     _bf_Opt.embedding.isnot(None),
                                     _bf_Opt.optimized_embedding.is_(None),
                                     _bf_Opt.optimized_prompt.isnot(None),
-                                )
+                                ).options(_bf_selectinload(_bf_Opt.vectors))
                             )).scalars().all()
 
                             # Batch embed for efficiency (errata E1-4)
@@ -828,9 +978,11 @@ async def lifespan(app: FastAPI):
             _recently_dispatched: set[str] = set()  # dedup window
 
             async for event in event_bus.subscribe():
-                if event.get("event") == "optimization_created":
-                    opt_id = event.get("data", {}).get("id")
-                    if opt_id:
+                if event.get("event") in (
+                    "optimization_created", "optimization_batch_created",
+                ):
+                    opt_ids = []
+                    for opt_id in _created_optimization_ids(event):
                         # Dedup: skip if already dispatched (cross-process
                         # events can arrive multiple times for the same opt)
                         if opt_id in _recently_dispatched:
@@ -840,18 +992,32 @@ async def lifespan(app: FastAPI):
                             )
                             continue
                         _recently_dispatched.add(opt_id)
-                        # Bound the set to prevent unbounded growth
-                        if len(_recently_dispatched) > 500:
-                            # Discard oldest half (set is unordered, but this
-                            # is a best-effort dedup, not a strict window)
-                            _to_remove = list(_recently_dispatched)[:250]
-                            _recently_dispatched.difference_update(_to_remove)
-                        logger.info(
-                            "Dispatching taxonomy extraction for optimization %s",
-                            opt_id,
-                        )
+                        opt_ids.append(opt_id)
+                    # Bound the set to prevent unbounded growth
+                    if len(_recently_dispatched) > 500:
+                        # Discard oldest half (set is unordered, but this
+                        # is a best-effort dedup, not a strict window)
+                        _to_remove = list(_recently_dispatched)[:250]
+                        _recently_dispatched.difference_update(_to_remove)
+                    if not opt_ids:
+                        if event.get("event") == "optimization_created":
+                            logger.warning(
+                                "optimization_created event missing 'id' in data: %s",
+                                event.get("data"),
+                            )
+                        continue
+                    logger.info(
+                        "Dispatching taxonomy extraction for %d optimization(s): %s",
+                        len(opt_ids), opt_ids[0] if len(opt_ids) == 1 else opt_ids[:3],
+                    )
 
-                        async def _run_extraction(oid: str) -> None:
+                    async def _run_extraction(oids: list[str]) -> None:
+                        # Batch-seeded rows run one after another in a single
+                        # task instead of one task (and session) per row.
+                        # process_optimization skips rows batch_taxonomy_assign
+                        # already clustered; promotion and strategy affinity
+                        # still run for their clusters.
+                        for oid in oids:
                             try:
                                 async with async_session_factory() as db:
                                     await engine.process_optimization(oid, db)
@@ -868,7 +1034,7 @@ async def lifespan(app: FastAPI):
                                             _OptPat.optimization_id == oid,
                                             _OptPat.relationship == "source",
                                         )
-                                    )).scalar_one_or_none()
+                                    )).scalars().first()
                                     if _row is not None and _row.cluster_id:
                                         lifecycle = PromptLifecycleService()
                                         await lifecycle.check_promotion(
@@ -884,17 +1050,30 @@ async def lifespan(app: FastAPI):
                                     oid, task_exc, exc_info=True,
                                 )
 
-                        task = asyncio.create_task(
-                            _run_extraction(opt_id),
-                            name=f"taxonomy-extract-{opt_id}",
-                        )
-                        extraction_tasks.add(task)
-                        task.add_done_callback(extraction_tasks.discard)
-                    else:
-                        logger.warning(
-                            "optimization_created event missing 'id' in data: %s",
-                            event.get("data"),
-                        )
+                    _spawn_background_task(
+                        _run_extraction(opt_ids),
+                        name=f"taxonomy-extract-{opt_ids[0]}",
+                        tasks=extraction_tasks,
+                    )
+                # Manual recluster requested through a follower worker
+                elif event.get("event") == "recluster_requested":
+                    async def _run_requested_recluster() -> None:
+                        try:
+                            async with async_session_factory() as cold_db:
+                                result = await engine.run_cold_path(cold_db)
+                            logger.info(
+                                "Requested recluster finished: %s",
+                                "skipped (lock held)" if result is None
+                                else ("accepted" if result.accepted else "rejected"),
+                            )
+                        except Exception as cold_exc:
+                            logger.error("Requested recluster failed: %s", cold_exc, exc_info=True)
+
+                    _spawn_background_task(
+                        _run_requested_recluster(),
+                        name="taxonomy-recluster",
+                        tasks=extraction_tasks,
+                    )
                 # Reload domain caches when taxonomy or domain events fire
                 elif event.get("event") in ("domain_created", "taxonomy_changed"):
                     try:
@@ -926,6 +1105,7 @@ async def lifespan(app: FastAPI):
 
     # Initialize unified context enrichment service
     try:
+        from app.database import async_session_factory
         from app.services.context_enrichment import ContextEnrichmentService
         from app.services.github_client import GitHubClient
         from app.services.heuristic_analyzer import HeuristicAnalyzer
@@ -939,6 +1119,7 @@ async def lifespan(app: FastAPI):
             heuristic_analyzer=HeuristicAnalyzer(),
             github_client=GitHubClient(),
             taxonomy_engine=getattr(app.state, "taxonomy_engine", None),
+            session_factory=async_session_factory,
         )
         logger.info("ContextEnrichmentService initialized")
     except Exception as exc:
@@ -948,6 +1129,13 @@ async def lifespan(app: FastAPI):
         )
         app.state.context_service = None
 
+    # Refinement result reuse + optional next-turn speculation
+    from app.services.refinement_speculation import RefinementSpeculator
+    app.state.refinement_speculator = RefinementSpeculator(
+        ttl_seconds=settings.REFINE_REUSE_TTL,
+        speculate=settings.REFINE_SPECULATION_ENABLED,
+    )
+
     # Start background repo index refresh loop (incremental staleness detection)
     async def _repo_index_refresh_loop():
         """Periodically check linked repos for file changes and incrementally
@@ -1123,7 +1311,7 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             logger.info("index_refresh_loop: shutting down after %d cycles", cycle_number)
 
-    refresh_task = asyncio.create_task(_repo_index_refresh_loop())
+    refresh_task = asyncio.create_task(_leader_only(coordinator, _repo_index_refresh_loop))
     app.state.refresh_task = refresh_task
 
     # Start warm-path periodic timer (Spec Section 6.4 — adaptive interval)
@@ -1206,6 +1394,9 @@ async def lifespan(app: FastAPI):
                                 result.operations_attempted,
                                 result.snapshot_id,
                             )
+                        # Followers reload the indexes from these files
+                        if coordinator.multi_worker and result is not None:
+                            await engine.save_index_caches(DATA_DIR)
                         # Cache injection effectiveness for health endpoint
                         eff = getattr(engine, "_injection_effectiveness", None)
                         if eff:
@@ -1269,7 +1460,7 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             logger.info("Warm path timer shutting down")
 
-    warm_path_task = asyncio.create_task(_warm_path_timer())
+    warm_path_task = asyncio.create_task(_leader_only(coordinator, _warm_path_timer))
     app.state.warm_path_task = warm_path_task
 
     # Record cold start time (process spawn to fully ready)
@@ -1299,6 +1490,7 @@ async def lifespan(app: FastAPI):
             getattr(app.state, "refresh_task", None),
             getattr(app.state, "watcher_task", None),
             getattr(app.state, "agent_watcher_task", None),
+            getattr(app.state, "config_watcher_task", None),
         ]
         if t is not None
     ]
@@ -1309,6 +1501,18 @@ async def lifespan(app: FastAPI):
     if bg_tasks:
         await asyncio.gather(*bg_tasks, return_exceptions=True)
 
+    _speculator = getattr(app.state, "refinement_speculator", None)
+    if _speculator is not None:
+        await _speculator.close()
+
+    # Stop the event relay and release taxonomy leadership
+    await coordinator.close()
+
+    # Kill pre-spawned Claude CLI workers so they don't outlive the backend.
+    from app.providers.claude_cli_pool import shutdown_cli_pool
+
+    await shutdown_cli_pool()
+
     # Phase 3: Drain in-flight extraction tasks (may be mid-DB-write).
     pending = list(extraction_tasks)
     if pending:
@@ -1368,6 +1572,11 @@ async def lifespan(app: FastAPI):
     except Exception as exc:
         logger.error("Error log rotation failed: %s", exc)
 
+    # Phase 4d: Write out buffered trace / taxonomy-event JSONL lines.
+    from app.services.jsonl_writer import shutdown_jsonl_writer
+
+    shutdown_jsonl_writer(timeout=5.0)
+
     # Phase 5: Clear taxonomy singleton + dispose database engine.
     try:
         from app.services.taxonomy import reset_engine
@@ -363,6 +363,7 @@ async def _mcp_lifespan(server: FastMCP) -> AsyncIterator[dict]:
                 heuristic_analyzer=HeuristicAnalyzer(),
                 github_client=GitHubClient(),
                 taxonomy_engine=_shared.get_taxonomy_engine(),
+                session_factory=_shared.async_session_factory,
             )
             _shared.set_context_service(_context_svc)
             logger.info("MCP server: ContextEnrichmentService initialized")
@@ -464,6 +465,19 @@ async def _mcp_lifespan(server: FastMCP) -> AsyncIterator[dict]:
     except RuntimeError:
         pass  # Event logger never initialized — nothing to drain
 
+    # Deliver whatever is still buffered for the backend event bus.
+    from app.services.event_notification import shutdown_event_forwarder
+
+    await shutdown_event_forwarder(timeout=5.0)
+
+    from app.services.jsonl_writer import shutdown_jsonl_writer
+
+    shutdown_jsonl_writer(timeout=5.0)
+
+    from app.providers.claude_cli_pool import shutdown_cli_pool
+
+    await shutdown_cli_pool()
+
     # Clean up session file on shutdown so the next startup doesn't
     # see a stale file and trigger false reconnect_detected events.
     # Without this, `init.sh restart` leaves mcp_session.json from the
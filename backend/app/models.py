@@ -22,8 +22,10 @@ from sqlalchemy import (
     LargeBinary,
     String,
     Text,
+    select,
     text,
 )
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import DeclarativeBase, Mapped, backref, mapped_column, relationship
 
 
@@ -43,6 +45,39 @@ class Base(DeclarativeBase):
     pass
 
 
+def _vector_attribute(name: str) -> hybrid_property:
+    """Expose an ``OptimizationEmbedding`` column as an ``Optimization`` attribute.
+
+    Instance access reads/writes through the ``vectors`` relationship (the
+    side row is created on first non-null write); class access is a
+    correlated scalar subquery labelled ``name``, so ``select(Optimization.id,
+    Optimization.embedding)`` and ``Optimization.embedding.isnot(None)`` keep
+    working unchanged.
+    """
+
+    def fget(self: "Optimization") -> bytes | None:
+        vectors = self.vectors
+        return getattr(vectors, name) if vectors is not None else None
+
+    def fset(self: "Optimization", value: bytes | None) -> None:
+        if self.vectors is None:
+            if value is None:
+                return
+            self.vectors = OptimizationEmbedding()
+        setattr(self.vectors, name, value)
+
+    def expr(cls: type["Optimization"]) -> Any:
+        column = getattr(OptimizationEmbedding, name)
+        return (
+            select(column)
+            .where(OptimizationEmbedding.optimization_id == cls.id)
+            .scalar_subquery()
+            .label(name)
+        )
+
+    return hybrid_property(fget, fset, expr=expr)
+
+
 # --- Core tables (Section 6) ---
 
 class Optimization(Base):
@@ -78,23 +113,61 @@ class Optimization(Base):
     score_deltas: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
     intent_label: Mapped[str | None] = mapped_column(String, nullable=True)
     domain: Mapped[str | None] = mapped_column(String, nullable=True)
-    embedding: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
-    optimized_embedding: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
-    transformation_embedding: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
-    qualifier_embedding: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
     phase_weights_json: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
     cluster_id: Mapped[str | None] = mapped_column(String, ForeignKey("prompt_cluster.id"), nullable=True)
     project_id: Mapped[str | None] = mapped_column(
         String(36),
         ForeignKey("prompt_cluster.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
     domain_raw: Mapped[str | None] = mapped_column(String, nullable=True)
     heuristic_flags: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
     improvement_score: Mapped[float | None] = mapped_column(Float, nullable=True)
     suggestions: Mapped[list[Any] | None] = mapped_column(JSON, nullable=True)
 
+    # Vector blobs live in ``optimization_embeddings`` so row scans don't
+    # page ~1.5 KB per vector through SQLite. Not loaded by default: queries
+    # that read or write vectors on instances pass
+    # ``selectinload(Optimization.vectors)``; anything else raises instead of
+    # silently reading None (column-level ``select(Optimization.embedding)``
+    # needs neither).
+    vectors: Mapped["OptimizationEmbedding | None"] = relationship(
+        uselist=False, cascade="all, delete-orphan", lazy="raise",
+    )
+    embedding = _vector_attribute("embedding")
+    optimized_embedding = _vector_attribute("optimized_embedding")
+    transformation_embedding = _vector_attribute("transformation_embedding")
+    qualifier_embedding = _vector_attribute("qualifier_embedding")
+
+    def __init__(self, **kwargs: Any) -> None:
+        # Mark ``vectors`` loaded (first, so vector kwargs land on it) — a new
+        # row would otherwise lazy-load it after flush, which async can't do.
+        super().__init__(**{"vectors": None, **kwargs})
+
+    # Matched to the hot queries: history sort/filter, failure counts,
+    # per-cluster member lists and best-scored lookups, project detail.
+    __table_args__ = (
+        Index("ix_optimizations_created_at", "created_at"),
+        Index("ix_optimizations_status_created", "status", "created_at"),
+        Index("ix_optimizations_cluster_created", "cluster_id", "created_at"),
+        Index("ix_optimizations_cluster_score", "cluster_id", "overall_score"),
+        Index("ix_optimizations_project_created", "project_id", "created_at"),
+        Index("ix_optimizations_trace_id", "trace_id"),
+    )
+
+
+class OptimizationEmbedding(Base):
+    """Per-optimization vectors, split out of ``optimizations`` (one row each)."""
+    __tablename__ = "optimization_embeddings"
+
+    optimization_id: Mapped[str] = mapped_column(
+        String, ForeignKey("optimizations.id", ondelete="CASCADE"), primary_key=True,
+    )
+    embedding: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    optimized_embedding: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    transformation_embedding: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    qualifier_embedding: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+
 
 class Feedback(Base):
     __tablename__ = "feedbacks"
@@ -512,3 +585,39 @@ class PromptTemplate(Base):
             sqlite_where=text("retired_at IS NULL"),
         ),
     )
+
+
+# --- Signal extraction term index ---
+
+class SignalTermDoc(Base):
+    """An optimization currently counted in ``signal_term_counts``.
+
+    Holds the groups the prompt was counted under and its distinct terms,
+    so a deletion or reclassification can be reversed without re-reading
+    or re-tokenizing the prompt. Deliberately no foreign key: the row must
+    outlive its optimization until the next sync subtracts it.
+    """
+    __tablename__ = "signal_term_docs"
+
+    optimization_id: Mapped[str] = mapped_column(String, primary_key=True)
+    task_type: Mapped[str | None] = mapped_column(String, nullable=True)
+    cluster_id: Mapped[str | None] = mapped_column(String, nullable=True)
+    terms: Mapped[str] = mapped_column(Text, nullable=False, default="")
+
+
+class SignalTermCount(Base):
+    """Document frequency of one term within one prompt group.
+
+    ``scope`` is ``"global"`` (key ``""``), ``"task_type"`` or ``"cluster"``.
+    The row with ``term == ""`` holds the group's document total.
+    """
+    __tablename__ = "signal_term_counts"
+
+    scope: Mapped[str] = mapped_column(String, primary_key=True)
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    term: Mapped[str] = mapped_column(String, primary_key=True)
+    doc_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_signal_term_counts_scope_term", "scope", "term"),
+    )
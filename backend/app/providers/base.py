@@ -8,12 +8,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import TypeVar
+from typing import TYPE_CHECKING, TypeVar
 
 from pydantic import BaseModel
 
+if TYPE_CHECKING:
+    from app.providers.concurrency import Priority
+    from app.providers.response_cache import ResponseCache
+
 T = TypeVar("T", bound=BaseModel)
 
 _logger = logging.getLogger(__name__)
@@ -180,6 +185,8 @@ async def call_provider_with_retry(
     streaming: bool = False,
     max_retries: int = _DEFAULT_MAX_RETRIES,
     retry_delay: float = _DEFAULT_RETRY_DELAY,
+    response_cache: ResponseCache | None = None,
+    priority: Priority | None = None,
 ) -> T:
     """Call provider.complete_parsed with smart retry logic.
 
@@ -189,24 +196,115 @@ async def call_provider_with_retry(
     When ``streaming=True``, dispatches to ``complete_parsed_streaming()``
     which prevents HTTP timeouts on long outputs (e.g. Opus 128K).
 
+    When ``response_cache`` is given, an identical prior request (same
+    provider, model, prompts, schema, ``max_tokens`` and ``effort``) is
+    answered from the cache without calling the provider; the provider's
+    ``last_usage`` is zeroed and ``response_cache.last_call_cached()``
+    reports True for the current task.
+
+    Each attempt holds a slot from the shared adaptive concurrency
+    controller (see ``app.providers.concurrency``) at *priority*, falling
+    back to the class set by ``llm_priority()``. Rate-limit and overload
+    errors shrink the shared limit; successes grow it. Retry backoff sleeps
+    happen outside the slot. Cache hits never take a slot.
+
     Used by both PipelineOrchestrator and RefinementService to avoid
     duplicating retry logic.
     """
     call_fn = provider.complete_parsed_streaming if streaming else provider.complete_parsed
 
+    cache_key: str | None = None
+    if response_cache is not None:
+        from app.providers.response_cache import _mark_cached
+
+        _mark_cached(False)
+        cache_key = response_cache.build_key(
+            provider=getattr(provider, "name", type(provider).__name__),
+            model=model,
+            system_prompt=system_prompt,
+            user_message=user_message,
+            output_format=output_format,
+            max_tokens=max_tokens,
+            effort=effort,
+        )
+        try:
+            payload = await response_cache.aget(cache_key)
+            if payload is not None:
+                cached_result = output_format.model_validate_json(payload)
+                provider.last_usage = TokenUsage()
+                provider.last_model = model
+                _mark_cached(True)
+                _logger.debug(
+                    "LLM response cache hit: model=%s schema=%s key=%s",
+                    model, output_format.__name__, cache_key[:12],
+                )
+                return cached_result
+        except Exception:
+            _logger.warning("LLM response cache read failed", exc_info=True)
+
+    from app.providers.concurrency import get_concurrency_controller
+
+    controller = get_concurrency_controller()
+
+    from app.services.metrics import observe
+    from app.services.profiling import span
+
+    provider_name = getattr(provider, "name", type(provider).__name__)
     last_exc: Exception | None = None
     for attempt in range(max_retries + 1):
+        t0 = time.perf_counter()
         try:
-            return await call_fn(
-                model=model,
-                system_prompt=system_prompt,
-                user_message=user_message,
-                output_format=output_format,
-                max_tokens=max_tokens,
-                effort=effort,
-                cache_ttl=cache_ttl,
+            if controller is None:
+                with span("provider.call"):
+                    result = await call_fn(
+                        model=model,
+                        system_prompt=system_prompt,
+                        user_message=user_message,
+                        output_format=output_format,
+                        max_tokens=max_tokens,
+                        effort=effort,
+                        cache_ttl=cache_ttl,
+                    )
+            else:
+                async with controller.slot(priority):
+                    try:
+                        with span("provider.call"):
+                            result = await call_fn(
+                                model=model,
+                                system_prompt=system_prompt,
+                                user_message=user_message,
+                                output_format=output_format,
+                                max_tokens=max_tokens,
+                                effort=effort,
+                                cache_ttl=cache_ttl,
+                            )
+                    except (ProviderRateLimitError, ProviderOverloadedError):
+                        controller.on_overload()
+                        raise
+                controller.on_success()
+            observe(
+                "provider_call_duration_seconds", time.perf_counter() - t0,
+                provider=provider_name, model=model, outcome="ok",
             )
+            if response_cache is not None and cache_key is not None:
+                try:
+                    await response_cache.aset(
+                        cache_key, result.model_dump_json(),
+                        model=model, schema=output_format.__name__,
+                    )
+                except Exception:
+                    _logger.warning("LLM response cache write failed", exc_info=True)
+            return result
         except ProviderError as exc:
+            observe(
+                "provider_call_duration_seconds", time.perf_counter() - t0,
+                provider=provider_name, model=model,
+                outcome=(
+                    "rate_limited"
+                    if isinstance(exc, (ProviderRateLimitError, ProviderOverloadedError))
+                    else "error"
+                ),
+            )
             if not exc.retryable:
                 raise  # Bad request, auth errors — fail immediately
             last_exc = exc
@@ -220,6 +318,10 @@ async def call_provider_with_retry(
                 )
                 await asyncio.sleep(delay)
         except Exception as exc:
+            observe(
+                "provider_call_duration_seconds", time.perf_counter() - t0,
+                provider=provider_name, model=model, outcome="error",
+            )
             last_exc = exc
             if attempt < max_retries:
                 _logger.warning(
@@ -2,7 +2,8 @@
 
 Calls the ``claude`` CLI with native ``--json-schema`` for structured output
 validation and ``--effort`` for thinking control. Maps exit codes and stderr
-patterns to the ProviderError hierarchy.
+patterns to the ProviderError hierarchy. Processes come from the warm worker
+pool in ``claude_cli_pool`` when ``CLAUDE_CLI_POOL_SIZE`` > 0.
 """
 
 from __future__ import annotations
@@ -20,6 +21,7 @@ from app.providers.base import (
     ProviderError,
     TokenUsage,
 )
+from app.providers.claude_cli_pool import get_cli_pool
 
 logger = logging.getLogger(__name__)
 
@@ -86,19 +88,16 @@ class ClaudeCLIProvider(LLMProvider):
 
         logger.debug("claude_cli executing model=%s effort=%s", model, effort)
 
+        pool = get_cli_pool()
         proc: asyncio.subprocess.Process | None = None
         try:
-            proc = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            proc = await pool.acquire(cmd)
             stdout, stderr = await asyncio.wait_for(
                 proc.communicate(input=user_message.encode()),
                 timeout=_CLI_TIMEOUT_SECONDS,
             )
         except asyncio.TimeoutError:
+            pool.discard(cmd)
             if proc:
                 proc.kill()
                 try:
@@ -122,6 +121,7 @@ class ClaudeCLIProvider(LLMProvider):
             )
 
         if proc.returncode != 0:
+            pool.discard(cmd)
             stderr_text = stderr.decode(errors="replace")
             stdout_text = stdout.decode(errors="replace")
 
@@ -0,0 +1,246 @@
+"""Pre-spawned worker pool for the Claude CLI provider.
+
+``claude -p`` boots Node, loads config and negotiates auth before it reads
+the prompt from stdin — hundreds of milliseconds to seconds per call. The
+pool moves that cost off the request path: after a call takes a process for
+a given command line, a replacement with the same arguments is spawned in
+the background and left blocked on stdin, so the next identical call
+(same model, system prompt, schema and effort) only pays for the write.
+
+Workers are single-use. The CLI's persistent stdio (``stream-json``) mode
+keeps one conversation per process, so reusing a process would leak earlier
+turns into unrelated calls; recycling after every call is the only safe N.
+
+- **Health checks** — a warm worker that has already exited, or has sat idle
+  longer than ``CLAUDE_CLI_POOL_MAX_IDLE_SECONDS``, is discarded on take.
+- **Recycle on error** — a failed call drops every warm worker for its
+  command line (they share its config, e.g. an expired login).
+- **Bounded** — at most ``CLAUDE_CLI_POOL_SIZE`` warm workers in total,
+  oldest command line evicted first. ``0`` disables the pool.
+- **Distinct command lines** — the system prompt and schema are CLI
+  arguments, bound when the process starts, so they are part of the key and
+  cannot be supplied per request. At most ``CLAUDE_CLI_POOL_MAX_COMMANDS``
+  command lines are kept warm. Once that is full, a new command line is
+  only warmed (evicting the least recently used) when it has been seen
+  before, so one-off system prompts don't churn the pool with spawns that
+  never get used. Keys are digests, so pooled prompts aren't held twice.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Recently seen command-line digests remembered for admission.
+_SEEN_LIMIT = 256
+
+
+@dataclass
+class _WarmWorker:
+    proc: asyncio.subprocess.Process
+    spawned_at: float = field(default_factory=time.monotonic)
+
+
+async def _spawn(cmd: list[str]) -> asyncio.subprocess.Process:
+    return await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+
+
+def _key(cmd: list[str]) -> str:
+    return hashlib.sha256("\0".join(cmd).encode()).hexdigest()
+
+
+class CLIWorkerPool:
+    """Keeps pre-spawned ``claude`` processes warm, keyed by command line."""
+
+    def __init__(
+        self,
+        size: int,
+        max_idle_seconds: float = 300.0,
+        max_commands: int = 4,
+    ) -> None:
+        self._size = max(0, size)
+        self._max_idle = max_idle_seconds
+        self._max_commands = max(1, max_commands)
+        self._idle: OrderedDict[str, list[_WarmWorker]] = OrderedDict()
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._refills: set[asyncio.Task[Any]] = set()
+        self._closed = False
+        self._hits = 0
+        self._misses = 0
+        self._spawned = 0
+        self._discarded = 0
+        self._not_admitted = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._size > 0 and not self._closed
+
+    def warm_count(self) -> int:
+        return sum(len(ws) for ws in self._idle.values())
+
+    # ------------------------------------------------------------------
+    # Acquire / release
+    # ------------------------------------------------------------------
+
+    async def acquire(self, cmd: list[str]) -> asyncio.subprocess.Process:
+        """Return a process for *cmd*: a warm one if healthy, else a fresh spawn.
+
+        Spawn errors (``FileNotFoundError``, ``OSError``) propagate unchanged.
+        """
+        key = _key(cmd)
+        recurring = self._note(key)
+        proc = self._take_warm(key)
+        if proc is not None:
+            self._hits += 1
+        else:
+            self._misses += 1
+            proc = await _spawn(cmd)
+        if self._admit(key, recurring):
+            self._schedule_refill(key, cmd)
+        else:
+            self._not_admitted += 1
+        return proc
+
+    def discard(self, cmd: list[str]) -> None:
+        """Drop warm workers for *cmd* after a failed call."""
+        for worker in self._idle.pop(_key(cmd), []):
+            self._kill(worker)
+
+    def _note(self, key: str) -> bool:
+        """Record *key* as seen; True if it was seen before."""
+        recurring = key in self._seen
+        self._seen[key] = None
+        self._seen.move_to_end(key)
+        while len(self._seen) > _SEEN_LIMIT:
+            self._seen.popitem(last=False)
+        return recurring
+
+    def _admit(self, key: str, recurring: bool) -> bool:
+        """Whether to warm a replacement for *key*."""
+        return key in self._idle or len(self._idle) < self._max_commands or recurring
+
+    def _take_warm(self, key: str) -> asyncio.subprocess.Process | None:
+        workers = self._idle.get(key)
+        now = time.monotonic()
+        while workers:
+            worker = workers.pop(0)
+            if worker.proc.returncode is None and now - worker.spawned_at <= self._max_idle:
+                if not workers:
+                    del self._idle[key]
+                return worker.proc
+            self._kill(worker)
+        self._idle.pop(key, None)
+        return None
+
+    def _schedule_refill(self, key: str, cmd: list[str]) -> None:
+        if not self.enabled:
+            return
+        task = asyncio.create_task(self._refill(key, cmd))
+        self._refills.add(task)
+        task.add_done_callback(self._refills.discard)
+
+    async def _refill(self, key: str, cmd: list[str]) -> None:
+        try:
+            proc = await _spawn(cmd)
+        except OSError as exc:
+            logger.debug("claude_cli pool refill failed: %s", exc)
+            return
+        if self._closed:
+            self._kill(_WarmWorker(proc))
+            return
+        self._spawned += 1
+        self._idle.setdefault(key, []).append(_WarmWorker(proc))
+        self._idle.move_to_end(key)
+        while len(self._idle) > self._max_commands:
+            for worker in self._idle.popitem(last=False)[1]:
+                self._kill(worker)
+        while self.warm_count() > self._size:
+            oldest_key = next(iter(self._idle))
+            workers = self._idle[oldest_key]
+            self._kill(workers.pop(0))
+            if not workers:
+                del self._idle[oldest_key]
+
+    def _kill(self, worker: _WarmWorker) -> None:
+        self._discarded += 1
+        if worker.proc.returncode is not None:
+            return
+        try:
+            worker.proc.kill()
+        except ProcessLookupError:
+            return
+        task = asyncio.create_task(_reap(worker.proc))
+        self._refills.add(task)
+        task.add_done_callback(self._refills.discard)
+
+    # ------------------------------------------------------------------
+    # Lifecycle / metrics
+    # ------------------------------------------------------------------
+
+    async def close(self) -> None:
+        """Kill every warm worker and wait for pending refills."""
+        self._closed = True
+        for key in list(self._idle):
+            for worker in self._idle.pop(key):
+                self._kill(worker)
+        if self._refills:
+            await asyncio.gather(*list(self._refills), return_exceptions=True)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": self._size,
+            "warm": self.warm_count(),
+            "commands": len(self._idle),
+            "not_admitted": self._not_admitted,
+            "hits": self._hits,
+            "misses": self._misses,
+            "spawned": self._spawned,
+            "discarded": self._discarded,
+        }
+
+
+async def _reap(proc: asyncio.subprocess.Process) -> None:
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=5)
+    except (asyncio.TimeoutError, ProcessLookupError):
+        pass  # Best-effort zombie reaping
+
+
+# ---------------------------------------------------------------------------
+# Process-wide singleton
+# ---------------------------------------------------------------------------
+
+_instance: CLIWorkerPool | None = None
+
+
+def get_cli_pool() -> CLIWorkerPool:
+    global _instance
+    if _instance is None:
+        from app.config import settings
+
+        _instance = CLIWorkerPool(
+            settings.CLAUDE_CLI_POOL_SIZE,
+            max_idle_seconds=settings.CLAUDE_CLI_POOL_MAX_IDLE_SECONDS,
+            max_commands=settings.CLAUDE_CLI_POOL_MAX_COMMANDS,
+        )
+    return _instance
+
+
+async def shutdown_cli_pool() -> None:
+    """Kill warm workers and drop the singleton (lifespan shutdown, tests)."""
+    global _instance
+    if _instance is not None:
+        await _instance.close()
+    _instance = None
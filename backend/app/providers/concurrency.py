@@ -0,0 +1,227 @@
+"""Process-wide adaptive concurrency control for LLM provider calls.
+
+Every ``call_provider_with_retry`` attempt takes a slot from one shared
+:class:`AdaptiveConcurrencyController`, so the interactive pipeline, batch
+seeding, warm/cold taxonomy work and explore synthesis share a single
+budget instead of each running its own semaphore.
+
+- **AIMD limit** — the slot limit grows by ``1/limit`` per successful call
+  (≈ +1 per window of ``limit`` calls) and is multiplied by
+  ``LLM_CONCURRENCY_DECREASE`` on a rate-limit / overload error, at most
+  once per cooldown so a burst of 429s from one window counts once.
+- **Priority classes** — when a slot frees, the highest-priority waiter
+  (``INTERACTIVE`` < ``BATCH`` < ``BACKGROUND``) is woken first, FIFO
+  within a class.
+- **Metrics** — per-class acquired / queued counts and queue-wait totals,
+  via :meth:`AdaptiveConcurrencyController.stats`.
+
+Callers choose a class with :func:`llm_priority` (a context manager over a
+``ContextVar``) so nested helpers inherit it without threading a parameter.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import IntEnum
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """Scheduling class for an LLM call. Lower value wins."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+    BACKGROUND = 2
+
+
+_priority_var: ContextVar[Priority] = ContextVar("llm_priority", default=Priority.INTERACTIVE)
+
+
+def current_priority() -> Priority:
+    return _priority_var.get()
+
+
+@contextmanager
+def llm_priority(priority: Priority) -> Iterator[None]:
+    """Run LLM calls inside the block at *priority*."""
+    token = _priority_var.set(priority)
+    try:
+        yield
+    finally:
+        _priority_var.reset(token)
+
+
+@dataclass
+class _ClassStats:
+    acquired: int = 0
+    wait_total_ms: float = 0.0
+    wait_max_ms: float = 0.0
+
+    def record(self, wait_ms: float) -> None:
+        self.acquired += 1
+        self.wait_total_ms += wait_ms
+        self.wait_max_ms = max(self.wait_max_ms, wait_ms)
+
+
+class AdaptiveConcurrencyController:
+    """AIMD-limited, priority-ordered slot pool for provider calls."""
+
+    def __init__(
+        self,
+        initial: int = 8,
+        minimum: int = 1,
+        maximum: int = 32,
+        decrease_factor: float = 0.5,
+        cooldown_seconds: float = 5.0,
+    ) -> None:
+        self._min = max(1, minimum)
+        self._max = max(self._min, maximum)
+        self._limit = float(min(max(initial, self._min), self._max))
+        self._decrease = decrease_factor
+        self._cooldown = cooldown_seconds
+        self._last_decrease = float("-inf")
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._seq = itertools.count()
+        self._stats = {p: _ClassStats() for p in Priority}
+        self._overloads = 0
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    # ------------------------------------------------------------------
+    # Slot management
+    # ------------------------------------------------------------------
+
+    async def acquire(self, priority: Priority = Priority.INTERACTIVE) -> None:
+        t0 = time.monotonic()
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+        else:
+            fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            entry = (int(priority), next(self._seq), fut)
+            heapq.heappush(self._waiters, entry)
+            try:
+                await fut
+            except BaseException:
+                if fut.done() and not fut.cancelled():
+                    # Slot was handed to us as we were cancelled — pass it on.
+                    self._in_flight -= 1
+                    self._wake()
+                else:
+                    self._waiters.remove(entry)
+                    heapq.heapify(self._waiters)
+                raise
+        self._stats[priority].record((time.monotonic() - t0) * 1000)
+
+    def release(self) -> None:
+        self._in_flight = max(0, self._in_flight - 1)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            _, _, fut = heapq.heappop(self._waiters)
+            if fut.done():
+                continue
+            self._in_flight += 1
+            fut.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority | None = None) -> AsyncIterator[None]:
+        await self.acquire(current_priority() if priority is None else priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    # ------------------------------------------------------------------
+    # AIMD feedback
+    # ------------------------------------------------------------------
+
+    def on_success(self) -> None:
+        if self._limit < self._max:
+            self._limit = min(float(self._max), self._limit + 1.0 / self._limit)
+            self._wake()
+
+    def on_overload(self) -> None:
+        self._overloads += 1
+        now = time.monotonic()
+        if now - self._last_decrease < self._cooldown:
+            return
+        self._last_decrease = now
+        old = self._limit
+        self._limit = max(float(self._min), self._limit * self._decrease)
+        logger.warning(
+            "LLM concurrency limit reduced %.1f → %.1f after rate limit/overload",
+            old, self._limit,
+        )
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    def stats(self) -> dict:
+        queued = {p: 0 for p in Priority}
+        for prio, _, fut in self._waiters:
+            if not fut.done():
+                queued[Priority(prio)] += 1
+        classes = {}
+        for p in Priority:
+            st = self._stats[p]
+            classes[p.name.lower()] = {
+                "acquired": st.acquired,
+                "queued": queued[p],
+                "wait_avg_ms": round(st.wait_total_ms / st.acquired, 1) if st.acquired else 0.0,
+                "wait_max_ms": round(st.wait_max_ms, 1),
+            }
+        return {
+            "limit": self.limit,
+            "limit_exact": round(self._limit, 2),
+            "in_flight": self._in_flight,
+            "overloads": self._overloads,
+            "classes": classes,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Process-wide singleton
+# ---------------------------------------------------------------------------
+
+_instance: AdaptiveConcurrencyController | None = None
+
+
+def get_concurrency_controller() -> AdaptiveConcurrencyController | None:
+    """Return the shared controller, or None when disabled."""
+    global _instance
+    from app.config import settings
+
+    if not settings.LLM_CONCURRENCY_ENABLED:
+        return None
+    if _instance is None:
+        _instance = AdaptiveConcurrencyController(
+            initial=settings.LLM_CONCURRENCY_INITIAL,
+            minimum=settings.LLM_CONCURRENCY_MIN,
+            maximum=settings.LLM_CONCURRENCY_MAX,
+            decrease_factor=settings.LLM_CONCURRENCY_DECREASE,
+        )
+    return _instance
+
+
+def reset_concurrency_controller() -> None:
+    """Drop the singleton (tests, settings reload)."""
+    global _instance
+    _instance = None
@@ -0,0 +1,236 @@
+"""Deterministic LLM response cache.
+
+Opt-in (``LLM_RESPONSE_CACHE_ENABLED``), size-bounded cache of parsed
+provider responses, keyed on a SHA-256 digest of the full request:
+provider name, model, system prompt, user message, output schema,
+``max_tokens`` and ``effort``. Entries live in a standalone SQLite file
+(``data/llm_response_cache.db`` by default) so they survive restarts
+without touching the application database.
+
+``call_provider_with_retry`` consults the cache when handed one; callers
+check :func:`last_call_cached` afterwards to tag trace entries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextvars import ContextVar
+from pathlib import Path
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+# Set by ``call_provider_with_retry`` for the current task: True when the
+# most recent call was served from the response cache.
+_last_call_cached: ContextVar[bool] = ContextVar("llm_last_call_cached", default=False)
+
+
+def last_call_cached() -> bool:
+    """Whether the most recent provider call in this task was a cache hit."""
+    return _last_call_cached.get()
+
+
+def _mark_cached(value: bool) -> None:
+    _last_call_cached.set(value)
+
+
+class ResponseCache:
+    """SQLite-backed TTL + LRU cache of serialized provider responses.
+
+    Blocking SQLite work runs under a lock; async callers use
+    :meth:`aget` / :meth:`aset`, which hop to a worker thread.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        ttl_seconds: int = 86400,
+        max_entries: int = 5000,
+    ) -> None:
+        self._path = Path(path)
+        self._ttl = ttl_seconds
+        self._max = max_entries
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " payload TEXT NOT NULL,"
+            " model TEXT,"
+            " schema TEXT,"
+            " created_at REAL NOT NULL,"
+            " last_used REAL NOT NULL,"
+            " hit_count INTEGER NOT NULL DEFAULT 0)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_responses_last_used ON responses (last_used)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def build_key(
+        *,
+        provider: str,
+        model: str,
+        system_prompt: str,
+        user_message: str,
+        output_format: type[BaseModel],
+        max_tokens: int,
+        effort: str | None,
+    ) -> str:
+        """SHA-256 digest of everything that determines the response."""
+        try:
+            schema = output_format.model_json_schema()
+        except Exception:
+            schema = output_format.__qualname__
+        material = json.dumps(
+            {
+                "provider": provider,
+                "model": model,
+                "system": system_prompt,
+                "user": user_message,
+                "schema": schema,
+                "max_tokens": max_tokens,
+                "effort": effort,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Sync API
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM responses WHERE key = ?", (key,),
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            payload, created_at = row
+            if now - created_at > self._ttl:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self._misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_used = ?, hit_count = hit_count + 1 WHERE key = ?",
+                (now, key),
+            )
+            self._conn.commit()
+            self._hits += 1
+            return payload
+
+    def set(self, key: str, payload: str, *, model: str = "", schema: str = "") -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, payload, model, schema, created_at, last_used, hit_count)"
+                " VALUES (?, ?, ?, ?, ?, ?, 0)",
+                (key, payload, model, schema, now, now),
+            )
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+            if count > self._max:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    " SELECT key FROM responses ORDER BY last_used ASC LIMIT ?)",
+                    (count - self._max,),
+                )
+            self._conn.commit()
+
+    def invalidate(self, *, model: str | None = None, schema: str | None = None) -> int:
+        """Delete entries (optionally only for *model* / *schema*). Returns count."""
+        clauses: list[str] = []
+        params: list[str] = []
+        if model is not None:
+            clauses.append("model = ?")
+            params.append(model)
+        if schema is not None:
+            clauses.append("schema = ?")
+            params.append(schema)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            cur = self._conn.execute(f"DELETE FROM responses{where}", params)
+            self._conn.commit()
+            count = cur.rowcount
+        if count:
+            logger.info("LLM response cache invalidated %d entries", count)
+        return count
+
+    def prune_expired(self) -> int:
+        """Drop entries older than the TTL. Returns count."""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (time.time() - self._ttl,),
+            )
+            self._conn.commit()
+            return cur.rowcount
+
+    def stats(self) -> dict:
+        with self._lock:
+            (size,) = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return {"hits": self._hits, "misses": self._misses, "size": size}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # Async wrappers
+    # ------------------------------------------------------------------
+
+    async def aget(self, key: str) -> str | None:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, payload: str, *, model: str = "", schema: str = "") -> None:
+        await asyncio.to_thread(self.set, key, payload, model=model, schema=schema)
+
+
+# ---------------------------------------------------------------------------
+# Process-wide singleton
+# ---------------------------------------------------------------------------
+
+_instance: ResponseCache | None = None
+
+
+def get_response_cache() -> ResponseCache | None:
+    """Return the shared cache, or None when disabled or unavailable."""
+    global _instance
+    from app.config import DATA_DIR, settings
+
+    if not settings.LLM_RESPONSE_CACHE_ENABLED:
+        return None
+    if _instance is None:
+        try:
+            _instance = ResponseCache(
+                settings.LLM_RESPONSE_CACHE_PATH or DATA_DIR / "llm_response_cache.db",
+                ttl_seconds=settings.LLM_RESPONSE_CACHE_TTL,
+                max_entries=settings.LLM_RESPONSE_CACHE_MAX_ENTRIES,
+            )
+        except Exception:
+            logger.warning("LLM response cache unavailable", exc_info=True)
+            return None
+    return _instance
+
+
+def reset_response_cache() -> None:
+    """Close and drop the singleton (tests, settings reload)."""
+    global _instance
+    if _instance is not None:
+        _instance.close()
+    _instance = None
@@ -34,6 +34,7 @@ from app.schemas.clusters import (
     SimilarityEdgesResponse,
     TaxonomyActivityEvent,
 )
+from app.services.event_bus import event_bus
 from app.services.taxonomy import TaxonomyEngine
 from app.services.taxonomy import get_engine as get_taxonomy_engine
 from app.services.taxonomy._constants import EXCLUDED_STRUCTURAL_STATES
@@ -305,7 +306,7 @@ async def get_cluster_activity_history(
         return ActivityHistoryResponse(events=[], total=0, has_more=False)
 
     try:
-        raw = tel.get_history(date=date, limit=limit + 1, offset=offset)
+        raw = await tel.aget_history(date=date, limit=limit + 1, offset=offset)
         has_more = len(raw) > limit
         raw = raw[:limit]
 
@@ -614,6 +615,11 @@ async def trigger_recluster(
 ) -> ReclusterResponse:
     """Manual cold-path trigger — full HDBSCAN + UMAP recomputation."""
     engine = _get_engine(request)
+    coordinator = getattr(request.app.state, "worker_coordinator", None)
+    if coordinator is not None and not coordinator.is_leader:
+        # Only the taxonomy leader worker may run the cold path
+        event_bus.publish("recluster_requested", {"trigger": "manual"})
+        return ReclusterResponse(status="queued", reason="forwarded to the taxonomy leader worker")
     try:
         result = await engine.run_cold_path(db)
         if result is None:
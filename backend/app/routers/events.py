@@ -1,7 +1,6 @@
 """Real-time SSE event stream endpoint."""
 
 import asyncio
-import json
 import logging
 
 from fastapi import APIRouter, Request
@@ -13,6 +12,8 @@ from app.services.event_bus import event_bus
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api", tags=["events"])
 
+_KEEPALIVE_SECONDS = 45.0
+
 
 class InternalEventRequest(BaseModel):
     event_type: str = Field(description="Event type identifier (e.g. 'optimization_created').")
@@ -23,9 +24,36 @@ class OkResponse(BaseModel):
     ok: bool = Field(default=True, description="Operation success indicator.")
 
 
+class InternalEventBatchRequest(BaseModel):
+    events: list[InternalEventRequest] = Field(
+        description="Events to publish, in delivery order.",
+    )
+
+
 @router.post("/events/_publish")
 async def publish_event(body: InternalEventRequest, request: Request) -> OkResponse:
-    """Internal endpoint for cross-process event publishing (used by MCP server).
+    """Internal endpoint for cross-process event publishing.
+
+    See :func:`_handle_internal_event` for per-event-type routing.
+    """
+    _handle_internal_event(body.event_type, body.data, request)
+    return OkResponse()
+
+
+@router.post("/events/_publish_batch")
+async def publish_event_batch(body: InternalEventBatchRequest, request: Request) -> OkResponse:
+    """Batched cross-process publishing (used by the MCP server's forwarder).
+
+    Events are handled in list order, so the bus sees them in the order the
+    MCP process emitted them.
+    """
+    for evt in body.events:
+        _handle_internal_event(evt.event_type, evt.data, request)
+    return OkResponse()
+
+
+def _handle_internal_event(event_type: str, data: dict, request: Request) -> None:
+    """Route one cross-process event.
 
     For ``routing_state_changed`` events, the backend's RoutingManager is
     synced first and handles local event publishing (avoiding duplicates).
@@ -33,49 +61,49 @@ async def publish_event(body: InternalEventRequest, request: Request) -> OkRespo
     """
     # E1b: Cross-process classification agreement bridge.
     # Internal counter updates only — no SSE broadcast, no event bus publish.
-    if body.event_type == "classification_agreement_record":
+    if event_type == "classification_agreement_record":
         try:
             from app.services.classification_agreement import get_classification_agreement
             get_classification_agreement().record(
-                heuristic_task_type=body.data.get("heuristic_task_type", ""),
-                heuristic_domain=body.data.get("heuristic_domain", ""),
-                llm_task_type=body.data.get("llm_task_type", ""),
-                llm_domain=body.data.get("llm_domain", ""),
-                prompt_snippet=body.data.get("prompt_snippet", ""),
+                heuristic_task_type=data.get("heuristic_task_type", ""),
+                heuristic_domain=data.get("heuristic_domain", ""),
+                llm_task_type=data.get("llm_task_type", ""),
+                llm_domain=data.get("llm_domain", ""),
+                prompt_snippet=data.get("prompt_snippet", ""),
             )
         except Exception as _ca_exc:
             logger.warning("Cross-process classification_agreement record failed: %s", _ca_exc)
-        return OkResponse()
-    if body.event_type == "classification_agreement_strategy_intel":
+        return
+    if event_type == "classification_agreement_strategy_intel":
         try:
             from app.services.classification_agreement import get_classification_agreement
             get_classification_agreement().record_strategy_intel(
-                had_intel=body.data.get("had_intel", False),
+                had_intel=data.get("had_intel", False),
             )
         except Exception as _si_exc:
             logger.warning("Cross-process strategy_intel record failed: %s", _si_exc)
-        return OkResponse()
+        return
 
     # General event routing — publish to in-process event bus for SSE delivery.
-    if body.event_type == "routing_state_changed":
+    if event_type == "routing_state_changed":
         routing = getattr(request.app.state, "routing", None)
         if routing:
             # sync_from_event publishes to event_bus only if state changed.
             # Do NOT also publish the raw event — that would double-notify
             # SSE subscribers (frontend would show duplicate toasts).
-            routing.sync_from_event(body.data)
+            routing.sync_from_event(data)
         else:
             # No routing manager — publish raw event as fallback
-            event_bus.publish(body.event_type, body.data)
+            event_bus.publish(event_type, data)
     else:
-        event_bus.publish(body.event_type, body.data)
+        event_bus.publish(event_type, data)
 
     # Mirror taxonomy_activity events into the backend's ring buffer so
     # the /api/clusters/activity endpoint returns cross-process events.
-    if body.event_type == "taxonomy_activity":
+    if event_type == "taxonomy_activity":
         try:
             from app.services.taxonomy.event_logger import get_event_logger
-            get_event_logger()._buffer.append(body.data)
+            get_event_logger().record_external(data)
         except RuntimeError:
             # Event logger not yet initialized — lazy-init with defaults
             # so the ring buffer starts capturing immediately instead of
@@ -84,7 +112,7 @@ async def publish_event(body: InternalEventRequest, request: Request) -> OkRespo
                 from app.services.taxonomy.event_logger import TaxonomyEventLogger, set_event_logger
                 _tel = TaxonomyEventLogger(publish_to_bus=False)
                 set_event_logger(_tel)
-                _tel._buffer.append(body.data)
+                _tel.record_external(data)
                 logger.info(
                     "taxonomy_activity received before lifespan init "
                     "— lazy-initialized event logger for ring buffer"
@@ -100,8 +128,6 @@ async def publish_event(body: InternalEventRequest, request: Request) -> OkRespo
                 _mirror_exc,
             )
 
-    return OkResponse()
-
 
 @router.get("/events")
 async def event_stream(
@@ -125,62 +151,53 @@ async def event_stream(
     )
 
     async def generate():
-        queue: asyncio.Queue = asyncio.Queue(maxsize=100)
-        event_bus._subscribers.add(queue)
-        # Track highest replayed seq to deduplicate events that arrived in
-        # the queue while replay was in progress.
-        replayed_up_to: int = 0
+        # Readers share the bus's ring of pre-rendered frames — no per-client
+        # queue copy and no json.dumps per connection.
+        after_seq: int | None = None
+        if resolved_last_id is not None:
+            try:
+                after_seq = int(resolved_last_id)
+            except (ValueError, TypeError):
+                logger.warning("Invalid Last-Event-ID: %s", resolved_last_id)
         try:
-            # Replay missed events on reconnection
-            if resolved_last_id is not None:
-                try:
-                    last_seq = int(resolved_last_id)
-                    missed = event_bus.replay_since(last_seq)
-                    for evt in missed:
-                        event_type = evt["event"]
-                        data = json.dumps(evt["data"])
-                        seq = evt["seq"]
-                        yield f"id: {seq}\nevent: {event_type}\ndata: {data}\n\n"
-                        replayed_up_to = max(replayed_up_to, seq)
+            with event_bus.reader(after_seq) as cursor:
+                # Replay missed events on reconnection
+                if after_seq is not None:
+                    missed = cursor.drain()
+                    if missed:
+                        yield "".join(evt.frame for evt in missed)
                     logger.info(
-                        "Replayed %d missed events (since seq %d)", len(missed), last_seq,
+                        "Replayed %d missed events (since seq %d)", len(missed), after_seq,
                     )
-                except (ValueError, TypeError):
-                    logger.warning("Invalid Last-Event-ID: %s", resolved_last_id)
-
-            # Send sync event with current sequence so client knows its starting point
-            yield (
-                f"id: {event_bus.current_sequence}\n"
-                f"event: sync\n"
-                f"data: {{\"seq\": {event_bus.current_sequence}}}\n\n"
-            )
 
-            while True:
-                try:
-                    # 45s timeout gives comfortable headroom over warm-path transactions
-                    # (~10-20s). The warm-path debounce (T7) reduces firing frequency,
-                    # so 45s keepalive intervals are safe and prevent EventSource
-                    # disconnects during busy warm-path windows.
-                    event = await asyncio.wait_for(queue.get(), timeout=45.0)
-                    if event_bus.is_shutdown_event(event):
-                        return
-                    # Skip events already sent during replay (deduplication)
-                    seq = event.get("seq", 0)
-                    if seq and seq <= replayed_up_to:
+                # Send sync event with current sequence so client knows its starting point
+                yield (
+                    f"id: {event_bus.current_sequence}\n"
+                    f"event: sync\n"
+                    f"data: {{\"seq\": {event_bus.current_sequence}}}\n\n"
+                )
+
+                while True:
+                    events = cursor.drain()
+                    if events:
+                        yield "".join(evt.frame for evt in events)
                         continue
-                    event_type = event["event"]
-                    data = json.dumps(event["data"])
-                    yield f"id: {seq}\nevent: {event_type}\ndata: {data}\n\n"
-                except asyncio.TimeoutError:
-                    # SSE keepalive comment (ignored by EventSource, keeps connection alive)
-                    yield ": keepalive\n\n"
-                except asyncio.CancelledError:
-                    # Uvicorn's graceful shutdown timer expired — exit cleanly
-                    # instead of letting the CancelledError propagate through
-                    # StreamingResponse and produce an ASGI exception traceback.
-                    return
+                    if event_bus.is_shutting_down:
+                        return
+                    try:
+                        # 45s timeout gives comfortable headroom over warm-path transactions
+                        # (~10-20s). The warm-path debounce (T7) reduces firing frequency,
+                        # so 45s keepalive intervals are safe and prevent EventSource
+                        # disconnects during busy warm-path windows.
+                        if not await cursor.wait(timeout=_KEEPALIVE_SECONDS):
+                            # SSE keepalive comment (ignored by EventSource, keeps connection alive)
+                            yield ": keepalive\n\n"
+                    except asyncio.CancelledError:
+                        # Uvicorn's graceful shutdown timer expired — exit cleanly
+                        # instead of letting the CancelledError propagate through
+                        # StreamingResponse and produce an ASGI exception traceback.
+                        return
         finally:
-            event_bus._subscribers.discard(queue)
             logger.info("SSE subscriber disconnected")
 
     return StreamingResponse(
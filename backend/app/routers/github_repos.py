@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import PROMPTS_DIR
 from app.database import get_db
 from app.models import LinkedRepo, PromptCluster
+from app.providers.concurrency import Priority, llm_priority
 from app.routers.github_auth import _get_session_token
 from app.services.github_client import GitHubApiError, GitHubClient
 
@@ -39,8 +40,12 @@ def _spawn_bg_task(coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
     module-level ``_background_tasks`` set so the event loop can't GC
     it mid-flight. The ``add_done_callback`` removes the task after it
     finishes, regardless of exception state, so the set doesn't leak.
+
+    The task's context carries ``Priority.BACKGROUND`` so LLM calls it makes
+    (explore synthesis) yield to interactive requests.
     """
-    task = asyncio.create_task(coro)
+    with llm_priority(Priority.BACKGROUND):
+        task = asyncio.create_task(coro)
     _background_tasks.add(task)
     task.add_done_callback(_background_tasks.discard)
     return task
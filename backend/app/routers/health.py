@@ -98,9 +98,16 @@ class HealthResponse(BaseModel):
     qualifier_vocab: dict | None = Field(
         default=None, description="Organic qualifier vocabulary cache stats.",
     )
+    explore_cache: dict | None = Field(
+        default=None, description="Explore result cache exact/semantic hit and miss counts.",
+    )
     domain_lifecycle: dict | None = Field(
         default=None, description="Domain dissolution lifecycle stats.",
     )
+    worker: dict | None = Field(
+        default=None,
+        description="Answering worker's role (standalone/leader/follower) and event relay counters.",
+    )
     global_patterns: dict[str, int] = Field(default_factory=dict)
     legacy_state_observed: int = Field(
         default=0,
@@ -439,6 +446,14 @@ async def health_check(
     except Exception:
         pass
 
+    # Explore result cache stats (exact + semantic tiers)
+    explore_cache_stats: dict | None = None
+    try:
+        from app.services.codebase_explorer import _explore_cache
+        explore_cache_stats = _explore_cache.stats()
+    except Exception:
+        pass
+
     # Domain lifecycle stats
     domain_lifecycle_stats: dict | None = None
     try:
@@ -448,6 +463,12 @@ async def health_check(
     except Exception:
         pass
 
+    # Multi-worker role of the process answering this request
+    worker_stats: dict | None = None
+    _coordinator = getattr(request.app.state, "worker_coordinator", None)
+    if _coordinator is not None:
+        worker_stats = _coordinator.stats()
+
     # Diagnostic: legacy 'template' state observations in activity ring buffer
     legacy_state_observed: int = 0
     try:
@@ -494,7 +515,9 @@ async def health_check(
         recovery=recovery_metrics,
         classification_agreement=agreement_data,
         qualifier_vocab=qualifier_vocab_stats,
+        explore_cache=explore_cache_stats,
         domain_lifecycle=domain_lifecycle_stats,
+        worker=worker_stats,
         global_patterns={
             "active": gp_active,
             "demoted": gp_demoted,
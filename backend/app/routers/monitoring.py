@@ -17,7 +17,8 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel, Field
 
 from app.config import DATA_DIR
@@ -30,6 +31,8 @@ router = APIRouter(prefix="/api", tags=["monitoring"])
 _latency_cache: dict[str, Any] | None = None
 _latency_cache_time: float = 0.0
 _LATENCY_CACHE_TTL = 60.0  # seconds
+# Per trace file: (bytes parsed, durations by phase) for incremental refresh.
+_latency_files: dict[Path, tuple[int, dict[str, list[int]]]] = {}
 
 
 # ---------------------------------------------------------------------------
@@ -55,9 +58,28 @@ class MonitoringResponse(BaseModel):
         default_factory=dict,
         description="Per-phase LLM latency percentiles from trace data.",
     )
+    llm_concurrency: dict[str, Any] | None = Field(
+        default=None,
+        description="Shared provider concurrency controller state (limit, in-flight, per-priority queue waits).",
+    )
     timestamp: str = Field(description="ISO 8601 timestamp of this response.")
 
 
+class TraceResponse(BaseModel):
+    trace_id: str = Field(description="Requested trace ID.")
+    phases: list[dict[str, Any]] = Field(description="Trace entries for this ID, in write order.")
+    profile: dict[str, Any] | None = Field(
+        default=None,
+        description="Per-request cost breakdown (spans, CPU, DB statements, embeds) when profiling is enabled.",
+    )
+
+
+class TraceWindowResponse(BaseModel):
+    entries: list[dict[str, Any]] = Field(description="Trace entries in the window, oldest first.")
+    count: int = Field(description="Number of entries returned.")
+    truncated: bool = Field(description="True when more entries matched than `limit`.")
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -87,14 +109,49 @@ def _estimate_service_uptimes(pid_dir: Path) -> dict[str, float | None]:
     return uptimes
 
 
+def _scan_trace_durations(path: Path) -> dict[str, list[int]]:
+    """Per-phase durations in one trace file, parsing only bytes new since last call.
+
+    Trace files are append-only, so each file's parsed durations and the
+    byte offset they cover are kept between cache refreshes.
+    """
+    size = path.stat().st_size
+    consumed, durations = _latency_files.get(path, (0, {}))
+    if size < consumed:  # Truncated/replaced — start over
+        consumed, durations = 0, {}
+    if size > consumed:
+        with path.open("rb") as fh:
+            fh.seek(consumed)
+            chunk = fh.read(size - consumed)
+        complete = chunk.rfind(b"\n") + 1
+        for line in chunk[:complete].splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry.get("cached"):
+                continue  # response-cache hits aren't LLM latency
+            phase = entry.get("phase")
+            dur = entry.get("duration_ms")
+            if phase and isinstance(dur, (int, float)) and dur > 0:
+                durations.setdefault(phase, []).append(int(dur))
+        consumed += complete
+    _latency_files[path] = (consumed, durations)
+    return durations
+
+
 def _compute_latency_percentiles(
     traces_dir: Path,
     recent_days: int = 7,
 ) -> dict[str, LLMLatencyPercentiles]:
     """Compute p50 and p95 latency per phase from trace JSONL files.
 
-    Reads the last `recent_days` of trace files and groups duration_ms
-    by phase. Filters out duration_ms <= 0 (phantom/mock traces).
+    Reads the last `recent_days` of trace files (only the bytes appended
+    since the previous computation) and groups duration_ms by phase.
+    Filters out duration_ms <= 0 (phantom/mock traces) and entries served
+    from the LLM response cache.
     Uses stdlib statistics.quantiles for percentile computation.
     """
     global _latency_cache, _latency_cache_time  # noqa: PLW0603
@@ -108,6 +165,7 @@ def _compute_latency_percentiles(
     if not traces_dir.exists():
         return {}
 
+    in_window: set[Path] = set()
     for path in sorted(traces_dir.glob("traces-*.jsonl")):
         # Parse date from filename
         try:
@@ -118,21 +176,17 @@ def _compute_latency_percentiles(
         except ValueError:
             continue
 
+        in_window.add(path)
         try:
-            for line in path.read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                phase = entry.get("phase")
-                dur = entry.get("duration_ms")
-                if phase and isinstance(dur, (int, float)) and dur > 0:
-                    durations_by_phase.setdefault(phase, []).append(int(dur))
+            file_durations = _scan_trace_durations(path)
         except OSError:
             continue
+        for phase, durs in file_durations.items():
+            durations_by_phase.setdefault(phase, []).extend(durs)
+
+    # Files that aged out of the window (or were rotated) no longer need state.
+    for stale in set(_latency_files) - in_window:
+        del _latency_files[stale]
 
     result: dict[str, LLMLatencyPercentiles] = {}
     for phase, durations in durations_by_phase.items():
@@ -182,9 +236,87 @@ async def monitoring(request: Request) -> MonitoringResponse:
     # LLM latency percentiles from trace data
     latency = _compute_latency_percentiles(DATA_DIR / "traces")
 
+    from app.providers.concurrency import get_concurrency_controller
+
+    controller = get_concurrency_controller()
+
     return MonitoringResponse(
         uptime_seconds=service_uptimes,
         cold_start_ms=cold_start,
         llm_latency=latency,
+        llm_concurrency=controller.stats() if controller is not None else None,
         timestamp=datetime.now(UTC).isoformat(),
     )
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Prometheus text-format export of in-process latency histograms and gauges.
+
+    Histograms: pipeline phases, provider calls, embedding calls, request
+    DB sessions and warm-path phases. Gauges: event bus readers, LLM
+    concurrency limit / in-flight / queued, JSONL writer queue.
+    """
+    from app.services.metrics import registry
+
+    return PlainTextResponse(
+        registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+@router.get("/monitoring/llm-cache")
+async def llm_cache_stats() -> dict[str, Any]:
+    """LLM response cache hit/miss counts and size (``enabled=False`` when off)."""
+    from app.providers.response_cache import get_response_cache
+
+    cache = get_response_cache()
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+@router.delete("/monitoring/llm-cache")
+async def llm_cache_invalidate(model: str | None = None) -> dict[str, Any]:
+    """Drop cached LLM responses — all of them, or only those for ``model``."""
+    from app.providers.response_cache import get_response_cache
+
+    cache = get_response_cache()
+    if cache is None:
+        return {"enabled": False, "invalidated": 0}
+    return {"enabled": True, "invalidated": cache.invalidate(model=model)}
+
+
+@router.get("/monitoring/traces/{trace_id}")
+async def get_trace(trace_id: str) -> TraceResponse:
+    """Per-request trace drill-down: every logged phase for ``trace_id``."""
+    from app.services.trace_logger import TraceLogger
+
+    entries = await TraceLogger(DATA_DIR / "traces").aread_trace(trace_id)
+    if not entries:
+        raise HTTPException(status_code=404, detail="Trace not found.")
+    phases = [e for e in entries if e.get("phase") != "profile"]
+    profiles = [e["profile"] for e in entries if e.get("phase") == "profile" and "profile" in e]
+    return TraceResponse(
+        trace_id=trace_id, phases=phases, profile=profiles[-1] if profiles else None,
+    )
+
+
+@router.get("/monitoring/traces")
+async def list_traces(
+    since: datetime | None = Query(default=None, description="Window start (ISO 8601)."),
+    until: datetime | None = Query(default=None, description="Window end (ISO 8601)."),
+    limit: int = Query(default=200, ge=1, le=2000, description="Max entries returned."),
+) -> TraceWindowResponse:
+    """Trace entries logged in ``[since, until]`` (defaults: the last hour)."""
+    from app.services.trace_logger import TraceLogger
+
+    if since is None and until is None:
+        since = datetime.now(UTC) - timedelta(hours=1)
+    since = since.replace(tzinfo=UTC) if since and since.tzinfo is None else since
+    until = until.replace(tzinfo=UTC) if until and until.tzinfo is None else until
+    entries = await TraceLogger(DATA_DIR / "traces").aread_window(since, until, limit + 1)
+    return TraceWindowResponse(
+        entries=entries[:limit],
+        count=min(len(entries), limit),
+        truncated=len(entries) > limit,
+    )
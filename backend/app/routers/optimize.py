@@ -14,6 +14,7 @@ from app.config import PROMPTS_DIR, settings
 from app.database import get_db
 from app.dependencies.rate_limit import RateLimit
 from app.models import Optimization, OptimizationPattern
+from app.services import profiling
 from app.services.heuristic_suggestions import generate_heuristic_suggestions
 from app.services.passthrough import assemble_passthrough_prompt
 from app.services.pipeline import PipelineOrchestrator
@@ -124,6 +125,10 @@ async def optimize(
 
     effective_strategy = body.strategy or _prefs.get("defaults.strategy", prefs_snapshot) or "auto"
 
+    # Profile enrichment too — the pipeline joins this profile and writes it
+    # to the trace when the run finishes (no-op unless PROFILING_ENABLED).
+    profiling.begin("optimize")
+
     # Unified context enrichment
     context_service = getattr(request.app.state, "context_service", None)
     if not context_service:
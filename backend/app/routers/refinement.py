@@ -93,7 +93,10 @@ async def refine(
 
     logger.info("POST /api/refine: optimization_id=%s branch=%s", body.optimization_id, body.branch_id)
 
-    ref_svc = RefinementService(db=db, provider=provider, prompts_dir=PROMPTS_DIR)
+    speculator = getattr(request.app.state, "refinement_speculator", None)
+    ref_svc = RefinementService(
+        db=db, provider=provider, prompts_dir=PROMPTS_DIR, speculator=speculator,
+    )
 
     # Ensure initial turn exists
     versions = await ref_svc.get_versions(body.optimization_id)
@@ -142,14 +145,29 @@ async def refine(
                     pass
 
             from app.config import PROJECT_ROOT
-            enrichment = await context_service.enrich(
-                raw_prompt=opt.optimized_prompt or opt.raw_prompt,
-                tier=decision.tier,
-                db=db,
-                workspace_path=str(PROJECT_ROOT),
-                repo_full_name=_repo,
-                preferences_snapshot=prefs_snapshot,
-            )
+
+            async def _enrich():
+                return await context_service.enrich(
+                    raw_prompt=opt.optimized_prompt or opt.raw_prompt,
+                    tier=decision.tier,
+                    db=db,
+                    workspace_path=str(PROJECT_ROOT),
+                    repo_full_name=_repo,
+                    preferences_snapshot=prefs_snapshot,
+                )
+
+            # Every turn enriches the same optimization output — reuse the
+            # previous turn's context while inputs and preferences match.
+            if speculator is not None:
+                from app.services.refinement_speculation import speculation_key
+                enrichment = await speculator.get_or_run(
+                    speculation_key(
+                        "enrichment", opt.id, decision.tier, _repo, prefs_snapshot,
+                    ),
+                    _enrich,
+                )
+            else:
+                enrichment = await _enrich()
             _codebase_context = enrichment.codebase_context
             _strategy_intelligence = enrichment.strategy_intelligence
             _divergence_alerts = enrichment.divergence_alerts
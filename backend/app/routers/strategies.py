@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field
 
 from app.config import PROMPTS_DIR, settings
 from app.dependencies.rate_limit import RateLimit
+from app.services.config_cache import config_cache
 from app.services.strategy_loader import (
     StrategyLoader,
     _parse_frontmatter,
@@ -135,6 +136,10 @@ async def update_strategy(name: str, body: StrategyUpdate, request: Request) ->
         raise HTTPException(
             status_code=500, detail="Failed to save strategy.",
         ) from exc
+    finally:
+        # Visible to the next pipeline call without waiting for the watcher
+        config_cache.invalidate(path)
+        config_cache.invalidate(_strategies_dir / f"{name}.md")
 
     # Audit log
     try:
@@ -15,11 +15,16 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
+from sqlalchemy import bindparam
+from sqlalchemy import insert as sa_insert
 from sqlalchemy import select as sa_select
+from sqlalchemy import update as sa_update
 
 from app.config import DATA_DIR
-from app.models import Optimization, OptimizationPattern
+from app.models import Optimization, OptimizationEmbedding, OptimizationPattern
 from app.providers.base import LLMProvider, call_provider_with_retry
+from app.providers.concurrency import Priority, llm_priority
+from app.providers.response_cache import get_response_cache
 from app.schemas.pipeline_contracts import (
     DIMENSION_WEIGHTS,
     AnalysisResult,
@@ -56,7 +61,7 @@ from app.services.strategy_loader import StrategyLoader
 from app.services.taxonomy import get_engine
 from app.services.taxonomy.cluster_meta import write_meta
 from app.services.taxonomy.event_logger import get_event_logger
-from app.services.taxonomy.family_ops import assign_cluster
+from app.services.taxonomy.family_ops import BatchAssignItem, assign_clusters_batch
 from app.utils.text_cleanup import (
     sanitize_optimization_result,
     title_case_label,
@@ -81,6 +86,9 @@ ScoreDistribution = dict[str, dict[str, float | int]]
 
 logger = logging.getLogger(__name__)
 
+# Rows per INSERT executemany + commit in bulk_persist().
+_PERSIST_CHUNK_SIZE = 500
+
 
 @dataclass
 class PendingOptimization:
@@ -214,6 +222,7 @@ async def run_single_prompt(
             output_format=AnalysisResult,
             max_tokens=ANALYZE_MAX_TOKENS,
             effort=prefs.get("pipeline.analyzer_effort", prefs_snapshot) or "low",
+            response_cache=get_response_cache(),
         )
 
         # Semantic upgrade gate (matches pipeline.py)
@@ -437,6 +446,7 @@ async def run_single_prompt(
                 output_format=ScoreResult,
                 max_tokens=SCORE_MAX_TOKENS,
                 effort=prefs.get("pipeline.scorer_effort", prefs_snapshot) or "low",
+                response_cache=get_response_cache(),
             )
             llm_original = scores.prompt_a_scores if original_first else scores.prompt_b_scores
             llm_optimized = scores.prompt_b_scores if original_first else scores.prompt_a_scores
@@ -647,12 +657,12 @@ async def run_batch(
             logger.debug("Batch-level historical stats fetch failed: %s", _hs_exc)
 
     async def _run_with_semaphore(index: int, prompt: str) -> None:
-        # Rate limit (429) backoff: reduce semaphore by half on first 429, retry once
-        _rate_limited = False
+        # Rate limit (429) recovery: retry the prompt once after a pause.
+        # Throttling itself is the shared concurrency controller's job — each
+        # provider call inside already shrank its AIMD limit on the 429.
 
         async def _attempt() -> PendingOptimization:
-            nonlocal _rate_limited
-            result = await run_single_prompt(
+            kwargs: dict[str, Any] = dict(
                 raw_prompt=prompt,
                 provider=provider,
                 prompt_loader=prompt_loader,
@@ -669,41 +679,16 @@ async def run_batch(
                 context_service=context_service,
                 historical_stats=shared_stats,
             )
+            result = await run_single_prompt(**kwargs)
             # Check for rate limit error in result
             if (
                 result.status == "failed"
                 and result.error
                 and ("429" in result.error or "rate_limit" in result.error.lower())
-                and not _rate_limited
             ):
-                _rate_limited = True
-                logger.warning(
-                    "Rate limit hit on prompt %d — reducing concurrency and retrying", index
-                )
-                # Reduce effective parallelism by acquiring an extra slot
-                await semaphore.acquire()
-                try:
-                    await asyncio.sleep(5)
-                    retry = await run_single_prompt(
-                        raw_prompt=prompt,
-                        provider=provider,
-                        prompt_loader=prompt_loader,
-                        embedding_service=embedding_service,
-                        codebase_context=codebase_context,
-                        repo_full_name=repo_full_name,
-                        batch_id=batch_id,
-                        prompt_index=index,
-                        total_prompts=len(prompts),
-                        session_factory=session_factory,
-                        taxonomy_engine=taxonomy_engine,
-                        domain_resolver=domain_resolver,
-                        tier=tier,
-                        context_service=context_service,
-                        historical_stats=shared_stats,
-                    )
-                    return retry
-                finally:
-                    semaphore.release()
+                logger.warning("Rate limit hit on prompt %d — retrying once", index)
+                await asyncio.sleep(5)
+                return await run_single_prompt(**kwargs)
             return result
 
         async with semaphore:
@@ -757,10 +742,13 @@ async def run_batch(
             if on_progress:
                 on_progress(index, len(prompts), result)
 
-    await asyncio.gather(
-        *[_run_with_semaphore(i, p) for i, p in enumerate(prompts)],
-        return_exceptions=True,
-    )
+    # Seed batches yield to interactive requests on the shared provider
+    # concurrency budget; tasks inherit the priority from this context.
+    with llm_priority(Priority.BATCH):
+        await asyncio.gather(
+            *[_run_with_semaphore(i, p) for i, p in enumerate(prompts)],
+            return_exceptions=True,
+        )
 
     # Stamp project_id on all completed results (resolve once, not per-prompt)
     _, _batch_project_id = await resolve_repo_project(repo_full_name)
@@ -772,16 +760,74 @@ async def run_batch(
     return [r for r in results if r is not None]
 
 
+def _optimization_row(pending: PendingOptimization) -> dict[str, Any]:
+    """Column mapping for one ``Optimization`` row (bulk INSERT parameters)."""
+    return {
+        "id": pending.id,
+        "trace_id": pending.trace_id,
+        "raw_prompt": pending.raw_prompt,
+        "optimized_prompt": pending.optimized_prompt,
+        "task_type": pending.task_type,
+        "strategy_used": pending.strategy_used,
+        "changes_summary": pending.changes_summary,
+        "score_clarity": pending.score_clarity,
+        "score_specificity": pending.score_specificity,
+        "score_structure": pending.score_structure,
+        "score_faithfulness": pending.score_faithfulness,
+        "score_conciseness": pending.score_conciseness,
+        "overall_score": pending.overall_score,
+        "improvement_score": pending.improvement_score,
+        "scoring_mode": pending.scoring_mode,
+        "intent_label": pending.intent_label,
+        "domain": pending.domain,
+        "domain_raw": pending.domain_raw,
+        "models_by_phase": pending.models_by_phase,
+        "original_scores": pending.original_scores,
+        "score_deltas": pending.score_deltas,
+        "duration_ms": pending.duration_ms,
+        "status": pending.status,
+        "provider": pending.provider,
+        "model_used": pending.model_used,
+        "routing_tier": pending.routing_tier,
+        "heuristic_flags": pending.heuristic_flags,
+        "suggestions": pending.suggestions,
+        "repo_full_name": pending.repo_full_name,
+        "project_id": pending.project_id,
+        "context_sources": pending.context_sources,
+    }
+
+
+def _embedding_row(pending: PendingOptimization) -> dict[str, Any] | None:
+    """``OptimizationEmbedding`` parameters for one row, or None without vectors."""
+    if (
+        pending.embedding is None
+        and pending.optimized_embedding is None
+        and pending.transformation_embedding is None
+    ):
+        return None
+    return {
+        "optimization_id": pending.id,
+        "embedding": pending.embedding,
+        "optimized_embedding": pending.optimized_embedding,
+        "transformation_embedding": pending.transformation_embedding,
+    }
+
+
 async def bulk_persist(
     results: list[PendingOptimization],
     session_factory: SessionFactory,
     batch_id: str,
 ) -> int:
-    """Persist all completed optimizations in a single transaction.
+    """Persist all completed optimizations via chunked bulk INSERTs.
+
+    Rows go in as one executemany INSERT per ``_PERSIST_CHUNK_SIZE`` chunk,
+    each chunk committed on its own, and a single ``optimization_batch_created``
+    event is published for the whole call.
 
     Returns count of rows inserted. Skips failed optimizations.
     Idempotent: skips prompts already persisted for this batch_id.
-    Includes retry logic — one retry after 5s on transient failures.
+    Includes retry logic — one retry after 5s on transient failures; chunks
+    committed before the failure are picked up by the idempotency check.
     """
     t0 = time.monotonic()
     # Quality gate: filter out low-quality seeds before persisting.
@@ -807,8 +853,8 @@ async def bulk_persist(
     if not completed:
         return 0
 
-    inserted = 0
     inserted_pendings: list[PendingOptimization] = []
+    committed_ids: set[str] = set()
     for attempt in range(2):
         try:
             async with session_factory() as db:
@@ -821,57 +867,34 @@ async def bulk_persist(
                     )
                 )
                 existing_ids: set[str] = {row[0] for row in existing_ids_result}
-                inserted = 0  # Reset for retry
-                inserted_pendings = []  # Reset for retry
+                to_insert: list[PendingOptimization] = []
                 for pending in completed:
+                    if pending.id in committed_ids:
+                        continue  # Committed by an earlier chunk of this call
                     if pending.id in existing_ids:
                         logger.debug(
                             "Skipping already-persisted optimization %s (batch_id=%s)",
                             pending.id[:8], batch_id,
                         )
                         continue
+                    to_insert.append(pending)
 
-                    db_opt = Optimization(
-                        id=pending.id,
-                        trace_id=pending.trace_id,
-                        raw_prompt=pending.raw_prompt,
-                        optimized_prompt=pending.optimized_prompt,
-                        task_type=pending.task_type,
-                        strategy_used=pending.strategy_used,
-                        changes_summary=pending.changes_summary,
-                        score_clarity=pending.score_clarity,
-                        score_specificity=pending.score_specificity,
-                        score_structure=pending.score_structure,
-                        score_faithfulness=pending.score_faithfulness,
-                        score_conciseness=pending.score_conciseness,
-                        overall_score=pending.overall_score,
-                        improvement_score=pending.improvement_score,
-                        scoring_mode=pending.scoring_mode,
-                        intent_label=pending.intent_label,
-                        domain=pending.domain,
-                        domain_raw=pending.domain_raw,
-                        embedding=pending.embedding,
-                        optimized_embedding=pending.optimized_embedding,
-                        transformation_embedding=pending.transformation_embedding,
-                        models_by_phase=pending.models_by_phase,
-                        original_scores=pending.original_scores,
-                        score_deltas=pending.score_deltas,
-                        duration_ms=pending.duration_ms,
-                        status=pending.status,
-                        provider=pending.provider,
-                        model_used=pending.model_used,
-                        routing_tier=pending.routing_tier,
-                        heuristic_flags=pending.heuristic_flags,
-                        suggestions=pending.suggestions,
-                        repo_full_name=pending.repo_full_name,
-                        project_id=pending.project_id,
-                        context_sources=pending.context_sources,
+                for i in range(0, len(to_insert), _PERSIST_CHUNK_SIZE):
+                    chunk = to_insert[i:i + _PERSIST_CHUNK_SIZE]
+                    await db.execute(
+                        sa_insert(Optimization),
+                        [_optimization_row(p) for p in chunk],
                     )
-                    db.add(db_opt)
-                    inserted += 1
-                    inserted_pendings.append(pending)
-
-                await db.commit()
+                    vector_rows = [
+                        row for row in map(_embedding_row, chunk) if row is not None
+                    ]
+                    if vector_rows:
+                        await db.execute(
+                            sa_insert(OptimizationEmbedding), vector_rows,
+                        )
+                    await db.commit()
+                    committed_ids.update(p.id for p in chunk)
+                    inserted_pendings.extend(chunk)
             break  # success
         except Exception as exc:
             if attempt == 0:
@@ -879,30 +902,38 @@ async def bulk_persist(
                 await asyncio.sleep(5)
             else:
                 raise
-
-    # Per-prompt event emission — parallels the regular pipeline contract so
-    # frontend history refresh and cross-process MCP bridge fire reliably.
-    # `source="batch_seed"` lets consumers distinguish seed-originated rows
-    # from text-editor optimizations while batch-level `seed_*` events still
-    # stream the coarser batch progress view.
+    inserted = len(inserted_pendings)
+
+    # One aggregated event per call instead of one per row — a seed batch of
+    # thousands would otherwise flood every SSE subscriber and the history
+    # refresh. ``optimizations`` carries the per-row payload (same fields as
+    # the regular pipeline's ``optimization_created``) for listeners that
+    # need ids. Cluster assignment for these rows is done in-batch by
+    # batch_taxonomy_assign(); the app's taxonomy listener still walks the
+    # ids for the per-cluster follow-ups (promotion, strategy affinity).
     if inserted_pendings:
         try:
-            for pending in inserted_pendings:
-                event_bus.publish("optimization_created", {
-                    "id": pending.id,
-                    "trace_id": pending.trace_id,
-                    "task_type": pending.task_type,
-                    "intent_label": pending.intent_label or "general",
-                    "domain": pending.domain,
-                    "domain_raw": pending.domain_raw,
-                    "strategy_used": pending.strategy_used,
-                    "overall_score": pending.overall_score,
-                    "provider": pending.provider,
-                    "status": pending.status,
-                    "routing_tier": pending.routing_tier,
-                    "source": "batch_seed",
-                    "batch_id": batch_id,
-                })
+            event_bus.publish("optimization_batch_created", {
+                "batch_id": batch_id,
+                "source": "batch_seed",
+                "count": inserted,
+                "optimizations": [
+                    {
+                        "id": pending.id,
+                        "trace_id": pending.trace_id,
+                        "task_type": pending.task_type,
+                        "intent_label": pending.intent_label or "general",
+                        "domain": pending.domain,
+                        "domain_raw": pending.domain_raw,
+                        "strategy_used": pending.strategy_used,
+                        "overall_score": pending.overall_score,
+                        "provider": pending.provider,
+                        "status": pending.status,
+                        "routing_tier": pending.routing_tier,
+                    }
+                    for pending in inserted_pendings
+                ],
+            })
         except Exception:
             logger.debug("Event bus publish failed", exc_info=True)
 
@@ -932,6 +963,11 @@ async def batch_taxonomy_assign(
 ) -> dict[str, Any]:
     """Assign clusters for all persisted optimizations in one transaction.
 
+    Works from the in-memory ``PendingOptimization`` results rather than
+    re-reading each row. Clusters are assigned in one vectorized pass by
+    :func:`assign_clusters_batch`; ``cluster_id`` write-backs go out as one
+    bulk UPDATE and the ``OptimizationPattern`` join rows as one bulk INSERT.
+
     Pattern extraction is deferred (pattern_stale=True) — the warm path
     handles it after the batch completes.
 
@@ -946,56 +982,65 @@ async def batch_taxonomy_assign(
         return {"clusters_assigned": 0, "clusters_created": 0, "domains_touched": []}
 
     engine = get_engine()
-    assigned = 0
+    items: list[BatchAssignItem] = []
+    kept: list[PendingOptimization] = []
+    for pending in completed:
+        try:
+            embedding = np.frombuffer(pending.embedding, dtype=np.float32)  # type: ignore[arg-type]
+        except (ValueError, TypeError) as exc:
+            logger.warning("Taxonomy assign skipped %s: %s", pending.id[:8], exc)
+            continue
+        items.append(BatchAssignItem(
+            embedding=embedding,
+            label=pending.intent_label or "general",
+            domain=pending.domain or "general",
+            task_type=pending.task_type or "general",
+            overall_score=pending.overall_score,
+        ))
+        kept.append(pending)
 
     async with session_factory() as db:
-        for pending in completed:
-            try:
-                embedding = np.frombuffer(pending.embedding, dtype=np.float32)  # type: ignore[arg-type]
-                cluster = await assign_cluster(
-                    db=db,
-                    embedding=embedding,
-                    label=pending.intent_label or "general",
-                    domain=pending.domain or "general",
-                    task_type=pending.task_type or "general",
-                    overall_score=pending.overall_score,
-                    embedding_index=engine._embedding_index,
-                )
-
-                # Write cluster_id back to the Optimization row (matches engine.py hot path)
-                opt_row = await db.execute(
-                    sa_select(Optimization).where(Optimization.id == pending.id)
-                )
-                opt = opt_row.scalar_one_or_none()
-                if opt is not None:
-                    opt.cluster_id = cluster.id
-
-                # Create OptimizationPattern join record so downstream consumers
-                # (history, detail view, lifecycle, pattern injection) can find this
-                # optimization's cluster. Matches engine.py hot path step 5.
-                db.add(OptimizationPattern(
-                    optimization_id=pending.id,
-                    cluster_id=cluster.id,
-                    relationship="source",
-                ))
-
-                # Track what was created
-                if cluster.member_count == 1:
-                    clusters_created += 1
-                domains_touched.add(pending.domain or "general")
-                assigned += 1
-
-                # Defer pattern extraction to warm path
-                cluster.cluster_metadata = write_meta(
-                    cluster.cluster_metadata, pattern_stale=True,
-                )
-
-            except Exception as exc:
-                logger.warning(
-                    "Taxonomy assign failed for %s: %s",
-                    pending.id[:8], exc,
-                )
+        # One vectorized pass scores every embedding against every centroid
+        # and writes each touched cluster once (see assign_clusters_batch).
+        batch = await assign_clusters_batch(
+            db, items, embedding_index=engine._embedding_index,
+        )
+        clusters_created = len(batch.created)
+        # Items assign_clusters_batch could not place stay unassigned, as
+        # with a failed per-item assign_cluster() call.
+        placed = [(p, c) for p, c in zip(kept, batch.clusters) if c is not None]
+
+        # cluster_id write-back (matches engine.py hot path) and the
+        # OptimizationPattern join record so downstream consumers (history,
+        # detail view, lifecycle, pattern injection) can find this
+        # optimization's cluster. Matches engine.py hot path step 5.
+        cluster_updates = [
+            {"opt_id": p.id, "new_cluster_id": c.id} for p, c in placed
+        ]
+        join_rows = [
+            {"optimization_id": p.id, "cluster_id": c.id, "relationship": "source"}
+            for p, c in placed
+        ]
+        domains_touched.update(p.domain or "general" for p, _ in placed)
+        assigned = len(placed)
+
+        # Defer pattern extraction to warm path
+        for cluster in {c.id: c for _, c in placed}.values():
+            cluster.cluster_metadata = write_meta(
+                cluster.cluster_metadata, pattern_stale=True,
+            )
 
+        if cluster_updates:
+            # Core executemany (not ORM bulk-by-PK): rows the quality gate kept
+            # out of bulk_persist simply match nothing.
+            opt_table = Optimization.__table__
+            await db.execute(
+                sa_update(opt_table)
+                .where(opt_table.c.id == bindparam("opt_id"))
+                .values(cluster_id=bindparam("new_cluster_id")),
+                cluster_updates,
+            )
+            await db.execute(sa_insert(OptimizationPattern), join_rows)
         await db.commit()
 
     duration_ms = int((time.monotonic() - t0) * 1000)
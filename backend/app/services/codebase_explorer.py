@@ -114,6 +114,28 @@ class CodebaseExplorer:
             logger.info("Explore cache hit for %s@%s (SHA=%s)", repo_full_name, branch, head_sha[:8])
             return cached
 
+        # Semantic tier: a rephrased prompt on the same HEAD reuses the
+        # closest prior synthesis.  The prompt embedding is kept for
+        # ranking and for storing alongside the new result.
+        query_vec: np.ndarray | None = None
+        if settings.EXPLORE_SEMANTIC_CACHE_ENABLED:
+            try:
+                query_vec = await self._es.aembed_single(raw_prompt)
+            except Exception:
+                logger.debug("Explore semantic cache: prompt embedding failed", exc_info=True)
+            if query_vec is not None:
+                similar = _explore_cache.get_similar(
+                    _explore_cache.build_scope(repo_full_name, branch, head_sha),
+                    query_vec,
+                    settings.EXPLORE_SEMANTIC_CACHE_THRESHOLD,
+                )
+                if similar is not None:
+                    logger.info(
+                        "Explore semantic cache hit for %s@%s (SHA=%s, sim=%.3f)",
+                        repo_full_name, branch, head_sha[:8], similar[1],
+                    )
+                    return similar[0]
+
         # 2. Filter to indexable files — shared filter with repo_index_service
         # so explore + embedded corpus exclude the same test/CI/lock files.
         indexable = [
@@ -122,7 +144,9 @@ class CodebaseExplorer:
         ]
 
         # 3. Rank files: semantic search or keyword fallback
-        ranked_paths = await self._rank_files(raw_prompt, indexable, repo_full_name, branch)
+        ranked_paths = await self._rank_files(
+            raw_prompt, indexable, repo_full_name, branch, query_vec=query_vec,
+        )
 
         # 4. Cap at EXPLORE_MAX_FILES
         max_files = settings.EXPLORE_MAX_FILES
@@ -234,7 +258,7 @@ class CodebaseExplorer:
         )
 
         # Cache the result
-        _explore_cache.set(cache_key, result.context)
+        _explore_cache.set(cache_key, result.context, embedding=query_vec)
 
         return result.context
 
@@ -244,9 +268,12 @@ class CodebaseExplorer:
         tree_items: list[dict],
         repo_full_name: str | None = None,
         branch: str | None = None,
+        query_vec: np.ndarray | None = None,
     ) -> list[str]:
         """Rank files by semantic similarity using index embeddings when available.
 
+        ``query_vec`` reuses an already-computed prompt embedding.
+
         Fallback cascade:
         1. Query pre-computed RepoFileIndex embeddings (richer: path+content)
         2. Path-embed files missing from the index (added after last indexing)
@@ -258,7 +285,8 @@ class CodebaseExplorer:
         source = "keyword"  # tracks which path was taken for the final log
 
         try:
-            query_vec = await self._es.aembed_single(raw_prompt)
+            if query_vec is None:
+                query_vec = await self._es.aembed_single(raw_prompt)
 
             # Try index embeddings first
             index_vecs: dict[str, np.ndarray] = {}
@@ -0,0 +1,212 @@
+"""In-memory cache for parsed configuration files.
+
+Prompt templates, strategy files and ``preferences.json`` are read on
+every optimization, often several times per request. ``ConfigFileCache``
+keeps their parsed form in memory so the hot path does no filesystem I/O.
+
+Two invalidation modes:
+
+* **Watched** — paths under a root registered with ``watch()`` are served
+  straight from memory. ``watch_config_files()`` in ``file_watcher``
+  registers the prompts directory and ``preferences.json`` and calls
+  ``invalidate()`` for every change it sees.
+* **Stat fallback** — everything else (the MCP server, CLI tools, tests)
+  is revalidated with one ``os.stat()`` against the cached mtime, size
+  and inode. Entries whose mtime is too close to the read time to be
+  trusted are re-read until the file settles, since coarse filesystem
+  timestamps can hide a same-size rewrite.
+
+In-process writers (``PreferencesService._write``, ``PUT /api/strategies``)
+invalidate their own paths, so a write is visible to the next read even
+before the watcher reports it.
+
+Copyright 2025-2026 Project Synthesis contributors.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# A file modified within this window of being read may change again
+# without moving its (coarse) mtime — don't trust its stat signature yet.
+_RACY_WINDOW_NS = 2_000_000_000
+
+_Signature = tuple[int, int, int]
+
+
+@dataclass
+class _Entry:
+    value: Any
+    signature: _Signature | None  # None: the path did not exist
+    racy: bool
+
+
+def _key(path: Path | str) -> str:
+    return os.path.abspath(path)
+
+
+def _stat(path: str) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def _signature(st: os.stat_result | None) -> _Signature | None:
+    if st is None:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _is_racy(st: os.stat_result | None) -> bool:
+    return st is not None and time.time_ns() - st.st_mtime_ns < _RACY_WINDOW_NS
+
+
+class ConfigFileCache:
+    """Parsed-file and directory-listing cache with watcher or stat invalidation."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._files: dict[tuple[str, Callable[[str], Any] | None], _Entry] = {}
+        self._listings: dict[tuple[str, str], _Entry] = {}
+        self._watched: set[str] = set()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    # ── watch registration ──────────────────────────────────────
+
+    def watch(self, root: Path | str) -> None:
+        """Trust cached entries at or under *root* until ``invalidate()``."""
+        key = _key(root)
+        with self._lock:
+            self._watched.add(key)
+        self.invalidate(key)
+
+    def unwatch(self, root: Path | str) -> None:
+        """Return *root* to stat-validated mode (watcher stopped or failed)."""
+        with self._lock:
+            self._watched.discard(_key(root))
+
+    def _is_watched(self, key: str) -> bool:
+        return any(key == root or key.startswith(root + os.sep) for root in self._watched)
+
+    # ── reads ───────────────────────────────────────────────────
+
+    def read(self, path: Path | str, parse: Callable[[str], Any] | None = None) -> Any:
+        """Return ``parse(text)`` for the UTF-8 file at *path*, or ``None`` if missing.
+
+        *parse* defaults to returning the raw text. Results are cached per
+        ``(path, parse)``; read and parse errors propagate and are not cached.
+        Cached values are shared — callers must not mutate them.
+        """
+        key = _key(path)
+        cache_key = (key, parse)
+        with self._lock:
+            entry = self._files.get(cache_key)
+            watched = self._is_watched(key)
+            generation = self._generation
+        if entry is not None:
+            if watched and not entry.racy:
+                self.hits += 1
+                return entry.value
+            st = _stat(key)
+            if not entry.racy and _signature(st) == entry.signature:
+                self.hits += 1
+                return entry.value
+
+        self.misses += 1
+        st = _stat(key)
+        if st is None:
+            value = None
+        else:
+            text = Path(key).read_text(encoding="utf-8")
+            value = parse(text) if parse is not None else text
+        self._store(self._files, cache_key, _Entry(value, _signature(st), _is_racy(st)), generation)
+        return value
+
+    def listdir(self, directory: Path | str, suffix: str) -> list[str] | None:
+        """Sorted stems of the *suffix* files in *directory*, or ``None`` if it is missing.
+
+        Validated against the directory's own mtime, which moves whenever
+        a file is created, deleted or renamed in it.
+        """
+        key = _key(directory)
+        cache_key = (key, suffix)
+        with self._lock:
+            entry = self._listings.get(cache_key)
+            watched = self._is_watched(key)
+            generation = self._generation
+        if entry is not None:
+            if watched and not entry.racy:
+                self.hits += 1
+                return list(entry.value) if entry.value is not None else None
+            st = _stat(key)
+            if not entry.racy and _signature(st) == entry.signature:
+                self.hits += 1
+                return list(entry.value) if entry.value is not None else None
+
+        self.misses += 1
+        st = _stat(key)
+        if st is None or not os.path.isdir(key):
+            stems = None
+        else:
+            stems = sorted(
+                name[: -len(suffix)]
+                for name in os.listdir(key)
+                if name.endswith(suffix) and os.path.isfile(os.path.join(key, name))
+            )
+        self._store(self._listings, cache_key, _Entry(stems, _signature(st), _is_racy(st)), generation)
+        return list(stems) if stems is not None else None
+
+    def _store(self, table: dict, cache_key: tuple, entry: _Entry, generation: int) -> None:
+        with self._lock:
+            # An invalidate() raced with this read — the value may be stale.
+            if generation == self._generation:
+                table[cache_key] = entry
+
+    # ── invalidation ────────────────────────────────────────────
+
+    def invalidate(self, path: Path | str | None = None) -> None:
+        """Drop entries for *path*, anything under it and its parent listing.
+
+        With no argument, drops everything.
+        """
+        with self._lock:
+            self._generation += 1
+            if path is None:
+                self._files.clear()
+                self._listings.clear()
+                return
+            key = _key(path)
+            parent = os.path.dirname(key)
+
+            def affected(entry_path: str) -> bool:
+                return entry_path == key or entry_path.startswith(key + os.sep)
+
+            for cache_key in [k for k in self._files if affected(k[0])]:
+                del self._files[cache_key]
+            for cache_key in [k for k in self._listings if affected(k[0]) or k[0] == parent]:
+                del self._listings[cache_key]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "files": len(self._files),
+                "listings": len(self._listings),
+                "watched_roots": len(self._watched),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+config_cache = ConfigFileCache()
@@ -13,8 +13,12 @@ Copyright 2025-2026 Project Synthesis contributors.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from types import MappingProxyType
@@ -23,6 +27,7 @@ from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
+from app.services import profiling
 from app.services.heuristic_analyzer import HeuristicAnalysis, HeuristicAnalyzer
 from app.services.workspace_intelligence import WorkspaceIntelligence
 
@@ -693,12 +698,17 @@ class ContextEnrichmentService:
         heuristic_analyzer: HeuristicAnalyzer,
         github_client: Any,              # GitHubClient
         taxonomy_engine: Any | None = None,
+        session_factory: Any | None = None,  # async_sessionmaker
     ) -> None:
         self._workspace_intel = workspace_intel
         self._embedding_service = embedding_service
         self._heuristic_analyzer = heuristic_analyzer
         self._github_client = github_client
         self._taxonomy_engine = taxonomy_engine
+        # When set, each DB-bound enrichment source opens its own session so
+        # sources genuinely overlap.  Without it they share the caller's
+        # session and are serialized around it.
+        self._session_factory = session_factory
 
     @staticmethod
     def _should_skip_curated(task_type: str, raw_prompt: str) -> tuple[bool, str | None]:
@@ -716,6 +726,7 @@ class ContextEnrichmentService:
                 return False, None
         return True, f"task_type={task_type}, no code keywords detected"
 
+    @profiling.traced("enrichment")
     async def enrich(
         self,
         raw_prompt: str,
@@ -735,6 +746,13 @@ class ContextEnrichmentService:
         layers are activated — cold_start skips strategy intelligence and patterns;
         knowledge_work skips codebase context.
 
+        Sources run in two concurrent waves: (1) heuristic analysis, history
+        depth and the cached explore synthesis; (2) codebase context (relevance
+        gate → curated retrieval / workspace guidance), strategy intelligence
+        and applied patterns.  Each source runs under its own deadline from
+        ``ENRICHMENT_SOURCE_BUDGETS`` and degrades to empty on timeout or
+        error.  Per-source timings land in ``enrichment_meta["source_timings"]``.
+
         ``preferences_snapshot``, when provided, gates optional layers:
         - ``enable_strategy_intelligence``: if ``False``, skip strategy intelligence.
 
@@ -742,55 +760,85 @@ class ContextEnrichmentService:
         ``MAX_CODEBASE_CONTEXT_CHARS``; ``strategy_intelligence`` at
         ``MAX_STRATEGY_INTELLIGENCE_CHARS``.
         """
-        import time as _time
-        _t_enrich_start = _time.monotonic()
+        _t_enrich_start = time.monotonic()
         prefs = preferences_snapshot or {}
-
-        # 1. Analysis — heuristic (zero-LLM) for all tiers.
-        #    Passthrough uses this as the primary analysis. Internal/sampling
-        #    tiers use it only for domain detection in curated retrieval
-        #    (the LLM analyze phase runs later with richer classification).
-        analysis: HeuristicAnalysis | None = None
-        task_type: str | None = None
+        source_timings: dict[str, dict[str, Any]] = {}
+        # Serializes access to the caller's session when no session factory
+        # is configured — an AsyncSession must never be used concurrently.
+        db_lock = asyncio.Lock()
+
+        # 1. Wave 1 — heuristic analysis, history depth, explore synthesis.
+        #    Heuristic (zero-LLM) analysis runs for all tiers.  Passthrough
+        #    uses it as the primary analysis. Internal/sampling tiers use it
+        #    only for domain detection in curated retrieval (the LLM analyze
+        #    phase runs later with richer classification).
         _enable_llm_fallback = prefs.get("enable_llm_classification_fallback", True)
-        try:
-            analysis = await self._heuristic_analyzer.analyze(
-                raw_prompt, db, enable_llm_fallback=_enable_llm_fallback,
-            )
-            task_type = analysis.task_type
-        except Exception:
-            logger.debug("Heuristic analysis failed during enrichment", exc_info=True)
+
+        async def _analyze() -> HeuristicAnalysis:
+            async with self._db_scope(db, db_lock) as session:
+                return await self._heuristic_analyzer.analyze(
+                    raw_prompt, session, enable_llm_fallback=_enable_llm_fallback,
+                )
+
+        async def _count_optimizations() -> int:
+            from sqlalchemy import func
+            from sqlalchemy import select as _sel_count
+
+            from app.models import Optimization
+            async with self._db_scope(db, db_lock) as session:
+                _count_q = await session.execute(
+                    _sel_count(func.count()).select_from(Optimization)
+                )
+                return _count_q.scalar() or 0
+
+        async def _repo_synthesis() -> tuple[str, str | None]:
+            # Resolve branch from LinkedRepo if not explicitly provided, then
+            # load the cached synthesis.  The synthesis feeds both the codebase
+            # layer and divergence detection, so it is fetched for every
+            # linked-repo request regardless of profile.
+            async with self._db_scope(db, db_lock) as session:
+                branch = repo_branch or await self._resolve_repo_branch(
+                    repo_full_name, session,  # type: ignore[arg-type]
+                )
+                synthesis = await self._get_explore_synthesis(
+                    repo_full_name, branch, session,  # type: ignore[arg-type]
+                )
+                return branch, synthesis
+
+        async def _no_repo() -> tuple[str, str | None]:
+            return repo_branch or "main", None
+
+        analysis, opt_count, (branch, explore_synthesis) = await asyncio.gather(
+            self._run_source(
+                "heuristic_analysis", _analyze, default=None, timings=source_timings,
+            ),
+            self._run_source(
+                "optimization_count", _count_optimizations, default=0, timings=source_timings,
+            ),
+            self._run_source(
+                "explore_synthesis", _repo_synthesis,
+                default=(repo_branch or "main", None), timings=source_timings,
+            ) if repo_full_name else _no_repo(),
+        )
+        if analysis is None:
             analysis = HeuristicAnalysis(
                 task_type="general", domain="general",
                 intent_label="general optimization", confidence=0.0,
             )
-            task_type = "general"
+        task_type: str = analysis.task_type
 
         # 1a. Track disambiguation, LLM fallback, and domain signals for observability
-        if analysis and analysis.disambiguation_applied:
+        if analysis.disambiguation_applied:
             _disambiguation_info = {
                 "original_task_type": analysis.disambiguation_from,
                 "corrected_to": analysis.task_type,
             }
         else:
             _disambiguation_info = None
-        _llm_fallback = analysis.llm_fallback_applied if analysis else False
+        _llm_fallback = analysis.llm_fallback_applied
 
         # 1b. Enrichment profile selection — determines which layers to activate.
         #     Pure function of observable state: task_type, repo link, history depth.
-        opt_count = 0
-        try:
-            from sqlalchemy import func
-            from sqlalchemy import select as _sel_count
-
-            from app.models import Optimization
-            _count_q = await db.execute(
-                _sel_count(func.count()).select_from(Optimization)
-            )
-            opt_count = _count_q.scalar() or 0
-        except Exception:
-            logger.debug("Optimization count query failed, defaulting to 0")
-
         profile = select_enrichment_profile(
             task_type or "general",
             repo_full_name is not None,
@@ -799,16 +847,38 @@ class ContextEnrichmentService:
         enrichment_meta_dict: dict[str, Any] = {"enrichment_profile": profile}
         if _disambiguation_info:
             enrichment_meta_dict["heuristic_disambiguation"] = _disambiguation_info
-        if analysis and analysis.domain_scores:
+        if analysis.domain_scores:
             enrichment_meta_dict["domain_signals"] = analysis.domain_scores
         if _llm_fallback:
             enrichment_meta_dict["llm_classification_fallback"] = True
-        if analysis:
-            enrichment_meta_dict["task_type_signal_source"] = analysis.task_type_signal_source
-            if analysis.task_type_scores:
-                enrichment_meta_dict["task_type_scores"] = analysis.task_type_scores
+        enrichment_meta_dict["task_type_signal_source"] = analysis.task_type_signal_source
+        if analysis.task_type_scores:
+            enrichment_meta_dict["task_type_scores"] = analysis.task_type_scores
         skipped_layers: list[str] = []
 
+        # Layer gating is decided up-front so wave 2 only launches the
+        # sources this profile actually needs.
+        skip_codebase = profile == PROFILE_KNOWLEDGE_WORK
+        if skip_codebase:
+            skipped_layers.append("codebase_context")
+        effective_task_type = task_type or "general"
+        run_si = False
+        if profile == PROFILE_COLD_START:
+            skipped_layers.append("strategy_intelligence")
+        else:
+            run_si = bool(prefs.get("enable_strategy_intelligence", True))
+        run_patterns = False
+        if profile == PROFILE_COLD_START:
+            skipped_layers.append("applied_patterns")
+        elif tier in ("internal", "sampling"):
+            # Internal/sampling tiers skip enrichment-level patterns because
+            # their pipelines call auto_inject_patterns() directly with
+            # provenance recording.
+            skipped_layers.append("applied_patterns")
+            enrichment_meta_dict["patterns_deferred_to_pipeline"] = True
+        else:
+            run_patterns = True
+
         # 2. Codebase context — unified layer combining three sources:
         #    (a) Cached Haiku synthesis (architectural overview)
         #    (b) Per-prompt curated retrieval (task-gated)
@@ -818,51 +888,49 @@ class ContextEnrichmentService:
         #    linked — it detects tech stack from manifests, which synthesis
         #    already covers. It only has unique value when IDE is connected
         #    without a repo (MCP roots or filesystem path).
-        codebase_context: str | None = None
-        skip_codebase = profile == PROFILE_KNOWLEDGE_WORK
-        if skip_codebase:
-            skipped_layers.append("codebase_context")
-        if repo_full_name and not skip_codebase:
-            # Resolve branch from LinkedRepo if not explicitly provided
-            if not repo_branch:
-                try:
-                    from sqlalchemy import select as _sel_br
-
-                    from app.models import LinkedRepo
-                    _lr_q = await db.execute(
-                        _sel_br(LinkedRepo).where(
-                            LinkedRepo.full_name == repo_full_name,
-                        ).limit(1)
-                    )
-                    _lr = _lr_q.scalar_one_or_none()
-                    repo_branch = (_lr.branch or _lr.default_branch) if _lr else "main"
-                except Exception:
-                    repo_branch = "main"
-            branch = repo_branch
+        async def _codebase() -> str | None:
+            if skip_codebase:
+                return None
+            if not repo_full_name:
+                # No repo linked — workspace guidance is the only codebase context source
+                ws_guidance = await self._run_source(
+                    "workspace_guidance",
+                    lambda: self._resolve_workspace_guidance(mcp_ctx, workspace_path),
+                    default=None, timings=source_timings,
+                )
+                if ws_guidance:
+                    enrichment_meta_dict["workspace_as_fallback"] = True
+                return ws_guidance
 
+            synthesis = explore_synthesis
             enrichment_meta_dict["repo_full_name"] = repo_full_name
             enrichment_meta_dict["repo_branch"] = branch
-
-            # 2a. Cached explore synthesis (architectural context) — always fetched
-            explore_synthesis = await self._get_explore_synthesis(
-                repo_full_name, branch, db,
-            )
             enrichment_meta_dict["explore_synthesis"] = {
-                "present": explore_synthesis is not None,
-                "char_count": len(explore_synthesis) if explore_synthesis else 0,
+                "present": synthesis is not None,
+                "char_count": len(synthesis) if synthesis else 0,
             }
 
             # 2a-gate. Hybrid repo relevance gate — skip codebase context
             # when the prompt is semantically unrelated to the linked repo
             # (same tech stack but different project).  Two-stage: cosine
             # floor + domain entity overlap.  Only fires when synthesis
-            # exists (can't compute relevance without it).
+            # exists (can't compute relevance without it).  Curated retrieval
+            # waits on the gate rather than racing it so off-topic prompts
+            # never pay for an index scan.
             _repo_relevance_skipped = False
-            if explore_synthesis:
-                try:
-                    relevance, relevance_info = await compute_repo_relevance(
-                        raw_prompt, explore_synthesis, self._embedding_service,
-                    )
+            if synthesis:
+                gate = await self._run_source(
+                    "repo_relevance",
+                    lambda: compute_repo_relevance(
+                        raw_prompt, synthesis, self._embedding_service,
+                    ),
+                    default=None, timings=source_timings,
+                )
+                if gate is None:
+                    # Fail open — proceed without the gate
+                    enrichment_meta_dict["repo_relevance_error"] = True
+                else:
+                    relevance, relevance_info = gate
                     enrichment_meta_dict["repo_relevance_score"] = round(relevance, 3)
                     enrichment_meta_dict["repo_relevance_info"] = relevance_info
 
@@ -874,21 +942,8 @@ class ContextEnrichmentService:
                             relevance_info["reason"], repo_full_name,
                         )
                         enrichment_meta_dict["repo_relevance_skipped"] = True
-                        explore_synthesis = None
+                        synthesis = None
                         _repo_relevance_skipped = True
-                except Exception:
-                    logger.debug(
-                        "repo_relevance_gate: failed, proceeding without gate",
-                        exc_info=True,
-                    )
-                    enrichment_meta_dict["repo_relevance_error"] = True
-
-            # 2b. Workspace guidance as fallback when synthesis is absent
-            if not explore_synthesis and not _repo_relevance_skipped:
-                ws_fallback = await self._resolve_workspace_guidance(mcp_ctx, workspace_path)
-                if ws_fallback:
-                    explore_synthesis = ws_fallback
-                    enrichment_meta_dict["workspace_as_fallback"] = True
 
             # 2c. Per-prompt curated index retrieval — task-gated
             skip_curated, skip_reason = self._should_skip_curated(
@@ -898,64 +953,121 @@ class ContextEnrichmentService:
             if _repo_relevance_skipped:
                 skip_curated = True
                 skip_reason = "repo_relevance_gate"
-            if skip_curated:
-                curated_text = None
-                _skip_status = (
-                    "skipped_repo_relevance" if _repo_relevance_skipped
-                    else "skipped_task_type"
-                )
-                enrichment_meta_dict["curated_retrieval"] = {
-                    "status": _skip_status,
-                    "files_included": 0,
-                    "reason": skip_reason,
-                }
-                logger.info(
-                    "Curated retrieval skipped: %s (repo=%s)",
-                    skip_reason, repo_full_name,
-                )
-            else:
-                curated_text, curated_meta = await self._query_index_context(
-                    repo_full_name, branch, raw_prompt,
-                    task_type, analysis.domain if analysis else None, db,
+
+            async def _curated() -> str | None:
+                if skip_curated:
+                    _skip_status = (
+                        "skipped_repo_relevance" if _repo_relevance_skipped
+                        else "skipped_task_type"
+                    )
+                    enrichment_meta_dict["curated_retrieval"] = {
+                        "status": _skip_status,
+                        "files_included": 0,
+                        "reason": skip_reason,
+                    }
+                    logger.info(
+                        "Curated retrieval skipped: %s (repo=%s)",
+                        skip_reason, repo_full_name,
+                    )
+                    return None
+
+                async def _query() -> tuple[str | None, dict]:
+                    async with self._db_scope(db, db_lock) as session:
+                        return await self._query_index_context(
+                            repo_full_name, branch, raw_prompt,  # type: ignore[arg-type]
+                            task_type, analysis.domain, session,
+                        )
+
+                curated_text, curated_meta = await self._run_source(
+                    "curated_index", _query,
+                    default=(None, {"status": "timeout", "files_included": 0}),
+                    timings=source_timings,
                 )
                 enrichment_meta_dict["curated_retrieval"] = curated_meta
+                return curated_text
+
+            async def _workspace_fallback() -> str | None:
+                # 2b. Workspace guidance as fallback when synthesis is absent
+                if synthesis or _repo_relevance_skipped:
+                    return None
+                return await self._run_source(
+                    "workspace_guidance",
+                    lambda: self._resolve_workspace_guidance(mcp_ctx, workspace_path),
+                    default=None, timings=source_timings,
+                )
 
-            # Combine: synthesis first (overview), then curated (prompt-specific)
-            if explore_synthesis and curated_text:
-                codebase_context = f"{explore_synthesis}\n\n---\n\n{curated_text}"
-            elif explore_synthesis:
-                codebase_context = explore_synthesis
-            elif curated_text:
-                codebase_context = curated_text
-
-        elif not skip_codebase:
-            # No repo linked — workspace guidance is the only codebase context source
-            ws_guidance = await self._resolve_workspace_guidance(mcp_ctx, workspace_path)
-            if ws_guidance:
-                codebase_context = ws_guidance
+            curated_text, ws_fallback = await asyncio.gather(
+                _curated(), _workspace_fallback(),
+            )
+            if ws_fallback:
+                synthesis = ws_fallback
                 enrichment_meta_dict["workspace_as_fallback"] = True
 
-        # 3. Divergence detection — compare prompt tech vs codebase stack.
+            # Combine: synthesis first (overview), then curated (prompt-specific)
+            if synthesis and curated_text:
+                return f"{synthesis}\n\n---\n\n{curated_text}"
+            return synthesis or curated_text
+
+        # 3. Strategy intelligence — unified layer merging performance signals
+        #    and user adaptation feedback into a single strategy advisory.
+        #    Gated by preference + profile (cold-start skips — no history yet).
+        async def _strategy() -> tuple[str | None, bool]:
+            if not run_si:
+                return None, False
+
+            async def _resolve() -> tuple[str | None, bool]:
+                async with self._db_scope(db, db_lock) as session:
+                    return await resolve_strategy_intelligence(
+                        session, effective_task_type, analysis.domain,
+                    )
+
+            return await self._run_source(
+                "strategy_intelligence", _resolve,
+                default=(None, False), timings=source_timings,
+            )
+
+        # 4. Applied patterns — profile-gated (cold-start skips — no clusters yet).
+        async def _patterns() -> tuple[str | None, list[dict] | None]:
+            if not run_patterns:
+                return None, None
+
+            async def _resolve() -> tuple[str | None, list[dict] | None]:
+                async with self._db_scope(db, db_lock) as session:
+                    return await self._resolve_patterns(
+                        raw_prompt, applied_pattern_ids, session,
+                    )
+
+            return await self._run_source(
+                "applied_patterns", _resolve,
+                default=(None, None), timings=source_timings,
+            )
+
+        # Wave 2 — independent layers run concurrently; total latency is
+        # bounded by the slowest source within its budget.
+        codebase_context, (strategy_intel, si_fallback), (patterns, _pattern_details) = (
+            await asyncio.gather(_codebase(), _strategy(), _patterns())
+        )
+        if strategy_intel:
+            enrichment_meta_dict["strategy_intelligence_detail"] = (
+                strategy_intel[:500] if len(strategy_intel) > 500
+                else strategy_intel
+            )
+        if si_fallback:
+            enrichment_meta_dict["strategy_intelligence_fallback"] = True
+        if _pattern_details:
+            enrichment_meta_dict["applied_pattern_texts"] = _pattern_details
+
+        # 5. Divergence detection — compare prompt tech vs codebase stack.
         #    When profile=knowledge_work skips codebase context but a repo IS linked,
-        #    still fetch the synthesis (cheap cached lookup) for divergence detection.
-        #    The synthesis tells us the tech stack even when we don't inject it into the LLM.
+        #    the synthesis fetched in wave 1 still tells us the tech stack even
+        #    though we don't inject it into the LLM.
         _divergence_source = codebase_context
-        if not _divergence_source and repo_full_name and skip_codebase:
-            # Lightweight synthesis-only fetch for divergence detection
-            try:
-                if not repo_branch:
-                    repo_branch = "main"
-                _synth_for_div = await self._get_explore_synthesis(
-                    repo_full_name, repo_branch, db,
-                )
-                if _synth_for_div:
-                    _divergence_source = _synth_for_div
-                    logger.debug(
-                        "divergence_detection: using synthesis for skipped-codebase profile (repo=%s)",
-                        repo_full_name,
-                    )
-            except Exception:
-                logger.debug("Synthesis fetch for divergence detection failed", exc_info=True)
+        if not _divergence_source and repo_full_name and skip_codebase and explore_synthesis:
+            _divergence_source = explore_synthesis
+            logger.debug(
+                "divergence_detection: using synthesis for skipped-codebase profile (repo=%s)",
+                repo_full_name,
+            )
 
         if _divergence_source:
             _div_source_type = "codebase" if codebase_context else "synthesis_fallback"
@@ -977,29 +1089,6 @@ class ContextEnrichmentService:
                     len(divergences), _div_source_type, _div_summary,
                 )
 
-        # 4. Strategy intelligence — unified layer merging performance signals
-        #    and user adaptation feedback into a single strategy advisory.
-        #    Gated by preference + profile (cold-start skips — no history yet).
-        strategy_intel: str | None = None
-        effective_task_type = task_type or "general"
-        skip_si = profile == PROFILE_COLD_START
-        if skip_si:
-            skipped_layers.append("strategy_intelligence")
-        else:
-            enable_si = prefs.get("enable_strategy_intelligence", True)
-            if enable_si:
-                strategy_intel, si_fallback = await resolve_strategy_intelligence(
-                    db, effective_task_type,
-                    analysis.domain if analysis else "general",
-                )
-                if strategy_intel:
-                    enrichment_meta_dict["strategy_intelligence_detail"] = (
-                        strategy_intel[:500] if len(strategy_intel) > 500
-                        else strategy_intel
-                    )
-                if si_fallback:
-                    enrichment_meta_dict["strategy_intelligence_fallback"] = True
-
         # E1: Track strategy intelligence hit rate
         try:
             from app.services.classification_agreement import get_classification_agreement
@@ -1009,27 +1098,11 @@ class ContextEnrichmentService:
         except Exception:
             pass
 
-        # 5. Applied patterns — profile-gated (cold-start skips — no clusters yet).
-        #    Internal/sampling tiers skip enrichment-level patterns because their
-        #    pipelines call auto_inject_patterns() directly with provenance recording.
-        patterns: str | None = None
-        if profile == PROFILE_COLD_START:
-            skipped_layers.append("applied_patterns")
-        elif tier in ("internal", "sampling"):
-            skipped_layers.append("applied_patterns")
-            enrichment_meta_dict["patterns_deferred_to_pipeline"] = True
-        else:
-            patterns, _pattern_details = await self._resolve_patterns(
-                raw_prompt, applied_pattern_ids, db,
-            )
-            if _pattern_details:
-                enrichment_meta_dict["applied_pattern_texts"] = _pattern_details
-
         # 6. Content capping and injection hardening
         codebase_context = self._cap_codebase_context(codebase_context)
         strategy_intel = self._cap_strategy_intelligence(strategy_intel)
 
-        # 6b. Enrichment metadata — track truncation and profile
+        # 6b. Enrichment metadata — track truncation, profile and source timings
         combined_chars = len(codebase_context) if codebase_context else 0
         enrichment_meta_dict["combined_context_chars"] = combined_chars
         enrichment_meta_dict["was_truncated"] = (
@@ -1037,6 +1110,12 @@ class ContextEnrichmentService:
         )
         if skipped_layers:
             enrichment_meta_dict["profile_skipped_layers"] = skipped_layers
+        enrichment_meta_dict["source_timings"] = source_timings
+        _timed_out = sorted(
+            name for name, t in source_timings.items() if t["status"] == "timeout"
+        )
+        if _timed_out:
+            enrichment_meta_dict["sources_timed_out"] = _timed_out
 
         # 7. Context sources audit (frozen via MappingProxyType)
         sources = MappingProxyType({
@@ -1047,7 +1126,7 @@ class ContextEnrichmentService:
         })
 
         # 8. Log enrichment summary
-        _enrich_ms = (_time.monotonic() - _t_enrich_start) * 1000
+        _enrich_ms = (time.monotonic() - _t_enrich_start) * 1000
 
         # Compute assembled context size for observability
         _total_context = sum(
@@ -1089,6 +1168,79 @@ class ContextEnrichmentService:
             enrichment_meta=MappingProxyType(enrichment_meta_dict) if enrichment_meta_dict else MappingProxyType({}),
         )
 
+    @asynccontextmanager
+    async def _db_scope(
+        self, db: AsyncSession, lock: asyncio.Lock,
+    ) -> AsyncIterator[AsyncSession]:
+        """Yield a session for one enrichment source.
+
+        Uses a dedicated session from ``session_factory`` when configured,
+        otherwise the caller's session guarded by *lock*.
+        """
+        if self._session_factory is not None:
+            async with self._session_factory() as session:
+                yield session
+        else:
+            async with lock:
+                yield db
+
+    @staticmethod
+    async def _run_source(
+        name: str,
+        fn: Callable[[], Awaitable[Any]],
+        *,
+        default: Any,
+        timings: dict[str, dict[str, Any]],
+    ) -> Any:
+        """Run one enrichment source under its ``ENRICHMENT_SOURCE_BUDGETS`` deadline.
+
+        Timeouts and unexpected errors degrade to *default* so a slow or broken
+        source never blocks the rest of enrichment.  Records ``elapsed_ms``,
+        ``status`` (``ok`` / ``timeout`` / ``error``) and ``budget_ms`` under
+        ``timings[name]``.
+        """
+        budget = settings.ENRICHMENT_SOURCE_BUDGETS.get(name)
+        t0 = time.monotonic()
+        status = "ok"
+        try:
+            with profiling.span(f"enrichment.{name}"):
+                result = await asyncio.wait_for(fn(), timeout=budget)
+        except TimeoutError:
+            status = "timeout"
+            result = default
+            logger.warning(
+                "enrichment source %s exceeded %.1fs budget, degrading to empty",
+                name, budget,
+            )
+        except Exception:
+            status = "error"
+            result = default
+            logger.debug("enrichment source %s failed", name, exc_info=True)
+        timings[name] = {
+            "elapsed_ms": round((time.monotonic() - t0) * 1000, 1),
+            "status": status,
+            "budget_ms": round(budget * 1000) if budget else None,
+        }
+        return result
+
+    async def _resolve_repo_branch(
+        self, repo_full_name: str, db: AsyncSession,
+    ) -> str:
+        """Resolve the working branch for a repo from LinkedRepo (``main`` fallback)."""
+        try:
+            from sqlalchemy import select
+
+            from app.models import LinkedRepo
+            _lr_q = await db.execute(
+                select(LinkedRepo).where(
+                    LinkedRepo.full_name == repo_full_name,
+                ).limit(1)
+            )
+            _lr = _lr_q.scalar_one_or_none()
+            return (_lr.branch or _lr.default_branch) if _lr else "main"
+        except Exception:
+            return "main"
+
     async def _resolve_workspace_guidance(
         self, mcp_ctx: Any | None, workspace_path: str | None,
     ) -> str | None:
@@ -1116,7 +1268,8 @@ class ContextEnrichmentService:
             return None
 
         try:
-            return self._workspace_intel.analyze(roots)
+            # Filesystem scan — off the event loop so it overlaps other sources
+            return await asyncio.to_thread(self._workspace_intel.analyze, roots)
         except Exception:
             logger.debug("Workspace guidance resolution failed", exc_info=True)
             return None
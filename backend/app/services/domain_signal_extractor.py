@@ -6,6 +6,8 @@ them as domain signals on the DomainSignalLoader singleton.
 
 Uses a simplified TF-IDF approach: tokens that appear frequently in the
 domain's prompts but rarely across all prompts are strong domain indicators.
+Document frequencies come from the incremental term index
+(``signal_term_index``) rather than re-tokenizing every member prompt.
 
 Copyright 2025-2026 Project Synthesis contributors.
 """
@@ -13,38 +15,25 @@ Copyright 2025-2026 Project Synthesis contributors.
 from __future__ import annotations
 
 import logging
-import re
-from collections import Counter
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Optimization, PromptCluster
+from app.models import PromptCluster
+from app.services.signal_term_index import (
+    SCOPE_CLUSTER,
+    global_term_counts,
+    group_term_counts,
+    group_totals,
+    rank_terms,
+    sync_term_counts,
+)
 
 logger = logging.getLogger(__name__)
 
-# Stopwords — common English words that are never useful as domain signals
-_STOPWORDS = frozenset({
-    "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
-    "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
-    "being", "have", "has", "had", "do", "does", "did", "will", "would",
-    "could", "should", "may", "might", "shall", "can", "that", "this",
-    "these", "those", "it", "its", "i", "you", "he", "she", "we", "they",
-    "my", "your", "our", "their", "me", "him", "her", "us", "them",
-    "not", "no", "so", "if", "as", "up", "out", "about", "into", "over",
-    "then", "than", "too", "very", "just", "also", "how", "what", "when",
-    "where", "which", "who", "why", "all", "each", "every", "both",
-    "few", "more", "most", "other", "some", "such", "any", "only", "own",
-    "same", "new", "use", "using", "used", "make", "like", "need", "want",
-    "get", "set", "add", "create", "write", "include", "provide", "ensure",
-    "implement", "build", "design", "please", "help", "give", "show",
-})
-
-# Minimum token length to consider
-_MIN_TOKEN_LENGTH = 3
-
-# Regex to extract words (alphanumeric + hyphens for tech terms like "ci-cd")
-_TOKEN_RE = re.compile(r"[a-z][a-z0-9\-]{2,}")
+# Filters: present in >= 30% of domain prompts AND <= 70% of all prompts
+_MIN_DOMAIN_FREQ = 0.3
+_MAX_GLOBAL_FREQ = 0.7
 
 
 async def extract_domain_signals(
@@ -108,87 +97,41 @@ async def extract_domain_signals(
         if not child_ids:
             return []
 
-        # 3. Fetch raw prompts from optimizations in these clusters
-        opt_q = await db.execute(
-            select(Optimization.raw_prompt).where(
-                Optimization.cluster_id.in_(child_ids),
-                Optimization.raw_prompt.isnot(None),
-            )
-        )
-        prompts = [r[0] for r in opt_q.all()]
+        # 3. Count member prompts from the term index (synced in the caller's transaction)
+        await sync_term_counts(db)
+        cluster_totals = await group_totals(db, SCOPE_CLUSTER)
+        total_domain = sum(cluster_totals.get(cid, 0) for cid in child_ids)
 
-        if len(prompts) < min_members:
+        if total_domain < min_members:
             logger.info(
                 "extract_domain_signals: domain '%s' skipped — %d members < %d threshold",
-                domain_label, len(prompts), min_members,
+                domain_label, total_domain, min_members,
             )
             try:
                 from app.services.taxonomy.event_logger import get_event_logger
                 get_event_logger().log_decision(
                     path="warm", op="signal_enrichment", decision="skipped_sparse",
-                    context={"domain": domain_label, "member_count": len(prompts),
+                    context={"domain": domain_label, "member_count": total_domain,
                              "threshold": min_members},
                 )
             except RuntimeError:
                 pass
             return []
 
-        # 4. Tokenize and compute domain term frequency
-        domain_doc_count: Counter[str] = Counter()  # how many prompts contain each token
-        for prompt in prompts:
-            tokens = set(_TOKEN_RE.findall(prompt.lower()))
-            tokens -= _STOPWORDS
-            for token in tokens:
-                domain_doc_count[token] += 1
-
-        # 5. Compute global term frequency (across ALL prompts, not just this domain)
-        global_q = await db.execute(
-            select(Optimization.raw_prompt).where(
-                Optimization.raw_prompt.isnot(None),
-            ).limit(500)  # sample cap to avoid scanning entire table
+        # 4. Domain and global term frequency
+        domain_doc_count = await group_term_counts(
+            db, SCOPE_CLUSTER, child_ids, int(_MIN_DOMAIN_FREQ * total_domain),
         )
-        global_prompts = [r[0] for r in global_q.all()]
-        global_doc_count: Counter[str] = Counter()
-        for prompt in global_prompts:
-            tokens = set(_TOKEN_RE.findall(prompt.lower()))
-            tokens -= _STOPWORDS
-            for token in tokens:
-                global_doc_count[token] += 1
-
-        total_domain = len(prompts)
-        total_global = max(len(global_prompts), 1)
-
-        # 6. Score: tokens that appear often in domain but rarely globally
-        scored: list[tuple[str, float]] = []
-        for token, domain_count in domain_doc_count.items():
-            domain_freq = domain_count / total_domain
-            global_freq = global_doc_count.get(token, 0) / total_global
-
-            # Filter: present in >= 30% of domain prompts AND <= 70% of all prompts
-            if domain_freq < 0.3:
-                continue
-            if global_freq > 0.7:
-                continue
-
-            # Discriminative score: how much more common in domain than globally
-            # Avoid division by zero; add smoothing
-            score = domain_freq / max(global_freq, 0.01)
-            scored.append((token, score))
-
-        # 7. Sort by score, normalize weights to [0.5, 1.0], return top_k
-        scored.sort(key=lambda x: x[1], reverse=True)
-        top = scored[:top_k]
-        if not top:
-            return []
+        global_doc_count, total_global = await global_term_counts(db, domain_doc_count)
 
-        max_score = top[0][1]
-        min_score = top[-1][1] if len(top) > 1 else max_score
-        score_range = max(max_score - min_score, 0.01)
-
-        result = [
-            (token, round(0.5 + 0.5 * (score - min_score) / score_range, 2))
-            for token, score in top
-        ]
+        # 5. Score tokens that appear often in domain but rarely globally,
+        # normalize weights to [0.5, 1.0], keep top_k
+        result, candidates_scored = rank_terms(
+            domain_doc_count, total_domain, global_doc_count, total_global,
+            min_group_freq=_MIN_DOMAIN_FREQ, max_global_freq=_MAX_GLOBAL_FREQ, top_k=top_k,
+        )
+        if not result:
+            return []
 
         logger.info(
             "extract_domain_signals: domain='%s' members=%d extracted=%d keywords=[%s]",
@@ -206,7 +149,7 @@ async def extract_domain_signals(
                 context={
                     "domain": domain_label,
                     "members_scanned": total_domain,
-                    "candidates_scored": len(scored),
+                    "candidates_scored": candidates_scored,
                     "keywords_extracted": len(result),
                     "top_keywords": [kw for kw, _ in result[:5]],
                     "coherence": round(coherence, 2),
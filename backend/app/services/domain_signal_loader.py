@@ -20,6 +20,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import PromptCluster
+from app.services.keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,7 @@ class DomainSignalLoader:
     def __init__(self) -> None:
         self._signals: dict[str, list[tuple[str, float]]] = {}
         self._patterns: dict[str, re.Pattern[str]] = {}
+        self._matcher = KeywordMatcher({})
         # Organic qualifier vocabulary cache — populated by Phase 5 via
         # refresh_qualifiers() and by load() from domain node metadata.
         self._qualifier_cache: dict[str, dict[str, list[str]]] = {}
@@ -176,7 +178,11 @@ class DomainSignalLoader:
         return result
 
     def _precompile_patterns(self) -> None:
-        """Compile ``\\b<keyword>\\b`` regex for every single-word keyword."""
+        """Compile ``\\b<keyword>\\b`` regex for every single-word keyword.
+
+        Also rebuilds the keyword matcher that :meth:`score` uses, so every
+        signal change goes through here.
+        """
         patterns: dict[str, re.Pattern[str]] = {}
         for keywords in self._signals.values():
             for keyword, _weight in keywords:
@@ -184,6 +190,7 @@ class DomainSignalLoader:
                 if " " not in kw and kw not in patterns:
                     patterns[kw] = re.compile(r"\b" + re.escape(kw) + r"\b")
         self._patterns = patterns
+        self._matcher = KeywordMatcher(self._signals)
 
     # ------------------------------------------------------------------
     # Runtime signal registration (A3 auto-enrichment)
@@ -233,18 +240,11 @@ class DomainSignalLoader:
 
         ``words`` should be a set of lowercase tokens from the prompt text.
         Multi-word keywords are skipped (they require full-text matching
-        outside this method).
+        outside this method).  Cost scales with the number of words, not
+        with the keyword vocabulary.
         """
-        scored: dict[str, float] = {}
-        for domain, keywords in self._signals.items():
-            total = 0.0
-            for keyword, weight in keywords:
-                kw = keyword.lower()
-                if " " not in kw and kw in words:
-                    total += weight
-            if total > 0:
-                scored[domain] = total
-        return scored
+        totals = self._matcher.score_tokens(words)
+        return {domain: total for domain, total in totals.items() if total > 0}
 
     def classify(self, scored: dict[str, float]) -> str:
         """Return the most-likely domain label given pre-computed domain scores.
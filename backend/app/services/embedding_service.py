@@ -13,6 +13,8 @@ from typing import Any
 import numpy as np
 
 from app.config import settings
+from app.services import profiling
+from app.services.metrics import timed
 
 logger = logging.getLogger(__name__)
 
@@ -98,7 +100,10 @@ class EmbeddingService:
             # Return zero vector for empty/whitespace strings
             return np.zeros(self.dimension or 384, dtype=np.float32)
         try:
-            return self.model.encode(text, convert_to_numpy=True)
+            profiling.count("embed_calls")
+            profiling.count("embed_texts")
+            with timed("embedding_duration_seconds", op="single"):
+                return self.model.encode(text, convert_to_numpy=True)
         except Exception as exc:
             raise EmbeddingError(f"Failed to embed text ({len(text)} chars): {exc}") from exc
 
@@ -118,7 +123,10 @@ class EmbeddingService:
         # Replace empty strings with placeholder (model may struggle with empty)
         cleaned = [t if t.strip() else " " for t in texts]
         try:
-            embeddings = self.model.encode(cleaned, convert_to_numpy=True)
+            profiling.count("embed_calls")
+            profiling.count("embed_texts", len(texts))
+            with timed("embedding_duration_seconds", op="batch"):
+                embeddings = self.model.encode(cleaned, convert_to_numpy=True)
             return [embeddings[i] for i in range(len(texts))]
         except Exception as exc:
             raise EmbeddingError(
@@ -140,25 +148,26 @@ class EmbeddingService:
     @staticmethod
     def cosine_search(
         query_vec: np.ndarray,
-        corpus_vecs: list[np.ndarray],
+        corpus_vecs: list[np.ndarray] | np.ndarray,
         top_k: int = 10,
     ) -> list[tuple[int, float]]:
         """Find the top-k most similar vectors via cosine similarity.
 
         Args:
             query_vec: Query embedding (1-D array).
-            corpus_vecs: List of corpus embeddings (same dimension).
+            corpus_vecs: List of corpus embeddings (same dimension), or a
+                pre-stacked ``(n, dim)`` matrix — skips the per-call stack.
             top_k: Number of results to return.
 
         Returns:
             List of (index, similarity_score) tuples, sorted by score descending.
         """
-        if not corpus_vecs:
+        if len(corpus_vecs) == 0:
             return []
         if query_vec is None:
             raise ValueError("query_vec cannot be None")
 
-        corpus = np.stack(corpus_vecs)
+        corpus = corpus_vecs if isinstance(corpus_vecs, np.ndarray) else np.stack(corpus_vecs)
         # L2 normalize with epsilon to prevent division by zero
         query_norm = query_vec / (np.linalg.norm(query_vec) + 1e-9)
         corpus_norm = corpus / (np.linalg.norm(corpus, axis=1, keepdims=True) + 1e-9)
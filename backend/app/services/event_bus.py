@@ -1,10 +1,11 @@
 """In-process event bus for real-time cross-client notifications."""
 
 import asyncio
+import json
 import logging
 import time
-from collections import deque
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Callable, Iterator
+from contextlib import contextmanager
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -21,32 +22,137 @@ _SHUTDOWN_SENTINEL = object()
 _REPLAY_BUFFER_SIZE = 500
 
 
+class BufferedEvent:
+    """One published event: the payload dict plus its pre-rendered SSE frame.
+
+    Shared by every reader — subscribers never get per-connection copies,
+    and ``json.dumps`` runs once per event instead of once per client.
+    """
+
+    __slots__ = ("seq", "payload", "frame")
+
+    def __init__(self, seq: int, payload: dict, frame: str) -> None:
+        self.seq = seq
+        self.payload = payload
+        self.frame = frame
+
+
+def _render_frame(seq: int, event_type: str, data: Any) -> str:
+    try:
+        body = json.dumps(data)
+    except (TypeError, ValueError):
+        body = json.dumps(data, default=str)
+    return f"id: {seq}\nevent: {event_type}\ndata: {body}\n\n"
+
+
+class EventCursor:
+    """A reader's position in the bus's replay ring.
+
+    Readers advance their own sequence number over the shared ring rather
+    than owning a queue. A reader that falls more than the ring size
+    behind skips ahead to the oldest retained event (logged), which keeps
+    slow connections alive the way the old drop-oldest queues did.
+    """
+
+    def __init__(self, bus: "EventBus", after_seq: int) -> None:
+        self._bus = bus
+        self.next_seq = after_seq + 1
+
+    def drain(self) -> list[BufferedEvent]:
+        """Return every event published since the last drain, in order."""
+        events = self._bus._range(self.next_seq)
+        if events:
+            if events[0].seq > self.next_seq:
+                logger.warning(
+                    "Event reader fell behind — skipped %d events",
+                    events[0].seq - self.next_seq,
+                )
+            self.next_seq = events[-1].seq + 1
+        return events
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        """Block until an unread event exists or the bus shuts down.
+
+        Returns False on timeout.
+        """
+        if self._bus._sequence >= self.next_seq or self._bus._shutting_down:
+            return True
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._bus._waiters.add(fut)
+        try:
+            await asyncio.wait_for(fut, timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._bus._waiters.discard(fut)
+
+
 class EventBus:
-    """Pub/sub backed by asyncio.Queue per subscriber.
+    """Pub/sub over a sequence-indexed ring of pre-serialized events.
 
     Features:
     - Monotonically increasing sequence numbers on every event
-    - Bounded replay buffer for SSE ``Last-Event-ID`` reconnection
-    - Overflow-safe: drops oldest queued event instead of removing subscriber
+    - Bounded ring buffer (``_REPLAY_BUFFER_SIZE``) doubling as the
+      ``Last-Event-ID`` replay store: slot ``seq % size``, O(1) lookup
+    - Events serialized to an SSE frame once, at publish time
+    - Readers (``subscribe()``, the SSE endpoint) hold an
+      :class:`EventCursor` into the shared ring instead of a queue copy
+    - Raw ``asyncio.Queue`` subscribers added to ``_subscribers`` still
+      receive payload dicts, overflow-safe (drops oldest queued event)
+    - Optional relay (multi-worker deployments): ``publish()`` hands events
+      to the relay, which assigns the sequence number and delivers them
+      back to every worker via :meth:`deliver`
     """
 
     def __init__(self) -> None:
         self._subscribers: set[asyncio.Queue] = set()
+        self._cursors: set[EventCursor] = set()
+        self._waiters: set[asyncio.Future[None]] = set()
         self._shutting_down = False
         self._sequence: int = 0
-        self._replay_buffer: deque[dict] = deque(maxlen=_REPLAY_BUFFER_SIZE)
+        self._ring: list[BufferedEvent | None] = [None] * _REPLAY_BUFFER_SIZE
+        self._relay: Callable[[str, Any], None] | None = None
+
+    def attach_relay(self, relay: Callable[[str, Any], None], sequence: int) -> None:
+        """Route ``publish()`` through *relay* instead of delivering locally.
+
+        *sequence* is the relay's current position; the relay numbers every
+        later event and hands it back through :meth:`deliver`, so workers
+        sharing a relay agree on ``seq`` (and ``Last-Event-ID``).
+        """
+        self._relay = relay
+        self._sequence = max(self._sequence, sequence)
+
+    def detach_relay(self) -> None:
+        self._relay = None
 
     def publish(self, event_type: str, data: dict | Any) -> None:
         if self._shutting_down:
             return
-        self._sequence += 1
+        if self._relay is not None:
+            self._relay(event_type, data)
+            return
+        self.deliver(self._sequence + 1, event_type, data, time.time())
+
+    def deliver(self, seq: int, event_type: str, data: dict | Any, timestamp: float) -> None:
+        """Store and fan out one event under sequence number *seq*."""
+        if self._shutting_down:
+            return
+        # Never move backwards (events published locally before a relay
+        # was attached already used these numbers).
+        seq = max(seq, self._sequence + 1)
+        self._sequence = seq
         payload = {
             "event": event_type,
             "data": data,
-            "timestamp": time.time(),
-            "seq": self._sequence,
+            "timestamp": timestamp,
+            "seq": seq,
         }
-        self._replay_buffer.append(payload)
+        self._ring[seq % _REPLAY_BUFFER_SIZE] = BufferedEvent(
+            seq, payload, _render_frame(seq, event_type, data),
+        )
+        self._wake_readers()
         for queue in self._subscribers:
             try:
                 queue.put_nowait(payload)
@@ -64,19 +170,59 @@ class EventBus:
                 logger.warning(
                     "Event bus queue overflow for subscriber — dropped oldest event"
                 )
-        if self._subscribers:
+        if self.subscriber_count:
             logger.debug(
                 "Published %s (seq=%d) to %d subscribers",
-                event_type, self._sequence, len(self._subscribers),
+                event_type, seq, self.subscriber_count,
             )
 
+    def _wake_readers(self) -> None:
+        waiters, self._waiters = self._waiters, set()
+        for fut in waiters:
+            if fut.done():
+                continue
+            try:
+                fut.set_result(None)
+            except RuntimeError:
+                pass  # Waiter's event loop already closed
+
+    def _range(self, from_seq: int) -> list[BufferedEvent]:
+        """Buffered events with seq >= *from_seq* (oldest retained first)."""
+        start = max(from_seq, self._sequence - _REPLAY_BUFFER_SIZE + 1, 1)
+        out: list[BufferedEvent] = []
+        for seq in range(start, self._sequence + 1):
+            evt = self._ring[seq % _REPLAY_BUFFER_SIZE]
+            if evt is not None and evt.seq == seq:
+                out.append(evt)
+        return out
+
     def replay_since(self, seq: int) -> list[dict]:
         """Return all buffered events with sequence number > *seq*.
 
         Used by the SSE endpoint to replay missed events on reconnection
         via the ``Last-Event-ID`` header.
         """
-        return [e for e in self._replay_buffer if e["seq"] > seq]
+        return [e.payload for e in self._range(seq + 1)]
+
+    def cursor(self, after_seq: int | None = None) -> EventCursor:
+        """A cursor positioned after *after_seq* (default: the current seq).
+
+        The cursor is not counted in ``subscriber_count``; long-lived readers
+        use :meth:`reader` instead.
+        """
+        if after_seq is None or after_seq > self._sequence:
+            after_seq = self._sequence
+        return EventCursor(self, after_seq)
+
+    @contextmanager
+    def reader(self, after_seq: int | None = None) -> Iterator[EventCursor]:
+        """A :meth:`cursor` counted in ``subscriber_count`` until the block exits."""
+        cursor = self.cursor(after_seq)
+        self._cursors.add(cursor)
+        try:
+            yield cursor
+        finally:
+            self._cursors.discard(cursor)
 
     @property
     def current_sequence(self) -> int:
@@ -84,37 +230,41 @@ class EventBus:
         return self._sequence
 
     async def subscribe(self) -> AsyncGenerator[dict, None]:
-        queue: asyncio.Queue = asyncio.Queue(maxsize=100)
-        self._subscribers.add(queue)
-        logger.info("Event subscriber connected (total: %d)", len(self._subscribers))
         try:
-            while True:
-                event = await queue.get()
-                if event is _SHUTDOWN_SENTINEL:
-                    logger.info("Event subscriber received shutdown signal")
-                    return
-                yield event
+            with self.reader() as cursor:
+                logger.info("Event subscriber connected (total: %d)", self.subscriber_count)
+                while True:
+                    for evt in cursor.drain():
+                        yield evt.payload
+                    if self._shutting_down:
+                        logger.info("Event subscriber received shutdown signal")
+                        return
+                    await cursor.wait()
         finally:
-            self._subscribers.discard(queue)
-            logger.info("Event subscriber disconnected (total: %d)", len(self._subscribers))
+            logger.info("Event subscriber disconnected (total: %d)", self.subscriber_count)
 
     def shutdown(self) -> None:
         """Signal all subscribers to disconnect.
 
-        Puts a sentinel into every queue. Subscribers (both the
-        ``subscribe()`` generator and the SSE router's manual queue)
-        check for the sentinel and return, causing their HTTP
-        connections to close naturally.
+        Wakes every cursor reader (``subscribe()`` and the SSE endpoint),
+        which sees ``_shutting_down`` and returns, and puts a sentinel into
+        every raw queue subscriber, causing their HTTP connections to close
+        naturally.
         """
         self._shutting_down = True
-        count = len(self._subscribers)
+        count = self.subscriber_count
+        self._wake_readers()
         for queue in list(self._subscribers):
             try:
                 queue.put_nowait(_SHUTDOWN_SENTINEL)
             except asyncio.QueueFull:
                 pass
         if count:
-            logger.info("Shutdown sentinel sent to %d subscribers", count)
+            logger.info("Shutdown signal sent to %d subscribers", count)
+
+    @property
+    def is_shutting_down(self) -> bool:
+        return self._shutting_down
 
     def is_shutdown_event(self, event: object) -> bool:
         """Check if an event is the shutdown sentinel."""
@@ -122,7 +272,7 @@ class EventBus:
 
     @property
     def subscriber_count(self) -> int:
-        return len(self._subscribers)
+        return len(self._subscribers) + len(self._cursors)
 
 
 event_bus = EventBus()
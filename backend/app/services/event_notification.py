@@ -1,31 +1,43 @@
 """Cross-process event bus notification for the MCP server.
 
 The MCP server runs in a separate process from the FastAPI backend. This
-module provides a shared HTTP-based notification function that both
-``mcp_server.py`` and ``sampling_pipeline.py`` use to publish events to
-the backend's in-process event bus via the ``/api/events/_publish`` endpoint.
+module provides a shared notification function that both ``mcp_server.py``
+and ``sampling_pipeline.py`` use to publish events to the backend's
+in-process event bus.
+
+``notify_event_bus()`` only appends to an in-memory buffer — it never
+waits on the network, so a slow or restarting backend cannot stall a
+tool call. A single background :class:`EventForwarder` task drains the
+buffer in order, posting batches to ``/api/events/_publish_batch`` over a
+reused keep-alive connection.
 
 Reliability: the ``optimization_created`` event is the sole trigger for
 taxonomy extraction (embedding + cluster assignment).  A dropped event
 leaves the optimization orphaned (no cluster_id, no embeddings) until
-the next server restart backfill.  For this reason, critical events get
-a retry with a short delay.
+the next server restart backfill.  Batches that fail transiently
+(connection errors, timeouts, 5xx, 429) stay at the head of the buffer and
+are retried with backoff until the backend comes back, so delivery order
+is preserved.  A permanent failure (other 4xx, an unserializable payload)
+would fail forever, so the batch is re-sent one event at a time and only
+the offending event is dropped and logged.  The buffer is bounded; on
+overflow the oldest non-critical event is dropped first.
 
-Observability events (``taxonomy_activity``) also get a retry — dropped
-events cause intermittent gaps in the frontend Activity panel.
+Observability events (``taxonomy_activity``) are treated as critical too —
+dropped events cause intermittent gaps in the frontend Activity panel.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+from collections import deque
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 # Events that drive data-integrity pipelines (taxonomy extraction,
-# domain caches) or observability (activity panel).  These get a retry
-# on failure.
+# domain caches) or observability (activity panel).  These are the last
+# to be dropped when the forwarding buffer overflows.
 _CRITICAL_EVENTS = frozenset({
     "optimization_created",
     "taxonomy_changed",
@@ -42,13 +54,36 @@ _TIMEOUT_BY_EVENT: dict[str, float] = {
 }
 _DEFAULT_TIMEOUT = 5.0
 
-_PUBLISH_URL = "http://127.0.0.1:8000/api/events/_publish"
+_PUBLISH_URL = "http://127.0.0.1:8000/api/events/_publish_batch"
+
+# Forwarding buffer bounds.  At ~10 events per pipeline run, 5000 events
+# rides out a multi-minute backend restart during a busy batch.
+_BUFFER_SIZE = 5000
+_MAX_BATCH = 100
+# Short linger after the first event so a burst (status → created →
+# taxonomy_activity) ships as one request instead of three.
+_LINGER_SECONDS = 0.005
+_RETRY_BASE_SECONDS = 0.5
+_RETRY_MAX_SECONDS = 10.0
 
 # Reusable httpx client — avoids per-call connection overhead for
 # high-frequency events like optimization_status (~10 calls per pipeline).
 _httpx_client: Any = None  # httpx.AsyncClient, lazily initialized
 
 
+def _is_transient(exc: Exception) -> bool:
+    """True when a failed send is worth retrying unchanged."""
+    if isinstance(exc, OSError):  # ConnectionError, TimeoutError, ...
+        return True
+    import httpx
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status >= 500 or status == 429
+    return False
+
+
 def _get_client() -> Any:
     """Lazy-init a module-level reusable httpx client."""
     global _httpx_client
@@ -58,44 +93,205 @@ def _get_client() -> Any:
     return _httpx_client
 
 
-async def notify_event_bus(event_type: str, data: dict) -> None:
-    """Notify the backend event bus via HTTP POST.
+class EventForwarder:
+    """Ordered, bounded, batching forwarder to the backend event bus."""
 
-    Non-fatal: logs and swallows any transport or connection errors so the
-    calling tool/pipeline is never interrupted by event bus failures.
+    def __init__(
+        self,
+        buffer_size: int = _BUFFER_SIZE,
+        max_batch: int = _MAX_BATCH,
+        linger_seconds: float = _LINGER_SECONDS,
+    ) -> None:
+        self._buffer: deque[dict[str, Any]] = deque()
+        self._buffer_size = max(1, buffer_size)
+        self._max_batch = max(1, max_batch)
+        self._linger = linger_seconds
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Future[None] | None = None
+        self._idle: asyncio.Future[None] | None = None
+        self._sent = 0
+        self._dropped = 0
+        self._rejected = 0
+        self._failed_attempts = 0
+        # Events left to send one at a time after a permanent batch failure,
+        # so a single bad event can't take its batch-mates down with it.
+        self._solo = 0
 
-    Critical and observability events get one retry after a 1-second delay.
-    """
-    max_attempts = 2 if event_type in _CRITICAL_EVENTS else 1
-    timeout = _TIMEOUT_BY_EVENT.get(event_type, _DEFAULT_TIMEOUT)
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def enqueue(self, event_type: str, data: dict) -> None:
+        """Buffer an event for delivery. Never blocks, never raises."""
+        if len(self._buffer) >= self._buffer_size:
+            self._drop_one()
+        self._buffer.append({"event_type": event_type, "data": data})
+        self._ensure_running()
+        if self._wakeup is not None and not self._wakeup.done():
+            self._wakeup.set_result(None)
 
-    for attempt in range(1, max_attempts + 1):
+    def _drop_one(self) -> None:
+        for i, evt in enumerate(self._buffer):
+            if evt["event_type"] not in _CRITICAL_EVENTS:
+                del self._buffer[i]
+                break
+        else:
+            evt = self._buffer.popleft()
+        self._dropped += 1
+        logger.warning(
+            "Event forwarding buffer full (%d) — dropped %s",
+            self._buffer_size, evt["event_type"],
+        )
+
+    def _ensure_running(self) -> None:
         try:
-            http = _get_client()
-            resp = await http.post(
-                _PUBLISH_URL,
-                json={"event_type": event_type, "data": data},
-                timeout=timeout,
-            )
-            resp.raise_for_status()
-            return  # success
-        except BaseException as exc:
-            # Catch BaseException (not just Exception) to handle
-            # asyncio.CancelledError from ASGI task cancellation.
-            if attempt < max_attempts:
-                logger.warning(
-                    "notify_event_bus(%s) attempt %d/%d failed: %s — retrying in 1s",
-                    event_type, attempt, max_attempts, exc,
-                )
-                try:
-                    await asyncio.sleep(1.0)
-                except BaseException:
-                    break  # Cancelled during sleep — give up
-            else:
-                # Final attempt failed — always warn so failures are visible
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Picked up by the next enqueue from async code
+        if self._task is not None and not self._task.done() and self._loop is loop:
+            return
+        self._loop = loop
+        self._wakeup = None
+        self._idle = None
+        self._task = loop.create_task(self._run(), name="event_forwarder")
+
+    # ------------------------------------------------------------------
+    # Consumer side
+    # ------------------------------------------------------------------
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        backoff = _RETRY_BASE_SECONDS
+        while True:
+            if not self._buffer:
+                if self._idle is not None and not self._idle.done():
+                    self._idle.set_result(None)
+                self._wakeup = loop.create_future()
+                await self._wakeup
+                self._wakeup = None
+                if self._linger > 0 and len(self._buffer) < self._max_batch:
+                    await asyncio.sleep(self._linger)
+
+            size = 1 if self._solo else self._max_batch
+            batch = [self._buffer[i] for i in range(min(size, len(self._buffer)))]
+            try:
+                await self._send(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self._failed_attempts += 1
+                if not _is_transient(exc):
+                    backoff = _RETRY_BASE_SECONDS
+                    if len(batch) > 1:
+                        self._solo = len(batch)
+                        logger.warning(
+                            "Event forwarding of %d events rejected: %s — "
+                            "re-sending one at a time",
+                            len(batch), exc,
+                        )
+                    else:
+                        self._pop_sent(batch)
+                        self._solo = max(0, self._solo - 1)
+                        self._rejected += 1
+                        logger.error(
+                            "Event forwarding rejected %s permanently, dropped: %s",
+                            batch[0]["event_type"], exc,
+                        )
+                    continue
                 logger.warning(
-                    "notify_event_bus(%s) FAILED after %d attempts: %s  "
-                    "[data_id=%s]",
-                    event_type, max_attempts, exc,
-                    data.get("id", data.get("op", "?")),
+                    "Event forwarding of %d events failed: %s — retrying in %.1fs "
+                    "(%d buffered)",
+                    len(batch), exc, backoff, len(self._buffer),
                 )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, _RETRY_MAX_SECONDS)
+                continue
+            backoff = _RETRY_BASE_SECONDS
+            self._pop_sent(batch)
+            self._solo = max(0, self._solo - len(batch))
+            self._sent += len(batch)
+
+    def _pop_sent(self, batch: list[dict[str, Any]]) -> None:
+        # Events may have been dropped from the head while the request
+        # was in flight; only pop entries that are still the ones sent.
+        for evt in batch:
+            if self._buffer and self._buffer[0] is evt:
+                self._buffer.popleft()
+
+    async def _send(self, batch: list[dict[str, Any]]) -> None:
+        timeout = max(
+            _TIMEOUT_BY_EVENT.get(evt["event_type"], _DEFAULT_TIMEOUT) for evt in batch
+        )
+        resp = await _get_client().post(
+            _PUBLISH_URL, json={"events": batch}, timeout=timeout,
+        )
+        resp.raise_for_status()
+
+    # ------------------------------------------------------------------
+    # Lifecycle / metrics
+    # ------------------------------------------------------------------
+
+    async def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until the buffer is delivered. Returns False on timeout."""
+        if not self._buffer:
+            return True
+        self._ensure_running()
+        if self._idle is None or self._idle.done():
+            self._idle = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.wait_for(asyncio.shield(self._idle), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Flush what the backend will accept in *timeout*, then stop."""
+        if not await self.flush(timeout):
+            logger.warning(
+                "Event forwarder closing with %d undelivered events", len(self._buffer),
+            )
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "buffered": len(self._buffer),
+            "sent": self._sent,
+            "dropped": self._dropped,
+            "rejected": self._rejected,
+            "failed_attempts": self._failed_attempts,
+        }
+
+
+_forwarder: EventForwarder | None = None
+
+
+def get_event_forwarder() -> EventForwarder:
+    global _forwarder
+    if _forwarder is None:
+        _forwarder = EventForwarder()
+    return _forwarder
+
+
+async def shutdown_event_forwarder(timeout: float = 5.0) -> None:
+    """Flush and stop the forwarder (MCP lifespan shutdown, tests)."""
+    global _forwarder
+    if _forwarder is not None:
+        await _forwarder.close(timeout)
+    _forwarder = None
+
+
+async def notify_event_bus(event_type: str, data: dict) -> None:
+    """Queue an event for the backend event bus.
+
+    Non-fatal and non-blocking: returns as soon as the event is buffered.
+    Delivery, batching and retry happen on the background forwarder, so
+    the calling tool/pipeline is never interrupted by event bus failures.
+    """
+    get_event_forwarder().enqueue(event_type, data)
@@ -1,10 +1,21 @@
-"""In-memory TTL cache for explore results with LRU eviction."""
+"""In-memory TTL cache for explore results with LRU eviction.
+
+Two lookup tiers share one store:
+
+- **Exact** — keyed by ``repo:branch:head_sha:prompt_hash``.
+- **Semantic** — entries stored with a prompt embedding can be reused by a
+  rephrased prompt on the same ``repo:branch:head_sha`` scope when cosine
+  similarity clears a threshold.  Entries without an embedding only serve
+  exact hits.
+"""
 
 import hashlib
 import logging
 import time
 from collections import OrderedDict
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -12,14 +23,21 @@ class ExploreCache:
     def __init__(self, ttl_seconds: int = 3600, max_entries: int = 100) -> None:
         self._ttl = ttl_seconds
         self._max = max_entries
-        self._store: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        # key -> (value, timestamp, unit-normalized prompt embedding or None)
+        self._store: OrderedDict[str, tuple[str, float, np.ndarray | None]] = OrderedDict()
         self._hits = 0
         self._misses = 0
+        self._semantic_hits = 0
+        self._semantic_misses = 0
+
+    @staticmethod
+    def build_scope(repo_full_name: str, branch: str, head_sha: str) -> str:
+        return f"{repo_full_name}:{branch}:{head_sha}"
 
     @staticmethod
     def build_key(repo_full_name: str, branch: str, head_sha: str, raw_prompt: str) -> str:
         prompt_hash = hashlib.sha256(raw_prompt.encode()).hexdigest()[:16]
-        return f"{repo_full_name}:{branch}:{head_sha}:{prompt_hash}"
+        return f"{ExploreCache.build_scope(repo_full_name, branch, head_sha)}:{prompt_hash}"
 
     def get(self, key: str) -> str | None:
         entry = self._store.get(key)
@@ -27,7 +45,7 @@ class ExploreCache:
             self._misses += 1
             logger.debug("Explore cache miss: %s (total misses=%d)", key[:60], self._misses)
             return None
-        value, timestamp = entry
+        value, timestamp, _ = entry
         if time.monotonic() - timestamp > self._ttl:
             del self._store[key]
             self._misses += 1
@@ -38,13 +56,60 @@ class ExploreCache:
         logger.debug("Explore cache hit: %s (total hits=%d)", key[:60], self._hits)
         return value
 
-    def set(self, key: str, value: str) -> None:
+    def get_similar(
+        self, scope: str, embedding: np.ndarray, threshold: float,
+    ) -> tuple[str, float] | None:
+        """Return ``(value, similarity)`` for the closest entry in *scope*.
+
+        Only entries stored with an embedding participate.  Returns None
+        (and counts a semantic miss) when nothing in scope clears
+        *threshold*.
+        """
+        query = _normalize(embedding)
+        if query is None:
+            self._semantic_misses += 1
+            return None
+
+        prefix = f"{scope}:"
+        now = time.monotonic()
+        expired: list[str] = []
+        best_key: str | None = None
+        best_score = threshold
+        for key, (_, timestamp, vec) in self._store.items():
+            if vec is None or not key.startswith(prefix):
+                continue
+            if now - timestamp > self._ttl:
+                expired.append(key)
+                continue
+            score = float(vec @ query)
+            if score >= best_score:
+                best_key, best_score = key, score
+        for key in expired:
+            del self._store[key]
+
+        if best_key is None:
+            self._semantic_misses += 1
+            logger.debug(
+                "Explore semantic cache miss: %s (total semantic misses=%d)",
+                scope[:60], self._semantic_misses,
+            )
+            return None
+        self._store.move_to_end(best_key)
+        self._semantic_hits += 1
+        logger.debug(
+            "Explore semantic cache hit: %s sim=%.3f (total semantic hits=%d)",
+            best_key[:60], best_score, self._semantic_hits,
+        )
+        return self._store[best_key][0], best_score
+
+    def set(self, key: str, value: str, embedding: np.ndarray | None = None) -> None:
         if key in self._store:
             del self._store[key]
         elif len(self._store) >= self._max:
             evicted_key, _ = self._store.popitem(last=False)
             logger.debug("Explore cache LRU eviction: %s (size was %d)", evicted_key[:60], self._max)
-        self._store[key] = (value, time.monotonic())
+        vec = _normalize(embedding) if embedding is not None else None
+        self._store[key] = (value, time.monotonic(), vec)
         logger.debug("Explore cache set: %s (%d chars, size=%d)", key[:60], len(value), len(self._store))
 
     def invalidate(self, repo_full_name: str) -> None:
@@ -63,4 +128,19 @@ class ExploreCache:
         return count
 
     def stats(self) -> dict:
-        return {"hits": self._hits, "misses": self._misses, "size": len(self._store)}
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "semantic_hits": self._semantic_hits,
+            "semantic_misses": self._semantic_misses,
+            "size": len(self._store),
+        }
+
+
+def _normalize(vec: np.ndarray) -> np.ndarray | None:
+    """L2-normalize to float32; None for zero/degenerate vectors."""
+    arr = np.asarray(vec, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(arr))
+    if not np.isfinite(norm) or norm < 1e-9:
+        return None
+    return arr / norm
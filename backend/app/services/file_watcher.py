@@ -1,8 +1,10 @@
-"""Background file watcher for strategy template hot-reload.
+"""Background file watchers for strategy template hot-reload.
 
 Uses watchfiles.awatch() for OS-native filesystem events (inotify/FSEvents).
 Publishes strategy_changed events to the event bus on file add/modify/delete.
 On deletion, proactively sanitizes preferences to prevent stale defaults.
+``watch_config_files`` keeps ``config_cache`` in step with prompts/ and
+``preferences.json``.
 """
 
 from __future__ import annotations
@@ -10,10 +12,13 @@ from __future__ import annotations
 import asyncio
 import logging
 import time
+from collections.abc import Callable
 from pathlib import Path
 
 from watchfiles import Change, awatch
 
+from app.services.config_cache import config_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -90,6 +95,10 @@ async def watch_strategy_files(strategies_dir: Path) -> None:
                     name = path.stem
                     logger.info("Strategy file %s: %s", action, name)
 
+                    # The config watcher may not have seen this change yet —
+                    # drop the cached copy so readers below see the new state.
+                    config_cache.invalidate(path)
+
                     # Sanitize preferences before publishing — ensures
                     # the default strategy is valid by the time the
                     # frontend re-fetches preferences.
@@ -110,6 +119,74 @@ async def watch_strategy_files(strategies_dir: Path) -> None:
             await asyncio.sleep(5)
 
 
+async def _watch_config_root(
+    root: Path,
+    trusted: Path,
+    *,
+    recursive: bool,
+    watch_filter: Callable[[Change, str], bool] | None = None,
+) -> None:
+    """Invalidate ``config_cache`` for every change under *root*.
+
+    *trusted* is served from memory without a stat while the watcher is
+    live. It is registered on the first batch — ``yield_on_timeout``
+    guarantees one — so nothing changed before the watcher started is
+    trusted unchecked. On error or cancellation it falls back to mtime
+    validation.
+    """
+    while True:
+        live = False
+        try:
+            async for changes in awatch(
+                root,
+                watch_filter=watch_filter,
+                recursive=recursive,
+                debounce=500,
+                force_polling=True,
+                poll_delay_ms=1000,
+                rust_timeout=5000,
+                yield_on_timeout=True,
+            ):
+                if not live:
+                    config_cache.watch(trusted)
+                    live = True
+                for _change_type, path_str in changes:
+                    config_cache.invalidate(path_str)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.error("Config file watcher error (%s): %s", root, exc)
+            await asyncio.sleep(5)
+        finally:
+            config_cache.unwatch(trusted)
+
+
+async def watch_config_files(prompts_dir: Path, data_dir: Path) -> None:
+    """Keep cached templates, strategies and preferences in step with disk.
+
+    Watches prompts/ recursively and ``preferences.json`` in the data
+    directory. Runs as a long-lived background task. Cancellation-safe.
+    """
+    prefs_path = data_dir / "preferences.json"
+    watchers = []
+    if prompts_dir.is_dir():
+        watchers.append(_watch_config_root(prompts_dir, prompts_dir, recursive=True))
+    if data_dir.is_dir():
+        watchers.append(_watch_config_root(
+            data_dir, prefs_path, recursive=False,
+            watch_filter=lambda _change, path: Path(path).name == prefs_path.name,
+        ))
+    if not watchers:
+        logger.info("No config directories to watch — config file watcher not started")
+        return
+
+    logger.info("Config file watcher started: %s, %s", prompts_dir, prefs_path)
+    try:
+        await asyncio.gather(*watchers)
+    except asyncio.CancelledError:
+        logger.info("Config file watcher stopped")
+
+
 async def watch_seed_agent_files(agents_dir: Path) -> None:
     """Watch seed agent .md files for changes and publish events."""
     from app.services.event_bus import event_bus
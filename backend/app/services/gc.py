@@ -56,7 +56,12 @@ async def _gc_failed_optimizations(db: AsyncSession) -> int:
         return 0
 
     # Delete any dependent records first (feedbacks, refinement turns, patterns)
-    from app.models import Feedback, OptimizationPattern, RefinementTurn
+    from app.models import (
+        Feedback,
+        OptimizationEmbedding,
+        OptimizationPattern,
+        RefinementTurn,
+    )
 
     await db.execute(
         delete(Feedback).where(Feedback.optimization_id.in_(failed_ids))
@@ -67,6 +72,11 @@ async def _gc_failed_optimizations(db: AsyncSession) -> int:
     await db.execute(
         delete(OptimizationPattern).where(OptimizationPattern.optimization_id.in_(failed_ids))
     )
+    await db.execute(
+        delete(OptimizationEmbedding).where(
+            OptimizationEmbedding.optimization_id.in_(failed_ids)
+        )
+    )
 
     await db.execute(
         delete(Optimization).where(Optimization.id.in_(failed_ids))
@@ -6,6 +6,7 @@ Callers should catch this and return appropriate HTTP responses.
 
 import base64
 import logging
+from typing import IO
 
 import httpx
 
@@ -147,6 +148,30 @@ class GitHubClient:
             return base64.b64decode(data["content"]).decode(errors="replace")
         return data.get("content", "")
 
+    async def download_tarball(
+        self, token: str, full_name: str, ref: str, dest: IO[bytes],
+    ) -> int:
+        """Stream the repository tarball at *ref* into *dest*.
+
+        One request (plus GitHub's redirect to codeload) replaces a
+        contents-API call per file. Returns the number of bytes written.
+        """
+        written = 0
+        async with self._client.stream(
+            "GET",
+            f"{GITHUB_API}/repos/{full_name}/tarball/{ref}",
+            headers=self._headers(token),
+            follow_redirects=True,
+            timeout=httpx.Timeout(30.0, read=300.0),
+        ) as resp:
+            if not resp.is_success:
+                await resp.aread()
+                _check(resp)
+            async for chunk in resp.aiter_bytes():
+                dest.write(chunk)
+                written += len(chunk)
+        return written
+
     async def get_release_by_tag(
         self, token: str, full_name: str, tag: str
     ) -> dict | None:
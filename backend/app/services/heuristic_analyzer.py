@@ -16,6 +16,7 @@ from dataclasses import dataclass, field
 from sqlalchemy import exists, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.services.keyword_matcher import KeywordMatcher
 from app.utils.text_cleanup import LABEL_STOP_WORDS, extract_meaningful_words
 
 logger = logging.getLogger(__name__)
@@ -214,22 +215,26 @@ _TECHNICAL_NOUNS = frozenset({
     "table", "index", "model", "route", "handler", "worker",
 })
 
-# Pre-compiled word-boundary patterns for task_type keywords.
-# Built once at import time to avoid recompilation in hot loops.
-# Domain patterns are managed by DomainSignalLoader._precompile_patterns().
-_KEYWORD_PATTERNS: dict[str, re.Pattern[str]] = {}
+# All task_type keywords compiled into one matcher, so a single scan of the
+# prompt scores every category.  Rebuilt whenever the signals change.
+# Domain keywords have their own matcher in DomainSignalLoader.
+_TASK_TYPE_MATCHER = KeywordMatcher({})
+# Task types whose signals include single-word keywords beyond the static
+# compounds, i.e. classification used the dynamic (TF-IDF) vocabulary.
+_DYNAMIC_SINGLE_TASK_TYPES: frozenset[str] = frozenset()
 
 
 def _precompile_keyword_patterns() -> None:
-    """Pre-compile regex for all single-word task_type signals at module load."""
-    _KEYWORD_PATTERNS.clear()
-    for keywords in _TASK_TYPE_SIGNALS.values():
-        for keyword, _weight in keywords:
-            kw = keyword.lower()
-            if " " not in kw and kw not in _KEYWORD_PATTERNS:
-                _KEYWORD_PATTERNS[kw] = re.compile(
-                    r"\b" + re.escape(kw) + r"\b",
-                )
+    """Rebuild the task_type keyword matcher from ``_TASK_TYPE_SIGNALS``."""
+    global _TASK_TYPE_MATCHER, _DYNAMIC_SINGLE_TASK_TYPES
+    _TASK_TYPE_MATCHER = KeywordMatcher(_TASK_TYPE_SIGNALS)
+    _DYNAMIC_SINGLE_TASK_TYPES = frozenset(
+        task_type for task_type, keywords in _TASK_TYPE_SIGNALS.items()
+        if any(
+            " " not in kw for kw, w in keywords
+            if (kw, w) not in _STATIC_COMPOUND_SIGNALS.get(task_type, [])
+        )
+    )
 
 
 _precompile_keyword_patterns()
@@ -403,24 +408,18 @@ class HeuristicAnalyzer:
 
         # Layer 1: Keyword classification
         task_type, task_confidence, all_scores = self._classify(
-            prompt_lower, first_sentence, _TASK_TYPE_SIGNALS,
+            prompt_lower, first_sentence,
         )
 
         # Track whether dynamic or static signals were used for classification
-        _has_dynamic_singles = bool(_TASK_TYPE_SIGNALS.get(task_type)) and any(
-            " " not in kw for kw, _ in _TASK_TYPE_SIGNALS.get(task_type, [])
-            if (kw, _) not in _STATIC_COMPOUND_SIGNALS.get(task_type, [])
-        )
-        _signal_source = "dynamic" if _has_dynamic_singles else "static"
+        _signal_source = "dynamic" if task_type in _DYNAMIC_SINGLE_TASK_TYPES else "static"
 
         # Layer 1b: Technical verb disambiguation (A2)
         disambiguation_applied = False
         disambiguation_from: str | None = None
         if task_type in ("creative", "general"):
             if self._check_technical_disambiguation(first_sentence):
-                coding_score = self._score_category(
-                    prompt_lower, first_sentence, _TASK_TYPE_SIGNALS["coding"],
-                )
+                coding_score = all_scores.get("coding", 0.0)
                 if coding_score > 0:
                     disambiguation_from = task_type
                     task_type = "coding"
@@ -472,14 +471,14 @@ class HeuristicAnalyzer:
 
         # Boost coding confidence if code blocks present
         if has_code_blocks and task_type != "coding":
-            coding_score = self._score_category(prompt_lower, first_sentence, _TASK_TYPE_SIGNALS.get("coding", []))
+            coding_score = all_scores.get("coding", 0.0)
             if coding_score > task_confidence * 0.7:
                 task_type = "coding"
                 task_confidence = max(task_confidence, coding_score)
 
         # Boost analysis confidence if question form detected
         if is_question and task_type not in ("coding", "analysis"):
-            analysis_score = self._score_category(prompt_lower, first_sentence, _TASK_TYPE_SIGNALS.get("analysis", []))
+            analysis_score = all_scores.get("analysis", 0.0)
             if analysis_score > task_confidence * 0.5:
                 task_type = "analysis"
                 task_confidence = max(task_confidence, analysis_score)
@@ -560,6 +559,7 @@ class HeuristicAnalyzer:
             from pydantic import BaseModel as _BaseModel
 
             from app.config import settings
+            from app.providers.base import call_provider_with_retry
             from app.providers.detector import detect_provider
 
             provider = detect_provider()
@@ -589,12 +589,16 @@ class HeuristicAnalyzer:
                 task_type: str
                 domain: str
 
-            result = await provider.complete_parsed(
+            # Through the shared concurrency controller; no retry — the
+            # heuristic result stands if this fast fallback fails.
+            result = await call_provider_with_retry(
+                provider,
                 model=getattr(settings, "MODEL_HAIKU", "claude-haiku-4-5-20251001"),
                 system_prompt="You are a prompt classifier.",
                 user_message=prompt_text,
                 output_format=_ClassificationResult,
                 max_tokens=100,
+                max_retries=0,
             )
 
             task_type = result.task_type
@@ -617,52 +621,22 @@ class HeuristicAnalyzer:
 
     def _classify(
         self, prompt_lower: str, first_sentence: str,
-        signals: dict[str, list[tuple[str, float]]],
     ) -> tuple[str, float, dict[str, float]]:
-        """Score all categories and return (best_category, confidence, all_scores)."""
-        scores: dict[str, float] = {}
-        for category, keywords in signals.items():
-            scores[category] = self._score_category(
-                prompt_lower, first_sentence, keywords,
-            )
+        """Score all task-type categories and return (best_category, confidence, all_scores).
+
+        Each category scores the weights of its keywords found in the prompt,
+        doubled for keywords that also appear in the first sentence.  One
+        pass of ``_TASK_TYPE_MATCHER`` scores every category.  Single-word
+        keywords match on word boundaries (e.g. "class" does not match
+        "classification").  Multi-word keywords (e.g. "system prompt") match
+        as substrings.
+        """
+        scores = _TASK_TYPE_MATCHER.score(prompt_lower, first_sentence)
         if not scores or max(scores.values()) == 0:
             return "general", 0.0, scores
         best = max(scores, key=scores.get)  # type: ignore[arg-type]
         return best, min(1.0, scores[best]), scores
 
-    @staticmethod
-    def _score_category(
-        prompt_lower: str, first_sentence: str,
-        keywords: list[tuple[str, float]],
-    ) -> float:
-        """Score a category by weighted keyword presence with positional boost.
-
-        Uses pre-compiled word-boundary patterns to avoid false positives
-        (e.g. "class" should not match "classification").  Multi-word
-        keywords (e.g. "system prompt") use simple substring search since
-        ``\\b`` would not match internal spaces correctly.
-        """
-        score = 0.0
-        for keyword, weight in keywords:
-            kw = keyword.lower()
-            # Multi-word keywords: substring match (word-boundary would fail)
-            if " " in kw:
-                found_in_prompt = kw in prompt_lower
-                found_in_first = kw in first_sentence
-            else:
-                pat = _KEYWORD_PATTERNS.get(kw)
-                if pat:
-                    found_in_prompt = bool(pat.search(prompt_lower))
-                    found_in_first = bool(pat.search(first_sentence))
-                else:
-                    found_in_prompt = kw in prompt_lower
-                    found_in_first = kw in first_sentence
-            if found_in_prompt:
-                # 2x boost if keyword appears in first sentence
-                multiplier = 2.0 if found_in_first else 1.0
-                score += weight * multiplier
-        return score
-
     def _detect_weaknesses(
         self, raw_prompt: str, prompt_lower: str,
         words: list[str], task_type: str,
@@ -8,45 +8,266 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# ---------------------------------------------------------------------------
+# Single-pass lexical features
+# ---------------------------------------------------------------------------
+#
+# Every dimension reads one cached ``_PromptFeatures`` per prompt instead of
+# re-scanning the text with its own literal patterns.  Word-level signals
+# come from one ``\w+`` token pass: ``\b(?:a|b)\b`` matches exactly the
+# maximal word runs equal to ``a`` or ``b``, so counting tokens gives the
+# same numbers as the per-pattern ``findall`` calls it replaces.  Phrase
+# patterns (fillers, "at least", "do not", ...) still use their regex, but
+# only run when every literal word of the phrase occurs among the prompt's
+# tokens, which for most prompts skips nearly all of them.
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# Case-insensitive word features: feature -> words (``\b(?:...)\b``, re.I).
+_CI_WORD_FEATURES: dict[str, frozenset[str]] = {
+    "format_mention": frozenset({"output", "format", "return", "json", "schema", "yaml", "xml", "markdown"}),
+    "spec_modal": frozenset({
+        "must", "shall", "should", "require", "requires", "required", "ensure", "ensures", "ensured",
+    }),
+    "spec_outcome": frozenset({"return", "raise", "output", "yield", "produce", "generate", "include", "handle"}),
+    "spec_format": frozenset({"format", "schema", "json", "yaml", "xml", "csv", "markdown", "html"}),
+    "spec_example": frozenset({"example", "examples"}),
+    "spec_exclusion": frozenset({"never", "exclude", "except", "without", "avoid"}),
+    "spec_quantity": frozenset({"exactly", "within", "maximum", "minimum"}),
+    "spec_audience": frozenset({"formal", "informal", "tone", "audience", "voice", "tense"}),
+    "prec_error": frozenset({"raise", "error", "edgecase"}),
+    "prec_scope": frozenset({"scope", "boundar", "limitation", "constraint"}),
+}
+# Case-sensitive word features.
+_CS_WORD_FEATURES: dict[str, frozenset[str]] = {
+    "spec_type": frozenset({"str", "int", "float", "bool", "list", "dict", "tuple", "set"}),
+    "prec_modal": frozenset({"must", "shall", "should"}),
+}
+
+
+def _invert(features: dict[str, frozenset[str]]) -> dict[str, tuple[str, ...]]:
+    index: dict[str, tuple[str, ...]] = {}
+    for feature, words in features.items():
+        for word in words:
+            index[word] = index.get(word, ()) + (feature,)
+    return index
+
+
+_CI_WORD_INDEX = _invert(_CI_WORD_FEATURES)
+_CS_WORD_INDEX = _invert(_CS_WORD_FEATURES)
+# Non-ASCII tokens can still match ASCII words under re.IGNORECASE (e.g. the
+# Kelvin sign folds to "k"), so they are checked with the regex itself, and
+# phrase patterns are never skipped for such prompts.
+_CI_WORD_FULLMATCH: dict[str, re.Pattern[str]] = {
+    feature: re.compile("|".join(sorted(words)), re.IGNORECASE)
+    for feature, words in _CI_WORD_FEATURES.items()
+}
+
+# Phrase halves of the specificity and clarity patterns:
+# (feature, pattern, words that must all be tokens of the prompt).
+# "for example" needs no entry: each match holds exactly one "example"
+# token, which the word pass already counts.
+_PHRASES: tuple[tuple[str, re.Pattern[str], frozenset[str]], ...] = tuple(
+    (feature, re.compile(pattern, re.IGNORECASE), frozenset(required.split()))
+    for feature, pattern, required in (
+        ("spec_example", r"\be\.g\.\b", "e g"),
+        ("spec_example", r"\bsuch as\b", "such as"),
+        ("spec_exclusion", r"(?:do|must|should)\s+not\b", "not"),
+        ("spec_quantity", r"\b(?:at\s+least|at\s+most)\b", "at"),
+        ("spec_quantity", r"\bno\s+more\s+than\b", "no more than"),
+        ("spec_audience", r"\b(?:first|third)\s+person\b", "person"),
+        ("prec_error", r"\bedge\s+case\b", "edge case"),
+        ("prec_error", r"\bhandle\s+(?:error|exception|failure|edge)", "handle"),
+    )
+)
+
+# (pattern, words that must all be tokens of the prompt)
+_FILLERS: tuple[tuple[re.Pattern[str], frozenset[str]], ...] = tuple(
+    (re.compile(pattern, re.IGNORECASE), frozenset(required.split()))
+    for pattern, required in (
+        (r"\bplease note that\b", "please note that"),
+        (r"\bit is (?:very |quite |extremely )?important (?:that|to)\b", "it is important"),
+        (r"\bmake sure to\b", "make sure to"),
+        (r"\bbasically\b", "basically"),
+        (r"\bessentially\b", "essentially"),
+        (r"\bsort of\b", "sort of"),
+        (r"\bkind of\b", "kind of"),
+        (r"\bjust\b", "just"),
+        (r"\bperhaps\b", "perhaps"),
+        (r"\bgenerally\b", "generally"),
+        (r"\bas much as possible\b", "as much possible"),
+        (r"\bin a way that\b", "in a way that"),
+        (r"\btry to\b", "try to"),
+    )
+)
+
+# Only genuinely vague language, not identifiers or compound terms
+# (e.g. "Maybe-null", "etc_config", "perhaps_valid").
+_AMBIGUITY_WORDS = frozenset({"maybe", "perhaps", "somehow", "something", "stuff", "things", "etc", "possibly"})
+_RE_AMBIGUITY = re.compile(
+    rf"(?<![_a-zA-Z0-9])\b(?:{'|'.join(sorted(_AMBIGUITY_WORDS))})\b(?![_a-zA-Z0-9-])",
+)
+_RE_SOMETHING_CLARIFIED = re.compile(r"\w+\s*[—\-–:]\s*specifically\b|\blike\b")
+
+_RE_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_RE_TTR_WORDS = re.compile(r"\b[a-zA-Z']+\b")
+_RE_PREC_TYPED = re.compile(r"(?:->|:\s*(?:str|int|float|bool|list|dict))\b")
+_RE_PREC_CODE = re.compile(r"```|^    \S", re.MULTILINE)
+_RE_PREC_ROLE = re.compile(r"<role>|\byou are\b|^##?\s+role\b", re.IGNORECASE | re.MULTILINE)
+_RE_HEADERS = re.compile(r"(?m)^#{1,6}\s+\S")
+_RE_LIST_ITEMS = re.compile(r"(?m)^\s*[-*+]\s+\S|^\s*\d+\.\s+\S")
+_RE_XML_OPEN = re.compile(r"<([A-Za-z][A-Za-z0-9_-]*)(?:\s[^>]*)?>")
+_RE_XML_CLOSE = re.compile(r"</([A-Za-z][A-Za-z0-9_-]*)>")
+_RE_XML_ANY = re.compile(r"</?[A-Za-z][A-Za-z0-9_-]*\s*/?>")
+
+_SPECIFICITY_CAPS: tuple[float, ...] = (2.0, 2.0, 2.0, 2.0, 2.0, 1.0, 2.0, 2.0, 2.0, 2.0)
+
+
+@dataclass(frozen=True, slots=True)
+class _PromptFeatures:
+    """Lexical features of one prompt, shared by every scoring dimension."""
+
+    # Structure
+    n_headers: int
+    n_list_items: int
+    n_xml_sections: int
+    n_xml_tags: int
+    has_format_mention: bool
+    has_code_fence: bool
+    # Conciseness
+    n_ttr_words: int
+    n_unique_ttr_words: int
+    filler_counts: tuple[int, ...]
+    # Specificity — hits per category, in scoring order
+    specificity_hits: tuple[int, ...]
+    n_whitespace_words: int
+    # Clarity
+    precision_hits: int
+    ambiguity_hits: int
+
+
+def _count_ambiguity(prompt_lower: str) -> int:
+    hits = 0
+    for m in _RE_AMBIGUITY.finditer(prompt_lower):
+        word = m.group()
+        ctx_before = prompt_lower[max(0, m.start() - 15):m.start()].rstrip()
+        ctx_after = prompt_lower[m.end():m.end() + 20].lstrip()
+        # Skip "etc" used as a field/identifier name
+        if word == "etc" and (
+            ctx_before.endswith(("the", "an", "a", "its", "my"))
+            or ctx_after.startswith(("field", "config", "value"))
+        ):
+            continue
+        # Skip "something" immediately clarified ("something useful —
+        # specifically", "something like X")
+        if word == "something" and _RE_SOMETHING_CLARIFIED.match(ctx_after):
+            continue
+        # Skip "things" in enumeration context ("the following things:")
+        if word == "things" and (
+            ctx_before.endswith("following") or ctx_after.startswith(":")
+        ):
+            continue
+        hits += 1
+    return hits
+
+
+@lru_cache(maxsize=256)
+def _extract_features(prompt: str) -> _PromptFeatures:
+    """Compute every lexical feature of *prompt* from one pass over its tokens.
+
+    Cached: ``score_prompt`` and callers that score dimensions one by one
+    extract features once per prompt.
+    """
+    words: Counter[str] = Counter()
+    # Lowercased tokens, or None when a non-ASCII token makes case folding
+    # uncertain — then no phrase pattern is skipped.
+    folded: set[str] | None = set()
+    n_errors = 0
+    has_number = False
+    for tok, n in Counter(_TOKEN_RE.findall(prompt)).items():
+        for feature in _CS_WORD_INDEX.get(tok, ()):
+            words[feature] += n
+        if (len(tok) > 5 and tok.endswith("Error")) or (len(tok) > 9 and tok.endswith("Exception")):
+            n_errors += n
+        has_number = has_number or tok[0].isdecimal()
+        if tok.isascii():
+            low = tok.lower()
+            if folded is not None:
+                folded.add(low)
+            for feature in _CI_WORD_INDEX.get(low, ()):
+                words[feature] += n
+        else:
+            folded = None
+            for feature, pattern in _CI_WORD_FULLMATCH.items():
+                if pattern.fullmatch(tok):
+                    words[feature] += n
+
+    def present(required: frozenset[str]) -> bool:
+        return folded is None or required <= folded
+
+    for feature, pattern, required in _PHRASES:
+        if present(required):
+            words[feature] += len(pattern.findall(prompt))
+    filler_counts = tuple(
+        len(pattern.findall(prompt)) if present(required) else 0
+        for pattern, required in _FILLERS
+    )
+
+    prompt_lower = prompt.lower()
+    ttr_words = _RE_TTR_WORDS.findall(prompt_lower)
+    has_code_fence = "```" in prompt
+    has_role = (
+        (present(frozenset({"role"})) or present(frozenset({"you", "are"})))
+        and bool(_RE_PREC_ROLE.search(prompt))
+    )
+    precision_hits = sum((
+        words["prec_modal"] > 0,
+        bool(_RE_PREC_TYPED.search(prompt)),
+        has_code_fence or bool(_RE_PREC_CODE.search(prompt)),
+        has_role,
+        words["prec_error"] > 0,
+        words["prec_scope"] > 0,
+    ))
+    ambiguous = folded is None or not _AMBIGUITY_WORDS.isdisjoint(folded)
+
+    return _PromptFeatures(
+        n_headers=len(_RE_HEADERS.findall(prompt)),
+        n_list_items=len(_RE_LIST_ITEMS.findall(prompt)),
+        # XML section pairs: count tags with matching open/close
+        n_xml_sections=len(set(_RE_XML_OPEN.findall(prompt)) & set(_RE_XML_CLOSE.findall(prompt))),
+        n_xml_tags=len(_RE_XML_ANY.findall(prompt)),
+        has_format_mention=words["format_mention"] > 0,
+        has_code_fence=has_code_fence,
+        n_ttr_words=len(ttr_words),
+        n_unique_ttr_words=len(set(ttr_words)),
+        filler_counts=filler_counts,
+        specificity_hits=(
+            words["spec_modal"],
+            words["spec_outcome"],
+            words["spec_type"] + prompt.count("->"),
+            words["spec_format"],
+            words["spec_example"],
+            len(_RE_NUMBER.findall(prompt)) if has_number else 0,
+            n_errors,
+            words["spec_exclusion"],
+            words["spec_quantity"],
+            words["spec_audience"],
+        ),
+        n_whitespace_words=len(prompt.split()),
+        precision_hits=precision_hits,
+        ambiguity_hits=_count_ambiguity(prompt_lower) if ambiguous else 0,
+    )
+
 
 class HeuristicScorer:
     """Static scoring utilities for passthrough pipeline validation."""
 
-    # ------------------------------------------------------------------
-    # Shared regex patterns (DRY — used by structure, clarity, conciseness)
-    # ------------------------------------------------------------------
-
-    _RE_HEADERS = r"(?m)^#{1,6}\s+\S"
-    _RE_LIST_ITEMS = r"(?m)^\s*[-*+]\s+\S|^\s*\d+\.\s+\S"
-    _RE_XML_OPEN = r"<([A-Za-z][A-Za-z0-9_-]*)(?:\s[^>]*)?>"
-    _RE_XML_CLOSE = r"</([A-Za-z][A-Za-z0-9_-]*)>"
-    _RE_XML_ANY = r"</?[A-Za-z][A-Za-z0-9_-]*\s*/?>"
-    _RE_FORMAT_MENTION = r"\b(?:output|format|return|json|schema|yaml|xml|markdown)\b"
-
-    @staticmethod
-    def _count_structural_signals(prompt: str) -> dict[str, int]:
-        """Parse structural formatting signals once for reuse across heuristics."""
-        n_headers = len(re.findall(HeuristicScorer._RE_HEADERS, prompt))
-        n_list_items = len(re.findall(HeuristicScorer._RE_LIST_ITEMS, prompt))
-        # XML section pairs: count tags with matching open/close
-        xml_opens = set(re.findall(HeuristicScorer._RE_XML_OPEN, prompt))
-        xml_closes = set(re.findall(HeuristicScorer._RE_XML_CLOSE, prompt))
-        n_xml_sections = len(xml_opens & xml_closes)
-        n_xml_tags = len(re.findall(HeuristicScorer._RE_XML_ANY, prompt))
-        has_format = bool(re.search(
-            HeuristicScorer._RE_FORMAT_MENTION, prompt, re.IGNORECASE,
-        ))
-        return {
-            "n_headers": n_headers,
-            "n_list_items": n_list_items,
-            "n_xml_sections": n_xml_sections,
-            "n_xml_tags": n_xml_tags,
-            "has_format_mention": has_format,
-        }
-
     # ------------------------------------------------------------------
     # Structural heuristics
     # ------------------------------------------------------------------
@@ -59,38 +280,38 @@ class HeuristicScorer:
         structural signals.  Both bonuses are additive — prompts using
         both patterns for different purposes get credit for each.
         """
-        sig = HeuristicScorer._count_structural_signals(prompt)
+        sig = _extract_features(prompt)
         score = 4.0
 
         # --- Markdown headers ---
-        if sig["n_headers"] >= 3:
+        if sig.n_headers >= 3:
             score += 2.5
-        elif sig["n_headers"] >= 2:
+        elif sig.n_headers >= 2:
             score += 2.0
-        elif sig["n_headers"] == 1:
+        elif sig.n_headers == 1:
             score += 1.0
 
         # --- XML section pairs (paired open/close tags) ---
-        if sig["n_xml_sections"] >= 3:
+        if sig.n_xml_sections >= 3:
             score += 2.5
-        elif sig["n_xml_sections"] >= 2:
+        elif sig.n_xml_sections >= 2:
             score += 2.0
-        elif sig["n_xml_sections"] == 1:
+        elif sig.n_xml_sections == 1:
             score += 1.0
-        elif sig["n_xml_tags"] >= 2:
+        elif sig.n_xml_tags >= 2:
             # Unpaired XML tags (e.g., self-closing or data delimiters)
             score += 1.0
 
         # --- List items ---
-        if sig["n_list_items"] >= 4:
+        if sig.n_list_items >= 4:
             score += 2.0
-        elif sig["n_list_items"] >= 2:
+        elif sig.n_list_items >= 2:
             score += 1.5
-        elif sig["n_list_items"] == 1:
+        elif sig.n_list_items == 1:
             score += 0.5
 
         # --- Output format mention ---
-        if sig["has_format_mention"]:
+        if sig.has_format_mention:
             score += 1.0
 
         return round(max(1.0, min(10.0, score)), 2)
@@ -103,28 +324,12 @@ class HeuristicScorer:
         contributes useful information. A long, structured prompt with
         high information density scores well.
         """
-        fillers = [
-            r"\bplease note that\b",
-            r"\bit is (?:very |quite |extremely )?important (?:that|to)\b",
-            r"\bmake sure to\b",
-            r"\bbasically\b",
-            r"\bessentially\b",
-            r"\bsort of\b",
-            r"\bkind of\b",
-            r"\bjust\b",
-            r"\bperhaps\b",
-            r"\bgenerally\b",
-            r"\bas much as possible\b",
-            r"\bin a way that\b",
-            r"\btry to\b",
-        ]
-
-        words = re.findall(r"\b[a-zA-Z']+\b", prompt.lower())
-        total = len(words)
+        sig = _extract_features(prompt)
+        total = sig.n_ttr_words
         if total == 0:
             return 6.0
 
-        unique = len(set(words))
+        unique = sig.n_unique_ttr_words
         ttr = unique / total
 
         # Base 6.0 + TTR adjustment (0.5 midpoint for long prompts)
@@ -134,10 +339,9 @@ class HeuristicScorer:
         # Well-structured prompts with domain-term repetition shouldn't be
         # penalized by low TTR — structure IS conciseness.  Tiered bonus
         # scales with structural complexity (cap +3.0).
-        sig = HeuristicScorer._count_structural_signals(prompt)
-        headers = sig["n_headers"]
-        lists = sig["n_list_items"]
-        has_code = bool(re.search(r"```", prompt))
+        headers = sig.n_headers
+        lists = sig.n_list_items
+        has_code = sig.has_code_fence
         struct_bonus = 0.0
         if headers >= 1 or lists >= 2:
             struct_bonus += 1.0  # base: any meaningful structure
@@ -152,9 +356,8 @@ class HeuristicScorer:
         score += min(struct_bonus, 3.0)
 
         # Filler penalty
-        for pattern in fillers:
-            matches = re.findall(pattern, prompt, re.IGNORECASE)
-            score -= 0.8 * len(matches)
+        for matches in sig.filler_counts:
+            score -= 0.8 * matches
 
         # Minimum information gate: short prompts get a ceiling.
         # Brevity without substance is not conciseness.
@@ -173,34 +376,17 @@ class HeuristicScorer:
         Broadened beyond coding patterns to cover creative, analytical,
         and writing prompts.
         """
-        categories: list[tuple[str, int, float]] = [
-            # (pattern, re_flags, category_cap)
-            # 1. Modal obligations
-            (r"\b(?:must|shall|should|require[ds]?|ensure[ds]?)\b", re.IGNORECASE, 2.0),
-            # 2. Outcome verbs
-            (r"\b(?:return|raise|output|yield|produce|generate|include|handle)\b", re.IGNORECASE, 2.0),
-            # 3. Type annotations + function signatures
-            (r"\b(?:str|int|float|bool|list|dict|tuple|set)\b|->", 0, 2.0),
-            # 4. Format keywords
-            (r"\b(?:format|schema|json|yaml|xml|csv|markdown|html)\b", re.IGNORECASE, 2.0),
-            # 5. Example markers
-            (r"\bfor example\b|\be\.g\.\b|\bsuch as\b|\bexamples?\b", re.IGNORECASE, 2.0),
-            # 6. Numeric constraints (capped at 1.0 — avoids incidental numbers)
-            (r"\b\d+(?:\.\d+)?\b", 0, 1.0),
-            # 7. Error/exception types
-            (r"\b\w+(?:Error|Exception)\b", 0, 2.0),
-            # 8. Exclusion/negation constraints
-            (r"\b(?:never|exclude|except|without|avoid)\b|(?:do|must|should)\s+not\b", re.IGNORECASE, 2.0),
-            # 9. Temporal/quantity constraints
-            (r"\b(?:exactly|at\s+least|at\s+most|no\s+more\s+than|within|maximum|minimum)\b", re.IGNORECASE, 2.0),
-            # 10. Audience/tone/style
-            (r"\b(?:first\s+person|third\s+person|formal|informal|tone|audience|voice|tense)\b", re.IGNORECASE, 2.0),
-        ]
-
+        # Hits per category, capped at +2.0 except numeric constraints
+        # (capped at 1.0 — avoids incidental numbers):
+        #  1. modal obligations       2. outcome verbs
+        #  3. type annotations / ->   4. format keywords
+        #  5. example markers         6. numeric constraints
+        #  7. Error/Exception types   8. exclusion/negation constraints
+        #  9. temporal/quantity       10. audience/tone/style
+        sig = _extract_features(prompt)
         total = 3.0  # Raised from 2.5 — most optimized prompts are at least somewhat specific
         categories_hit = 0
-        for pattern, flags, cap in categories:
-            hits = len(re.findall(pattern, prompt, flags))
+        for hits, cap in zip(sig.specificity_hits, _SPECIFICITY_CAPS):
             if hits > 0:
                 categories_hit += 1
                 category_score = min(1.0 + 0.3 * (hits - 1), cap)
@@ -209,7 +395,7 @@ class HeuristicScorer:
         # Density bonus: reward concentrated specificity in shorter prompts.
         # A 50-word prompt hitting 4 categories is MORE specific per-word than
         # a 500-word prompt hitting the same 4. Cap bonus at 1.5.
-        word_count = max(1, len(prompt.split()))
+        word_count = max(1, sig.n_whitespace_words)
         if categories_hit >= 2:
             density = categories_hit / (word_count / 40)
             total += min(1.5, density * 0.5)
@@ -228,62 +414,20 @@ class HeuristicScorer:
         score = 5.0
 
         # --- Organizational clarity (capped +1.5) ---
-        sig = HeuristicScorer._count_structural_signals(prompt)
-        has_sections = sig["n_headers"] >= 1 or sig["n_xml_sections"] >= 2 or sig["n_list_items"] >= 3
+        sig = _extract_features(prompt)
+        has_sections = sig.n_headers >= 1 or sig.n_xml_sections >= 2 or sig.n_list_items >= 3
         if has_sections:
             score += 1.0
-        if sig["has_format_mention"]:
+        if sig.has_format_mention:
             score += 0.5
 
         # --- Precision signals (up to +3.0) ---
-        precision_checks: list[tuple[str, int]] = [
-            (r"\b(?:must|shall|should)\b", 0),                             # explicit constraints
-            (r"(?:->|:\s*(?:str|int|float|bool|list|dict))\b", 0),        # typed parameters
-            (r"```|^    \S", re.MULTILINE),                                # code blocks / indented code
-            (r"<role>|\byou are\b|^##?\s+role\b", re.IGNORECASE | re.MULTILINE),  # role framing
-            (r"\b(?:raise|error|edge\s*case)\b|\bhandle\s+(?:error|exception|failure|edge)",  # error/edge handling
-             re.IGNORECASE),
-            (r"\b(?:scope|boundar|limitation|constraint)\b", re.IGNORECASE),  # scoping language
-        ]
-        precision_hits = sum(
-            1 for pat, flags in precision_checks if re.search(pat, prompt, flags)
-        )
-        score += min(precision_hits * 0.5, 3.0)
+        # Explicit constraints, typed parameters, code blocks / indented
+        # code, role framing, error/edge handling, scoping language.
+        score += min(sig.precision_hits * 0.5, 3.0)
 
         # --- Ambiguity penalty (max -3.0) ---
-        # Only penalize genuinely vague language, not identifiers or
-        # compound terms (e.g. "Maybe-null", "etc_config", "perhaps_valid").
-        ambiguity_words = [
-            "maybe", "perhaps", "somehow", "something",
-            "stuff", "things", "etc", "possibly",
-        ]
-        ambiguity_hits = 0
-        prompt_lower = prompt.lower()
-        for word in ambiguity_words:
-            # Match standalone words not touching identifiers on either side
-            pattern = rf"(?<![_a-zA-Z0-9])\b{word}\b(?![_a-zA-Z0-9-])"
-            for m in re.finditer(pattern, prompt_lower):
-                ctx_before = prompt_lower[max(0, m.start() - 15):m.start()].rstrip()
-                ctx_after = prompt_lower[m.end():m.end() + 20].lstrip()
-                # Skip "etc" used as a field/identifier name
-                if word == "etc" and (
-                    ctx_before.endswith(("the", "an", "a", "its", "my"))
-                    or ctx_after.startswith(("field", "config", "value"))
-                ):
-                    continue
-                # Skip "something" immediately clarified ("something useful —
-                # specifically", "something like X")
-                if word == "something" and re.match(
-                    r"\w+\s*[—\-–:]\s*specifically\b|\blike\b", ctx_after
-                ):
-                    continue
-                # Skip "things" in enumeration context ("the following things:")
-                if word == "things" and (
-                    ctx_before.endswith("following") or ctx_after.startswith(":")
-                ):
-                    continue
-                ambiguity_hits += 1
-        score -= min(ambiguity_hits * 0.5, 3.0)
+        score -= min(sig.ambiguity_hits * 0.5, 3.0)
 
         return round(max(1.0, min(10.0, score)), 2)
 
@@ -0,0 +1,321 @@
+"""Background writer for append-only JSONL logs.
+
+``TraceLogger`` and ``TaxonomyEventLogger`` used to open, append and close
+their daily file on the event loop for every line. They now hand the
+serialized line to :class:`JsonlWriter`, which appends from a single
+daemon thread:
+
+- **Ordering** — one consumer thread drains one FIFO queue, so lines for a
+  given file land in the order they were submitted.
+- **Handle reuse** — ``O_APPEND`` descriptors stay open between writes,
+  keyed by path; each drained burst is one ``write()`` per file. When the
+  daily file name rolls over, the new path gets its own descriptor and
+  yesterday's is closed once it has been idle for ``_HANDLE_IDLE_SECONDS``
+  (or evicted past ``_MAX_OPEN_HANDLES``).
+- **Offset sidecar** — a line written with ``index=`` also gets a
+  ``<index>\t<offset>\t<length>`` line in ``<file>.idx``, appended after
+  the data so a sidecar entry never points past the file. Offsets come from
+  the ``O_APPEND`` write itself, so they stay correct when another process
+  appends to the same file.
+- **fsync policy** — every drained burst is flushed to the OS; ``fsync``
+  runs at most once per ``JSONL_FSYNC_INTERVAL_SECONDS`` per file
+  (``0`` = after every burst, negative = never).
+- **Bounded** — at most ``JSONL_WRITER_QUEUE_SIZE`` pending lines.
+  ``write()`` never blocks; overflow is dropped and counted.
+
+Readers of these files call :meth:`JsonlWriter.flush` first so they see
+everything submitted before the read.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_MAX_OPEN_HANDLES = 16
+_HANDLE_IDLE_SECONDS = 300.0
+
+
+class _Barrier:
+    """Queue marker: set once every line submitted before it is written."""
+
+    __slots__ = ("done",)
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class _Handle:
+    __slots__ = ("fd", "pending", "pending_size", "index", "last_write", "last_fsync", "dirty")
+
+    def __init__(self, fd: int) -> None:
+        self.fd = fd
+        self.pending: list[bytes] = []
+        self.pending_size = 0
+        # (start within pending burst, length, index key) per indexed line
+        self.index: list[tuple[int, int, str]] = []
+        self.last_write = time.monotonic()
+        self.last_fsync = self.last_write
+        self.dirty = False
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        n = os.write(fd, view)
+        view = view[n:]
+
+
+class JsonlWriter:
+    """Single-threaded, ordered, bounded appender for JSONL files."""
+
+    def __init__(self, max_queue: int = 10_000, fsync_interval: float = 1.0) -> None:
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=max(1, max_queue))
+        self._fsync_interval = fsync_interval
+        self._handles: OrderedDict[Path, _Handle] = OrderedDict()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+        self._written = 0
+        self._dropped = 0
+        self._errors = 0
+
+    # ------------------------------------------------------------------
+    # Producer side
+    # ------------------------------------------------------------------
+
+    def write(self, path: Path, line: str, index: str | None = None) -> bool:
+        """Queue *line* (without trailing newline) for *path*.
+
+        With *index*, the line's byte offset and length are recorded in the
+        ``.idx`` sidecar under that key (tab-free string).
+        Returns False when the line was dropped (queue full or closed).
+        """
+        if self._closed:
+            self._dropped += 1
+            return False
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((path, line, index))
+        except queue.Full:
+            self._dropped += 1
+            if self._dropped == 1 or self._dropped % 1000 == 0:
+                logger.warning(
+                    "JSONL writer queue full — dropped %d lines so far", self._dropped,
+                )
+            return False
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until every line queued so far is written and flushed."""
+        if self._thread is None or not self._thread.is_alive():
+            return self._queue.empty()
+        barrier = _Barrier()
+        try:
+            self._queue.put(barrier, timeout=timeout)
+        except queue.Full:
+            return False
+        return barrier.done.wait(timeout)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name="jsonl_writer",
+                )
+                self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Consumer thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=_HANDLE_IDLE_SECONDS / 2)
+            except queue.Empty:
+                self._close_idle()
+                continue
+            barriers: list[_Barrier] = []
+            stop = False
+            # Drain whatever else is already queued as one burst.
+            while True:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, _Barrier):
+                    barriers.append(item)
+                else:
+                    self._append(*item)  # type: ignore[misc]
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+            self._flush_handles()
+            for barrier in barriers:
+                barrier.done.set()
+            if stop:
+                self._close_all()
+                return
+
+    def _append(self, path: Path, line: str, index: str | None = None) -> None:
+        try:
+            handle = self._handles.get(path)
+            if handle is None:
+                handle = self._open(path)
+            else:
+                self._handles.move_to_end(path)
+        except OSError as exc:
+            self._errors += 1
+            logger.warning("JSONL open of %s failed: %s", path.name, exc)
+            return
+        data = (line + "\n").encode("utf-8")
+        if index is not None:
+            handle.index.append((handle.pending_size, len(data), index))
+        handle.pending.append(data)
+        handle.pending_size += len(data)
+        handle.last_write = time.monotonic()
+        handle.dirty = True
+
+    def _open(self, path: Path) -> _Handle:
+        while len(self._handles) >= _MAX_OPEN_HANDLES:
+            self._close(next(iter(self._handles)))
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        handle = _Handle(fd)
+        self._handles[path] = handle
+        return handle
+
+    def _flush_handles(self) -> None:
+        now = time.monotonic()
+        for path, handle in list(self._handles.items()):
+            if not handle.dirty:
+                continue
+            try:
+                self._write_pending(path, handle)
+                if self._fsync_interval >= 0 and now - handle.last_fsync >= self._fsync_interval:
+                    os.fsync(handle.fd)
+                    handle.last_fsync = now
+            except OSError as exc:
+                self._errors += 1
+                logger.warning("JSONL write to %s failed: %s", path.name, exc)
+                self._close(path)
+        self._close_idle(now)
+
+    def _write_pending(self, path: Path, handle: _Handle) -> None:
+        data = b"".join(handle.pending)
+        lines = len(handle.pending)
+        index = handle.index
+        handle.pending, handle.pending_size, handle.index = [], 0, []
+        handle.dirty = False
+        if not data:
+            return
+        _write_all(handle.fd, data)
+        self._written += lines
+        if not index:
+            return
+        # O_APPEND leaves the descriptor's offset at the end of our write.
+        start = os.lseek(handle.fd, 0, os.SEEK_CUR) - len(data)
+        sidecar = "".join(
+            f"{key}\t{start + rel}\t{length}\n" for rel, length, key in index
+        ).encode("utf-8")
+        fd = os.open(path.with_suffix(".idx"), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            _write_all(fd, sidecar)
+        finally:
+            os.close(fd)
+
+    def _close_idle(self, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        for path, handle in list(self._handles.items()):
+            if not handle.dirty and now - handle.last_write > _HANDLE_IDLE_SECONDS:
+                self._close(path)
+
+    def _close(self, path: Path) -> None:
+        handle = self._handles.pop(path, None)
+        if handle is None:
+            return
+        try:
+            if handle.dirty:
+                self._write_pending(path, handle)
+                if self._fsync_interval >= 0:
+                    os.fsync(handle.fd)
+        except OSError:
+            self._errors += 1
+        finally:
+            try:
+                os.close(handle.fd)
+            except OSError:
+                pass
+
+    def _close_all(self) -> None:
+        for path in list(self._handles):
+            self._close(path)
+
+    # ------------------------------------------------------------------
+    # Lifecycle / metrics
+    # ------------------------------------------------------------------
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write out the queue, close every handle and stop the thread."""
+        if self._closed:
+            return
+        self._closed = True
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("JSONL writer queue still full at close — lines lost")
+            return
+        thread.join(timeout)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "queued": self._queue.qsize(),
+            "written": self._written,
+            "dropped": self._dropped,
+            "errors": self._errors,
+            "open_files": len(self._handles),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Process-wide singleton
+# ---------------------------------------------------------------------------
+
+_instance: JsonlWriter | None = None
+_instance_lock = threading.Lock()
+
+
+def get_jsonl_writer() -> JsonlWriter:
+    global _instance
+    if _instance is None:
+        with _instance_lock:
+            if _instance is None:
+                from app.config import settings
+
+                _instance = JsonlWriter(
+                    max_queue=settings.JSONL_WRITER_QUEUE_SIZE,
+                    fsync_interval=settings.JSONL_FSYNC_INTERVAL_SECONDS,
+                )
+    return _instance
+
+
+def shutdown_jsonl_writer(timeout: float = 5.0) -> None:
+    """Drain and close the shared writer (lifespan shutdown, tests)."""
+    global _instance
+    if _instance is not None:
+        _instance.close(timeout)
+    _instance = None
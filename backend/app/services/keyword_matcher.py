@@ -0,0 +1,103 @@
+"""Single-pass weighted keyword matching for heuristic classification.
+
+A ``KeywordMatcher`` compiles a ``{category: [(keyword, weight), ...]}``
+signal map once. After that, one scan of the text scores every category.
+Before, every keyword needed its own regex search, so classification cost
+grew with vocabulary size. Rebuild the matcher when the signals change.
+
+A keyword made only of word characters matches exactly when it is one of
+the text's maximal ``\\w+`` runs. That is the same as ``\\bkeyword\\b``, so
+these keywords are answered by a hash lookup per token of the text. A
+single-word keyword with punctuation (``node.js``, ``c++``) keeps its own
+``\\b`` regex. A multi-word keyword keeps substring matching. Both are rare
+in practice.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+
+_TOKEN_RE = re.compile(r"\w+")
+
+# (category, position in the category's keyword list, weight)
+_Entry = tuple[str, int, float]
+
+
+class KeywordMatcher:
+    """Score every category of a weighted keyword map in one pass over the text."""
+
+    __slots__ = ("_categories", "_words", "_irregular", "_phrases")
+
+    def __init__(self, signals: Mapping[str, Iterable[tuple[str, float]]]) -> None:
+        self._categories: tuple[str, ...] = tuple(signals)
+        self._words: dict[str, list[_Entry]] = {}
+        self._irregular: dict[str, tuple[re.Pattern[str], list[_Entry]]] = {}
+        self._phrases: dict[str, list[_Entry]] = {}
+        for category, keywords in signals.items():
+            for idx, (keyword, weight) in enumerate(keywords):
+                kw = keyword.lower()
+                entry = (category, idx, weight)
+                if " " in kw:
+                    self._phrases.setdefault(kw, []).append(entry)
+                elif _TOKEN_RE.fullmatch(kw):
+                    self._words.setdefault(kw, []).append(entry)
+                elif kw in self._irregular:
+                    self._irregular[kw][1].append(entry)
+                else:
+                    pattern = re.compile(r"\b" + re.escape(kw) + r"\b")
+                    self._irregular[kw] = (pattern, [entry])
+
+    def score(self, text: str, first_sentence: str = "") -> dict[str, float]:
+        """Weighted keyword score for every category, in signal order.
+
+        A keyword found in *text* adds its weight once. The weight is doubled
+        when the keyword is also found in *first_sentence*. Both strings are
+        expected to be lowercase already.
+        """
+        hits: dict[str, list[tuple[int, float]]] = {}
+        first_tokens = set(_TOKEN_RE.findall(first_sentence))
+        for tok in set(_TOKEN_RE.findall(text)):
+            entries = self._words.get(tok)
+            if entries:
+                _add(hits, entries, 2.0 if tok in first_tokens else 1.0)
+        for pattern, entries in self._irregular.values():
+            if pattern.search(text):
+                _add(hits, entries, 2.0 if pattern.search(first_sentence) else 1.0)
+        for kw, entries in self._phrases.items():
+            if kw in text:
+                _add(hits, entries, 2.0 if kw in first_sentence else 1.0)
+        return self._totals(hits)
+
+    def score_tokens(self, tokens: Iterable[str]) -> dict[str, float]:
+        """Sum the weights of single-word keywords present in *tokens*.
+
+        *tokens* should be distinct (a set). They are compared verbatim, so
+        the caller decides how the text is split. Multi-word keywords are
+        ignored.
+        """
+        hits: dict[str, list[tuple[int, float]]] = {}
+        for tok in tokens:
+            entries = self._words.get(tok)
+            if entries is None:
+                irregular = self._irregular.get(tok)
+                entries = irregular[1] if irregular else None
+            if entries:
+                _add(hits, entries, 1.0)
+        return self._totals(hits)
+
+    def _totals(self, hits: dict[str, list[tuple[int, float]]]) -> dict[str, float]:
+        # Sum in keyword-list order so totals are bit-identical to a
+        # keyword-by-keyword loop regardless of token iteration order.
+        totals = dict.fromkeys(self._categories, 0.0)
+        for category, weighted in hits.items():
+            score = 0.0
+            for _idx, value in sorted(weighted):
+                score += value
+            totals[category] = score
+        return totals
+
+
+def _add(hits: dict[str, list[tuple[int, float]]], entries: list[_Entry], multiplier: float) -> None:
+    for category, idx, weight in entries:
+        hits.setdefault(category, []).append((idx, weight * multiplier))
@@ -0,0 +1,256 @@
+"""In-process streaming latency histograms and Prometheus text export.
+
+Every histogram uses the same fixed log-linear bucket layout (HDR style):
+four buckets per power of two from 1 ms to ~20 min, so any quantile read
+back from the counts is within ~9% of the true value. Recording an
+observation is a bisect over ~80 precomputed bounds plus three increments
+under an uncontended lock — no allocation, no sorting, no disk I/O.
+
+Series are created on first observation, keyed by metric name and label
+values. Point-in-time values (queue depths, concurrency limits) are
+registered as gauge callbacks and only evaluated when ``/api/metrics`` is
+scraped.
+
+Usage::
+
+    from app.services.metrics import observe, timed
+
+    observe("provider_call_duration_seconds", 1.2, provider="claude_cli")
+    with timed("warm_phase_duration_seconds", phase="merge"):
+        ...
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+_MIN_BOUND = 0.001  # seconds
+_BUCKETS_PER_OCTAVE = 4
+_OCTAVES = 20  # 1 ms · 2^20 ≈ 17.5 min
+_BOUNDS: tuple[float, ...] = tuple(
+    _MIN_BOUND * 2 ** (i / _BUCKETS_PER_OCTAVE)
+    for i in range(_OCTAVES * _BUCKETS_PER_OCTAVE + 1)
+)
+
+# Declared histograms. Observing an undeclared name still works; it is
+# exported with a generic help line.
+HISTOGRAMS: dict[str, str] = {
+    "pipeline_phase_duration_seconds": "Optimization pipeline phase duration (from trace logging).",
+    "provider_call_duration_seconds": "LLM provider call duration per attempt.",
+    "embedding_duration_seconds": "Sentence-embedding encode duration.",
+    "db_session_duration_seconds": "Lifetime of request-scoped database sessions.",
+    "warm_phase_duration_seconds": "Taxonomy warm-path phase duration.",
+}
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+class Histogram:
+    """Fixed log-bucket histogram with count, sum and quantile estimates."""
+
+    __slots__ = ("counts", "count", "total", "_lock")
+
+    def __init__(self) -> None:
+        # One slot per bound plus an overflow slot (+Inf).
+        self.counts = [0] * (len(_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        i = bisect.bisect_left(_BOUNDS, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.total += value
+
+    def quantile(self, q: float) -> float | None:
+        """Estimated *q*-quantile (0..1), interpolated within its bucket."""
+        with self._lock:
+            counts = list(self.counts)
+            n = self.count
+        if n == 0:
+            return None
+        rank = q * n
+        seen = 0
+        for i, c in enumerate(counts):
+            if c and seen + c >= rank:
+                lo = _BOUNDS[i - 1] if i > 0 else 0.0
+                hi = _BOUNDS[i] if i < len(_BOUNDS) else _BOUNDS[-1]
+                return lo + (hi - lo) * ((rank - seen) / c)
+            seen += c
+        return _BOUNDS[-1]
+
+    def snapshot(self) -> tuple[list[int], int, float]:
+        with self._lock:
+            return list(self.counts), self.count, self.total
+
+
+class MetricsRegistry:
+    """Histogram series plus scrape-time gauge callbacks."""
+
+    def __init__(self) -> None:
+        self._histograms: dict[str, dict[LabelKey, Histogram]] = {}
+        self._gauges: dict[str, tuple[str, str, Callable[[], dict[LabelKey, float] | float | None]]] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str, labels: LabelKey = ()) -> Histogram:
+        series = self._histograms.get(name)
+        if series is not None:
+            hist = series.get(labels)
+            if hist is not None:
+                return hist
+        with self._lock:
+            hist = self._histograms.setdefault(name, {}).get(labels)
+            if hist is None:
+                hist = self._histograms[name][labels] = Histogram()
+            return hist
+
+    def observe(self, name: str, value: float, labels: LabelKey = ()) -> None:
+        self.histogram(name, labels).observe(value)
+
+    def register_gauge(
+        self,
+        name: str,
+        help_text: str,
+        fn: Callable[[], dict[LabelKey, float] | float | None],
+        kind: str = "gauge",
+    ) -> None:
+        """Register a scrape-time callback (``kind`` is ``gauge`` or ``counter``)."""
+        self._gauges[name] = (help_text, kind, fn)
+
+    def render(self) -> str:
+        """Prometheus text exposition format (0.0.4)."""
+        lines: list[str] = []
+        for name in sorted(self._histograms):
+            lines.append(f"# HELP {name} {HISTOGRAMS.get(name, 'Latency histogram.')}")
+            lines.append(f"# TYPE {name} histogram")
+            for labels, hist in sorted(self._histograms[name].items()):
+                counts, count, total = hist.snapshot()
+                cumulative = 0
+                for bound, c in zip(_BOUNDS, counts):
+                    cumulative += c
+                    lines.append(
+                        f"{name}_bucket{_fmt_labels(labels, ('le', _fmt_float(bound)))} {cumulative}"
+                    )
+                lines.append(f"{name}_bucket{_fmt_labels(labels, ('le', '+Inf'))} {count}")
+                lines.append(f"{name}_sum{_fmt_labels(labels)} {_fmt_float(total)}")
+                lines.append(f"{name}_count{_fmt_labels(labels)} {count}")
+        for name in sorted(self._gauges):
+            help_text, kind, fn = self._gauges[name]
+            try:
+                value = fn()
+            except Exception:
+                logger.debug("metrics gauge %s failed", name, exc_info=True)
+                continue
+            if value is None:
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            samples = value if isinstance(value, dict) else {(): value}
+            for labels, v in sorted(samples.items()):
+                lines.append(f"{name}{_fmt_labels(labels)} {_fmt_float(float(v))}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+
+
+def _fmt_float(v: float) -> str:
+    if math.isinf(v):
+        return "+Inf" if v > 0 else "-Inf"
+    return repr(round(v, 6)) if v != int(v) else str(int(v))
+
+
+def _escape(v: str) -> str:
+    return v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _fmt_labels(labels: LabelKey, *extra: tuple[str, str]) -> str:
+    pairs = (*labels, *extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(str(v))}"' for k, v in pairs) + "}"
+
+
+# ---------------------------------------------------------------------------
+# Process-wide registry
+# ---------------------------------------------------------------------------
+
+registry = MetricsRegistry()
+
+
+def observe(name: str, seconds: float, **labels: str) -> None:
+    """Record one duration (seconds) on histogram *name*."""
+    registry.observe(name, seconds, tuple(sorted((k, str(v)) for k, v in labels.items())))
+
+
+@contextmanager
+def timed(name: str, **labels: str) -> Iterator[None]:
+    """Record the wall-clock duration of the block, including on error."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, time.perf_counter() - t0, **labels)
+
+
+def _register_default_gauges() -> None:
+    def _event_bus() -> dict[LabelKey, float]:
+        from app.services.event_bus import event_bus
+
+        return {(): float(event_bus.subscriber_count)}
+
+    def _event_seq() -> float:
+        from app.services.event_bus import event_bus
+
+        return float(event_bus.current_sequence)
+
+    def _llm_concurrency() -> dict[LabelKey, float] | None:
+        from app.providers.concurrency import get_concurrency_controller
+
+        controller = get_concurrency_controller()
+        if controller is None:
+            return None
+        stats = controller.stats()
+        out: dict[LabelKey, float] = {
+            (("kind", "limit"),): stats["limit"],
+            (("kind", "in_flight"),): stats["in_flight"],
+        }
+        for cls, cs in stats["classes"].items():
+            out[(("kind", "queued"), ("priority", cls))] = cs["queued"]
+        return out
+
+    def _jsonl_writer() -> dict[LabelKey, float]:
+        from app.services.jsonl_writer import get_jsonl_writer
+
+        stats = get_jsonl_writer().stats()
+        return {(("kind", k),): float(v) for k, v in stats.items()}
+
+    registry.register_gauge(
+        "event_bus_subscribers", "Connected event bus readers (SSE + in-process).", _event_bus,
+    )
+    registry.register_gauge(
+        "event_bus_events_total", "Events published on the in-process bus.", _event_seq,
+        kind="counter",
+    )
+    registry.register_gauge(
+        "llm_concurrency", "Shared provider concurrency controller: limit, in-flight, queued.",
+        _llm_concurrency,
+    )
+    registry.register_gauge(
+        "jsonl_writer", "Background JSONL writer: queued, written, dropped, errors, open files.",
+        _jsonl_writer,
+    )
+
+
+_register_default_gauges()
@@ -18,6 +18,7 @@ from typing import TYPE_CHECKING, Any
 import numpy as np
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.models import Optimization, OptimizationPattern, PromptCluster
 from app.services.taxonomy._constants import _utcnow
@@ -165,7 +166,9 @@ class OrphanRecoveryService:
     ) -> bool:
         """Inner recovery logic (runs inside concurrency guard)."""
         result = await db.execute(
-            select(Optimization).where(Optimization.id == optimization_id)
+            select(Optimization)
+            .where(Optimization.id == optimization_id)
+            .options(selectinload(Optimization.vectors))
         )
         opt = result.scalar_one_or_none()
         if opt is None:
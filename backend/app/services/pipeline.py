@@ -22,6 +22,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.config import DATA_DIR, settings
 from app.models import Optimization
 from app.providers.base import LLMProvider, TokenUsage, call_provider_with_retry
+from app.providers.response_cache import ResponseCache, get_response_cache, last_call_cached
 from app.schemas.pipeline_contracts import (
     DIMENSION_WEIGHTS,
     AnalysisResult,
@@ -32,6 +33,7 @@ from app.schemas.pipeline_contracts import (
     ScoreResult,
     SuggestionsOutput,
 )
+from app.services import profiling
 from app.services.heuristic_scorer import HeuristicScorer
 from app.services.pattern_injection import (
     InjectedPattern,
@@ -96,6 +98,7 @@ class PipelineOrchestrator:
         max_tokens: int = 16384,
         streaming: bool = False,
         cache_ttl: str | None = None,
+        response_cache: ResponseCache | None = None,
     ) -> Any:
         """Call provider with smart retry logic.
 
@@ -116,6 +119,7 @@ class PipelineOrchestrator:
             effort=effort,
             streaming=streaming,
             cache_ttl=cache_ttl,
+            response_cache=response_cache,
         )
 
     @staticmethod
@@ -126,6 +130,12 @@ class PipelineOrchestrator:
             return usage
         return TokenUsage()
 
+    def _record_profile(self, trace_id: str) -> None:
+        """Write the request's profiling summary (if profiling is on) to its trace."""
+        summary = profiling.finish()
+        if summary is not None and self.trace_logger:
+            self.trace_logger.log_profile(trace_id, summary)
+
     # _semantic_check delegated to pipeline_constants.semantic_check()
 
     # ------------------------------------------------------------------
@@ -145,10 +155,11 @@ class PipelineOrchestrator:
         Delegates to the shared ``pattern_injection.auto_inject_patterns()``
         helper so the same logic is reused by the sampling pipeline.
         """
-        return await auto_inject_patterns(
-            raw_prompt, taxonomy_engine, db, trace_id,
-            optimization_id=optimization_id,
-        )
+        with profiling.span("pipeline.pattern_injection"):
+            return await auto_inject_patterns(
+                raw_prompt, taxonomy_engine, db, trace_id,
+                optimization_id=optimization_id,
+            )
 
     # ------------------------------------------------------------------
     # Main pipeline
@@ -177,6 +188,9 @@ class PipelineOrchestrator:
         trace_id = str(uuid.uuid4())
         opt_id = str(uuid.uuid4())
         start_time = time.monotonic()
+        profile = profiling.begin("pipeline")
+        if profile is not None:
+            profile.trace_id = trace_id
 
         prefs = PreferencesService(DATA_DIR)
         prefs_snapshot = prefs.load()
@@ -276,15 +290,18 @@ class PipelineOrchestrator:
             })
 
             phase_start = time.monotonic()
-            analysis: AnalysisResult = await self._call_provider(
-                provider,
-                system_prompt=system_prompt,
-                user_message=analyze_msg,
-                output_format=AnalysisResult,
-                model=analyzer_model,
-                effort=prefs.get("pipeline.analyzer_effort", prefs_snapshot) or "low",
-                max_tokens=ANALYZE_MAX_TOKENS,
-            )
+            with profiling.span("pipeline.analyze"):
+                analysis: AnalysisResult = await self._call_provider(
+                    provider,
+                    system_prompt=system_prompt,
+                    user_message=analyze_msg,
+                    output_format=AnalysisResult,
+                    model=analyzer_model,
+                    effort=prefs.get("pipeline.analyzer_effort", prefs_snapshot) or "low",
+                    max_tokens=ANALYZE_MAX_TOKENS,
+                    response_cache=get_response_cache(),
+                )
+            analyze_cached = last_call_cached()
 
             # Capture actual model ID from provider response
             if isinstance(provider.last_model, str):
@@ -309,6 +326,7 @@ class PipelineOrchestrator:
                         "strategy": analysis.selected_strategy,
                         "effort": prefs.get("pipeline.analyzer_effort", prefs_snapshot) or "low",
                     },
+                    cached=analyze_cached,
                 )
 
             # Semantic check + domain confidence gate (shared with sampling pipeline)
@@ -397,7 +415,8 @@ class PipelineOrchestrator:
             try:
                 from app.services.embedding_service import EmbeddingService as _EmbSvc
 
-                _prompt_embedding = await _EmbSvc().aembed_single(raw_prompt)
+                with profiling.span("pipeline.embed_prompt"):
+                    _prompt_embedding = await _EmbSvc().aembed_single(raw_prompt)
             except Exception as _emb_exc:
                 logger.warning(
                     "Prompt embedding failed (downstream consumers will re-embed independently): "
@@ -410,13 +429,14 @@ class PipelineOrchestrator:
             try:
                 from app.services.pipeline_constants import recommend_strategy_from_history
 
-                data_recommendation = await recommend_strategy_from_history(
-                    raw_prompt=raw_prompt,
-                    db=db,
-                    available_strategies=self.strategy_loader.list_strategies(),
-                    trace_id=trace_id,
-                    prompt_embedding=_prompt_embedding,
-                )
+                with profiling.span("pipeline.strategy_recommendation"):
+                    data_recommendation = await recommend_strategy_from_history(
+                        raw_prompt=raw_prompt,
+                        db=db,
+                        available_strategies=self.strategy_loader.list_strategies(),
+                        trace_id=trace_id,
+                        prompt_embedding=_prompt_embedding,
+                    )
             except Exception:
                 logger.debug("Strategy recommendation unavailable. trace_id=%s", trace_id)
 
@@ -548,10 +568,11 @@ class PipelineOrchestrator:
                     retrieve_few_shot_examples,
                 )
 
-                few_shot_examples = await retrieve_few_shot_examples(
-                    raw_prompt=raw_prompt, db=db, trace_id=trace_id,
-                    prompt_embedding=_prompt_embedding,
-                )
+                with profiling.span("pipeline.few_shot"):
+                    few_shot_examples = await retrieve_few_shot_examples(
+                        raw_prompt=raw_prompt, db=db, trace_id=trace_id,
+                        prompt_embedding=_prompt_embedding,
+                    )
                 few_shot_text = format_few_shot_examples(few_shot_examples)
                 if few_shot_text:
                     if context_sources is None:
@@ -585,16 +606,17 @@ class PipelineOrchestrator:
             )
 
             phase_start = time.monotonic()
-            optimization: OptimizationResult = await self._call_provider(
-                provider,
-                system_prompt=system_prompt,
-                user_message=optimize_msg,
-                output_format=OptimizationResult,
-                model=optimizer_model,
-                effort=prefs.get("pipeline.optimizer_effort", prefs_snapshot) or "high",
-                max_tokens=dynamic_max_tokens,
-                streaming=True,
-            )
+            with profiling.span("pipeline.optimize"):
+                optimization: OptimizationResult = await self._call_provider(
+                    provider,
+                    system_prompt=system_prompt,
+                    user_message=optimize_msg,
+                    output_format=OptimizationResult,
+                    model=optimizer_model,
+                    effort=prefs.get("pipeline.optimizer_effort", prefs_snapshot) or "high",
+                    max_tokens=dynamic_max_tokens,
+                    streaming=True,
+                )
 
             # Post-cleanup: strip leaked ## Changes / ## Applied Patterns
             # from optimized_prompt — LLMs frequently embed change narratives
@@ -677,16 +699,19 @@ class PipelineOrchestrator:
                 )
 
                 phase_start = time.monotonic()
-                scores: ScoreResult = await self._call_provider(
-                    provider,
-                    system_prompt=scoring_system,
-                    user_message=scorer_msg,
-                    output_format=ScoreResult,
-                    model=scorer_model,
-                    effort=prefs.get("pipeline.scorer_effort", prefs_snapshot) or "low",
-                    max_tokens=SCORE_MAX_TOKENS,
-                    cache_ttl="1h",
-                )
+                with profiling.span("pipeline.score"):
+                    scores: ScoreResult = await self._call_provider(
+                        provider,
+                        system_prompt=scoring_system,
+                        user_message=scorer_msg,
+                        output_format=ScoreResult,
+                        model=scorer_model,
+                        effort=prefs.get("pipeline.scorer_effort", prefs_snapshot) or "low",
+                        max_tokens=SCORE_MAX_TOKENS,
+                        cache_ttl="1h",
+                        response_cache=get_response_cache(),
+                    )
+                score_cached = last_call_cached()
 
                 # Capture actual model ID from provider response
                 if isinstance(provider.last_model, str):
@@ -707,6 +732,7 @@ class PipelineOrchestrator:
                         tokens_in=usage.input_tokens, tokens_out=usage.output_tokens,
                         model=scorer_model, provider=provider.name,
                         result={"effort": prefs.get("pipeline.scorer_effort", prefs_snapshot) or "low"},
+                        cached=score_cached,
                     )
 
                 # Map A/B scores back to original/optimized
@@ -858,14 +884,15 @@ class PipelineOrchestrator:
                         "score_trajectory": "first turn",
                     })
 
-                    suggest_result: SuggestionsOutput = await self._call_provider(
-                        provider,
-                        system_prompt=self._load_system_prompt(),
-                        user_message=suggest_msg,
-                        output_format=SuggestionsOutput,
-                        model=settings.MODEL_HAIKU,
-                        max_tokens=2048,
-                    )
+                    with profiling.span("pipeline.suggest"):
+                        suggest_result: SuggestionsOutput = await self._call_provider(
+                            provider,
+                            system_prompt=self._load_system_prompt(),
+                            user_message=suggest_msg,
+                            output_format=SuggestionsOutput,
+                            model=settings.MODEL_HAIKU,
+                            max_tokens=2048,
+                        )
                     suggestions = suggest_result.suggestions
 
                     yield PipelineEvent(event="suggestions", data={"suggestions": suggestions})
@@ -958,7 +985,8 @@ class PipelineOrchestrator:
                 except Exception as exc:
                     logger.warning("Failed to track applied patterns: %s", exc)
 
-            await db.commit()
+            with profiling.span("pipeline.persist"):
+                await db.commit()
 
             # Include auto-injected cluster IDs in usage propagation
             if auto_injected_cluster_ids:
@@ -1065,6 +1093,7 @@ class PipelineOrchestrator:
                     trace_id, duration_ms, effective_strategy,
                 )
 
+            self._record_profile(trace_id)
             yield PipelineEvent(
                 event="optimization_complete",
                 data=result.model_dump(mode="json"),
@@ -1125,6 +1154,7 @@ class PipelineOrchestrator:
             except Exception:
                 pass
 
+            self._record_profile(trace_id)
             yield PipelineEvent(event="error", data={
                 "trace_id": trace_id,
                 "error": str(exc),
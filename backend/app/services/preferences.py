@@ -4,6 +4,9 @@ Preferences are stored at ``data/preferences.json``.  The service provides
 load/save/patch/resolve_model with a snapshot pattern — ``load()`` returns a
 frozen-copy dict so callers can pass a consistent snapshot through the
 pipeline without mid-flight mutations.
+
+The parsed file and the strategy listing come from ``config_cache``, so a
+``load()`` on the hot path touches the disk only after the file changed.
 """
 
 import copy
@@ -15,6 +18,7 @@ from pathlib import Path
 from typing import Any
 
 from app.config import PROMPTS_DIR, settings
+from app.services.config_cache import config_cache
 
 logger = logging.getLogger(__name__)
 
@@ -23,15 +27,12 @@ VALID_EFFORTS: set[str] = {"low", "medium", "high", "max"}
 
 
 def _discover_strategies() -> set[str] | None:
-    """Discover available strategies from disk (prompts/strategies/*.md).
+    """Discover available strategies (prompts/strategies/*.md, cached listing).
 
     Returns None if no strategies directory or no files — meaning
     validation should be skipped (accept any value).
     """
-    strategies_dir = PROMPTS_DIR / "strategies"
-    if not strategies_dir.is_dir():
-        return None
-    found = {p.stem for p in strategies_dir.glob("*.md")}
+    found = set(config_cache.listdir(PROMPTS_DIR / "strategies", ".md") or ())
     return found if found else None
 
 DEFAULTS: dict[str, Any] = {
@@ -112,22 +113,23 @@ class PreferencesService:
     # ── public API ───────────────────────────────────────────────
 
     def load(self) -> dict[str, Any]:
-        """Read preferences from disk, deep-merge with defaults, sanitize.
+        """Read preferences, deep-merge with defaults, sanitize.
 
         Creates the file with defaults if it does not exist or contains
         invalid JSON.  Always returns a *fresh* dict snapshot.
 
         On first load after a rename, legacy keys are migrated in-place via
         ``_migrate_legacy_keys`` and the file is rewritten with the
-        canonical schema.
+        canonical schema.  The file is only rewritten when the sanitized
+        result differs from what is on disk.
         """
-        disk: dict[str, Any] = {}
-        if self._path.exists():
-            try:
-                disk = json.loads(self._path.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError) as exc:
-                logger.warning("Corrupt preferences file — resetting to defaults: %s", exc)
-                disk = {}
+        cached: dict[str, Any] | None = None
+        try:
+            cached = config_cache.read(self._path, json.loads)
+        except (json.JSONDecodeError, OSError, UnicodeDecodeError) as exc:
+            logger.warning("Corrupt preferences file — resetting to defaults: %s", exc)
+        # The cached dict is shared — never mutate it.
+        disk: dict[str, Any] = copy.deepcopy(cached) if cached is not None else {}
 
         migrated = _migrate_legacy_keys(disk)
         if migrated:
@@ -135,8 +137,9 @@ class PreferencesService:
 
         merged = self._deep_merge(copy.deepcopy(DEFAULTS), disk)
         self._sanitize(merged)
-        self._write(merged)
-        return copy.deepcopy(merged)
+        if merged != cached:
+            self._write(merged)
+        return merged
 
     def save(self, prefs: dict[str, Any]) -> None:
         """Validate then atomically persist *prefs*."""
@@ -342,3 +345,5 @@ class PreferencesService:
             except OSError:
                 pass
             raise
+        finally:
+            config_cache.invalidate(self._path)
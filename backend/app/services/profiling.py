@@ -0,0 +1,199 @@
+"""Opt-in per-request profiling — structured spans and cost counters.
+
+When ``PROFILING_ENABLED`` is set, each optimization request carries a
+:class:`RequestProfile` in a context variable. Hot-path code wraps its
+expensive sections in :func:`span`, and low-level hooks bump counters on
+whatever profile is active:
+
+- ``db_statements`` — every SQL statement (SQLAlchemy cursor hook).
+- ``embed_calls`` / ``embed_texts`` — sentence-embedding encodes.
+
+Each span records wall time, CPU time of the thread that ran it, and the
+counter deltas observed while it was open. Spans are aggregated by name,
+so the summary stays small however many times a span repeats. The summary
+is written to the request's trace as a ``phase: "profile"`` entry and is
+returned by ``GET /api/monitoring/traces/{trace_id}``.
+
+Numbers are inclusive: concurrent tasks of the same request (e.g. the
+enrichment fan-out) can all see each other's counters, and CPU time on the
+event-loop thread includes any task interleaved at an ``await``.
+
+With profiling disabled (the default) no profile is ever created and
+:func:`span` / :func:`count` cost one context-variable lookup.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, ParamSpec, TypeVar
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+COUNTERS: tuple[str, ...] = ("db_statements", "embed_calls", "embed_texts")
+
+
+class _SpanStats:
+    __slots__ = ("count", "wall", "cpu", "counters")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.counters = dict.fromkeys(COUNTERS, 0)
+
+
+class RequestProfile:
+    """Counters and aggregated spans for one request."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.trace_id: str | None = None
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.spans: dict[str, _SpanStats] = {}
+        self._lock = threading.Lock()
+        self._t0 = time.perf_counter()
+        self._cpu0 = time.thread_time()
+
+    def count(self, counter: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + n
+
+    def snapshot(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self.counters)
+
+    def add_span(
+        self, name: str, wall: float, cpu: float, before: dict[str, int],
+    ) -> None:
+        with self._lock:
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = _SpanStats()
+            stats.count += 1
+            stats.wall += wall
+            stats.cpu += cpu
+            for key, value in self.counters.items():
+                stats.counters[key] = stats.counters.get(key, 0) + value - before.get(key, 0)
+
+    def summary(self) -> dict[str, Any]:
+        """JSON-ready totals plus per-span breakdown (slowest first)."""
+        with self._lock:
+            spans = sorted(self.spans.items(), key=lambda kv: kv[1].wall, reverse=True)
+            return {
+                "name": self.name,
+                "wall_ms": round((time.perf_counter() - self._t0) * 1000, 2),
+                "cpu_ms": round((time.thread_time() - self._cpu0) * 1000, 2),
+                **self.counters,
+                "spans": {
+                    name: {
+                        "count": s.count,
+                        "wall_ms": round(s.wall * 1000, 2),
+                        "cpu_ms": round(s.cpu * 1000, 2),
+                        **s.counters,
+                    }
+                    for name, s in spans
+                },
+            }
+
+
+_current: ContextVar[RequestProfile | None] = ContextVar("request_profile", default=None)
+
+
+def current() -> RequestProfile | None:
+    """The profile active in this context, if any."""
+    return _current.get()
+
+
+def begin(name: str) -> RequestProfile | None:
+    """Start profiling the current request (no-op unless enabled).
+
+    Joins the already-active profile when there is one, so an endpoint can
+    start profiling before enrichment and the pipeline simply continues it.
+    """
+    prof = _current.get()
+    if prof is not None or not settings.PROFILING_ENABLED:
+        return prof
+    prof = RequestProfile(name)
+    _current.set(prof)
+    return prof
+
+
+def finish() -> dict[str, Any] | None:
+    """Detach the active profile and return its summary."""
+    prof = _current.get()
+    if prof is None:
+        return None
+    _current.set(None)
+    return prof.summary()
+
+
+@contextmanager
+def activate(prof: RequestProfile | None) -> Iterator[None]:
+    """Make *prof* the active profile for the block (e.g. in a worker task)."""
+    token = _current.set(prof)
+    try:
+        yield
+    finally:
+        _current.reset(token)
+
+
+def count(counter: str, n: int = 1) -> None:
+    """Add *n* to *counter* on the active profile."""
+    prof = _current.get()
+    if prof is not None:
+        prof.count(counter, n)
+
+
+@contextmanager
+def span(name: str) -> Iterator[None]:
+    """Time the block as span *name* on the active profile, including on error."""
+    prof = _current.get()
+    if prof is None:
+        yield
+        return
+    before = prof.snapshot()
+    t0 = time.perf_counter()
+    c0 = time.thread_time()
+    try:
+        yield
+    finally:
+        prof.add_span(name, time.perf_counter() - t0, time.thread_time() - c0, before)
+
+
+def traced(name: str) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Decorator: run an async function as span *name*."""
+
+    def decorator(fn: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if _current.get() is None:
+                return await fn(*args, **kwargs)
+            with span(name):
+                return await fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def install_db_hook(sync_engine: Any) -> None:
+    """Count every SQL statement executed on *sync_engine* against the active profile."""
+    from sqlalchemy import event
+
+    def _before_cursor_execute(*_args: Any) -> None:
+        prof = _current.get()
+        if prof is not None:
+            prof.count("db_statements")
+
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
@@ -2,14 +2,18 @@
 
 Templates are Markdown files with {{variable}} placeholders.
 Variables with no value are omitted, including surrounding XML tags.
-Templates are read from disk on each call (hot-reload, no restart needed).
+Templates are held in ``config_cache`` and invalidated by the file watcher
+(or an mtime check when no watcher runs), so edits still hot-reload.
 """
 
+import copy
 import json
 import logging
 import re
 from pathlib import Path
 
+from app.services.config_cache import config_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,20 +25,21 @@ class PromptLoader:
 
     @property
     def manifest(self) -> dict:
-        """Load manifest.json (reloaded on each access for hot-reload)."""
-        manifest_path = self.prompts_dir / "manifest.json"
-        if manifest_path.exists():
-            return json.loads(manifest_path.read_text())
-        return {}
+        """Parsed manifest.json (a copy — safe to mutate)."""
+        return copy.deepcopy(self._manifest())
+
+    def _manifest(self) -> dict:
+        """Cached, shared manifest — read-only."""
+        return config_cache.read(self.prompts_dir / "manifest.json", json.loads) or {}
 
     def load(self, name: str) -> str:
         """Load a template file as raw text (no substitution)."""
         path = self.prompts_dir / name
-        if not path.exists():
+        content = config_cache.read(path)
+        if content is None:
             raise FileNotFoundError(
                 "Template not found: %s. Check that the prompts/ directory contains this file." % path
             )
-        content = path.read_text()
         logger.debug("Loaded template %s (%d chars)", name, len(content))
         return content
 
@@ -49,7 +54,7 @@ class PromptLoader:
         template = self.load(name)
 
         # Validate required variables
-        spec = self.manifest.get(name, {})
+        spec = self._manifest().get(name, {})
         for required in spec.get("required", []):
             if not variables.get(required):
                 raise ValueError(
@@ -79,14 +84,13 @@ class PromptLoader:
         Checks: (1) file exists, (2) all required placeholders present.
         Raises RuntimeError on any validation failure.
         """
-        manifest = self.manifest
+        manifest = self._manifest()
         errors = []
         for template_name, spec in manifest.items():
-            path = self.prompts_dir / template_name
-            if not path.exists():
+            content = config_cache.read(self.prompts_dir / template_name)
+            if content is None:
                 errors.append(f"Template file missing: {template_name}")
                 continue
-            content = path.read_text()
             for required_var in spec.get("required", []):
                 placeholder = "{{" + required_var + "}}"
                 if placeholder not in content:
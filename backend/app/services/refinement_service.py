@@ -3,6 +3,10 @@
 Each refinement turn is a fresh pipeline invocation (analyze -> refine -> score
 -> suggest), not multi-turn conversation. The service orchestrates its own flow
 using refine.md instead of optimize.md.
+
+When given a ``RefinementSpeculator``, identical analyze/refine requests and
+the score distribution are reused across turns, and the next turn can be
+precomputed in the background (see ``refinement_speculation``).
 """
 
 from __future__ import annotations
@@ -11,9 +15,9 @@ import json
 import logging
 import random
 import uuid
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -33,11 +37,19 @@ from app.services.heuristic_scorer import HeuristicScorer
 from app.services.pipeline_constants import ANALYZE_MAX_TOKENS, SCORE_MAX_TOKENS, compute_optimize_max_tokens
 from app.services.preferences import PreferencesService
 from app.services.prompt_loader import PromptLoader
+from app.services.refinement_speculation import RefinementSpeculator, speculation_key
 from app.services.score_blender import blend_scores
 from app.services.strategy_loader import StrategyLoader
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# The score distribution moves slowly; one read serves consecutive turns.
+_SCORE_DISTRIBUTION_TTL = 60.0
+
+_SCORE_DIMENSIONS = ("clarity", "specificity", "structure", "faithfulness", "conciseness")
+
 
 # ---------------------------------------------------------------------------
 # Service
@@ -53,11 +65,13 @@ class RefinementService:
         db: AsyncSession,
         provider: LLMProvider,
         prompts_dir: Path,
+        speculator: RefinementSpeculator | None = None,
     ) -> None:
         self.db = db
         self.provider = provider
         self.prompt_loader = PromptLoader(prompts_dir)
         self.strategy_loader = StrategyLoader(prompts_dir / "strategies")
+        self.speculator = speculator
 
     # ------------------------------------------------------------------
     # Provider call with retry
@@ -207,30 +221,9 @@ class RefinementService:
         yield PipelineEvent(event="status", data={"stage": "analyze", "state": "running"})
 
         system_prompt = self.prompt_loader.load("agent-guidance.md")
-        available_strategies = self.strategy_loader.format_available()
-
-        # Resolve dynamic domain list for analyzer prompt
-        try:
-            from app.services.domain_resolver import get_domain_resolver
-            _resolver = get_domain_resolver()
-            _known_domains = ", ".join(sorted(_resolver.domain_labels))
-        except (ValueError, ImportError):
-            _known_domains = "backend, frontend, database, data, devops, security, fullstack, general"
-
-        analyze_msg = self.prompt_loader.render("analyze.md", {
-            "raw_prompt": current_prompt,
-            "available_strategies": available_strategies,
-            "known_domains": _known_domains,
-        })
-
-        analysis: AnalysisResult = await self._call_provider(
-            system_prompt=system_prompt,
-            user_message=analyze_msg,
-            output_format=AnalysisResult,
-            model=_prefs.resolve_model("analyzer", _prefs_snapshot),
-            effort=_prefs.get("pipeline.analyzer_effort", _prefs_snapshot) or "low",
-            max_tokens=ANALYZE_MAX_TOKENS,
-        )
+        analysis: AnalysisResult = await self._speculated(*self._analysis_request(
+            current_prompt, system_prompt, _prefs, _prefs_snapshot,
+        ))
 
         yield PipelineEvent(event="status", data={"stage": "analyze", "state": "complete"})
 
@@ -239,51 +232,23 @@ class RefinementService:
         # ---------------------------------------------------------------
         yield PipelineEvent(event="status", data={"stage": "refine", "state": "running"})
 
-        strategy_instructions = self.strategy_loader.load(strategy_name)
-
-        # Build score context for the refine template
-        prev_scores = prev_turn.scores or {}
-        scores_str = ", ".join(
-            f"{dim}: {prev_scores.get(dim, '?')}" for dim in
-            ("clarity", "specificity", "structure", "faithfulness", "conciseness")
-        ) if prev_scores else "not yet scored"
-        # Top 2 dimensions to protect
-        if prev_scores:
-            sorted_dims = sorted(
-                ((d, v) for d, v in prev_scores.items() if d != "overall"),
-                key=lambda x: x[1], reverse=True,
-            )
-            strongest_str = ", ".join(
-                f"{d} ({v})" for d, v in sorted_dims[:2]
-            )
-        else:
-            strongest_str = "unknown"
-
-        refine_msg = self.prompt_loader.render("refine.md", {
-            "current_prompt": current_prompt,
-            "refinement_request": refinement_request,
-            "original_prompt": original_prompt,
-            "strategy_instructions": strategy_instructions,
+        enrichment = {
             "codebase_context": codebase_context,
             "strategy_intelligence": strategy_intelligence,
-            "current_scores": scores_str,
-            "strongest_dimensions": strongest_str,
             "divergence_alerts": divergence_alerts,
             "applied_patterns": applied_patterns,
-        })
-
-        # Dynamic output budget matching the main pipeline (128K cap with streaming)
-        dynamic_max_tokens = compute_optimize_max_tokens(len(current_prompt))
-
-        refined: OptimizationResult = await self._call_provider(
+        }
+        refined: OptimizationResult = await self._speculated(*self._refine_request(
             system_prompt=system_prompt,
-            user_message=refine_msg,
-            output_format=OptimizationResult,
-            model=_prefs.resolve_model("optimizer", _prefs_snapshot),
-            effort=_prefs.get("pipeline.optimizer_effort", _prefs_snapshot) or "high",
-            max_tokens=dynamic_max_tokens,
-            streaming=True,
-        )
+            current_prompt=current_prompt,
+            refinement_request=refinement_request,
+            original_prompt=original_prompt,
+            strategy_name=strategy_name,
+            prev_scores=prev_turn.scores or {},
+            enrichment=enrichment,
+            prefs=_prefs,
+            prefs_snapshot=_prefs_snapshot,
+        ))
 
         yield PipelineEvent(event="prompt_preview", data={
             "prompt": refined.optimized_prompt,
@@ -353,8 +318,12 @@ class RefinementService:
             try:
                 from app.services.optimization_service import OptimizationService
                 opt_svc = OptimizationService(self.db)
-                historical_stats = await opt_svc.get_score_distribution(
-                    exclude_scoring_modes=["heuristic"],
+                historical_stats = await self._reuse(
+                    speculation_key("score_distribution"),
+                    lambda: opt_svc.get_score_distribution(
+                        exclude_scoring_modes=["heuristic"],
+                    ),
+                    ttl_seconds=_SCORE_DISTRIBUTION_TTL,
                 )
             except Exception:
                 pass
@@ -371,7 +340,7 @@ class RefinementService:
             if prev_turn.scores:
                 prev_scores = prev_turn.scores
                 deltas_from_prev = {}
-                for dim in ("clarity", "specificity", "structure", "faithfulness", "conciseness"):
+                for dim in _SCORE_DIMENSIONS:
                     opt_val = getattr(optimized_scores, dim)
                     prev_val = prev_scores.get(dim)
                     if prev_val is not None:
@@ -463,6 +432,19 @@ class RefinementService:
             optimization_id, new_turn.version, _overall, trace_id,
         )
 
+        if self.speculator is not None and self.speculator.speculate:
+            self._speculate_next_turn(
+                system_prompt=system_prompt,
+                new_prompt=refined.optimized_prompt,
+                suggestions=suggestions_list,
+                original_prompt=original_prompt,
+                strategy_name=refined.strategy_used or "auto",
+                scores=scores_dict or {},
+                enrichment=enrichment,
+                prefs=_prefs,
+                prefs_snapshot=_prefs_snapshot,
+            )
+
     async def get_versions(
         self,
         optimization_id: str,
@@ -551,6 +533,168 @@ class RefinementService:
     # Private helpers
     # ------------------------------------------------------------------
 
+    async def _reuse(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[T]],
+        ttl_seconds: float | None = None,
+    ) -> T:
+        """Run *factory*, or reuse its stored result when a speculator is attached."""
+        if self.speculator is None:
+            return await factory()
+        return await self.speculator.get_or_run(key, factory, ttl_seconds)
+
+    async def _speculated(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run the LLM call *factory*, unless a prefetch already produced it."""
+        if self.speculator is None:
+            return await factory()
+        return await self.speculator.take_or_run(key, factory)
+
+    def _analysis_request(
+        self,
+        prompt: str,
+        system_prompt: str,
+        prefs: PreferencesService,
+        prefs_snapshot: dict[str, Any],
+    ) -> tuple[str, Callable[[], Awaitable[AnalysisResult]]]:
+        """Build the analyze call for *prompt*: its reuse key and a factory."""
+        available_strategies = self.strategy_loader.format_available()
+
+        # Resolve dynamic domain list for analyzer prompt
+        try:
+            from app.services.domain_resolver import get_domain_resolver
+            _resolver = get_domain_resolver()
+            _known_domains = ", ".join(sorted(_resolver.domain_labels))
+        except (ValueError, ImportError):
+            _known_domains = "backend, frontend, database, data, devops, security, fullstack, general"
+
+        analyze_msg = self.prompt_loader.render("analyze.md", {
+            "raw_prompt": prompt,
+            "available_strategies": available_strategies,
+            "known_domains": _known_domains,
+        })
+        model = prefs.resolve_model("analyzer", prefs_snapshot)
+        effort = prefs.get("pipeline.analyzer_effort", prefs_snapshot) or "low"
+
+        def call() -> Awaitable[AnalysisResult]:
+            return self._call_provider(
+                system_prompt=system_prompt,
+                user_message=analyze_msg,
+                output_format=AnalysisResult,
+                model=model,
+                effort=effort,
+                max_tokens=ANALYZE_MAX_TOKENS,
+            )
+
+        key = speculation_key(
+            "analyze", self.provider.name, model, effort, system_prompt, analyze_msg,
+        )
+        return key, call
+
+    def _refine_request(
+        self,
+        *,
+        system_prompt: str,
+        current_prompt: str,
+        refinement_request: str,
+        original_prompt: str,
+        strategy_name: str,
+        prev_scores: dict[str, Any],
+        enrichment: dict[str, str | None],
+        prefs: PreferencesService,
+        prefs_snapshot: dict[str, Any],
+    ) -> tuple[str, Callable[[], Awaitable[OptimizationResult]]]:
+        """Build the refine call for one turn: its reuse key and a factory."""
+        strategy_instructions = self.strategy_loader.load(strategy_name)
+
+        # Build score context for the refine template
+        scores_str = ", ".join(
+            f"{dim}: {prev_scores.get(dim, '?')}" for dim in _SCORE_DIMENSIONS
+        ) if prev_scores else "not yet scored"
+        # Top 2 dimensions to protect
+        if prev_scores:
+            sorted_dims = sorted(
+                ((d, v) for d, v in prev_scores.items() if d != "overall"),
+                key=lambda x: x[1], reverse=True,
+            )
+            strongest_str = ", ".join(
+                f"{d} ({v})" for d, v in sorted_dims[:2]
+            )
+        else:
+            strongest_str = "unknown"
+
+        refine_msg = self.prompt_loader.render("refine.md", {
+            "current_prompt": current_prompt,
+            "refinement_request": refinement_request,
+            "original_prompt": original_prompt,
+            "strategy_instructions": strategy_instructions,
+            "current_scores": scores_str,
+            "strongest_dimensions": strongest_str,
+            **enrichment,
+        })
+
+        # Dynamic output budget matching the main pipeline (128K cap with streaming)
+        dynamic_max_tokens = compute_optimize_max_tokens(len(current_prompt))
+        model = prefs.resolve_model("optimizer", prefs_snapshot)
+        effort = prefs.get("pipeline.optimizer_effort", prefs_snapshot) or "high"
+
+        def call() -> Awaitable[OptimizationResult]:
+            return self._call_provider(
+                system_prompt=system_prompt,
+                user_message=refine_msg,
+                output_format=OptimizationResult,
+                model=model,
+                effort=effort,
+                max_tokens=dynamic_max_tokens,
+                streaming=True,
+            )
+
+        key = speculation_key(
+            "refine", self.provider.name, model, effort, dynamic_max_tokens,
+            system_prompt, refine_msg,
+        )
+        return key, call
+
+    def _speculate_next_turn(
+        self,
+        *,
+        system_prompt: str,
+        new_prompt: str,
+        suggestions: list[dict[str, str]],
+        original_prompt: str,
+        strategy_name: str,
+        scores: dict[str, Any],
+        enrichment: dict[str, str | None],
+        prefs: PreferencesService,
+        prefs_snapshot: dict[str, Any],
+    ) -> None:
+        """Precompute the next turn's analysis and the top suggestion's refine call.
+
+        The next turn starts from *new_prompt* with this turn's scores and
+        strategy, so its requests are known now. Only the first suggestion
+        is speculated — it is the one most often applied.
+        """
+        if self.speculator is None:
+            return
+        try:
+            self.speculator.prefetch(*self._analysis_request(
+                new_prompt, system_prompt, prefs, prefs_snapshot,
+            ))
+            if suggestions and suggestions[0].get("text"):
+                self.speculator.prefetch(*self._refine_request(
+                    system_prompt=system_prompt,
+                    current_prompt=new_prompt,
+                    refinement_request=suggestions[0]["text"],
+                    original_prompt=original_prompt,
+                    strategy_name=strategy_name,
+                    prev_scores=scores,
+                    enrichment=enrichment,
+                    prefs=prefs,
+                    prefs_snapshot=prefs_snapshot,
+                ))
+        except Exception:
+            logger.debug("Refinement speculation skipped", exc_info=True)
+
     async def _generate_suggestions(
         self,
         optimized_prompt: str,
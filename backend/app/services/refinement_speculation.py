@@ -0,0 +1,227 @@
+"""Result reuse and speculative precomputation for refinement turns.
+
+A refinement turn runs analyze -> refine -> score -> suggest, and the
+router enriches context for it first. Much of that repeats between
+turns: enrichment is computed from the optimization's original output,
+a turn started from the same version re-analyzes the same prompt, and
+the score distribution barely moves between two clicks. The next request
+is often predictable too — usually one of the suggestions just shown.
+
+``RefinementSpeculator`` is an in-process TTL + LRU store of those
+results, keyed on a digest of everything that determines them (rendered
+message, model, effort). A key match means the provider would receive
+the same request, so reuse cannot change what the user gets beyond
+sampling variance.
+
+Two kinds of reuse:
+  - ``get_or_run()`` — computed data (router enrichment, score
+    distribution): stored for the TTL and shared by every caller.
+  - ``take_or_run()`` — LLM calls (analyze, refine): only a speculative
+    prefetch's result is reused, and only once. Inline calls are never
+    stored, so repeating a request always gets a fresh completion.
+
+With ``REFINE_SPECULATION_ENABLED`` it also precomputes the next turn in
+the background: the new prompt's analysis and the refine call for the
+top suggestion. Speculative calls run at ``Priority.BACKGROUND`` on the
+shared provider concurrency budget, so they yield to interactive work.
+If the user applies that suggestion, the turn reuses the result. If the
+speculative call is still running, the turn waits for it instead of
+issuing a second one.
+
+One instance lives on ``app.state.refinement_speculator``. Services built
+without it (MCP tools, tests) behave exactly as before.
+
+Copyright 2025-2026 Project Synthesis contributors.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from app.providers.concurrency import Priority, llm_priority
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Speculative tasks allowed in flight at once; further prefetches are dropped.
+_MAX_SPECULATIVE_TASKS = 4
+
+
+def speculation_key(kind: str, *parts: Any) -> str:
+    """Stable digest of *kind* and the inputs that determine its result."""
+    payload = json.dumps([kind, *parts], sort_keys=True, default=str)
+    return f"{kind}:{hashlib.sha256(payload.encode()).hexdigest()}"
+
+
+class RefinementSpeculator:
+    """TTL + LRU store of reusable refinement results and speculative tasks."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = 600,
+        max_entries: int = 256,
+        speculate: bool = False,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.speculate = speculate
+        self._results: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.joined = 0
+        self.speculated = 0
+        self.dropped = 0
+
+    # ------------------------------------------------------------------
+    # Result store
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Any | None:
+        entry = self._results.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._results[key]
+            return None
+        self._results.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._results[key] = (time.monotonic() + ttl, value)
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+
+    async def get_or_run(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[T]],
+        ttl_seconds: float | None = None,
+    ) -> T:
+        """Return the stored result for *key*, join its in-flight task, or run *factory*."""
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            logger.info("Refinement reuse hit: %s", key.split(":", 1)[0])
+            return cached
+
+        task = self._inflight.get(key)
+        if task is not None:
+            try:
+                # Shield: a cancelled request must not kill a shared prefetch.
+                result = await asyncio.shield(task)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.debug("Speculative task for %s failed — running inline", key, exc_info=True)
+            else:
+                if result is not None:
+                    self.joined += 1
+                    logger.info("Refinement reuse joined in-flight: %s", key.split(":", 1)[0])
+                    return result
+
+        self.misses += 1
+        value = await factory()
+        if value is not None:
+            self.put(key, value, ttl_seconds)
+        return value
+
+    async def take_or_run(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Consume the speculative result for *key*, join its prefetch, or run *factory*.
+
+        Each prefetched result is handed out once; the inline result is not
+        stored.
+        """
+        entry = self._results.pop(key, None)
+        if entry is not None and entry[0] >= time.monotonic():
+            self.hits += 1
+            logger.info("Refinement speculation hit: %s", key.split(":", 1)[0])
+            return entry[1]
+
+        # Claim the prefetch so a concurrent request runs its own call.
+        task = self._inflight.pop(key, None)
+        if task is not None:
+            try:
+                # Shield: a cancelled request must not kill a shared prefetch.
+                result = await asyncio.shield(task)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.debug("Speculative task for %s failed — running inline", key, exc_info=True)
+            else:
+                self._results.pop(key, None)
+                if result is not None:
+                    self.joined += 1
+                    logger.info("Refinement speculation joined in-flight: %s", key.split(":", 1)[0])
+                    return result
+
+        self.misses += 1
+        return await factory()
+
+    # ------------------------------------------------------------------
+    # Speculation
+    # ------------------------------------------------------------------
+
+    def prefetch(self, key: str, factory: Callable[[], Awaitable[Any]]) -> bool:
+        """Compute *key* in the background at ``BACKGROUND`` priority.
+
+        No-op (returns False) when speculation is disabled, the result is
+        already stored or running, or too many prefetches are in flight.
+        """
+        if not self.speculate or self.get(key) is not None or key in self._inflight:
+            return False
+        if len(self._inflight) >= _MAX_SPECULATIVE_TASKS:
+            self.dropped += 1
+            return False
+
+        async def _run() -> Any:
+            with llm_priority(Priority.BACKGROUND):
+                try:
+                    value = await factory()
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.debug("Speculative refinement step failed: %s", key, exc_info=True)
+                    return None
+            if value is not None:
+                self.put(key, value)
+            return value
+
+        task = asyncio.create_task(_run())
+        self._inflight[key] = task
+        task.add_done_callback(
+            lambda t: self._inflight.pop(key, None) if self._inflight.get(key) is t else None,
+        )
+        self.speculated += 1
+        return True
+
+    async def close(self) -> None:
+        """Cancel speculative work (application shutdown)."""
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._inflight.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._results),
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "joined": self.joined,
+            "speculated": self.speculated,
+            "dropped": self.dropped,
+        }
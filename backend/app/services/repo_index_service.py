@@ -4,6 +4,7 @@ import asyncio
 import hashlib
 import logging
 import re
+import tempfile
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -17,6 +18,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.models import RepoFileIndex, RepoIndexMeta
+from app.services import profiling
 from app.services.embedding_service import EmbeddingService
 from app.services.file_filters import (
     INDEXABLE_EXTENSIONS as _INDEXABLE_EXTENSIONS,
@@ -31,6 +33,7 @@ from app.services.file_filters import (
     is_test_file as _is_test_file,
 )
 from app.services.github_client import GitHubApiError, GitHubClient
+from app.services.repo_snapshot import read_tarball, scan_local_checkout
 
 logger = logging.getLogger(__name__)
 
@@ -132,6 +135,59 @@ def _file_cache_put(key: tuple[str, str, str], content: str) -> None:
     _file_content_cache[key] = (time.time(), content)
 
 
+# Module-level per-repo vector indexes keyed by ``(repo_full_name, branch)``.
+# Each entry holds only paths + a stacked embedding matrix for one
+# ``head_sha``, so relevance queries never pull ``content``/``outline``
+# for the whole repo — bodies are fetched afterwards for the selected
+# files only. An entry is trusted only while its ``head_sha`` matches
+# ``RepoIndexMeta.head_sha``; indexing paths drop and rebuild it eagerly.
+_vector_indexes: dict[tuple[str, str], "_RepoVectorIndex"] = {}
+
+# Bodies are fetched in chunks while packing curated context.
+_BODY_FETCH_CHUNK = 32
+
+
+@dataclass
+class _RepoVectorIndex:
+    """Embedding matrix for one ``(repo, branch, head_sha)`` snapshot."""
+
+    head_sha: str | None
+    paths: list[str]
+    matrix: np.ndarray  # (n, dim) float32, row i ↔ paths[i]
+    path_to_idx: dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+def invalidate_vector_index(
+    repo_full_name: str | None = None, branch: str | None = None,
+) -> int:
+    """Drop cached vector indexes. Returns count evicted.
+
+    With no arguments evicts every entry; otherwise only entries for
+    *repo_full_name* (narrowed to *branch* when given).
+    """
+    if repo_full_name is None:
+        count = len(_vector_indexes)
+        _vector_indexes.clear()
+        return count
+    keys = [
+        k for k in _vector_indexes
+        if k[0] == repo_full_name and (branch is None or k[1] == branch)
+    ]
+    for k in keys:
+        del _vector_indexes[k]
+    return len(keys)
+
+
+def _retag_vector_index(repo_full_name: str, branch: str, head_sha: str | None) -> None:
+    """Advance a cached index's ``head_sha`` when HEAD moved without file changes."""
+    cached = _vector_indexes.get((repo_full_name, branch))
+    if cached is not None and head_sha:
+        cached.head_sha = head_sha
+
+
 # Extensions, size cap, and test-exclusion primitives are imported from
 # ``file_filters`` (re-exported above) so this module + ``codebase_explorer``
 # share a single source of truth for what's indexable.
@@ -584,17 +640,52 @@ class RepoIndexService:
     # Public API
     # ------------------------------------------------------------------
 
+    async def _fetch_remote_tree(
+        self,
+        meta: RepoIndexMeta,
+        repo_full_name: str,
+        branch: str,
+        token: str | None,
+    ) -> tuple[str, list[dict] | None, str | None]:
+        """Return ``(head_sha, tree, new_tree_etag)`` from GitHub.
+
+        ``tree`` is None on a 304 — the caller reuses its existing rows.
+        """
+        head_sha = await self._gc.get_branch_head_sha(token, repo_full_name, branch)
+
+        # ETag-conditioned tree fetch. If the stored etag is still valid
+        # we get a 304 and can short-circuit the whole rebuild — GitHub
+        # counts 304 responses as "no content served" for the primary
+        # rate limit, so this is the cheap path. We only send the etag
+        # when we actually have cached rows to trust; a stale etag
+        # without rows would leave us with nothing to serve from.
+        etag_to_send: str | None = None
+        if meta.tree_etag and (meta.file_count or 0) > 0:
+            etag_to_send = meta.tree_etag
+        tree, new_tree_etag = await self._gc.get_tree_with_cache(
+            token, repo_full_name, branch, etag=etag_to_send,
+        )
+        return head_sha, tree, new_tree_etag
+
     async def build_index(
         self,
         repo_full_name: str,
         branch: str,
-        token: str,
+        token: str | None,
+        *,
+        local_path: str | None = None,
     ) -> None:
         """Fetch repo tree, read files, embed, and store in DB.
 
         Updates or creates a RepoIndexMeta row with status="ready", the
         current HEAD SHA, and the file count on success.  Sets
         status="error" if an unrecoverable error occurs.
+
+        With ``local_path`` the tree and file contents come from a local
+        checkout (see ``repo_snapshot.scan_local_checkout``) and no GitHub
+        call is made, so ``token`` may be None.  Otherwise large trees are
+        ingested from a single tarball download
+        (``INDEX_BULK_INGEST_MIN_FILES``).
         """
         t_start = time.monotonic()
         logger.info("build_index started for %s@%s", repo_full_name, branch)
@@ -612,20 +703,16 @@ class RepoIndexService:
         )
 
         try:
-            head_sha = await self._gc.get_branch_head_sha(token, repo_full_name, branch)
-
-            # ETag-conditioned tree fetch. If the stored etag is still valid
-            # we get a 304 and can short-circuit the whole rebuild — GitHub
-            # counts 304 responses as "no content served" for the primary
-            # rate limit, so this is the cheap path. We only send the etag
-            # when we actually have cached rows to trust; a stale etag
-            # without rows would leave us with nothing to serve from.
-            etag_to_send: str | None = None
-            if meta.tree_etag and (meta.file_count or 0) > 0:
-                etag_to_send = meta.tree_etag
-            tree, new_tree_etag = await self._gc.get_tree_with_cache(
-                token, repo_full_name, branch, etag=etag_to_send,
-            )
+            prefetched: dict[str, str] | None = None
+            if local_path is not None:
+                snapshot = await asyncio.to_thread(scan_local_checkout, local_path)
+                head_sha = snapshot.head_sha
+                tree, new_tree_etag = snapshot.tree, None
+                prefetched = snapshot.contents
+            else:
+                head_sha, tree, new_tree_etag = await self._fetch_remote_tree(
+                    meta, repo_full_name, branch, token,
+                )
 
             if tree is None:
                 # 304 Not Modified. Reuse existing file rows; just refresh
@@ -645,6 +732,7 @@ class RepoIndexService:
                 meta.indexed_at = datetime.now(timezone.utc)
                 # tree_etag intentionally unchanged (304 echoed it).
                 await self._db.commit()
+                _retag_vector_index(repo_full_name, branch, head_sha)
                 await _publish_phase_change(
                     repo_full_name, branch,
                     phase="embedding", status="ready",
@@ -702,6 +790,8 @@ class RepoIndexService:
                 repo_full_name=repo_full_name,
                 branch=branch,
                 concurrency=10,
+                prefetched=prefetched,
+                ref=head_sha,
             )
             process_ms = (time.monotonic() - t_read) * 1000
             total_content_chars = sum(len(pf.content) for pf in processed)
@@ -747,6 +837,7 @@ class RepoIndexService:
             # now stale. Flush the TTL cache unconditionally. TTL is 5 minutes
             # so warm-up cost is trivial; correctness over caching.
             invalidate_curated_cache()
+            await self._refresh_vector_index(repo_full_name, branch)
             await _publish_phase_change(
                 repo_full_name, branch,
                 phase="embedding", status="ready",
@@ -778,6 +869,114 @@ class RepoIndexService:
             )
             raise
 
+    async def _get_vector_index(
+        self,
+        repo_full_name: str,
+        branch: str,
+        head_sha: str | None,
+    ) -> _RepoVectorIndex | None:
+        """Return the vector index for *head_sha*, building it on a miss.
+
+        Only ``file_path`` + ``embedding`` are read — bodies stay in the
+        database until a caller asks for specific paths.  Indexes are
+        cached only when *head_sha* is known, so an unversioned index is
+        never served stale.
+        """
+        key = (repo_full_name, branch)
+        cached = _vector_indexes.get(key)
+        if cached is not None and head_sha is not None and cached.head_sha == head_sha:
+            return cached
+
+        t0 = time.monotonic()
+        result = await self._db.execute(
+            select(RepoFileIndex.file_path, RepoFileIndex.embedding).where(
+                RepoFileIndex.repo_full_name == repo_full_name,
+                RepoFileIndex.branch == branch,
+                RepoFileIndex.embedding.isnot(None),
+            )
+        )
+        paths: list[str] = []
+        vecs: list[np.ndarray] = []
+        skipped = 0
+        for row in result.all():
+            vec = np.frombuffer(row.embedding, dtype=np.float32)
+            if vecs and vec.shape[0] != vecs[0].shape[0]:
+                skipped += 1
+                continue
+            paths.append(row.file_path)
+            vecs.append(vec)
+
+        if not vecs:
+            _vector_indexes.pop(key, None)
+            return None
+
+        index = _RepoVectorIndex(
+            head_sha=head_sha,
+            paths=paths,
+            matrix=np.vstack(vecs),
+            path_to_idx={p: i for i, p in enumerate(paths)},
+        )
+        if head_sha is not None:
+            _vector_indexes[key] = index
+        logger.debug(
+            "vector_index built: repo=%s branch=%s files=%d skipped=%d sha=%s (%.0fms)",
+            repo_full_name, branch, len(index), skipped,
+            (head_sha or "none")[:8], (time.monotonic() - t0) * 1000,
+        )
+        return index
+
+    def _search_index(
+        self,
+        index: _RepoVectorIndex,
+        query_vec: np.ndarray,
+        top_k: int,
+    ) -> list[tuple[str, float]]:
+        """Cosine-search *index* and map row positions back to paths."""
+        ranked = self._es.cosine_search(query_vec, index.matrix, top_k=top_k)
+        return [(index.paths[idx], score) for idx, score in ranked]
+
+    async def _load_file_bodies(
+        self,
+        repo_full_name: str,
+        branch: str,
+        paths: list[str],
+    ) -> dict[str, tuple[str | None, str | None]]:
+        """Fetch ``(content, outline)`` for *paths* only."""
+        out: dict[str, tuple[str | None, str | None]] = {}
+        for start in range(0, len(paths), 500):
+            chunk = paths[start:start + 500]
+            result = await self._db.execute(
+                select(
+                    RepoFileIndex.file_path,
+                    RepoFileIndex.content,
+                    RepoFileIndex.outline,
+                ).where(
+                    RepoFileIndex.repo_full_name == repo_full_name,
+                    RepoFileIndex.branch == branch,
+                    RepoFileIndex.file_path.in_(chunk),
+                )
+            )
+            for row in result.all():
+                out[row.file_path] = (row.content, row.outline)
+        return out
+
+    async def _refresh_vector_index(self, repo_full_name: str, branch: str) -> None:
+        """Drop and eagerly rebuild the vector index after an index write.
+
+        Non-fatal: a failed rebuild just leaves the next query to build it.
+        """
+        invalidate_vector_index(repo_full_name, branch)
+        try:
+            meta = await self.get_index_status(repo_full_name, branch)
+            if meta and meta.head_sha:
+                await self._get_vector_index(repo_full_name, branch, meta.head_sha)
+        except Exception:
+            logger.debug(
+                "vector_index rebuild failed for %s@%s", repo_full_name, branch,
+                exc_info=True,
+            )
+
+    @profiling.traced("repo_index.query_relevant_files")
     async def query_relevant_files(
         self,
         repo_full_name: str,
@@ -787,36 +986,31 @@ class RepoIndexService:
     ) -> list[dict]:
         """Embed query and cosine-search the pre-built index.
 
+        Searches the in-memory vector index for this repo/branch and only
+        loads outlines for the top-k hits.
+
         Returns a list of dicts with keys: file_path, outline, score.
         """
-        result = await self._db.execute(
-            select(RepoFileIndex).where(
-                RepoFileIndex.repo_full_name == repo_full_name,
-                RepoFileIndex.branch == branch,
-                RepoFileIndex.embedding.isnot(None),
-            )
+        meta = await self.get_index_status(repo_full_name, branch)
+        index = await self._get_vector_index(
+            repo_full_name, branch, meta.head_sha if meta else None,
         )
-        rows = result.scalars().all()
-        if not rows:
+        if index is None:
             return []
 
         query_vec: np.ndarray = await self._es.aembed_single(query)
+        hits = self._search_index(index, query_vec, top_k=min(top_k, len(index)))
 
-        corpus_vecs = [
-            np.frombuffer(row.embedding, dtype=np.float32) for row in rows  # type: ignore[arg-type]
-        ]
-
-        ranked: list[tuple[int, float]] = self._es.cosine_search(
-            query_vec, corpus_vecs, top_k=min(top_k, len(rows))
+        outlines = await self._load_file_bodies(
+            repo_full_name, branch, [path for path, _ in hits],
         )
-
         return [
             {
-                "file_path": rows[idx].file_path,
-                "outline": rows[idx].outline,
+                "file_path": path,
+                "outline": outlines.get(path, (None, None))[1],
                 "score": score,
             }
-            for idx, score in ranked
+            for path, score in hits
         ]
 
     async def get_embeddings_by_paths(
@@ -869,6 +1063,7 @@ class RepoIndexService:
         )
         return out
 
+    @profiling.traced("repo_index.query_curated_context")
     async def query_curated_context(
         self,
         repo_full_name: str,
@@ -893,25 +1088,22 @@ class RepoIndexService:
 
         t_curated_start = time.monotonic()
 
-        # Fetch all indexed files
+        # Resolve the in-memory vector index for the current head SHA —
+        # paths + embeddings only, no file bodies.
         t_fetch = time.monotonic()
-        fetch_result = await self._db.execute(
-            select(RepoFileIndex).where(
-                RepoFileIndex.repo_full_name == repo_full_name,
-                RepoFileIndex.branch == branch,
-                RepoFileIndex.embedding.isnot(None),
-            )
+        meta = await self.get_index_status(repo_full_name, branch)
+        index = await self._get_vector_index(
+            repo_full_name, branch, meta.head_sha if meta else None,
         )
-        rows = fetch_result.scalars().all()
-        if not rows:
+        if index is None:
             return None
+        paths = index.paths
         fetch_ms = (time.monotonic() - t_fetch) * 1000
 
         # Semantic search
         t_search = time.monotonic()
         query_vec = await self._es.aembed_single(query)
-        corpus_vecs = [np.frombuffer(r.embedding, dtype=np.float32) for r in rows]  # type: ignore[arg-type]
-        ranked = self._es.cosine_search(query_vec, corpus_vecs, top_k=len(rows))
+        ranked = self._es.cosine_search(query_vec, index.matrix, top_k=len(index))
         search_ms = (time.monotonic() - t_search) * 1000
 
         # Relevance filtering + domain-aware thresholds
@@ -922,7 +1114,7 @@ class RepoIndexService:
         cross_domain_filtered = 0
         below_base_filtered = 0
         for idx, score in ranked:
-            path_lower = rows[idx].file_path.lower()
+            path_lower = paths[idx].lower()
 
             # Check if this file belongs to ANY known domain
             file_domain: str | None = None
@@ -944,9 +1136,9 @@ class RepoIndexService:
                 else:
                     below_base_filtered += 1
                 continue
-            raw_score_by_path[rows[idx].file_path] = score
+            raw_score_by_path[paths[idx]] = score
             # D1: Source-type weighting — code > config > docs
-            source_weight = _compute_source_weight(rows[idx].file_path)
+            source_weight = _compute_source_weight(paths[idx])
             effective_score = score * source_weight
             # Domain boost stacks multiplicatively
             if is_same_domain:
@@ -964,7 +1156,7 @@ class RepoIndexService:
         diversity_excluded = 0
         doc_selected = 0
         for idx, score in boosted:
-            path = rows[idx].file_path
+            path = paths[idx]
             directory = path.rsplit("/", 1)[0] if "/" in path else ""
             if dir_counts.get(directory, 0) >= max_per_dir:
                 diversity_excluded += 1
@@ -995,7 +1187,7 @@ class RepoIndexService:
             "above_threshold=%d cross_domain_cut=%d below_base_cut=%d "
             "diversity_excluded=%d doc_deferred=%d selected=%d top=%.3f "
             "fetch=%.0fms search=%.0fms",
-            repo_full_name, len(query), len(rows),
+            repo_full_name, len(query), len(index),
             len(boosted), cross_domain_filtered, below_base_filtered,
             diversity_excluded, len(deferred_docs), len(selected),
             selected[0][1] if selected else 0.0,
@@ -1013,9 +1205,13 @@ class RepoIndexService:
         # skip it and try the next one (up to _MAX_BUDGET_SKIPS consecutive
         # skips).  This prevents a single oversized file from wasting half
         # the budget when smaller high-value files would still fit.
+        #
+        # File bodies are loaded lazily in ``_BODY_FETCH_CHUNK`` batches as
+        # the loop advances, so only files the packer actually reaches pay
+        # for a content read.
         # ------------------------------------------------------------------
 
-        path_to_row_idx = {r.file_path: i for i, r in enumerate(rows)}
+        bodies: dict[str, tuple[str | None, str | None]] = {}  # path -> (content, outline)
         included_paths: set[str] = set()
         parts: list[str] = []
         total_chars = 0
@@ -1029,7 +1225,12 @@ class RepoIndexService:
         selected_files_meta: list[dict] = []
         stop_reason = "relevance_exhausted"
 
-        def _pack_file(row_: RepoFileIndex, score_: float, source_: str) -> bool:
+        async def _ensure_bodies(wanted: list[str]) -> None:
+            missing = [p for p in wanted if p not in bodies]
+            if missing:
+                bodies.update(await self._load_file_bodies(repo_full_name, branch, missing))
+
+        def _pack_file(path_: str, score_: float, source_: str) -> bool:
             """Try to add a file to the budget.  Returns True if added.
 
             Pure budget check — does NOT set ``stop_reason``.  The caller
@@ -1038,7 +1239,8 @@ class RepoIndexService:
             nonlocal total_chars, files_included
             nonlocal graph_from_imports, graph_from_doc_refs
             nonlocal doc_files_packed, code_files_packed
-            body = row_.content or row_.outline or ""
+            content_, outline_ = bodies.get(path_, (None, None))
+            body = content_ or outline_ or ""
             if not body:
                 return False
             label = (
@@ -1046,29 +1248,29 @@ class RepoIndexService:
                 if source_ not in ("import-graph", "doc-ref")
                 else source_
             )
-            header = f"## {row_.file_path} ({label})"
-            entry = f"{header}\n```\n{body}\n```" if row_.content else f"{header}\n{body}"
+            header = f"## {path_} ({label})"
+            entry = f"{header}\n```\n{body}\n```" if content_ else f"{header}\n{body}"
             if total_chars + len(entry) > effective_max:
                 return False
             parts.append(entry)
             total_chars += len(entry)
             files_included += 1
-            included_paths.add(row_.file_path)
+            included_paths.add(path_)
             if source_ == "import-graph":
                 graph_from_imports += 1
             elif source_ == "doc-ref":
                 graph_from_doc_refs += 1
-            st = _classify_source_type(row_.file_path)
+            st = _classify_source_type(path_)
             if st == "docs":
                 doc_files_packed += 1
             elif st == "code":
                 code_files_packed += 1
             if len(selected_files_meta) < 30:
                 selected_files_meta.append({
-                    "path": row_.file_path,
+                    "path": path_,
                     "score": round(score_, 3),
-                    "raw_similarity": round(raw_score_by_path.get(row_.file_path, score_), 3),
-                    "source_weight": round(_compute_source_weight(row_.file_path), 2),
+                    "raw_similarity": round(raw_score_by_path.get(path_, score_), 3),
+                    "source_weight": round(_compute_source_weight(path_), 2),
                     "content_chars": len(body),
                     "source": source_,
                     "source_type": st,
@@ -1076,13 +1278,18 @@ class RepoIndexService:
             return True
 
         budget_skips = 0
-        for idx, score in selected:
-            row = rows[idx]
-            if row.file_path in included_paths:
+        for pos, (idx, score) in enumerate(selected):
+            path = paths[idx]
+            if path in included_paths:
                 continue
+            if path not in bodies:
+                await _ensure_bodies([
+                    paths[i] for i, _ in selected[pos:pos + _BODY_FETCH_CHUNK]
+                ])
+            content = bodies.get(path, (None, None))[0]
             # Pack this similarity-ranked file
-            source = "full" if row.content else "outline"
-            if not _pack_file(row, score, source):
+            source = "full" if content else "outline"
+            if not _pack_file(path, score, source):
                 budget_skips += 1
                 budget_skip_count += 1
                 if budget_skips >= _MAX_BUDGET_SKIPS:
@@ -1096,21 +1303,22 @@ class RepoIndexService:
             # before moving to the next similarity-ranked file so that
             # high-value transitive files (models.py, github_client.py)
             # take priority over low-scoring similarity tail files.
-            if row.content:
-                is_doc = _classify_source_type(row.file_path) == "docs"
+            if content:
+                is_doc = _classify_source_type(path) == "docs"
                 if is_doc:
-                    ref_paths = _extract_markdown_references(row.content)
+                    ref_paths = _extract_markdown_references(content)
                 else:
-                    ref_paths = _extract_import_paths(row.file_path, row.content)
+                    ref_paths = _extract_import_paths(path, content)
                 ref_source = "doc-ref" if is_doc else "import-graph"
+                ref_paths = [
+                    ref for ref in ref_paths
+                    if ref not in included_paths and ref in index.path_to_idx
+                ]
+                await _ensure_bodies(ref_paths)
                 for ref in ref_paths:
                     if ref in included_paths:
                         continue
-                    ref_row_idx = path_to_row_idx.get(ref)
-                    if ref_row_idx is None:
-                        continue
-                    ref_row = rows[ref_row_idx]
-                    _pack_file(ref_row, 0.0, ref_source)
+                    _pack_file(ref, 0.0, ref_source)
                     # Don't break on ref failure — skip and continue
 
         graph_expanded = graph_from_imports + graph_from_doc_refs
@@ -1132,19 +1340,18 @@ class RepoIndexService:
         for idx, score in selected:
             if len(near_misses) >= 5:
                 break
-            if rows[idx].file_path not in included_paths:
+            if paths[idx] not in included_paths:
                 near_misses.append({
-                    "path": rows[idx].file_path,
+                    "path": paths[idx],
                     "score": round(score, 3),
-                    "raw_similarity": round(raw_score_by_path.get(rows[idx].file_path, score), 3),
-                    "source_weight": round(_compute_source_weight(rows[idx].file_path), 2),
+                    "raw_similarity": round(raw_score_by_path.get(paths[idx], score), 3),
+                    "source_weight": round(_compute_source_weight(paths[idx]), 2),
                 })
 
         if not parts:
             return None
 
         # Freshness: "fresh" (SHA exists), "stale" (meta but no SHA), "unknown" (no meta)
-        meta = await self.get_index_status(repo_full_name, branch)
         if meta and meta.head_sha:
             freshness = "fresh"
         elif meta:
@@ -1156,19 +1363,19 @@ class RepoIndexService:
         logger.info(
             "curated_retrieval_detail: files=%d (code=%d docs=%d) "
             "graph=%d (imports=%d doc_refs=%d) skips=%d "
-            "budget=%d/%d (%.0f%%) stop=%s near_misses=%d total=%.0fms",
+            "budget=%d/%d (%.0f%%) stop=%s near_misses=%d bodies_loaded=%d total=%.0fms",
             files_included, code_files_packed, doc_files_packed,
             graph_expanded, graph_from_imports, graph_from_doc_refs,
             budget_skip_count,
             total_chars, effective_max,
             total_chars / max(effective_max, 1) * 100,
-            stop_reason, len(near_misses), curated_total_ms,
+            stop_reason, len(near_misses), len(bodies), curated_total_ms,
         )
 
         result = CuratedCodebaseContext(
             context_text="\n\n".join(parts),
             files_included=files_included,
-            total_files_indexed=len(rows),
+            total_files_indexed=len(index),
             index_freshness=freshness,
             top_relevance_score=top_score,
             selected_files=selected_files_meta,
@@ -1228,6 +1435,7 @@ class RepoIndexService:
             )
         )
         await self._db.commit()
+        invalidate_vector_index(repo_full_name, branch)
 
     # ------------------------------------------------------------------
     # Incremental refresh — detect changed files and re-embed only those
@@ -1323,6 +1531,7 @@ class RepoIndexService:
         if tree is None:
             meta.head_sha = current_sha
             await self._db.commit()
+            _retag_vector_index(repo_full_name, branch, current_sha)
             logger.info(
                 "incremental_update: %s tree unchanged (304) head=%s→%s "
                 "sha=%.0fms tree=%.0fms",
@@ -1373,6 +1582,7 @@ class RepoIndexService:
             # SHA differs but no file-level changes (e.g. merge commit)
             meta.head_sha = current_sha
             await self._db.commit()
+            _retag_vector_index(repo_full_name, branch, current_sha)
             logger.info(
                 "incremental_update: %s HEAD changed (%s→%s) but no file diffs "
                 "sha=%.0fms tree=%.0fms",
@@ -1411,6 +1621,7 @@ class RepoIndexService:
             repo_full_name=repo_full_name,
             branch=branch,
             concurrency=concurrency,
+            ref=current_sha,
         )
         process_ms = (time.monotonic() - t_process) * 1000
 
@@ -1471,6 +1682,7 @@ class RepoIndexService:
         # short-circuit above and the no-diff early-return (line ~1253) both
         # skip this path, so this flush only fires when state actually moved.
         invalidate_curated_cache()
+        await self._refresh_vector_index(repo_full_name, branch)
 
         total_ms = (time.monotonic() - t_start) * 1000
         logger.info(
@@ -1500,28 +1712,50 @@ class RepoIndexService:
     async def _read_and_embed_files(
         self,
         items: list[dict],
-        token: str,
+        token: str | None,
         repo_full_name: str,
         branch: str,
         concurrency: int = 10,
+        prefetched: dict[str, str] | None = None,
+        ref: str | None = None,
     ) -> tuple[list[ProcessedFile], int, int]:
         """Read file content, extract outlines, and batch-embed.
 
         Shared by ``build_index()`` (full rebuild) and
         ``incremental_update()`` (selective re-embed).
 
+        ``prefetched`` supplies contents already in hand (local checkout).
+        Otherwise, at ``INDEX_BULK_INGEST_MIN_FILES`` or more files the
+        whole snapshot at ``ref`` is pulled as one tarball; anything still
+        missing falls back to per-file contents API reads.
+
         Returns:
             (processed_files, read_failures, embed_failures)
         """
         if not items:
             return [], 0, 0
 
-        # Phase A: Read files with bounded concurrency
-        semaphore = asyncio.Semaphore(concurrency)
-        raw: list[tuple[dict, str | None]] = await asyncio.gather(
-            *[self._read_file(semaphore, token, repo_full_name, branch, it)
-              for it in items]
-        )
+        # Phase A: Bulk snapshot, then per-file reads for the remainder
+        if prefetched is None and token and len(items) >= settings.INDEX_BULK_INGEST_MIN_FILES:
+            prefetched = await self._prefetch_tarball(
+                token, repo_full_name, ref or branch, items,
+            )
+        prefetched = prefetched or {}
+        remaining = [it for it in items if it["path"] not in prefetched]
+        fetched: list[tuple[dict, str | None]] = []
+        if remaining and token:
+            semaphore = asyncio.Semaphore(concurrency)
+            fetched = await asyncio.gather(
+                *[self._read_file(semaphore, token, repo_full_name, branch, it)
+                  for it in remaining]
+            )
+        elif remaining:
+            fetched = [(it, None) for it in remaining]
+        fetched_by_path = {it["path"]: content for it, content in fetched}
+        raw: list[tuple[dict, str | None]] = [
+            (it, prefetched.get(it["path"], fetched_by_path.get(it["path"])))
+            for it in items
+        ]
 
         # Phase B: Filter out failed reads, extract outlines + embedding text
         #          + compute content_sha for each file (the dedup key).
@@ -1569,8 +1803,12 @@ class RepoIndexService:
         miss_embeddings: list[np.ndarray] = []
         if miss_indices:
             miss_texts = [valid[i][3] for i in miss_indices]
+            batch = settings.INDEX_EMBED_BATCH_SIZE
             try:
-                miss_embeddings = await self._es.aembed_texts(miss_texts)
+                for start in range(0, len(miss_texts), batch):
+                    miss_embeddings.extend(
+                        await self._es.aembed_texts(miss_texts[start:start + batch])
+                    )
             except Exception as exc:
                 logger.error(
                     "_read_and_embed_files: embedding failed for %s@%s (%s) — "
@@ -1611,6 +1849,39 @@ class RepoIndexService:
 
         return processed, read_failures, embed_failures
 
+    async def _prefetch_tarball(
+        self,
+        token: str,
+        repo_full_name: str,
+        ref: str,
+        items: list[dict],
+    ) -> dict[str, str] | None:
+        """Download the repo tarball at *ref* and extract *items*' contents.
+
+        Returns None on any failure so the caller falls back to per-file
+        reads. The archive is spooled (memory, then disk past 32 MB) and
+        parsed off the event loop.
+        """
+        t0 = time.monotonic()
+        wanted = {it["path"] for it in items}
+        try:
+            with tempfile.SpooledTemporaryFile(max_size=32 * 1024 * 1024) as buf:
+                size = await self._gc.download_tarball(token, repo_full_name, ref, buf)
+                buf.seek(0)
+                contents = await asyncio.to_thread(read_tarball, buf, wanted=wanted)
+        except Exception as exc:
+            logger.warning(
+                "tarball ingest failed for %s@%s (%s) — falling back to per-file reads",
+                repo_full_name, ref[:12], exc,
+            )
+            return None
+        logger.info(
+            "tarball ingest: repo=%s ref=%s bytes=%d extracted=%d/%d (%.0fms)",
+            repo_full_name, ref[:12], size, len(contents), len(wanted),
+            (time.monotonic() - t0) * 1000,
+        )
+        return contents
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
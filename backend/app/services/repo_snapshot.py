@@ -0,0 +1,173 @@
+"""Whole-repository snapshot readers for bulk indexing.
+
+``RepoIndexService`` normally reads files one at a time through the GitHub
+contents API. For large repos that is one HTTP round-trip per file and
+trips secondary rate limits. These helpers ingest a whole snapshot in one
+pass instead:
+
+- :func:`read_tarball` — stream a ``git archive``-style tarball (GitHub's
+  ``/tarball/{ref}`` endpoint) and keep only indexable files.
+- :func:`scan_local_checkout` — walk a local checkout and return tree
+  entries shaped like GitHub's recursive tree, plus file contents, so
+  indexing can run fully offline.
+
+Both are synchronous (file/tar I/O) — call them via ``asyncio.to_thread``.
+Tree entries carry git blob SHAs so rows built from a snapshot diff
+cleanly against later GitHub trees in ``incremental_update()``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import subprocess
+import tarfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO
+
+from app.services.file_filters import MAX_FILE_SIZE, is_indexable
+
+logger = logging.getLogger(__name__)
+
+# Directories never worth walking when a checkout isn't a git work tree
+# (no ``git ls-files`` to honour .gitignore).
+_SKIP_DIRS: frozenset[str] = frozenset({
+    ".git", "node_modules", ".venv", "venv", "__pycache__",
+    ".mypy_cache", ".pytest_cache", ".ruff_cache", "dist", "build",
+    ".svelte-kit", ".next", "target",
+})
+
+_GIT_TIMEOUT = 30
+
+
+@dataclass
+class LocalSnapshot:
+    """Tree + contents for a local checkout."""
+
+    head_sha: str
+    tree: list[dict] = field(default_factory=list)  # [{"path", "sha", "size"}]
+    contents: dict[str, str] = field(default_factory=dict)
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Git blob object id for *data* (matches GitHub tree ``sha``)."""
+    h = hashlib.sha1(usedforsecurity=False)
+    h.update(b"blob %d\0" % len(data))
+    h.update(data)
+    return h.hexdigest()
+
+
+def read_tarball(
+    fileobj: IO[bytes],
+    *,
+    wanted: set[str] | None = None,
+) -> dict[str, str]:
+    """Extract indexable text files from a (possibly gzipped) tarball.
+
+    The archive is read in streaming mode, so *fileobj* need not be
+    seekable. GitHub tarballs nest everything under one
+    ``{owner}-{repo}-{sha}/`` directory; that leading component is
+    stripped so keys match tree paths. When *wanted* is given only those
+    paths are decoded.
+    """
+    out: dict[str, str] = {}
+    with tarfile.open(fileobj=fileobj, mode="r|*") as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            _, sep, path = member.name.partition("/")
+            if not sep or not path:
+                continue
+            if wanted is not None:
+                if path not in wanted:
+                    continue
+            elif not is_indexable(path, member.size):
+                continue
+            if member.size > MAX_FILE_SIZE:
+                continue
+            fh = tar.extractfile(member)
+            if fh is None:
+                continue
+            out[path] = fh.read().decode(errors="replace")
+    return out
+
+
+def _git(root: Path, *args: str) -> str | None:
+    try:
+        proc = subprocess.run(
+            ["git", "-C", str(root), *args],
+            capture_output=True, timeout=_GIT_TIMEOUT, check=False,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if proc.returncode != 0:
+        return None
+    return proc.stdout.decode(errors="replace")
+
+
+def _list_paths(root: Path) -> tuple[list[str], bool]:
+    """Return ``(relative paths, from_git)`` for candidate files."""
+    listed = _git(root, "ls-files", "-z")
+    if listed is not None:
+        return [p for p in listed.split("\0") if p], True
+    paths: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+        rel_dir = os.path.relpath(dirpath, root)
+        for name in filenames:
+            rel = name if rel_dir == "." else f"{rel_dir}/{name}"
+            paths.append(rel.replace(os.sep, "/"))
+    return paths, False
+
+
+def scan_local_checkout(root: str | os.PathLike[str]) -> LocalSnapshot:
+    """Read every indexable file under *root*.
+
+    Uses ``git ls-files`` when *root* is a git work tree (honours
+    .gitignore), otherwise a filtered directory walk. ``head_sha`` is the
+    checkout's HEAD commit when the work tree is clean; for dirty or
+    non-git trees it is a ``local-`` digest of the listing so the index is
+    still versioned by content.
+
+    Raises:
+        FileNotFoundError: If *root* is not a directory.
+    """
+    base = Path(root).expanduser().resolve()
+    if not base.is_dir():
+        raise FileNotFoundError(f"Local checkout not found: {root}")
+
+    paths, from_git = _list_paths(base)
+    snapshot = LocalSnapshot(head_sha="")
+    listing = hashlib.sha1(usedforsecurity=False)
+    for rel in sorted(paths):
+        full = base / rel
+        try:
+            size = full.stat().st_size
+        except OSError:
+            continue
+        if not full.is_file() or not is_indexable(rel, size):
+            continue
+        try:
+            data = full.read_bytes()
+        except OSError:
+            logger.warning("scan_local_checkout: failed to read %s", full)
+            continue
+        sha = git_blob_sha(data)
+        snapshot.tree.append({"path": rel, "sha": sha, "size": len(data)})
+        snapshot.contents[rel] = data.decode(errors="replace")
+        listing.update(f"{rel}\0{sha}\n".encode())
+
+    head: str | None = None
+    if from_git:
+        status = _git(base, "status", "--porcelain", "--untracked-files=no")
+        if status is not None and not status.strip():
+            head = (_git(base, "rev-parse", "HEAD") or "").strip() or None
+    snapshot.head_sha = head or f"local-{listing.hexdigest()}"
+    logger.info(
+        "scan_local_checkout: root=%s files=%d source=%s head=%s",
+        base, len(snapshot.tree), "git" if from_git else "walk",
+        snapshot.head_sha[:14],
+    )
+    return snapshot
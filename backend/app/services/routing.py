@@ -406,7 +406,7 @@ class RoutingManager:
         )
         self._broadcast_state_change("session_invalidated")
 
-    def sync_from_event(self, data: RoutingStatePayload | dict) -> None:
+    def sync_from_event(self, data: RoutingStatePayload | dict, *, broadcast: bool = True) -> None:
         """Update state from a cross-process ``routing_state_changed`` event.
 
         Used by the FastAPI backend to keep its own RoutingManager in sync
@@ -417,6 +417,9 @@ class RoutingManager:
         ``sampling_capable`` field is legitimately ``None`` after session
         invalidation, and we must sync that.
 
+        With ``broadcast=False`` only the local state is updated — used by
+        API workers applying a change another worker already published.
+
         Notes:
             - ``mcp_connected=None`` is coerced to ``False`` (clients always
               send an explicit bool or omit the field).
@@ -447,7 +450,7 @@ class RoutingManager:
         # Only broadcast if something actually changed
         new_connected = self._state.mcp_connected
         new_sampling = self._state.sampling_capable
-        if old_connected != new_connected or old_sampling != new_sampling:
+        if broadcast and (old_connected != new_connected or old_sampling != new_sampling):
             # Local broadcast only — do NOT fire cross_process_notify
             # (this IS the receiving end of a cross-process notification)
             payload: RoutingStatePayload = {
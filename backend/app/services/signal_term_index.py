@@ -0,0 +1,304 @@
+"""Incremental term document-frequency index for TF-IDF signal extraction.
+
+The task-type and domain signal extractors score a term by how often it
+appears in a group's prompts compared with all prompts. Recomputing that
+from ``raw_prompt`` meant re-tokenizing the whole history on every warm
+cycle. This module keeps the counts in two tables instead:
+
+* ``signal_term_docs`` records each counted optimization, the groups it
+  was counted under and its distinct terms.
+* ``signal_term_counts`` holds per-(scope, key, term) document counts for
+  the ``global``, ``task_type`` and ``cluster`` scopes.
+
+``sync_term_counts()`` reconciles the two with ``optimizations`` and
+applies +/- deltas. It tokenizes only prompts it has not seen before.
+Deleted and reclassified optimizations are reversed from their stored
+terms. Change detection compares ids, ``task_type``, ``status`` and
+``cluster_id`` in SQL rather than hooking every writer of those columns.
+After a sync, extractor reads cost O(vocabulary) instead of O(history).
+
+Copyright 2025-2026 Project Synthesis contributors.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import time
+from collections import Counter
+from collections.abc import Iterable
+
+from sqlalchemy import and_, bindparam, case, delete, func, or_, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Optimization, SignalTermCount, SignalTermDoc
+
+logger = logging.getLogger(__name__)
+
+SCOPE_GLOBAL = "global"
+SCOPE_TASK_TYPE = "task_type"
+SCOPE_CLUSTER = "cluster"
+
+# Sentinel term whose count is the number of documents in the group.
+TOTAL_TERM = ""
+
+# Stopwords — common English words that are never useful as signals.
+# Extractors may filter further at read time.
+STOPWORDS = frozenset({
+    "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
+    "being", "have", "has", "had", "do", "does", "did", "will", "would",
+    "could", "should", "may", "might", "shall", "can", "that", "this",
+    "these", "those", "it", "its", "i", "you", "he", "she", "we", "they",
+    "my", "your", "our", "their", "me", "him", "her", "us", "them",
+    "not", "no", "so", "if", "as", "up", "out", "about", "into", "over",
+    "then", "than", "too", "very", "just", "also", "how", "what", "when",
+    "where", "which", "who", "why", "all", "each", "every", "both",
+    "few", "more", "most", "other", "some", "such", "any", "only", "own",
+    "same", "new", "use", "using", "used", "make", "like", "need", "want",
+    "get", "set", "add", "create", "write", "include", "provide", "ensure",
+    "implement", "build", "design", "please", "help", "give", "show",
+})
+
+# Regex to extract tokens (alphanumeric + hyphens for tech terms like "ci-cd")
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9\-]{2,}")
+
+# Rows per executemany batch.
+_BATCH = 500
+
+
+def tokenize(prompt: str) -> set[str]:
+    """Distinct non-stopword terms of *prompt*."""
+    return set(_TOKEN_RE.findall(prompt.lower())) - STOPWORDS
+
+
+def _counted_task_type():
+    """SQL expression for the task type an optimization is counted under.
+
+    Only completed optimizations contribute to task-type signals.
+    """
+    return case((Optimization.status == "completed", Optimization.task_type), else_=None)
+
+
+def _groups(task_type: str | None, cluster_id: str | None) -> list[tuple[str, str]]:
+    groups = [(SCOPE_GLOBAL, "")]
+    if task_type:
+        groups.append((SCOPE_TASK_TYPE, task_type))
+    if cluster_id:
+        groups.append((SCOPE_CLUSTER, cluster_id))
+    return groups
+
+
+def _apply(
+    deltas: Counter[tuple[str, str, str]],
+    terms: Iterable[str],
+    groups: list[tuple[str, str]],
+    sign: int,
+) -> None:
+    terms = [TOTAL_TERM, *terms]
+    for scope, key in groups:
+        for term in terms:
+            deltas[(scope, key, term)] += sign
+
+
+async def sync_term_counts(db: AsyncSession) -> dict[str, int]:
+    """Bring the term index up to date with ``optimizations``.
+
+    Writes through *db* inside a savepoint without committing, so the
+    index changes land atomically in the caller's transaction. Returns how
+    many optimizations were added, removed and regrouped.
+    """
+    async with db.begin_nested():
+        return await _sync(db)
+
+
+async def _sync(db: AsyncSession) -> dict[str, int]:
+    t0 = time.monotonic()
+    deltas: Counter[tuple[str, str, str]] = Counter()
+    counted_task_type = _counted_task_type()
+
+    # 1. Optimizations that no longer exist.
+    removed_q = await db.execute(
+        select(SignalTermDoc.optimization_id, SignalTermDoc.task_type,
+               SignalTermDoc.cluster_id, SignalTermDoc.terms)
+        .outerjoin(Optimization, Optimization.id == SignalTermDoc.optimization_id)
+        .where(Optimization.id.is_(None))
+    )
+    removed_ids: list[str] = []
+    for opt_id, task_type, cluster_id, terms in removed_q.all():
+        _apply(deltas, terms.split(), _groups(task_type, cluster_id), -1)
+        removed_ids.append(opt_id)
+
+    # 2. Optimizations whose task type, status or cluster changed.
+    moved_q = await db.execute(
+        select(SignalTermDoc.optimization_id, SignalTermDoc.task_type,
+               SignalTermDoc.cluster_id, SignalTermDoc.terms,
+               counted_task_type, Optimization.cluster_id)
+        .join(Optimization, Optimization.id == SignalTermDoc.optimization_id)
+        .where(or_(
+            SignalTermDoc.task_type.is_distinct_from(counted_task_type),
+            SignalTermDoc.cluster_id.is_distinct_from(Optimization.cluster_id),
+        ))
+    )
+    moved: list[dict[str, str | None]] = []
+    for opt_id, old_tt, old_cluster, terms, new_tt, new_cluster in moved_q.all():
+        term_list = terms.split()
+        _apply(deltas, term_list, _groups(old_tt, old_cluster), -1)
+        _apply(deltas, term_list, _groups(new_tt, new_cluster), +1)
+        moved.append({"oid": opt_id, "tt": new_tt, "cid": new_cluster})
+
+    # 3. Optimizations not indexed yet — the only prompts read and tokenized.
+    added_q = await db.execute(
+        select(Optimization.id, Optimization.raw_prompt, counted_task_type, Optimization.cluster_id)
+        .outerjoin(SignalTermDoc, SignalTermDoc.optimization_id == Optimization.id)
+        .where(SignalTermDoc.optimization_id.is_(None), Optimization.raw_prompt.isnot(None))
+    )
+    added: list[dict[str, str | None]] = []
+    for opt_id, raw_prompt, task_type, cluster_id in added_q.all():
+        terms = sorted(tokenize(raw_prompt))
+        _apply(deltas, terms, _groups(task_type, cluster_id), +1)
+        added.append({
+            "optimization_id": opt_id, "task_type": task_type,
+            "cluster_id": cluster_id, "terms": " ".join(terms),
+        })
+
+    for i in range(0, len(removed_ids), _BATCH):
+        await db.execute(
+            delete(SignalTermDoc)
+            .where(SignalTermDoc.optimization_id.in_(removed_ids[i:i + _BATCH]))
+        )
+    if moved:
+        docs = SignalTermDoc.__table__
+        await db.execute(
+            update(docs)
+            .where(docs.c.optimization_id == bindparam("oid"))
+            .values(task_type=bindparam("tt"), cluster_id=bindparam("cid")),
+            moved,
+        )
+    for i in range(0, len(added), _BATCH):
+        await db.execute(sqlite_insert(SignalTermDoc.__table__), added[i:i + _BATCH])
+
+    changes = [
+        {"scope": scope, "key": key, "term": term, "doc_count": n}
+        for (scope, key, term), n in deltas.items() if n
+    ]
+    if changes:
+        counts = SignalTermCount.__table__
+        upsert = sqlite_insert(counts)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=["scope", "key", "term"],
+            set_={"doc_count": counts.c.doc_count + upsert.excluded.doc_count},
+        )
+        for i in range(0, len(changes), _BATCH):
+            await db.execute(upsert, changes[i:i + _BATCH])
+        await db.execute(delete(SignalTermCount).where(SignalTermCount.doc_count <= 0))
+
+    stats = {"added": len(added), "removed": len(removed_ids), "moved": len(moved)}
+    if any(stats.values()):
+        logger.info(
+            "sync_term_counts: +%d -%d ~%d optimizations, %d count deltas in %.1fms",
+            stats["added"], stats["removed"], stats["moved"], len(changes),
+            (time.monotonic() - t0) * 1000,
+        )
+    return stats
+
+
+async def group_totals(db: AsyncSession, scope: str) -> dict[str, int]:
+    """Document total per key of *scope*."""
+    rows = await db.execute(
+        select(SignalTermCount.key, SignalTermCount.doc_count).where(
+            SignalTermCount.scope == scope,
+            SignalTermCount.term == TOTAL_TERM,
+        )
+    )
+    return {key: n for key, n in rows.all()}
+
+
+async def group_term_counts(
+    db: AsyncSession,
+    scope: str,
+    keys: list[str],
+    min_count: int = 0,
+) -> dict[str, int]:
+    """Document count per term summed over *keys* of *scope*.
+
+    Only terms with at least *min_count* documents are returned, which keeps
+    the result to the handful of candidates worth scoring.
+    """
+    if not keys:
+        return {}
+    total = func.sum(SignalTermCount.doc_count)
+    rows = await db.execute(
+        select(SignalTermCount.term, total)
+        .where(
+            SignalTermCount.scope == scope,
+            SignalTermCount.key.in_(keys),
+            SignalTermCount.term != TOTAL_TERM,
+        )
+        .group_by(SignalTermCount.term)
+        .having(total >= min_count)
+    )
+    return {term: int(n) for term, n in rows.all()}
+
+
+async def global_term_counts(db: AsyncSession, terms: Iterable[str]) -> tuple[dict[str, int], int]:
+    """Global document count for each of *terms*, and the global document total."""
+    wanted = [TOTAL_TERM, *terms]
+    found: dict[str, int] = {}
+    for i in range(0, len(wanted), _BATCH):
+        rows = await db.execute(
+            select(SignalTermCount.term, SignalTermCount.doc_count).where(
+                and_(
+                    SignalTermCount.scope == SCOPE_GLOBAL,
+                    SignalTermCount.key == "",
+                    SignalTermCount.term.in_(wanted[i:i + _BATCH]),
+                )
+            )
+        )
+        found.update(rows.all())
+    total = found.pop(TOTAL_TERM, 0)
+    return found, total
+
+
+def rank_terms(
+    group_counts: dict[str, int],
+    group_total: int,
+    global_counts: dict[str, int],
+    global_total: int,
+    *,
+    min_group_freq: float,
+    max_global_freq: float,
+    top_k: int,
+    exclude: frozenset[str] = frozenset(),
+) -> tuple[list[tuple[str, float]], int]:
+    """Top *top_k* discriminative terms with weights normalized to ``[0.5, 1.0]``.
+
+    A term scores ``group_freq / max(global_freq, 0.01)``. It must appear in
+    at least *min_group_freq* of the group's prompts and at most
+    *max_global_freq* of all prompts. Ties break alphabetically. Also
+    returns how many terms passed the filters.
+    """
+    global_total = max(global_total, 1)
+    scored: list[tuple[str, float]] = []
+    for term, count in group_counts.items():
+        if term in exclude:
+            continue
+        group_freq = count / group_total
+        global_freq = global_counts.get(term, 0) / global_total
+        if group_freq < min_group_freq or global_freq > max_global_freq:
+            continue
+        scored.append((term, group_freq / max(global_freq, 0.01)))
+
+    scored.sort(key=lambda x: (-x[1], x[0]))
+    top = scored[:top_k]
+    if not top:
+        return [], len(scored)
+
+    max_score = top[0][1]
+    min_score = top[-1][1] if len(top) > 1 else max_score
+    score_range = max(max_score - min_score, 0.01)
+    return [
+        (term, round(0.5 + 0.5 * (score - min_score) / score_range, 2))
+        for term, score in top
+    ], len(scored)
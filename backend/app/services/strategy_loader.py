@@ -12,15 +12,19 @@ Strategy files are Markdown in prompts/strategies/ with YAML frontmatter:
 
 The frontmatter is stripped before injection into optimizer/refiner templates.
 The system is fully adaptive — adding/removing .md files is auto-detected.
+Parsed files and the directory listing are held in ``config_cache``.
 """
 
 from __future__ import annotations
 
 import logging
 import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from app.services.config_cache import config_cache
+
 logger = logging.getLogger(__name__)
 
 # Regex to extract YAML frontmatter between --- delimiters
@@ -78,6 +82,20 @@ def _parse_frontmatter(content: str) -> tuple[dict[str, str], str]:
     return meta, body
 
 
+@dataclass(frozen=True)
+class _StrategyFile:
+    """A strategy file parsed once per change: frontmatter, body, raw size."""
+
+    meta: dict[str, str]
+    body: str
+    size: int
+
+
+def _parse_strategy(content: str) -> _StrategyFile:
+    meta, body = _parse_frontmatter(content)
+    return _StrategyFile(meta=meta, body=body, size=len(content))
+
+
 def validate_frontmatter(
     meta: dict[str, str],
     filename: str = "",
@@ -123,8 +141,8 @@ def validate_frontmatter(
 class StrategyLoader:
     """Discovers and loads strategy files from the strategies directory.
 
-    Fully adaptive: strategies are discovered from disk on each call.
-    No hardcoded list — adding/removing .md files changes available strategies.
+    Fully adaptive: the cached listing follows the directory, so
+    adding/removing .md files changes available strategies.
     """
 
     def __init__(self, strategies_dir: Path) -> None:
@@ -132,10 +150,8 @@ class StrategyLoader:
 
     def list_strategies(self) -> list[str]:
         """Return sorted list of available strategy names (without .md extension)."""
-        if not self.strategies_dir.exists():
-            return []
         try:
-            return sorted(p.stem for p in self.strategies_dir.glob("*.md"))
+            return config_cache.listdir(self.strategies_dir, ".md") or []
         except OSError as exc:
             logger.error("Failed to list strategies: %s", exc)
             return []
@@ -148,7 +164,16 @@ class StrategyLoader:
         the file is missing or unreadable.
         """
         path = self.strategies_dir / f"{name}.md"
-        if not path.exists():
+        try:
+            parsed = config_cache.read(path, _parse_strategy)
+        except (OSError, UnicodeDecodeError) as exc:
+            logger.error("Failed to read strategy '%s': %s", name, exc)
+            return (
+                "Strategy file could not be read. "
+                "Use your best judgment to optimize the prompt."
+            )
+
+        if parsed is None:
             available = self.list_strategies()
             if available:
                 logger.warning(
@@ -167,24 +192,14 @@ class StrategyLoader:
                 "focus on clarity, specificity, and structure."
             )
 
-        try:
-            content = path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError) as exc:
-            logger.error("Failed to read strategy '%s': %s", name, exc)
-            return (
-                "Strategy file could not be read. "
-                "Use your best judgment to optimize the prompt."
-            )
-
-        if len(content) > _MAX_FILE_SIZE:
+        if parsed.size > _MAX_FILE_SIZE:
             logger.warning(
                 "Strategy '%s' is very large (%d bytes, max %d). "
                 "Consider trimming for optimal LLM performance.",
-                name, len(content), _MAX_FILE_SIZE,
+                name, parsed.size, _MAX_FILE_SIZE,
             )
 
-        _, body = _parse_frontmatter(content)
-        body = body.strip()
+        body = parsed.body.strip()
 
         if not body:
             logger.warning(
@@ -224,26 +239,26 @@ class StrategyLoader:
         no frontmatter. Logs validation warnings but never crashes.
         """
         path = self.strategies_dir / f"{name}.md"
-        if not path.exists():
+        try:
+            parsed = config_cache.read(path, _parse_strategy)
+        except (OSError, UnicodeDecodeError) as exc:
+            logger.error("Failed to read strategy '%s' metadata: %s", name, exc)
             return {
                 "name": name,
                 "tagline": "",
                 "description": "",
-                "warnings": [f"Strategy file '{name}.md' not found"],
+                "warnings": [f"Could not read file: {exc}"],
             }
 
-        try:
-            content = path.read_text(encoding="utf-8")
-        except (OSError, UnicodeDecodeError) as exc:
-            logger.error("Failed to read strategy '%s' metadata: %s", name, exc)
+        if parsed is None:
             return {
                 "name": name,
                 "tagline": "",
                 "description": "",
-                "warnings": [f"Could not read file: {exc}"],
+                "warnings": [f"Strategy file '{name}.md' not found"],
             }
 
-        meta, body = _parse_frontmatter(content)
+        meta, body = parsed.meta, parsed.body
 
         # Validate frontmatter
         fm_warnings = validate_frontmatter(meta, filename=name)
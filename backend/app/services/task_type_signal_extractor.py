@@ -1,10 +1,14 @@
 """Task-type signal extractor -- mines TF-IDF keywords from optimizations grouped by task_type.
 
-Queries all optimizations, groups by task_type, and for each type with
+Groups completed optimizations by task_type, and for each type with
 sufficient samples computes discriminative keywords using a simplified
 TF-IDF approach: tokens that appear frequently in a task type's prompts
 but rarely across all prompts are strong task-type indicators.
 
+Document frequencies come from the incremental term index
+(``signal_term_index``), so a refresh only tokenizes prompts added since
+the last one.
+
 Returns ``{task_type: [(keyword, weight), ...]}`` with top keywords per type,
 or an empty dict on failure (callers keep existing signals).
 
@@ -14,14 +18,18 @@ Copyright 2025-2026 Project Synthesis contributors.
 from __future__ import annotations
 
 import logging
-import re
 import time
-from collections import Counter
 
-from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import Optimization
+from app.services.signal_term_index import (
+    SCOPE_TASK_TYPE,
+    global_term_counts,
+    group_term_counts,
+    group_totals,
+    rank_terms,
+    sync_term_counts,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,31 +41,12 @@ MIN_SAMPLES = 30       # Minimum optimizations per task type to extract signals
 TOP_K = 15             # Maximum keywords per task type
 MIN_TASK_FREQ = 0.30   # Token must appear in >= 30% of the type's prompts
 MAX_GLOBAL_FREQ = 0.70 # Token must appear in <= 70% of ALL prompts
-GLOBAL_SAMPLE_CAP = 500  # Cap global frequency sample to avoid full table scan
-
-# Stopwords -- common English words that are never useful as task-type signals.
-# Copied from domain_signal_extractor.py (private, not imported) and extended.
-_STOPWORDS = frozenset({
-    "a", "an", "the", "and", "or", "but", "in", "on", "at", "to", "for",
-    "of", "with", "by", "from", "is", "are", "was", "were", "be", "been",
-    "being", "have", "has", "had", "do", "does", "did", "will", "would",
-    "could", "should", "may", "might", "shall", "can", "that", "this",
-    "these", "those", "it", "its", "i", "you", "he", "she", "we", "they",
-    "my", "your", "our", "their", "me", "him", "her", "us", "them",
-    "not", "no", "so", "if", "as", "up", "out", "about", "into", "over",
-    "then", "than", "too", "very", "just", "also", "how", "what", "when",
-    "where", "which", "who", "why", "all", "each", "every", "both",
-    "few", "more", "most", "other", "some", "such", "any", "only", "own",
-    "same", "new", "use", "using", "used", "make", "like", "need", "want",
-    "get", "set", "add", "create", "write", "include", "provide", "ensure",
-    "implement", "build", "design", "please", "help", "give", "show",
-    # Extended for task-type extraction
+
+# Words too generic for task-type signals, on top of the index's stopwords.
+_EXTRA_STOPWORDS = frozenset({
     "good", "better", "best", "example", "following", "given", "based",
 })
 
-# Regex to extract tokens (alphanumeric + hyphens for tech terms like "ci-cd")
-_TOKEN_RE = re.compile(r"[a-z][a-z0-9\-]{2,}")
-
 
 async def extract_task_type_signals(
     db: AsyncSession,
@@ -75,19 +64,10 @@ async def extract_task_type_signals(
     t0 = time.monotonic()
 
     try:
-        # 1. Count optimizations per task type
-        type_counts_q = await db.execute(
-            select(Optimization.task_type, func.count(Optimization.id))
-            .where(
-                Optimization.task_type.isnot(None),
-                Optimization.raw_prompt.isnot(None),
-                Optimization.status == "completed",
-            )
-            .group_by(Optimization.task_type)
-        )
-        type_counts: dict[str, int] = {
-            row[0]: row[1] for row in type_counts_q.all()
-        }
+        # 1. Bring the term index up to date, then read group totals from it
+        await sync_term_counts(db)
+        await db.commit()
+        type_counts = await group_totals(db, SCOPE_TASK_TYPE)
 
         total_samples = sum(type_counts.values())
         logger.info(
@@ -95,23 +75,7 @@ async def extract_task_type_signals(
             total_samples, len(type_counts),
         )
 
-        # 2. Fetch global sample for background frequency
-        global_q = await db.execute(
-            select(Optimization.raw_prompt)
-            .where(Optimization.raw_prompt.isnot(None))
-            .limit(GLOBAL_SAMPLE_CAP)
-        )
-        global_prompts = [r[0] for r in global_q.all()]
-        total_global = max(len(global_prompts), 1)
-
-        global_doc_count: Counter[str] = Counter()
-        for prompt in global_prompts:
-            tokens = set(_TOKEN_RE.findall(prompt.lower()))
-            tokens -= _STOPWORDS
-            for token in tokens:
-                global_doc_count[token] += 1
-
-        # 3. Process each task type
+        # 2. Process each task type
         result: dict[str, list[tuple[str, float]]] = {}
         dynamic_count = 0
         static_count = 0
@@ -139,46 +103,22 @@ async def extract_task_type_signals(
                     pass
                 continue
 
-            # Fetch prompts for this task type
             try:
-                type_q = await db.execute(
-                    select(Optimization.raw_prompt).where(
-                        Optimization.task_type == task_type,
-                        Optimization.raw_prompt.isnot(None),
-                        Optimization.status == "completed",
-                    )
+                # Terms frequent enough in this type, with their global counts
+                total_type = count
+                type_doc_count = await group_term_counts(
+                    db, SCOPE_TASK_TYPE, [task_type], int(MIN_TASK_FREQ * total_type),
                 )
-                type_prompts = [r[0] for r in type_q.all()]
-
-                # Compute task-type term frequency
-                type_doc_count: Counter[str] = Counter()
-                for prompt in type_prompts:
-                    tokens = set(_TOKEN_RE.findall(prompt.lower()))
-                    tokens -= _STOPWORDS
-                    for token in tokens:
-                        type_doc_count[token] += 1
-
-                total_type = len(type_prompts)
+                global_doc_count, total_global = await global_term_counts(db, type_doc_count)
 
                 # Score: tokens frequent in this type but rare globally
-                scored: list[tuple[str, float]] = []
-                for token, type_count_val in type_doc_count.items():
-                    task_freq = type_count_val / total_type
-                    global_freq = global_doc_count.get(token, 0) / total_global
-
-                    if task_freq < MIN_TASK_FREQ:
-                        continue
-                    if global_freq > MAX_GLOBAL_FREQ:
-                        continue
-
-                    score = task_freq / max(global_freq, 0.01)
-                    scored.append((token, score))
-
-                # Sort by score, take top_k, normalize weights to [0.5, 1.0]
-                scored.sort(key=lambda x: x[1], reverse=True)
-                top = scored[:TOP_K]
+                normalized, _ = rank_terms(
+                    type_doc_count, total_type, global_doc_count, total_global,
+                    min_group_freq=MIN_TASK_FREQ, max_global_freq=MAX_GLOBAL_FREQ,
+                    top_k=TOP_K, exclude=_EXTRA_STOPWORDS,
+                )
 
-                if not top:
+                if not normalized:
                     logger.info(
                         "extract_task_type_signals: task_type='%s' — no discriminative keywords found (%d prompts)",
                         task_type, total_type,
@@ -186,15 +126,6 @@ async def extract_task_type_signals(
                     static_count += 1
                     continue
 
-                max_score = top[0][1]
-                min_score = top[-1][1] if len(top) > 1 else max_score
-                score_range = max(max_score - min_score, 0.01)
-
-                normalized = [
-                    (token, round(0.5 + 0.5 * (score - min_score) / score_range, 2))
-                    for token, score in top
-                ]
-
                 result[task_type] = normalized
                 dynamic_count += 1
 
@@ -163,6 +163,15 @@ DOMAIN_DISSOLUTION_MEMBER_CEILING: int = 5             # large domains don't dis
 MAINTENANCE_CYCLE_INTERVAL: int = 6  # ~30 min at default 5-min warm interval
 
 
+# ---------------------------------------------------------------------------
+# Incremental Q ledger
+# ---------------------------------------------------------------------------
+# Speculative-phase Q gates read Q from ``QLedger`` (per-cluster sums).
+# Every Nth warm cycle they also recompute Q from a full node load, gate
+# on that value, and force a ledger rebuild if the two disagree.
+Q_LEDGER_VERIFY_INTERVAL: int = 6
+
+
 # ---------------------------------------------------------------------------
 # Spectral split algorithm
 # ---------------------------------------------------------------------------
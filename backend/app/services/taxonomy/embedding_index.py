@@ -597,8 +597,11 @@ class EmbeddingIndex:
             }
 
         try:
-            with open(cache_path, "wb") as f:
+            # Write-then-rename so readers in other processes never see a partial file
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
                 pickle.dump(data, f)
+            tmp_path.replace(cache_path)
             logger.info(
                 "EmbeddingIndex cache saved: %d entries → %s",
                 len(data["ids"]),  # type: ignore[arg-type]
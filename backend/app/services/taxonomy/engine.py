@@ -28,6 +28,7 @@ from typing import Any
 import numpy as np
 from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.config import PROMPTS_DIR, settings
 from app.models import (
@@ -38,6 +39,8 @@ from app.models import (
     TaxonomySnapshot,
 )
 from app.providers.base import LLMProvider
+from app.providers.concurrency import Priority, llm_priority
+from app.services import profiling
 from app.services.embedding_service import EmbeddingService
 from app.services.prompt_loader import PromptLoader
 from app.services.taxonomy._constants import EXCLUDED_STRUCTURAL_STATES, _utcnow
@@ -61,6 +64,7 @@ from app.services.taxonomy.matching import (
 from app.services.taxonomy.matching import (
     match_prompt as _match_prompt,
 )
+from app.services.taxonomy.q_ledger import QLedger
 from app.services.taxonomy.sparkline import compute_sparkline_data
 from app.services.taxonomy.sub_domain_readiness import compute_qualifier_cascade
 from app.services.taxonomy.warm_path import WarmPathResult, execute_warm_path
@@ -375,6 +379,9 @@ class TaxonomyEngine:
         # Hot path marks clusters as dirty when members change.
         # Warm path snapshots and clears at cycle start.
         self._dirty_set: dict[str, str | None] = {}  # cluster_id -> project_id (Phase 3A)
+        # Incremental Q for the warm-path speculative gates — rebuilt each
+        # cycle from the Phase 0 load; dirty clusters are re-read lazily.
+        self._q_ledger = QLedger()
         # ADR-005: Adaptive scheduler — rolling window of warm cycle timings.
         self._scheduler = AdaptiveScheduler()
         # ADR-005 Phase 2A: project resolution caches
@@ -403,6 +410,7 @@ class TaxonomyEngine:
     def mark_dirty(self, cluster_id: str, project_id: str | None = None) -> None:
         """Mark a cluster as needing warm-path processing."""
         self._dirty_set[cluster_id] = project_id
+        self._q_ledger.invalidate(cluster_id)
 
     def snapshot_dirty_set_with_projects(self) -> tuple[set[str], dict[str, set[str]]]:
         """Snapshot dirty set with per-project breakdown.
@@ -513,10 +521,29 @@ class TaxonomyEngine:
         except Exception as oi_exc:
             logger.warning("OptimizedEmbeddingIndex warm-load failed (non-fatal): %s", oi_exc)
 
+    async def save_index_caches(self, data_dir: Path) -> None:
+        """Persist all four in-memory indexes to their disk caches.
+
+        The cold path saves these after a rebuild; the taxonomy leader also
+        calls this after each warm cycle when running with several API
+        workers, so followers pick up hot-path additions from disk.
+        """
+        for name, index in (
+            ("embedding_index.pkl", self._embedding_index),
+            ("transformation_index.pkl", self._transformation_index),
+            ("optimized_index.pkl", self._optimized_index),
+            ("qualifier_index.pkl", self._qualifier_index),
+        ):
+            try:
+                await index.save_cache(data_dir / name)
+            except Exception as exc:
+                logger.warning("%s cache save failed (non-fatal): %s", name, exc)
+
     # ------------------------------------------------------------------
     # Public hot-path entry point
     # ------------------------------------------------------------------
 
+    @profiling.traced("taxonomy.process_optimization")
     async def process_optimization(
         self,
         optimization_id: str,
@@ -542,7 +569,9 @@ class TaxonomyEngine:
         """
         try:
             result = await db.execute(
-                select(Optimization).where(Optimization.id == optimization_id)
+                select(Optimization)
+                .where(Optimization.id == optimization_id)
+                .options(selectinload(Optimization.vectors))
             )
             opt = result.scalar_one_or_none()
 
@@ -887,6 +916,7 @@ class TaxonomyEngine:
     # Pattern matching — delegated to matching.py
     # ------------------------------------------------------------------
 
+    @profiling.traced("taxonomy.match_prompt")
     async def match_prompt(
         self, prompt_text: str, db: AsyncSession,
     ) -> PatternMatch | None:
@@ -933,7 +963,8 @@ class TaxonomyEngine:
 
         async with self._warm_path_lock:
             try:
-                return await execute_warm_path(self, session_factory)
+                with llm_priority(Priority.BACKGROUND):
+                    return await execute_warm_path(self, session_factory)
             except Exception as exc:
                 logger.error("Warm path failed: %s", exc, exc_info=True)
                 # Return a minimal result so callers don't break
@@ -996,6 +1027,7 @@ class TaxonomyEngine:
             select(Optimization)
             .where(Optimization.embedding.isnot(None))
             .order_by(Optimization.created_at.asc())
+            .options(selectinload(Optimization.vectors))
         )
         optimizations = list(opt_result.scalars().all())
         if not optimizations:
@@ -1302,7 +1334,8 @@ class TaxonomyEngine:
 
         async with self._warm_path_lock:
             try:
-                return await execute_cold_path(self, db)
+                with llm_priority(Priority.BACKGROUND):
+                    return await execute_cold_path(self, db)
             except Exception as exc:
                 logger.error("Cold path failed: %s", exc, exc_info=True)
                 try:
@@ -3607,6 +3640,7 @@ class TaxonomyEngine:
     # Domain mapping — delegated to matching.py
     # ------------------------------------------------------------------
 
+    @profiling.traced("taxonomy.map_domain")
     async def map_domain(
         self,
         domain_raw: str,
@@ -3879,6 +3913,7 @@ class TaxonomyEngine:
 
         return result
 
+    @profiling.traced("taxonomy.increment_usage")
     async def increment_usage(self, cluster_id: str, db: AsyncSession) -> None:
         """Increment usage on the cluster and propagate up the taxonomy tree.
 
@@ -19,6 +19,8 @@ from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any, Literal
 
+from app.services.jsonl_writer import JsonlWriter, get_jsonl_writer
+
 logger = logging.getLogger(__name__)
 
 # Accepted legacy context-dict state values. 'template' is tolerated for
@@ -96,9 +98,11 @@ class TaxonomyEventLogger:
         publish_to_bus: bool = True,
         cross_process: bool = False,
         buffer_size: int = 500,
+        writer: JsonlWriter | None = None,
     ) -> None:
         self._events_dir = Path(events_dir)
         self._events_dir.mkdir(parents=True, exist_ok=True)
+        self._writer = writer or get_jsonl_writer()
         self._publish_to_bus = publish_to_bus
         self._cross_process = cross_process
         self._buffer: deque[dict[str, Any]] = deque(maxlen=buffer_size)
@@ -182,13 +186,10 @@ class TaxonomyEventLogger:
         # 1. Append to ring buffer
         self._buffer.append(event)
 
-        # 2. Append to daily JSONL file
-        try:
-            daily_file = self._daily_file()
-            with daily_file.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(event, ensure_ascii=False, default=str) + "\n")
-        except OSError as exc:
-            logger.warning("Failed to write taxonomy event to JSONL: %s", exc)
+        # 2. Append to daily JSONL file (background writer — no disk I/O here)
+        self._writer.write(
+            self._daily_file(), json.dumps(event, ensure_ascii=False, default=str),
+        )
 
         # 3. Publish for SSE delivery
         if self._publish_to_bus:
@@ -316,6 +317,15 @@ class TaxonomyEventLogger:
                 t.cancel()
         return len(tasks)
 
+    def record_external(self, event: dict[str, Any]) -> None:
+        """Add an event logged by another process to the ring buffer.
+
+        For ``taxonomy_activity`` events relayed from the MCP server or a
+        peer worker: that process already wrote the JSONL line and
+        published it, so this only makes it visible to ``get_recent()``.
+        """
+        self._buffer.append(event)
+
     # ------------------------------------------------------------------
     # Read
     # ------------------------------------------------------------------
@@ -362,7 +372,11 @@ class TaxonomyEventLogger:
         limit: int = 100,
         offset: int = 0,
     ) -> list[dict[str, Any]]:
-        """Read events from a specific day's JSONL file."""
+        """Read events from a specific day's JSONL file.
+
+        Blocks on ``flush()``; from the event loop use ``aget_history``.
+        """
+        self.flush()
         filepath = self._events_dir / f"decisions-{date}.jsonl"
         if not filepath.exists():
             return []
@@ -382,10 +396,23 @@ class TaxonomyEventLogger:
                 continue
         return events[offset : offset + limit]
 
+    async def aget_history(
+        self,
+        date: str,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> list[dict[str, Any]]:
+        """``get_history`` off the event loop."""
+        return await asyncio.to_thread(self.get_history, date, limit, offset)
+
     # ------------------------------------------------------------------
     # Maintenance
     # ------------------------------------------------------------------
 
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every event logged so far is on disk."""
+        return self._writer.flush(timeout)
+
     def rotate(self, retention_days: int = 30) -> int:
         """Delete JSONL event files older than retention_days."""
         cutoff = datetime.now(UTC) - timedelta(days=retention_days)
@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import logging
 import math
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -842,6 +843,371 @@ async def assign_cluster(
     return new_cluster
 
 
+@dataclass
+class BatchAssignItem:
+    """One optimization awaiting cluster assignment in batch mode."""
+
+    embedding: np.ndarray
+    label: str
+    domain: str
+    task_type: str
+    overall_score: float | None
+
+
+@dataclass
+class BatchAssignResult:
+    """Outcome of :func:`assign_clusters_batch`."""
+
+    clusters: list[PromptCluster | None]  # per item, in input order; None = failed
+    created: list[PromptCluster]  # clusters spawned by this batch
+
+
+@dataclass
+class _Slot:
+    """In-memory cluster state during :func:`assign_clusters_batch`."""
+
+    cluster: PromptCluster | None  # None until a new cluster is materialized
+    centroid: np.ndarray
+    member_count: int
+    weighted_sum: float
+    domain: str
+    domain_primary: str
+    task_type: str | None
+    static_penalty: float = 0.0  # coherence + output-coherence (fixed in-batch)
+    type_counts: dict[str | None, int] = field(default_factory=dict)  # written-back members
+    scores: list[float | None] = field(default_factory=list)
+    touched: bool = False
+    creator_label: str = ""
+
+
+def _static_assign_penalty(cluster: PromptCluster) -> float:
+    """Coherence + output-coherence penalty, as applied in :func:`assign_cluster`."""
+    from app.services.taxonomy.cluster_meta import read_meta
+
+    penalty = 0.0
+    if cluster.coherence is not None and cluster.coherence < 0.4:
+        penalty += (0.4 - cluster.coherence) * 0.3
+    out_coh = read_meta(cluster.cluster_metadata).get("output_coherence")
+    if out_coh is not None and out_coh < 0.35:
+        penalty += (0.35 - out_coh) * 0.4
+    return penalty
+
+
+def _apply_type_mode(slot: _Slot) -> None:
+    """Majority (>50%) task_type, mirroring ``_recompute_cluster_task_type``.
+
+    Like that query, NULL task types count towards the total but never win.
+    """
+    total = sum(slot.type_counts.values())
+    if not total:
+        return
+    mode_type, mode_count = max(slot.type_counts.items(), key=lambda kv: kv[1])
+    if mode_type and mode_count / total > 0.5:
+        slot.task_type = mode_type
+
+
+def _batch_embedding_dim(items: list[BatchAssignItem]) -> int:
+    """Most common embedding dimension in the batch (stray dims are rejected)."""
+    from collections import Counter
+
+    dims = Counter(
+        it.embedding.shape[0] for it in items
+        if isinstance(it.embedding, np.ndarray) and it.embedding.ndim == 1
+    )
+    return dims.most_common(1)[0][0] if dims else 0
+
+
+async def assign_clusters_batch(
+    db: AsyncSession,
+    items: list[BatchAssignItem],
+    embedding_index: EmbeddingIndex | None = None,
+) -> BatchAssignResult:
+    """Assign many optimizations to clusters in one pass.
+
+    Batch counterpart of :func:`assign_cluster` (non-project path) for seed
+    imports. Produces the assignments sequential calls would, within float
+    tolerance, without a DB round-trip per item:
+
+    - All item embeddings are scored against all candidate centroids in one
+      matmul; only columns for centroids that moved earlier in the batch are
+      re-scored per item.
+    - Items that would spawn new clusters are grouped by in-memory leader
+      clustering — later items compare against the batch's pending new
+      centroids with the same threshold, penalties and cross-domain gate.
+    - Centroid / count / score updates accumulate in memory and are written
+      once per touched cluster, followed by one flush and one
+      ``EmbeddingIndex`` upsert per cluster.
+
+    Failures are isolated per item, as in the sequential loop this replaces:
+    an item with an unusable embedding (wrong dimension, non-finite, zero)
+    or one that raises while being scored is logged, left unassigned
+    (``None`` in ``clusters``) and does not affect the others.
+
+    Returns the assigned cluster per item (in order) and the new clusters.
+    """
+    if not items:
+        return BatchAssignResult(clusters=[], created=[])
+
+    dim = _batch_embedding_dim(items)
+    valid: list[int] = []
+    for i, it in enumerate(items):
+        e = it.embedding
+        if (
+            isinstance(e, np.ndarray)
+            and e.shape == (dim,)
+            and np.all(np.isfinite(e))
+            and np.any(e)
+        ):
+            valid.append(i)
+        else:
+            logger.warning(
+                "Batch assign skipped item %d: unusable embedding (shape=%s)",
+                i, getattr(e, "shape", None),
+            )
+    _cluster_q = await db.execute(
+        select(PromptCluster).where(
+            PromptCluster.state.in_(["candidate", "active", "mature"])
+        )
+    )
+    slots: list[_Slot] = []
+    for c_row in _cluster_q.scalars().all():
+        try:
+            c = np.frombuffer(c_row.centroid_embedding, dtype=np.float32)  # type: ignore[arg-type]
+        except (ValueError, TypeError) as exc:
+            logger.warning("Skipping cluster '%s' — corrupt centroid: %s", c_row.label, exc)
+            continue
+        if c.shape[0] != dim:
+            continue
+        slots.append(_Slot(
+            cluster=c_row,
+            centroid=c.astype(np.float32),
+            member_count=c_row.member_count or 0,
+            weighted_sum=(
+                getattr(c_row, "weighted_member_sum", None)
+                or float(c_row.member_count or 1)
+            ),
+            domain=c_row.domain or "general",
+            domain_primary=parse_domain(c_row.domain)[0],
+            task_type=c_row.task_type,
+            static_penalty=_static_assign_penalty(c_row),
+        ))
+    n_existing = len(slots)
+
+    # Member task_type tallies (one grouped query) so the majority rule of
+    # ``_recompute_cluster_task_type`` can be applied in memory per merge.
+    if slots:
+        from sqlalchemy import func as _func
+
+        by_id = {s.cluster.id: s for s in slots}  # type: ignore[union-attr]
+        type_rows = await db.execute(
+            select(Optimization.cluster_id, Optimization.task_type, _func.count())
+            .where(Optimization.cluster_id.in_(list(by_id)))
+            .group_by(Optimization.cluster_id, Optimization.task_type)
+        )
+        for cid, ttype, cnt in type_rows.all():
+            by_id[cid].type_counts[ttype] = cnt
+
+    def _unit(m: np.ndarray) -> np.ndarray:
+        return m / (np.linalg.norm(m, axis=-1, keepdims=True) + 1e-9)
+
+    emb = np.zeros((len(items), dim), dtype=np.float32)
+    if valid:
+        emb[valid] = _unit(np.stack([items[i].embedding.astype(np.float32) for i in valid]))
+    base_scores = (
+        emb @ _unit(np.stack([s.centroid for s in slots])).T
+        if slots else np.zeros((len(items), 0), dtype=np.float32)
+    )
+    dirty: set[int] = set()
+    assigned_slots: list[int | None] = [None] * len(items)
+
+    for i in valid:
+        item = items[i]
+        try:
+            row = base_scores[i].copy()
+            for j in dirty:
+                row[j] = float(emb[i] @ _unit(slots[j].centroid))
+            if len(slots) > n_existing:
+                new_mat = _unit(np.stack([s.centroid for s in slots[n_existing:]]))
+                row = np.concatenate([row, new_mat @ emb[i]])
+
+            target: int | None = None
+            if row.size:
+                j = int(np.argmax(row))
+                score = float(row[j])
+                slot = slots[j]
+                if score > 0:
+                    effective = score - slot.static_penalty
+                    if item.task_type and slot.task_type and item.task_type != slot.task_type:
+                        effective *= 0.88
+                    threshold = adaptive_merge_threshold(slot.member_count or 1)
+                    if (
+                        effective >= threshold
+                        and parse_domain(item.domain)[0] == slot.domain_primary
+                    ):
+                        target = j
+            weight = score_to_centroid_weight(item.overall_score)
+        except Exception as exc:
+            logger.warning("Batch assign failed for item %d: %s", i, exc)
+            continue
+
+        if target is None:
+            slots.append(_Slot(
+                cluster=None,
+                centroid=item.embedding.astype(np.float32),
+                member_count=1,
+                weighted_sum=score_to_centroid_weight(item.overall_score),
+                domain=item.domain,
+                domain_primary=parse_domain(item.domain)[0],
+                task_type=item.task_type,
+                type_counts={item.task_type or None: 1},
+                scores=[item.overall_score],
+                touched=True,
+                creator_label=item.label,
+            ))
+            assigned_slots[i] = len(slots) - 1
+            continue
+
+        slot = slots[target]
+        new_sum = slot.weighted_sum + weight
+        centroid = (slot.centroid * slot.weighted_sum + item.embedding * weight) / new_sum
+        c_norm = np.linalg.norm(centroid)
+        if c_norm > 0:
+            centroid = centroid / c_norm
+        slot.centroid = centroid.astype(np.float32)
+        slot.weighted_sum = new_sum
+        slot.member_count += 1
+        slot.scores.append(item.overall_score)
+        # Sequential assign_cluster() recomputes the majority from members
+        # already written back, i.e. before this item's own row is linked.
+        _apply_type_mode(slot)
+        ttype = item.task_type or None
+        slot.type_counts[ttype] = slot.type_counts.get(ttype, 0) + 1
+        slot.touched = True
+        if target < n_existing:
+            dirty.add(target)
+        assigned_slots[i] = target
+
+    touched_existing = [s for s in slots[:n_existing] if s.touched]
+
+    # Resolve domain parents for new clusters in one query.
+    new_slots = slots[n_existing:]
+    domain_nodes: dict[str, PromptCluster] = {}
+    if new_slots:
+        dn_q = await db.execute(
+            select(PromptCluster).where(
+                PromptCluster.state == "domain",
+                PromptCluster.label.in_({s.domain for s in new_slots}),
+            )
+        )
+        for dn in dn_q.scalars().all():
+            domain_nodes.setdefault(dn.label, dn)
+
+    from app.services.taxonomy.cluster_meta import write_meta
+    from app.services.taxonomy.coloring import generate_color
+
+    existing_clusters = [s.cluster for s in slots[:n_existing]]
+    for slot in slots:
+        if not slot.touched:
+            continue
+        if slot.cluster is not None:
+            cluster = slot.cluster
+            cluster.centroid_embedding = slot.centroid.tobytes()
+            cluster.member_count = slot.member_count
+            cluster.weighted_member_sum = slot.weighted_sum
+            for s in slot.scores:
+                merge_score_into_cluster(cluster, s)
+            cluster.task_type = slot.task_type
+            continue
+
+        first_score = slot.scores[0]
+        domain_node = domain_nodes.get(slot.domain)
+        cluster = PromptCluster(
+            label=slot.creator_label,
+            domain=slot.domain,
+            task_type=slot.task_type,
+            parent_id=domain_node.id if domain_node else None,
+            centroid_embedding=slot.centroid.tobytes(),
+            member_count=slot.member_count,
+            weighted_member_sum=slot.weighted_sum,
+            scored_count=1 if first_score is not None else 0,
+            usage_count=0,
+            avg_score=first_score,
+        )
+        for s in slot.scores[1:]:
+            merge_score_into_cluster(cluster, s)
+        if domain_node is not None:
+            sibling_data = [
+                (
+                    np.frombuffer(c.centroid_embedding, dtype=np.float32),  # type: ignore[arg-type]
+                    c.umap_x, c.umap_y, c.umap_z,
+                )
+                for c in existing_clusters
+                if c is not None
+                and c.parent_id == domain_node.id
+                and c.umap_x is not None
+                and c.umap_y is not None
+                and c.umap_z is not None
+            ]
+            pos = interpolate_position(slot.centroid, sibling_data)
+            if pos is not None:
+                cluster.umap_x, cluster.umap_y, cluster.umap_z = pos
+                cluster.cluster_metadata = write_meta(
+                    cluster.cluster_metadata, position_source="interpolated",
+                )
+        if cluster.umap_x is not None:
+            cluster.color_hex = generate_color(
+                cluster.umap_x, cluster.umap_y or 0, cluster.umap_z or 0,
+            )
+        elif domain_node is not None and domain_node.color_hex:
+            cluster.color_hex = domain_node.color_hex
+        else:
+            cluster.color_hex = "#7a7a9e"  # fallback gray
+        db.add(cluster)
+        slot.cluster = cluster
+
+    await db.flush()  # populate new IDs
+
+    # Recount touched domain nodes once (excludes archived and domain nodes)
+    if new_slots:
+        from sqlalchemy import func as _func
+
+        for dom, node in domain_nodes.items():
+            count_q = await db.execute(
+                select(_func.count()).where(
+                    PromptCluster.state.notin_(EXCLUDED_STRUCTURAL_STATES),
+                    PromptCluster.domain == dom,
+                )
+            )
+            node.member_count = count_q.scalar() or 0
+
+    if embedding_index is not None:
+        for slot in slots:
+            if slot.touched:
+                await embedding_index.upsert(slot.cluster.id, slot.centroid)  # type: ignore[union-attr]
+
+    try:
+        get_event_logger().log_decision(
+            path="hot", op="assign", decision="batch_assign",
+            context={
+                "items": len(items),
+                "items_failed": assigned_slots.count(None),
+                "clusters_merged_into": len(touched_existing),
+                "clusters_created": len(new_slots),
+            },
+        )
+    except RuntimeError:
+        pass
+    logger.info(
+        "Batch assign: %d items → %d existing clusters, %d new",
+        len(items), len(touched_existing), len(new_slots),
+    )
+
+    return BatchAssignResult(
+        clusters=[slots[j].cluster if j is not None else None for j in assigned_slots],
+        created=[s.cluster for s in new_slots],  # type: ignore[misc]
+    )
+
+
 # ---------------------------------------------------------------------------
 # Meta-pattern extraction
 # ---------------------------------------------------------------------------
@@ -207,8 +207,10 @@ class OptimizedEmbeddingIndex:
         async with self._lock:
             data: dict[str, object] = {"matrix": self._matrix, "ids": list(self._ids)}
         try:
-            with open(cache_path, "wb") as f:
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            with open(tmp_path, "wb") as f:
                 pickle.dump(data, f)
+            tmp_path.replace(cache_path)
             logger.info(
                 "OptimizedEmbeddingIndex cache saved: %d entries -> %s",
                 len(data["ids"]),  # type: ignore[arg-type]
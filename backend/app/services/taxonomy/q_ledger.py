@@ -0,0 +1,221 @@
+"""Incremental Q_system for the warm-path speculative gates.
+
+``QLedger`` keeps each Q-contributing cluster's (coherence, separation)
+contribution and exact running sums, so the warm path can price a phase
+from the clusters it touched instead of reloading every active
+``PromptCluster`` before and after it.
+
+Exactness: sums are ``Fraction``s of the stored floats, so each mean is the
+correctly rounded quotient — the same value ``statistics.mean`` returns —
+and the final weighting goes through ``combine_q_components()``, the tail of
+``compute_q_system()``.  ``q_system()`` is therefore bit-identical to
+``engine._compute_q_from_nodes()`` over the same rows (warm-path form: no
+silhouette, candidates excluded).
+
+Freshness:
+  - ``execute_warm_path`` rebuilds the ledger from the Phase 0 baseline load
+    every cycle.
+  - ``engine.mark_dirty()`` and non-gated phases call ``invalidate()``;
+    stale ids are re-read (narrow, by id) before the next gate.
+  - ``track_cluster_writes()`` collects what a phase flushed; only those rows
+    are re-read for Q_after, and ``restore()`` undoes them on rejection.
+  - Writers the process can't see (other processes) are caught by the
+    periodic full recompute in ``warm_path`` (``Q_LEDGER_VERIFY_INTERVAL``).
+
+Copyright 2025-2026 Project Synthesis contributors.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from fractions import Fraction
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import PromptCluster
+from app.services.taxonomy._constants import EXCLUDED_STRUCTURAL_STATES
+from app.services.taxonomy.quality import QWeights, combine_q_components
+
+# Same population as ``_load_active_nodes(db, exclude_candidates=True)``.
+_NON_CONTRIBUTING_STATES = [*EXCLUDED_STRUCTURAL_STATES, "candidate"]
+
+# Bound the ``IN (...)`` list of a refresh query.
+_REFRESH_CHUNK = 500
+
+
+@dataclass(frozen=True)
+class _Contribution:
+    """One cluster's share of Q. ``None`` = non-finite, skipped by the mean."""
+
+    coherence: Fraction | None
+    separation: Fraction | None
+
+
+def _contribution(coherence: float | None, separation: float | None) -> _Contribution:
+    # Same NULL defaults as ``_compute_q_from_nodes`` → ``NodeMetrics``.
+    c = coherence if coherence is not None else 0.0
+    s = separation if separation is not None else 1.0
+    return _Contribution(
+        coherence=Fraction(c) if math.isfinite(c) else None,
+        separation=Fraction(s) if math.isfinite(s) else None,
+    )
+
+
+class QLedger:
+    """Per-cluster Q contributions with exact running totals."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, _Contribution] = {}
+        self._stale: set[str] = set()
+        self._reset_totals()
+        self.synced = False
+
+    def _reset_totals(self) -> None:
+        self._sum_c = Fraction(0)
+        self._n_c = 0
+        self._sum_s = Fraction(0)
+        self._n_s = 0
+
+    def __contains__(self, cluster_id: object) -> bool:
+        return cluster_id in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -- maintenance -------------------------------------------------------
+
+    def _set(self, cluster_id: str, contrib: _Contribution | None) -> None:
+        old = self._entries.pop(cluster_id, None)
+        if old is not None:
+            if old.coherence is not None:
+                self._sum_c -= old.coherence
+                self._n_c -= 1
+            if old.separation is not None:
+                self._sum_s -= old.separation
+                self._n_s -= 1
+        if contrib is not None:
+            self._entries[cluster_id] = contrib
+            if contrib.coherence is not None:
+                self._sum_c += contrib.coherence
+                self._n_c += 1
+            if contrib.separation is not None:
+                self._sum_s += contrib.separation
+                self._n_s += 1
+
+    def rebuild(self, nodes: Iterable[Any]) -> None:
+        """Replace all entries from loaded ``PromptCluster`` rows.
+
+        Rows outside the Q population (candidates, structural states) are
+        skipped, so the full Phase 0 baseline load can be passed as-is.
+        """
+        self._entries.clear()
+        self._stale.clear()
+        self._reset_totals()
+        for node in nodes:
+            if node.state in _NON_CONTRIBUTING_STATES:
+                continue
+            self._set(node.id, _contribution(node.coherence, node.separation))
+        self.synced = True
+
+    def invalidate(self, cluster_id: str) -> None:
+        """Mark one cluster for re-read before the next ``q_system()`` use."""
+        self._stale.add(cluster_id)
+
+    def invalidate_all(self) -> None:
+        """Force a full rebuild before the ledger is trusted again."""
+        self.synced = False
+
+    def take_stale(self) -> set[str]:
+        stale, self._stale = self._stale, set()
+        return stale
+
+    async def refresh(
+        self, db: AsyncSession, cluster_ids: Iterable[str],
+    ) -> dict[str, _Contribution | None]:
+        """Re-read the given clusters; return their previous entries for ``restore()``.
+
+        Ids that are gone or have left the Q population are dropped.
+        """
+        ids = list(set(cluster_ids))
+        fresh: dict[str, _Contribution] = {}
+        for i in range(0, len(ids), _REFRESH_CHUNK):
+            rows = await db.execute(
+                select(
+                    PromptCluster.id,
+                    PromptCluster.coherence,
+                    PromptCluster.separation,
+                ).where(
+                    PromptCluster.id.in_(ids[i:i + _REFRESH_CHUNK]),
+                    PromptCluster.state.notin_(_NON_CONTRIBUTING_STATES),
+                )
+            )
+            for row in rows:
+                fresh[row.id] = _contribution(row.coherence, row.separation)
+
+        undo: dict[str, _Contribution | None] = {}
+        for cid in ids:
+            undo[cid] = self._entries.get(cid)
+            self._set(cid, fresh.get(cid))
+        return undo
+
+    def restore(self, undo: dict[str, _Contribution | None]) -> None:
+        """Put back entries returned by ``refresh()`` (rejected phase)."""
+        for cid, contrib in undo.items():
+            self._set(cid, contrib)
+
+    # -- Q ---------------------------------------------------------------
+
+    def q_system(self, cluster_ids: Iterable[str] | None = None) -> float:
+        """Q over the whole ledger, or over ``cluster_ids`` (all must be present).
+
+        The whole-ledger form is O(1); a scoped one is O(len(cluster_ids)).
+        """
+        if cluster_ids is None:
+            n = len(self._entries)
+            sum_c, n_c, sum_s, n_s = self._sum_c, self._n_c, self._sum_s, self._n_s
+        else:
+            n = 0
+            sum_c, n_c, sum_s, n_s = Fraction(0), 0, Fraction(0), 0
+            for cid in cluster_ids:
+                contrib = self._entries[cid]
+                n += 1
+                if contrib.coherence is not None:
+                    sum_c += contrib.coherence
+                    n_c += 1
+                if contrib.separation is not None:
+                    sum_s += contrib.separation
+                    n_s += 1
+        if n == 0:
+            return 0.0
+        mean_c = float(sum_c / n_c) if n_c else 0.0
+        mean_s = float(sum_s / n_s) if n_s else 1.0
+        return combine_q_components(mean_c, mean_s, QWeights.from_ramp(0.0))
+
+
+@contextmanager
+def track_cluster_writes(db: AsyncSession) -> Iterator[set[str]]:
+    """Collect ids of ``PromptCluster`` rows the session inserts, updates or deletes.
+
+    Hooks ``after_flush`` (ids are assigned by then), so call
+    ``await db.flush()`` before reading the set.  Core ``update()``
+    statements bypass it — the speculative phases mutate clusters through
+    the ORM only.
+    """
+    touched: set[str] = set()
+
+    def _collect(session: Any, _flush_context: Any) -> None:
+        for obj in chain(session.new, session.dirty, session.deleted):
+            if isinstance(obj, PromptCluster) and obj.id:
+                touched.add(obj.id)
+
+    event.listen(db.sync_session, "after_flush", _collect)
+    try:
+        yield touched
+    finally:
+        event.remove(db.sync_session, "after_flush", _collect)
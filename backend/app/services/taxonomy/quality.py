@@ -122,6 +122,21 @@ def compute_q_system(
     mean_c = statistics.mean(coherences) if coherences else 0.0
     mean_s = statistics.mean(separations) if separations else 1.0
 
+    return combine_q_components(mean_c, mean_s, weights, coverage, dbcv)
+
+
+def combine_q_components(
+    mean_c: float,
+    mean_s: float,
+    weights: QWeights,
+    coverage: float = 1.0,
+    dbcv: float = 0.0,
+) -> float:
+    """Weight already-averaged components into Q_system.
+
+    Final step of ``compute_q_system()``, shared with ``QLedger`` so an
+    incrementally maintained Q is bit-identical to a full recompute.
+    """
     # Clamp all components to [0.0, 1.0]
     mean_c = max(0.0, min(1.0, mean_c))
     mean_s = max(0.0, min(1.0, mean_s))
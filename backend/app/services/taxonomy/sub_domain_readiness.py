@@ -15,18 +15,21 @@ that mirrors the three-source cascade inside ``engine._propose_sub_domains``:
 Extracting the cascade here eliminates drift by construction — both the engine
 (in a follow-up refactor) and this service consume the same implementation.
 
-An in-memory TTL cache (30s, keyed by ``(domain_id, member_count)``) keeps repeat
-polls cheap.  Passing ``fresh=True`` bypasses the cache.  The cache key naturally
-invalidates whenever a new optimization changes the member count.
+Cascade results come from per-vocabulary, per-cluster qualifier counters that
+are reconciled incrementally on each call, so only new, moved or relabelled
+optimizations are rematched and the counts are never stale.  An in-memory TTL
+cache (30s) reuses the full report while the domain's cascade is unchanged.
+Passing ``fresh=True`` bypasses the cache.
 
 Copyright 2025-2026 Project Synthesis contributors.
 """
 
 from __future__ import annotations
 
+import json
 import logging
 import time
-from collections import Counter
+from collections import Counter, OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Literal, TypedDict
@@ -171,6 +174,241 @@ async def _collect_child_cluster_ids(
     return [r[0] for r in child_q.all()]
 
 
+@dataclass(frozen=True)
+class _Vocab:
+    """Cascade vocabulary read from a meta node's ``cluster_metadata``."""
+
+    generated_qualifiers: dict[str, list[str]]
+    dynamic_keywords: tuple[tuple[str, float], ...]
+    known_qualifiers: frozenset[str]
+    fingerprint: str
+
+
+def _read_vocab(meta_node: PromptCluster) -> _Vocab:
+    meta = read_meta(meta_node.cluster_metadata)
+    generated_qualifiers: dict[str, list[str]] = {}
+    cached_vocab = meta.get("generated_qualifiers")
+    if isinstance(cached_vocab, dict):
+        generated_qualifiers = cached_vocab
+
+    dynamic_keywords: list[tuple[str, float]] = []
+    for item in meta.get("signal_keywords", []) or []:
+        try:
+            kw, weight = item[0], float(item[1])
+        except (IndexError, TypeError, ValueError):
+            continue
+        if isinstance(kw, str) and len(kw) >= 3 and weight >= 0.5:
+            dynamic_keywords.append((kw, weight))
+
+    known_qualifiers: set[str] = set(generated_qualifiers.keys())
+    for kw, _ in dynamic_keywords:
+        kw_lower = kw.lower()
+        known_qualifiers.add(kw_lower)
+        known_qualifiers.add(kw_lower.replace(" ", "-"))
+
+    return _Vocab(
+        generated_qualifiers=generated_qualifiers,
+        dynamic_keywords=tuple(dynamic_keywords),
+        known_qualifiers=frozenset(known_qualifiers),
+        fingerprint=json.dumps([generated_qualifiers, dynamic_keywords], sort_keys=True, default=str),
+    )
+
+
+def _match_labels(
+    domain_raw: str | None,
+    intent_label: str | None,
+    vocab: _Vocab,
+) -> tuple[str, str] | None:
+    """Sources 1 and 2 of the cascade — ``(qualifier, source)`` or None."""
+    # Lazy import to avoid circular dependency
+    from app.services.domain_signal_loader import DomainSignalLoader
+
+    # Source 1: parse_domain on domain_raw
+    if domain_raw:
+        _, q = parse_domain(domain_raw)
+        if q:
+            q_normalized = q.lower().replace(" ", "-")
+            if q in vocab.known_qualifiers or q_normalized in vocab.known_qualifiers:
+                return q, _SOURCE_DOMAIN_RAW
+
+    # Source 2: intent_label vs organic vocab
+    if intent_label and vocab.generated_qualifiers:
+        best_q, best_hits = DomainSignalLoader.find_best_qualifier(
+            intent_label.lower(), vocab.generated_qualifiers,
+        )
+        if best_q and best_hits >= SUB_DOMAIN_QUALIFIER_MIN_KEYWORD_HITS:
+            return best_q, _SOURCE_INTENT_LABEL
+    return None
+
+
+def _match_prompt(
+    raw_prompt: str | None,
+    intent_label: str | None,
+    vocab: _Vocab,
+) -> tuple[str, str] | None:
+    """Source 3 of the cascade: raw_prompt vs dynamic TF-IDF keywords."""
+    if not raw_prompt or not vocab.dynamic_keywords:
+        return None
+    prompt_lower = raw_prompt.lower()
+    intent_lower_s3 = (intent_label or "").lower()
+    best_dyn: str | None = None
+    best_dyn_weight = 0.0
+    dyn_hits = 0
+    for kw, weight in vocab.dynamic_keywords:
+        kw_lower = kw.lower()
+        if kw_lower in prompt_lower:
+            dyn_hits += 1
+            effective_weight = weight + (
+                0.5 if kw_lower in intent_lower_s3 else 0.0
+            )
+            if effective_weight > best_dyn_weight:
+                best_dyn_weight = effective_weight
+                best_dyn = kw
+    if best_dyn:
+        raw_weight = best_dyn_weight - (
+            0.5 if best_dyn.lower() in intent_lower_s3 else 0.0
+        )
+        min_hits = 1 if raw_weight >= 0.8 else 2
+        if dyn_hits >= min_hits:
+            return best_dyn.lower().replace(" ", "-"), _SOURCE_TF_IDF
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Incremental cascade counters
+# ---------------------------------------------------------------------------
+#
+# An optimization's cascade outcome depends only on its own ``domain_raw``,
+# ``intent_label`` and ``raw_prompt`` plus the vocabulary.  Counters are kept
+# per vocabulary fingerprint (so a vocabulary change starts a fresh set) and
+# per cluster.  Each call reconciles the scanned clusters against a narrow
+# ``(id, cluster_id, domain_raw, intent_label)`` read: new optimizations and
+# ones whose labels changed are matched, moved ones shift between cluster
+# tallies, and vanished ones are subtracted.  Prompts are only read for
+# optimizations that reach Source 3.  The counters are process-local and
+# rebuild lazily after a restart.
+
+
+@dataclass
+class _Member:
+    cluster_id: str
+    domain_raw: str | None
+    intent_label: str | None
+    hit: tuple[str, str] | None  # (qualifier, source)
+
+
+@dataclass
+class _ClusterTally:
+    member_ids: set[str] = field(default_factory=set)
+    hits: Counter[tuple[str, str]] = field(default_factory=Counter)
+
+
+@dataclass
+class _VocabCounters:
+    members: dict[str, _Member] = field(default_factory=dict)
+    tallies: dict[str, _ClusterTally] = field(default_factory=dict)
+
+    def add(self, opt_id: str, member: _Member) -> None:
+        tally = self.tallies.setdefault(member.cluster_id, _ClusterTally())
+        tally.member_ids.add(opt_id)
+        if member.hit:
+            tally.hits[member.hit] += 1
+        self.members[opt_id] = member
+
+    def remove(self, opt_id: str) -> None:
+        member = self.members.pop(opt_id)
+        tally = self.tallies[member.cluster_id]
+        tally.member_ids.discard(opt_id)
+        if member.hit:
+            tally.hits[member.hit] -= 1
+            if tally.hits[member.hit] <= 0:
+                del tally.hits[member.hit]
+        if not tally.member_ids:
+            del self.tallies[member.cluster_id]
+
+
+_COUNTERS_MAX_VOCABS = 64
+_counters: OrderedDict[str, _VocabCounters] = OrderedDict()
+
+# Optimizations whose raw_prompt is fetched per query when matching Source 3.
+_PROMPT_FETCH_BATCH = 500
+
+
+def _counters_for(vocab: _Vocab) -> _VocabCounters:
+    counters = _counters.get(vocab.fingerprint)
+    if counters is None:
+        counters = _counters[vocab.fingerprint] = _VocabCounters()
+        while len(_counters) > _COUNTERS_MAX_VOCABS:
+            _counters.popitem(last=False)
+    else:
+        _counters.move_to_end(vocab.fingerprint)
+    return counters
+
+
+async def _sync_counters(
+    db: AsyncSession,
+    child_ids: list[str],
+    vocab: _Vocab,
+) -> _VocabCounters:
+    """Reconcile the counters for ``child_ids`` with the database."""
+    counters = _counters_for(vocab)
+    rows_q = await db.execute(
+        select(
+            Optimization.id,
+            Optimization.cluster_id,
+            Optimization.domain_raw,
+            Optimization.intent_label,
+        ).where(Optimization.cluster_id.in_(child_ids))
+    )
+    rows = rows_q.all()
+
+    # Match new or relabelled optimizations before touching any state, so
+    # the updates below run without awaiting.
+    hits: dict[str, tuple[str, str] | None] = {}
+    needs_prompt: list[str] = []
+    for opt_id, _, domain_raw, intent_label in rows:
+        member = counters.members.get(opt_id)
+        if member is not None and (member.domain_raw, member.intent_label) == (domain_raw, intent_label):
+            continue
+        hits[opt_id] = _match_labels(domain_raw, intent_label, vocab)
+        if hits[opt_id] is None and vocab.dynamic_keywords:
+            needs_prompt.append(opt_id)
+
+    if needs_prompt:
+        intent_by_id = {r[0]: r[3] for r in rows}
+        for i in range(0, len(needs_prompt), _PROMPT_FETCH_BATCH):
+            prompt_q = await db.execute(
+                select(Optimization.id, Optimization.raw_prompt).where(
+                    Optimization.id.in_(needs_prompt[i:i + _PROMPT_FETCH_BATCH]),
+                )
+            )
+            for opt_id, raw_prompt in prompt_q.all():
+                hits[opt_id] = _match_prompt(raw_prompt, intent_by_id[opt_id], vocab)
+
+    seen: set[str] = set()
+    for opt_id, cluster_id, domain_raw, intent_label in rows:
+        seen.add(opt_id)
+        member = counters.members.get(opt_id)
+        if opt_id in hits:
+            hit = hits[opt_id]
+        elif member is not None and member.cluster_id != cluster_id:
+            hit = member.hit
+        else:
+            continue
+        if member is not None:
+            counters.remove(opt_id)
+        counters.add(opt_id, _Member(cluster_id, domain_raw, intent_label, hit))
+
+    # Deleted, or moved to a cluster outside this scan.
+    for cluster_id in child_ids:
+        tally = counters.tallies.get(cluster_id)
+        if tally is None:
+            continue
+        for opt_id in tally.member_ids - seen:
+            counters.remove(opt_id)
+    return counters
+
+
 async def compute_qualifier_cascade(
     db: AsyncSession,
     domain_node: PromptCluster,
@@ -180,12 +418,16 @@ async def compute_qualifier_cascade(
 ) -> CascadeResult:
     """Run the three-source qualifier cascade over a domain's optimizations.
 
-    Pure (read-only) analytics — no state mutation, no side effects beyond
-    SELECTs.  Shared primitive consumed by the readiness service **and** the
+    Read-only with respect to the database — no side effects beyond SELECTs.
+    Shared primitive consumed by the readiness service **and** the
     warm-path sub-domain discovery/dissolution in
     ``TaxonomyEngine._propose_sub_domains`` / ``_reevaluate_sub_domains`` —
     single implementation, no drift.
 
+    Results come from the incremental cascade counters, which are brought up
+    to date first, so they are exact for the session's current view.  Counts
+    are listed by descending count, then qualifier.
+
     Args:
         db: Async SQLAlchemy session.
         domain_node: Node whose children are scanned for qualifier signals.
@@ -213,109 +455,34 @@ async def compute_qualifier_cascade(
             generated_qualifiers_present=False,
         )
 
-    opt_q = await db.execute(
-        select(
-            Optimization.domain_raw,
-            Optimization.intent_label,
-            Optimization.cluster_id,
-            Optimization.raw_prompt,
-        ).where(Optimization.cluster_id.in_(child_ids))
-    )
-    opt_rows = opt_q.all()
-    total_opts = len(opt_rows)
-
-    meta = read_meta((meta_node or domain_node).cluster_metadata)
-    generated_qualifiers: dict[str, list[str]] = {}
-    cached_vocab = meta.get("generated_qualifiers")
-    if isinstance(cached_vocab, dict):
-        generated_qualifiers = cached_vocab
-
-    dynamic_keywords: list[tuple[str, float]] = []
-    for item in meta.get("signal_keywords", []) or []:
-        try:
-            kw, weight = item[0], float(item[1])
-        except (IndexError, TypeError, ValueError):
-            continue
-        if isinstance(kw, str) and len(kw) >= 3 and weight >= 0.5:
-            dynamic_keywords.append((kw, weight))
-
-    known_qualifiers: set[str] = set(generated_qualifiers.keys())
-    for kw, _ in dynamic_keywords:
-        kw_lower = kw.lower()
-        known_qualifiers.add(kw_lower)
-        known_qualifiers.add(kw_lower.replace(" ", "-"))
+    vocab = _read_vocab(meta_node or domain_node)
+    counters = await _sync_counters(db, child_ids, vocab)
 
+    total_opts = 0
     qualifier_counts: Counter[str] = Counter()
     per_qualifier_sources: dict[str, dict[str, int]] = {}
     qualifier_to_cluster_ids: dict[str, set[str]] = {}
     source_breakdown: Counter[str] = Counter()
-
-    # Lazy import to avoid circular dependency
-    from app.services.domain_signal_loader import DomainSignalLoader
-
-    def _record(qualifier: str, source: str, cluster_id: str) -> None:
-        qualifier_counts[qualifier] += 1
-        per_qualifier_sources.setdefault(qualifier, {}).setdefault(source, 0)
-        per_qualifier_sources[qualifier][source] += 1
-        qualifier_to_cluster_ids.setdefault(qualifier, set()).add(cluster_id)
-        source_breakdown[source] += 1
-
-    for domain_raw, intent_label, cluster_id, raw_prompt in opt_rows:
-        qualifier: str | None = None
-
-        # Source 1: parse_domain on domain_raw
-        if domain_raw:
-            _, q = parse_domain(domain_raw)
-            if q:
-                q_normalized = q.lower().replace(" ", "-")
-                if q in known_qualifiers or q_normalized in known_qualifiers:
-                    qualifier = q
-                    _record(qualifier, _SOURCE_DOMAIN_RAW, cluster_id)
-
-        # Source 2: intent_label vs organic vocab
-        if not qualifier and intent_label and generated_qualifiers:
-            intent_lower = intent_label.lower()
-            best_q, best_hits = DomainSignalLoader.find_best_qualifier(
-                intent_lower, generated_qualifiers,
-            )
-            if best_q and best_hits >= SUB_DOMAIN_QUALIFIER_MIN_KEYWORD_HITS:
-                qualifier = best_q
-                _record(qualifier, _SOURCE_INTENT_LABEL, cluster_id)
-
-        # Source 3: raw_prompt vs dynamic TF-IDF keywords
-        if not qualifier and raw_prompt and dynamic_keywords:
-            prompt_lower = raw_prompt.lower()
-            intent_lower_s3 = (intent_label or "").lower()
-            best_dyn: str | None = None
-            best_dyn_weight = 0.0
-            dyn_hits = 0
-            for kw, weight in dynamic_keywords:
-                kw_lower = kw.lower()
-                if kw_lower in prompt_lower:
-                    dyn_hits += 1
-                    effective_weight = weight + (
-                        0.5 if kw_lower in intent_lower_s3 else 0.0
-                    )
-                    if effective_weight > best_dyn_weight:
-                        best_dyn_weight = effective_weight
-                        best_dyn = kw
-            if best_dyn:
-                raw_weight = best_dyn_weight - (
-                    0.5 if best_dyn.lower() in intent_lower_s3 else 0.0
-                )
-                min_hits = 1 if raw_weight >= 0.8 else 2
-                if dyn_hits >= min_hits:
-                    qualifier = best_dyn.lower().replace(" ", "-")
-                    _record(qualifier, _SOURCE_TF_IDF, cluster_id)
+    for cluster_id in child_ids:
+        tally = counters.tallies.get(cluster_id)
+        if tally is None:
+            continue
+        total_opts += len(tally.member_ids)
+        for (qualifier, source), n in tally.hits.items():
+            qualifier_counts[qualifier] += n
+            per_qualifier_sources.setdefault(qualifier, {}).setdefault(source, 0)
+            per_qualifier_sources[qualifier][source] += n
+            qualifier_to_cluster_ids.setdefault(qualifier, set()).add(cluster_id)
+            source_breakdown[source] += n
 
     return CascadeResult(
         total_opts=total_opts,
-        qualifier_counts=dict(qualifier_counts),
+        qualifier_counts=dict(sorted(qualifier_counts.items(), key=lambda kv: (-kv[1], kv[0]))),
         source_breakdown={src: source_breakdown.get(src, 0) for src in _SOURCES},
         per_qualifier_sources=per_qualifier_sources,
         qualifier_to_cluster_ids=qualifier_to_cluster_ids,
-        dynamic_keywords=tuple(dynamic_keywords),
-        generated_qualifiers_present=bool(generated_qualifiers),
+        dynamic_keywords=vocab.dynamic_keywords,
+        generated_qualifiers_present=bool(vocab.generated_qualifiers),
     )
 
 
@@ -608,15 +775,16 @@ async def compute_domain_stability(
 class _CacheEntry:
     report: DomainReadinessReport
     stored_at: float
-    member_count: int
+    cascade: CascadeResult
 
 
 _cache: dict[str, _CacheEntry] = {}
 
 
 def clear_cache() -> None:
-    """Drop all cached readiness reports (test hook + manual invalidation)."""
+    """Drop all cached readiness reports and cascade counters (test hook + manual invalidation)."""
     _cache.clear()
+    _counters.clear()
 
 
 def _evict_expired(now: float) -> None:
@@ -631,21 +799,6 @@ def _evict_expired(now: float) -> None:
             _cache.pop(domain_id, None)
 
 
-async def _count_domain_opts(db: AsyncSession, domain_node: PromptCluster) -> int:
-    """Fast opt-count query used as cache-key input.
-
-    Counts the same opt set that the cascade will later scan, so the key
-    changes the instant a new optimization lands in the domain's tree.
-    """
-    child_ids = await _collect_child_cluster_ids(db, domain_node)
-    if not child_ids:
-        return 0
-    q = await db.execute(
-        select(func.count()).where(Optimization.cluster_id.in_(child_ids))
-    )
-    return int(q.scalar() or 0)
-
-
 async def compute_domain_readiness(
     db: AsyncSession,
     domain_node: PromptCluster,
@@ -654,25 +807,25 @@ async def compute_domain_readiness(
 ) -> DomainReadinessReport:
     """Compose stability + emergence for a domain, with TTL caching.
 
-    Cache is keyed by ``(domain_id, total_opts)``.  Adding an optimization
-    (or moving one into/out of the domain's tree) changes the key and forces
-    a recompute.  ``fresh=True`` bypasses the cache entirely.
+    The cascade is always brought up to date (an incremental counter sync),
+    and a cached report is only reused while its cascade is unchanged, so
+    emergence is exact.  The TTL only bounds how stale the time-dependent
+    stability fields can get.  ``fresh=True`` bypasses the cache entirely.
     """
     now = time.monotonic()
     _evict_expired(now)
 
-    current_member_count = await _count_domain_opts(db, domain_node)
+    cascade = await compute_qualifier_cascade(db, domain_node)
 
     if not fresh:
         entry = _cache.get(domain_node.id)
         if (
             entry is not None
-            and entry.member_count == current_member_count
+            and entry.cascade == cascade
             and (now - entry.stored_at) < _CACHE_TTL_SECONDS
         ):
             return entry.report
 
-    cascade = await compute_qualifier_cascade(db, domain_node)
     emergence = await compute_sub_domain_emergence(db, domain_node, cascade=cascade)
     stability = await compute_domain_stability(db, domain_node)
 
@@ -688,7 +841,7 @@ async def compute_domain_readiness(
     _cache[domain_node.id] = _CacheEntry(
         report=report,
         stored_at=now,
-        member_count=current_member_count,
+        cascade=cascade,
     )
 
     # Observability — debounced at 5s/domain
@@ -36,13 +36,19 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import PromptCluster
-from app.services.taxonomy._constants import DEADLOCK_BREAKER_THRESHOLD, EXCLUDED_STRUCTURAL_STATES
+from app.services.metrics import timed
+from app.services.taxonomy._constants import (
+    DEADLOCK_BREAKER_THRESHOLD,
+    EXCLUDED_STRUCTURAL_STATES,
+    Q_LEDGER_VERIFY_INTERVAL,
+)
 from app.services.taxonomy.cluster_meta import read_meta, write_meta
 from app.services.taxonomy.event_logger import get_event_logger
+from app.services.taxonomy.q_ledger import track_cluster_writes
 from app.services.taxonomy.quality import is_non_regressive
 from app.services.taxonomy.warm_phases import (
     PhaseResult,
@@ -96,22 +102,12 @@ class WarmPathResult:
 # ---------------------------------------------------------------------------
 
 
-async def _load_active_nodes(
+async def _active_nodes_stmt(
     db: AsyncSession,
     exclude_candidates: bool = False,
-    project_id: str | None = None,  # ADR-005 Phase 2A
-) -> list[PromptCluster]:
-    """Load all non-domain, non-archived nodes from the database.
-
-    Args:
-        db: Active database session.
-        exclude_candidates: When True, also exclude ``state="candidate"``
-            from the result set. Used in Q computation to prevent low-coherence
-            candidates from dragging Q_after below Q_before.
-        project_id: When provided, restrict results to clusters under this
-            project's domain subtree. Used for per-project Q scoping so that
-            a bad merge in Project A cannot block Project B's warm cycle.
-    """
+    project_id: str | None = None,
+) -> Select | None:
+    """Build the ``_load_active_nodes`` query (None = empty project scope)."""
     excluded = list(EXCLUDED_STRUCTURAL_STATES)
     if exclude_candidates:
         excluded.append("candidate")
@@ -122,7 +118,7 @@ async def _load_active_nodes(
         domain_ids = await _get_project_domain_ids(db, project_id)
 
         if not domain_ids:
-            return []
+            return None
 
         # Include clusters under this project's domains AND cross-project
         # clusters that contain this project's optimizations (ADR-005 spec §3)
@@ -135,24 +131,112 @@ async def _load_active_nodes(
             Optimization.cluster_id.isnot(None),
         ).distinct().scalar_subquery()
 
-        result = await db.execute(
-            select(PromptCluster).where(
-                PromptCluster.state.notin_(excluded),
-                or_(
-                    PromptCluster.parent_id.in_(domain_ids),
-                    PromptCluster.id.in_(cross_project_cluster_ids),
-                ),
-            )
-        )
-    else:
-        result = await db.execute(
-            select(PromptCluster).where(
-                PromptCluster.state.notin_(excluded)
-            )
+        return select(PromptCluster).where(
+            PromptCluster.state.notin_(excluded),
+            or_(
+                PromptCluster.parent_id.in_(domain_ids),
+                PromptCluster.id.in_(cross_project_cluster_ids),
+            ),
         )
+    return select(PromptCluster).where(
+        PromptCluster.state.notin_(excluded)
+    )
+
+
+async def _load_active_nodes(
+    db: AsyncSession,
+    exclude_candidates: bool = False,
+    project_id: str | None = None,  # ADR-005 Phase 2A
+) -> list[PromptCluster]:
+    """Load all non-domain, non-archived nodes from the database.
+
+    Args:
+        db: Active database session.
+        exclude_candidates: When True, also exclude ``state="candidate"``
+            from the result set. Used in Q computation to prevent low-coherence
+            candidates from dragging Q_after below Q_before.
+        project_id: When provided, restrict results to clusters under this
+            project's domain subtree. Used for per-project Q scoping so that
+            a bad merge in Project A cannot block Project B's warm cycle.
+    """
+    stmt = await _active_nodes_stmt(db, exclude_candidates, project_id)
+    if stmt is None:
+        return []
+    result = await db.execute(stmt)
     return list(result.scalars().all())
 
 
+async def _load_active_ids(
+    db: AsyncSession,
+    exclude_candidates: bool = False,
+    project_id: str | None = None,
+) -> list[str]:
+    """IDs of the rows ``_load_active_nodes`` would return (id column only)."""
+    stmt = await _active_nodes_stmt(db, exclude_candidates, project_id)
+    if stmt is None:
+        return []
+    result = await db.execute(stmt.with_only_columns(PromptCluster.id))
+    return list(result.scalars().all())
+
+
+async def _ledger_q(
+    engine: TaxonomyEngine,
+    db: AsyncSession,
+    project_id: str | None,
+) -> float:
+    """Q_system for the speculative gate, from ``engine._q_ledger``.
+
+    Same value as ``_compute_q_from_nodes(_load_active_nodes(db,
+    exclude_candidates=True, project_id=...))``. A project scope costs an
+    id-only query; the global scope costs nothing beyond the ledger.
+    """
+    ledger = engine._q_ledger
+    if project_id is None:
+        return ledger.q_system()
+    scope = await _load_active_ids(db, exclude_candidates=True, project_id=project_id)
+    missing = [cid for cid in scope if cid not in ledger]
+    if missing:
+        await ledger.refresh(db, missing)
+    return ledger.q_system(scope)
+
+
+async def _verify_ledger_q(
+    engine: TaxonomyEngine,
+    db: AsyncSession,
+    project_id: str | None,
+    q_ledger: float,
+    phase_name: str,
+    stage: str,
+) -> float:
+    """Full-recompute cross-check of a ledger Q; returns the full value.
+
+    A mismatch means a writer bypassed the ledger (another process, a Core
+    ``UPDATE``). It is logged and the ledger is rebuilt before its next use.
+    """
+    nodes = await _load_active_nodes(db, exclude_candidates=True, project_id=project_id)
+    q_full = engine._compute_q_from_nodes(nodes)
+    if q_full != q_ledger:
+        engine._q_ledger.invalidate_all()
+        logger.warning(
+            "Q ledger drift in %s (%s): ledger=%.6f full=%.6f — rebuilding",
+            phase_name, stage, q_ledger, q_full,
+        )
+        try:
+            get_event_logger().log_decision(
+                path="warm", op="phase", decision="q_ledger_drift",
+                context={
+                    "phase_name": phase_name,
+                    "stage": stage,
+                    "q_ledger": round(q_ledger, 6),
+                    "q_full": round(q_full, 6),
+                    "project_scope": project_id,
+                },
+            )
+        except RuntimeError:
+            pass
+    return q_full
+
+
 async def _run_speculative_phase(
     phase_name: str,
     phase_fn: Callable,
@@ -166,11 +250,14 @@ async def _run_speculative_phase(
 
     1. Snapshot the embedding index
     2. Open a fresh session
-    3. Load active nodes, compute Q_before
-    4. Run the phase function
-    5. Re-query nodes, compute Q_after
+    3. Compute Q_before from ``engine._q_ledger`` (re-reading stale clusters)
+    4. Run the phase function, tracking the clusters it writes
+    5. Re-read only those clusters into the ledger, compute Q_after
     6. If non-regressive: commit and return accepted
-    7. If regressive: rollback DB + restore embedding index snapshot
+    7. If regressive: rollback DB + ledger entries + embedding index snapshot
+
+    Every ``Q_LEDGER_VERIFY_INTERVAL`` cycles both Q values are also
+    recomputed from a full node load, which is what the gate then uses.
 
     Args:
         phase_name: Human-readable phase identifier (e.g. "split_emerge").
@@ -198,28 +285,42 @@ async def _run_speculative_phase(
             if len(_dirty_projects) == 1:
                 _project_scope = _dirty_projects.pop()
 
-        # Load nodes and compute Q_before — exclude candidates to prevent
-        # low-coherence candidate clusters from dragging Q down.
-        nodes_before = await _load_active_nodes(
-            db, exclude_candidates=True, project_id=_project_scope,
-        )
-        q_before = engine._compute_q_from_nodes(nodes_before)
-
-        # Call the phase function with appropriate arguments
-        if phase_name == "retire":
-            # phase_retire does not take split_protected_ids
-            phase_result = await phase_fn(engine, db)
+        # Q_before from the incremental ledger — candidates excluded to
+        # prevent low-coherence candidate clusters from dragging Q down.
+        # Full load only when the ledger is unsynced (first use, or drift).
+        ledger = engine._q_ledger
+        if not ledger.synced:
+            ledger.rebuild(await _load_active_nodes(db, exclude_candidates=True))
         else:
-            # phase_split_emerge and phase_merge take split_protected_ids
-            phase_result = await phase_fn(
-                engine, db, split_protected_ids or set(), dirty_ids=dirty_ids,
+            await ledger.refresh(db, ledger.take_stale())
+        verify = engine._warm_path_age % Q_LEDGER_VERIFY_INTERVAL == 0
+        q_before = await _ledger_q(engine, db, _project_scope)
+        if verify:
+            q_before = await _verify_ledger_q(
+                engine, db, _project_scope, q_before, phase_name, "before",
             )
 
-        # Re-query nodes and compute Q_after — same exclusion as Q_before.
-        nodes_after = await _load_active_nodes(
-            db, exclude_candidates=True, project_id=_project_scope,
-        )
-        q_after = engine._compute_q_from_nodes(nodes_after)
+        # Call the phase function with appropriate arguments
+        with track_cluster_writes(db) as mutated:
+            with timed("warm_phase_duration_seconds", phase=phase_name):
+                if phase_name == "retire":
+                    # phase_retire does not take split_protected_ids
+                    phase_result = await phase_fn(engine, db)
+                else:
+                    # phase_split_emerge and phase_merge take split_protected_ids
+                    phase_result = await phase_fn(
+                        engine, db, split_protected_ids or set(), dirty_ids=dirty_ids,
+                    )
+            await db.flush()
+
+        # Q_after — re-price only the clusters the phase wrote.
+        phase_result.mutated_cluster_ids = set(mutated)
+        ledger_undo = await ledger.refresh(db, mutated)
+        q_after = await _ledger_q(engine, db, _project_scope)
+        if verify:
+            q_after = await _verify_ledger_q(
+                engine, db, _project_scope, q_after, phase_name, "after",
+            )
 
         # Update phase result Q values
         phase_result.q_before = q_before
@@ -248,6 +349,7 @@ async def _run_speculative_phase(
                             "delta": round(q_after - q_before, 4),
                             "ops_accepted": phase_result.ops_accepted,
                             "ops_attempted": phase_result.ops_attempted,
+                            "mutated_clusters": len(phase_result.mutated_cluster_ids),
                             "rejection_count": engine._phase_rejection_counters.get(phase_name, 0),
                             "operations": phase_result.operations[:10],
                             "accepted": True,
@@ -258,6 +360,7 @@ async def _run_speculative_phase(
             return phase_result
         else:
             await db.rollback()
+            ledger.restore(ledger_undo)
             await engine.embedding_index.restore(idx_snapshot)
             await engine._transformation_index.restore(ti_snapshot)
             phase_result.accepted = False
@@ -275,6 +378,7 @@ async def _run_speculative_phase(
                         "q_after": round(q_after, 4),
                         "delta": round(q_after - q_before, 4),
                         "ops_attempted": phase_result.ops_attempted,
+                        "mutated_clusters": len(phase_result.mutated_cluster_ids),
                         "rejection_count": engine._phase_rejection_counters.get(phase_name, 0),
                         "accepted": False,
                         "rolled_back_splits": phase_result.split_attempted_ids,
@@ -467,7 +571,8 @@ async def execute_maintenance_phases(
     # ------------------------------------------------------------------
     try:
         async with session_factory() as db:
-            discover_result = await phase_discover(engine, db)
+            with timed("warm_phase_duration_seconds", phase="discover"):
+                discover_result = await phase_discover(engine, db)
             await db.commit()
             logger.info(
                 "Phase 5 (discover): domains=%d candidates=%d",
@@ -552,7 +657,8 @@ async def execute_maintenance_phases(
     # ------------------------------------------------------------------
     try:
         async with session_factory() as db:
-            sub_domains_archived = await phase_archive_empty_sub_domains(engine, db)
+            with timed("warm_phase_duration_seconds", phase="archive_sub_domains"):
+                sub_domains_archived = await phase_archive_empty_sub_domains(engine, db)
             await db.commit()
             if sub_domains_archived:
                 logger.info(
@@ -567,9 +673,10 @@ async def execute_maintenance_phases(
     # ADR-005: Full scan — audit/snapshot needs complete cluster state
     # ------------------------------------------------------------------
     async with session_factory() as db:
-        audit_result = await phase_audit(
-            engine, db, phase_results, q_baseline,
-        )
+        with timed("warm_phase_duration_seconds", phase="audit"):
+            audit_result = await phase_audit(
+                engine, db, phase_results, q_baseline,
+            )
         await db.commit()
         logger.info(
             "Phase 6 (audit): snapshot=%s q_final=%.4f deadlock=%s",
@@ -717,7 +824,8 @@ async def execute_warm_path(
     # ADR-005: Full scan — reconciliation needs complete cluster state
     # ------------------------------------------------------------------
     async with session_factory() as db:
-        reconcile_result = await phase_reconcile(engine, db)
+        with timed("warm_phase_duration_seconds", phase="reconcile"):
+            reconcile_result = await phase_reconcile(engine, db)
         await db.commit()
         logger.info(
             "Phase 0 (reconcile): fixed=%d coherence=%d scores=%d "
@@ -729,17 +837,23 @@ async def execute_warm_path(
             reconcile_result.outliers_ejected,
         )
 
-        # Compute Q_baseline from the reconciled state
+        # Compute Q_baseline from the reconciled state; the same load
+        # resyncs the Q ledger used by the speculative gates below.
         nodes = await _load_active_nodes(db)
         q_baseline = engine._compute_q_from_nodes(nodes)
+        engine._q_ledger.rebuild(nodes)
 
     # ------------------------------------------------------------------
     # Phase 0.5: Evaluate candidates — NOT Q-gated, always commits
     # ADR-005: Full scan — candidate evaluation needs complete cluster state
     # ------------------------------------------------------------------
     async with session_factory() as db:
-        candidate_result = await phase_evaluate_candidates(db)
-        await db.commit()
+        with track_cluster_writes(db) as evaluated:
+            with timed("warm_phase_duration_seconds", phase="evaluate_candidates"):
+                candidate_result = await phase_evaluate_candidates(db)
+            await db.commit()
+        for cid in evaluated:
+            engine._q_ledger.invalidate(cid)
         if candidate_result["promoted"] > 0 or candidate_result["rejected"] > 0:
             logger.info(
                 "Phase 0.5 (candidate_eval): promoted=%d rejected=%d splits_fully_reversed=%d",
@@ -813,7 +927,8 @@ async def execute_warm_path(
     # ADR-005: Full scan — label/pattern refresh needs complete cluster state
     # ------------------------------------------------------------------
     async with session_factory() as db:
-        refresh_result = await phase_refresh(engine, db)
+        with timed("warm_phase_duration_seconds", phase="refresh"):
+            refresh_result = await phase_refresh(engine, db)
         await db.commit()
         logger.info(
             "Phase 4 (refresh): clusters_refreshed=%d",
@@ -32,6 +32,7 @@ from typing import TYPE_CHECKING, Any
 import numpy as np
 from sqlalchemy import delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.config import settings
 from app.models import (
@@ -253,6 +254,10 @@ class PhaseResult:
     # Persisted outside the speculative transaction so the content-hash
     # loop detector can compare future split attempts against prior ones.
     split_content_hashes: dict[str, str] = field(default_factory=dict)
+    # PromptCluster IDs the phase inserted, updated or deleted (set by
+    # warm_path._run_speculative_phase from the session's flushes).
+    # Q_after is re-priced from these rows only.
+    mutated_cluster_ids: set[str] = field(default_factory=set)
 
 
 @dataclass
@@ -1751,7 +1756,9 @@ async def phase_reconcile(
                     Optimization.cluster_id.is_(None),
                     ~Optimization.cluster_id.in_(active_ids_sq),
                 ),
-            ).limit(50)  # cap per cycle to avoid blocking warm path
+            )
+            .options(selectinload(Optimization.vectors))
+            .limit(50)  # cap per cycle to avoid blocking warm path
         )
         semi_orphans = list(semi_orphan_q.scalars().all())
         if semi_orphans:
@@ -3251,8 +3258,9 @@ async def phase_refresh(
                     )
                 cluster_taxonomy_ctx[sc_node.id] = ctx_str
 
-            # Bound concurrency to avoid Haiku rate-limit pressure.
-            # 10 matches batch_pipeline.py's CLI concurrency limit.
+            # Bound fan-out per phase; provider-level throttling (and yielding
+            # to interactive calls) is handled by the shared concurrency
+            # controller, since the warm path runs at BACKGROUND priority.
             _extraction_sem = asyncio.Semaphore(10)
 
             async def _extract_patterns_for_cluster(
@@ -3727,6 +3735,7 @@ async def phase_refresh(
                     )
                 )
                 .order_by(Optimization.created_at.desc())
+                .options(selectinload(Optimization.vectors))
                 .limit(_qualifier_backfill_cap)
             )
             backfill_opts = list(backfill_q.scalars().all())
@@ -0,0 +1,277 @@
+"""TraceIndex — trace_id and time-range lookup over the daily trace JSONL files.
+
+``TraceLogger`` writes each entry through :class:`JsonlWriter` with an
+index key, so every ``traces-YYYY-MM-DD.jsonl`` has a ``.idx`` sidecar of
+``trace_id \\t epoch \\t offset \\t length`` rows, appended at write time.
+The index reads only those sidecars (and only the bytes appended since the
+last query), then seeks straight to the matching lines:
+
+- ``trace_id`` → hash lookup to the days and byte spans holding it.
+- time window → bisect over the sorted day list, then bisect over each
+  day's sorted timestamps.
+
+Files without a sidecar (written before indexing existed), or with an
+unindexed head, are scanned once in memory; the sidecar is written back
+for past days so the scan is not repeated by the next process.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_FILE_PREFIX = "traces-"
+
+
+def index_key(trace_id: str, ts: float) -> str:
+    """Sidecar key for one entry — must stay tab/newline free."""
+    safe = trace_id.replace("\t", " ").replace("\n", " ")
+    return f"{safe}\t{ts:.3f}"
+
+
+@dataclass
+class _DayIndex:
+    path: Path
+    idx_pos: int = 0  # bytes of the sidecar consumed so far
+    scanned_to: int = 0  # bytes of unindexed head scanned so far
+    first_indexed: int | None = None  # offset of the first sidecar row
+    by_trace: dict[str, list[tuple[int, int]]] = field(default_factory=dict)
+    times: list[float] = field(default_factory=list)
+    spans: list[tuple[int, int]] = field(default_factory=list)
+    offsets: set[int] = field(default_factory=set)
+
+    @property
+    def first_ts(self) -> float | None:
+        return self.times[0] if self.times else None
+
+    @property
+    def last_ts(self) -> float | None:
+        return self.times[-1] if self.times else None
+
+    def add(self, trace_id: str, ts: float, offset: int, length: int) -> bool:
+        """Record one entry; returns True when *trace_id* is new for the day."""
+        if offset in self.offsets:
+            return False  # Same line seen via scan and sidecar
+        self.offsets.add(offset)
+        spans = self.by_trace.get(trace_id)
+        new = spans is None
+        if new:
+            spans = self.by_trace[trace_id] = []
+        bisect.insort(spans, (offset, length))
+        if not self.times or ts >= self.times[-1]:
+            self.times.append(ts)
+            self.spans.append((offset, length))
+        else:  # another process' clock/ordering — keep the arrays sorted
+            i = bisect.bisect_right(self.times, ts)
+            self.times.insert(i, ts)
+            self.spans.insert(i, (offset, length))
+        return new
+
+
+class TraceIndex:
+    """In-memory index over one traces directory, refreshed from sidecars."""
+
+    def __init__(self, traces_dir: str | Path) -> None:
+        self.traces_dir = Path(traces_dir)
+        self._days: dict[str, _DayIndex] = {}
+        self._day_keys: list[str] = []  # sorted "YYYY-MM-DD"
+        self._trace_days: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get(self, trace_id: str) -> list[dict[str, Any]]:
+        """All entries for *trace_id*, in write order."""
+        with self._lock:
+            self._refresh()
+            hits = [
+                (self._days[day].path, span)
+                for day in self._trace_days.get(trace_id, ())
+                for span in self._days[day].by_trace.get(trace_id, ())
+            ]
+        return [e for e in _read_spans(hits) if e.get("trace_id") == trace_id]
+
+    def window(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 500,
+    ) -> list[dict[str, Any]]:
+        """Entries with ``since <= timestamp <= until``, oldest first."""
+        lo = since.timestamp() if since else float("-inf")
+        hi = until.timestamp() if until else float("inf")
+        hits: list[tuple[Path, tuple[int, int]]] = []
+        with self._lock:
+            self._refresh()
+            # Daily files: only days whose UTC date overlaps the window.
+            start = bisect.bisect_left(self._day_keys, since.astimezone(UTC).strftime("%Y-%m-%d")) if since else 0
+            end = (
+                bisect.bisect_right(self._day_keys, until.astimezone(UTC).strftime("%Y-%m-%d"))
+                if until else len(self._day_keys)
+            )
+            for day in self._day_keys[start:end]:
+                idx = self._days[day]
+                i = bisect.bisect_left(idx.times, lo)
+                j = bisect.bisect_right(idx.times, hi)
+                for span in idx.spans[i:j]:
+                    hits.append((idx.path, span))
+                    if len(hits) >= limit:
+                        break
+                if len(hits) >= limit:
+                    break
+        return _read_spans(hits)
+
+    def day_bounds(self) -> dict[str, tuple[float | None, float | None]]:
+        """Per-day (first, last) entry epoch timestamps."""
+        with self._lock:
+            self._refresh()
+            return {d: (self._days[d].first_ts, self._days[d].last_ts) for d in self._day_keys}
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _refresh(self) -> None:
+        try:
+            names = {
+                e.name for e in os.scandir(self.traces_dir)
+                if e.name.startswith(_FILE_PREFIX) and e.name.endswith(".jsonl")
+            }
+        except FileNotFoundError:
+            names = set()
+        present = {n[len(_FILE_PREFIX):-len(".jsonl")]: n for n in names}
+
+        for day in [d for d in self._days if d not in present]:
+            self._drop_day(day)  # rotated away
+        for day, name in present.items():
+            if day not in self._days:
+                self._days[day] = _DayIndex(self.traces_dir / name)
+                bisect.insort(self._day_keys, day)
+            self._refresh_day(day, self._days[day])
+
+    def _drop_day(self, day: str) -> None:
+        idx = self._days.pop(day)
+        self._day_keys.remove(day)
+        for trace_id in idx.by_trace:
+            days = self._trace_days.get(trace_id)
+            if days and day in days:
+                days.remove(day)
+                if not days:
+                    del self._trace_days[trace_id]
+
+    def _add(self, day: str, idx: _DayIndex, trace_id: str, ts: float, off: int, ln: int) -> None:
+        if idx.add(trace_id, ts, off, ln):
+            days = self._trace_days.setdefault(trace_id, [])
+            bisect.insort(days, day)
+
+    def _refresh_day(self, day: str, idx: _DayIndex) -> None:
+        sidecar = idx.path.with_suffix(".idx")
+        try:
+            size = sidecar.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size > idx.idx_pos:
+            with sidecar.open("rb") as fh:
+                fh.seek(idx.idx_pos)
+                chunk = fh.read(size - idx.idx_pos)
+            complete = chunk.rfind(b"\n") + 1
+            idx.idx_pos += complete
+            for row in chunk[:complete].decode("utf-8", "replace").splitlines():
+                parts = row.split("\t")
+                if len(parts) != 4:
+                    continue
+                try:
+                    ts, off, ln = float(parts[1]), int(parts[2]), int(parts[3])
+                except ValueError:
+                    continue
+                if idx.first_indexed is None:
+                    idx.first_indexed = off
+                self._add(day, idx, parts[0], ts, off, ln)
+
+        # Unindexed head (legacy lines): everything before the first sidecar
+        # row, or the whole file when there is no sidecar at all.
+        if idx.first_indexed is not None:
+            head_end = idx.first_indexed
+        else:
+            try:
+                head_end = idx.path.stat().st_size
+            except FileNotFoundError:
+                return
+        if head_end > idx.scanned_to:
+            self._scan_head(day, idx, head_end, write_sidecar=size == 0)
+
+    def _scan_head(self, day: str, idx: _DayIndex, end: int, *, write_sidecar: bool) -> None:
+        with idx.path.open("rb") as fh:
+            fh.seek(idx.scanned_to)
+            chunk = fh.read(end - idx.scanned_to)
+        complete = chunk.rfind(b"\n") + 1
+        rows: list[str] = []
+        pos = idx.scanned_to
+        for raw in chunk[:complete].splitlines(keepends=True):
+            off, pos = pos, pos + len(raw)
+            try:
+                entry = json.loads(raw)
+                trace_id = entry["trace_id"]
+                ts = datetime.fromisoformat(entry["timestamp"]).timestamp()
+            except (ValueError, KeyError, TypeError):
+                continue
+            self._add(day, idx, trace_id, ts, off, len(raw))
+            rows.append(f"{index_key(trace_id, ts)}\t{off}\t{len(raw)}\n")
+        idx.scanned_to += complete
+        today = datetime.now(UTC).strftime("%Y-%m-%d")
+        if write_sidecar and rows and day < today:
+            # Past days are no longer written to — persist the backfill.
+            try:
+                with idx.path.with_suffix(".idx").open("x", encoding="utf-8") as fh:
+                    fh.write("".join(rows))
+                idx.idx_pos = sum(len(r.encode("utf-8")) for r in rows)
+                idx.first_indexed = 0
+            except OSError:
+                pass  # Another process got there first, or read-only dir
+
+
+def _read_spans(hits: list[tuple[Path, tuple[int, int]]]) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    by_file: dict[Path, list[tuple[int, int]]] = {}
+    for path, span in hits:
+        by_file.setdefault(path, []).append(span)
+    for path in sorted(by_file):
+        try:
+            with path.open("rb") as fh:
+                for offset, length in by_file[path]:
+                    fh.seek(offset)
+                    raw = fh.read(length)
+                    try:
+                        out.append(json.loads(raw))
+                    except json.JSONDecodeError as jde:
+                        logger.warning(
+                            "Malformed JSONL line in %s at %d (skipping): %s",
+                            path.name, offset, jde,
+                        )
+        except OSError as exc:
+            logger.warning("Could not read trace file %s: %s", path.name, exc)
+    return out
+
+
+_indexes: dict[Path, TraceIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_trace_index(traces_dir: str | Path) -> TraceIndex:
+    """Shared index for *traces_dir* (one per directory per process)."""
+    key = Path(traces_dir).resolve()
+    with _indexes_lock:
+        if key not in _indexes:
+            _indexes[key] = TraceIndex(key)
+        return _indexes[key]
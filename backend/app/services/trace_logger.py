@@ -1,11 +1,16 @@
 """TraceLogger — writes per-phase JSONL trace entries to data/traces/."""
 
+import asyncio
 import json
 import logging
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from app.services.jsonl_writer import JsonlWriter, get_jsonl_writer
+from app.services.metrics import observe
+from app.services.trace_index import TraceIndex, get_trace_index, index_key
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,14 +18,24 @@ class TraceLogger:
     """Append-only JSONL trace logger.
 
     Each call to ``log_phase`` appends a single JSON line to a daily file
-    ``<traces_dir>/traces-YYYY-MM-DD.jsonl``.  ``read_trace`` scans all
-    ``.jsonl`` files in the directory and returns every entry whose
-    ``trace_id`` matches the requested value.
+    ``<traces_dir>/traces-YYYY-MM-DD.jsonl``, plus an offset row in the
+    day's ``.idx`` sidecar.  ``read_trace`` and ``read_window`` go through
+    the directory's shared :class:`TraceIndex` instead of scanning files.
+
+    Lines are appended by the shared background :class:`JsonlWriter`, so
+    ``log_phase`` does no disk I/O on the caller's thread.  Reads first
+    wait for that writer (up to 5 s), so async callers use ``aread_trace``
+    / ``aread_window``, which run the read in a worker thread.
     """
 
-    def __init__(self, traces_dir: str | Path = "data/traces") -> None:
+    def __init__(
+        self,
+        traces_dir: str | Path = "data/traces",
+        writer: JsonlWriter | None = None,
+    ) -> None:
         self.traces_dir = Path(traces_dir)
         self.traces_dir.mkdir(parents=True, exist_ok=True)
+        self._writer = writer or get_jsonl_writer()
 
     # ------------------------------------------------------------------
     # Public API
@@ -38,12 +53,15 @@ class TraceLogger:
         result: dict[str, Any] | None = None,
         *,
         status: str = "ok",
+        cached: bool = False,
     ) -> None:
         """Append one trace entry to today's JSONL file.
 
         *status* indicates the outcome of the phase: ``"ok"`` (default),
-        ``"error"``, or ``"skipped"``.
+        ``"error"``, or ``"skipped"``.  *cached* marks phases answered from
+        the LLM response cache so analytics can include or exclude them.
         """
+        now = datetime.now(UTC)
         entry: dict[str, Any] = {
             "trace_id": trace_id,
             "phase": phase,
@@ -53,34 +71,82 @@ class TraceLogger:
             "tokens_out": tokens_out,
             "model": model,
             "provider": provider,
-            "timestamp": datetime.now(UTC).isoformat(),
+            "cached": cached,
+            "timestamp": now.isoformat(),
         }
         if result is not None:
             entry["result"] = result
 
-        daily_file = self._daily_file()
-        with daily_file.open("a", encoding="utf-8") as fh:
-            fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        if not cached:
+            observe(
+                "pipeline_phase_duration_seconds", duration_ms / 1000,
+                phase=phase, status=status,
+            )
+        self._writer.write(
+            self._daily_file(),
+            json.dumps(entry, ensure_ascii=False),
+            index=index_key(trace_id, now.timestamp()),
+        )
+
+    def log_profile(self, trace_id: str, profile: dict[str, Any]) -> None:
+        """Append the request's profiling summary as a ``phase: "profile"`` entry.
+
+        The entry has no ``duration_ms``, so latency percentiles skip it.
+        """
+        now = datetime.now(UTC)
+        entry = {
+            "trace_id": trace_id,
+            "phase": "profile",
+            "profile": profile,
+            "timestamp": now.isoformat(),
+        }
+        self._writer.write(
+            self._daily_file(),
+            json.dumps(entry, ensure_ascii=False),
+            index=index_key(trace_id, now.timestamp()),
+        )
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every entry logged so far is on disk."""
+        return self._writer.flush(timeout)
+
+    @property
+    def index(self) -> TraceIndex:
+        return get_trace_index(self.traces_dir)
 
     def read_trace(self, trace_id: str) -> list[dict[str, Any]]:
-        """Return all entries for *trace_id* across all daily files, in order."""
-        matches: list[dict[str, Any]] = []
-        for path in sorted(self.traces_dir.glob("traces-*.jsonl")):
-            for line in path.read_text(encoding="utf-8").splitlines():
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    entry = json.loads(line)
-                except json.JSONDecodeError as jde:
-                    logger.warning(
-                        "Malformed JSONL line in %s (skipping): %s",
-                        path.name, jde,
-                    )
-                    continue
-                if entry.get("trace_id") == trace_id:
-                    matches.append(entry)
-        return matches
+        """Return all entries for *trace_id* across all daily files, in order.
+
+        Blocks on ``flush()``; from the event loop use ``aread_trace``.
+        """
+        self.flush()
+        return self.index.get(trace_id)
+
+    async def aread_trace(self, trace_id: str) -> list[dict[str, Any]]:
+        """``read_trace`` off the event loop."""
+        return await asyncio.to_thread(self.read_trace, trace_id)
+
+    def read_window(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 500,
+    ) -> list[dict[str, Any]]:
+        """Return up to *limit* entries logged in ``[since, until]``, oldest first.
+
+        Blocks on ``flush()``; from the event loop use ``aread_window``.
+        """
+        self.flush()
+        return self.index.window(since, until, limit)
+
+    async def aread_window(
+        self,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        limit: int = 500,
+    ) -> list[dict[str, Any]]:
+        """``read_window`` off the event loop."""
+        return await asyncio.to_thread(self.read_window, since, until, limit)
 
     def rotate(self, retention_days: int = 30) -> int:
         """Delete JSONL trace files older than retention_days. Returns count deleted."""
@@ -95,6 +161,7 @@ class TraceLogger:
                 file_date = datetime.strptime(date_str, "%Y-%m-%d").replace(tzinfo=UTC)
                 if file_date < cutoff:
                     path.unlink()
+                    path.with_suffix(".idx").unlink(missing_ok=True)
                     deleted += 1
                     logger.info("Deleted old trace file: %s", path.name)
             except (ValueError, OSError) as exc:
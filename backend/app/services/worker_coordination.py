@@ -0,0 +1,411 @@
+"""Coordination between uvicorn workers: taxonomy leader election and event relay.
+
+With ``API_WORKERS=1`` (the default) nothing here is active and the
+process behaves exactly as before. With more workers, each worker runs
+the full application for request handling, but two things cannot be
+duplicated per process:
+
+* **The taxonomy engine's write side** — hot-path assignment, warm and
+  cold cycles, startup backfills and maintenance loops mutate shared
+  clusters and in-memory indexes. Exactly one worker, the *leader*, owns
+  them. Leadership is a non-blocking ``flock`` on
+  ``data/taxonomy_leader.lock``: the kernel releases it when the holder
+  exits, and followers retry every few seconds, so a crashed leader is
+  replaced without any lease bookkeeping. Followers serve reads from
+  index caches the leader persists to disk (same mechanism the MCP
+  process already uses).
+* **The event bus** — an SSE client is connected to one worker but must
+  see events published on every worker, and the leader must see
+  ``optimization_created`` from whichever worker ran the pipeline.
+  :class:`EventRelay` routes ``EventBus.publish()`` through an append-only
+  SQLite journal (``data/event_journal.db``) and every worker tails it,
+  delivering rows locally with the journal id as the event ``seq``. All
+  workers therefore agree on ordering and ``Last-Event-ID`` replay works
+  no matter which worker a reconnecting client lands on.
+
+Copyright 2025-2026 Project Synthesis contributors.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from app.services.event_bus import EventBus
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover — non-POSIX platforms
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+ROLE_STANDALONE = "standalone"
+ROLE_LEADER = "leader"
+ROLE_FOLLOWER = "follower"
+
+# Seconds between a follower's attempts to take over leadership.
+_LEADER_RETRY_SECONDS = 5.0
+
+# Rows read from the journal per tail query.
+_TAIL_BATCH = 500
+
+# Seconds between journal pruning passes.
+_PRUNE_INTERVAL = 60.0
+
+# Unsent events kept while the journal is unwritable; oldest dropped beyond this.
+_MAX_OUTBOX = 10_000
+
+
+class LeaderLock:
+    """Non-blocking exclusive ``flock`` on a lock file (POSIX only)."""
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._fd: int | None = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        """Take the lock if no other process holds it. Never blocks."""
+        if self._fd is not None:
+            return True
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+        os.close(self._fd)
+        self._fd = None
+
+
+class EventJournal:
+    """Append-only SQLite log of bus events shared by all workers.
+
+    Blocking SQLite work runs under a lock; the relay calls it from a
+    worker thread.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._lock = threading.Lock()
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self._path), check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " ts REAL NOT NULL,"
+            " origin INTEGER NOT NULL,"
+            " event_type TEXT NOT NULL,"
+            " payload TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def append(self, origin: int, events: list[tuple[float, str, str]]) -> None:
+        """Insert ``(timestamp, event_type, payload_json)`` rows in order."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO events (ts, origin, event_type, payload) VALUES (?, ?, ?, ?)",
+                [(ts, origin, event_type, payload) for ts, event_type, payload in events],
+            )
+            self._conn.commit()
+
+    def read_after(
+        self, after_id: int, limit: int = _TAIL_BATCH,
+    ) -> list[tuple[int, float, int, str, str]]:
+        """Rows ``(id, ts, origin, event_type, payload)`` with id > *after_id*."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT id, ts, origin, event_type, payload FROM events"
+                " WHERE id > ? ORDER BY id LIMIT ?",
+                (after_id, limit),
+            ).fetchall()
+
+    def last_id(self) -> int:
+        with self._lock:
+            (last,) = self._conn.execute("SELECT COALESCE(MAX(id), 0) FROM events").fetchone()
+        return last
+
+    def prune(self, older_than: float) -> int:
+        """Drop rows written before *older_than* (epoch seconds). Returns count."""
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM events WHERE ts < ?", (older_than,))
+            self._conn.commit()
+            return cur.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class EventRelay:
+    """Carries ``EventBus`` traffic through an :class:`EventJournal`.
+
+    ``publish()`` on the attached bus only queues the event; a writer task
+    batches queued events into the journal and a tailer task delivers
+    every new journal row (from any worker) back to the local bus.
+    *on_peer_event* is called for rows written by other workers, for
+    process-local state that normally updates next to a publish.
+    """
+
+    def __init__(
+        self,
+        bus: EventBus,
+        journal: EventJournal,
+        *,
+        poll_interval: float = 0.1,
+        retention_seconds: float = 600.0,
+        on_peer_event: Callable[[str, Any], None] | None = None,
+        origin: int | None = None,
+    ) -> None:
+        self._bus = bus
+        self._journal = journal
+        self._poll_interval = poll_interval
+        self._retention = retention_seconds
+        self.on_peer_event = on_peer_event
+        self._origin = os.getpid() if origin is None else origin
+        self._outbox: list[tuple[float, str, str]] = []
+        self._last_id = 0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending = asyncio.Event()
+        self._appended = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self.relayed = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    async def start(self) -> None:
+        """Attach to the bus and start relaying from the journal's current end."""
+        self._loop = asyncio.get_running_loop()
+        self._last_id = await asyncio.to_thread(self._journal.last_id)
+        self._bus.attach_relay(self.submit, self._last_id)
+        self._tasks = [
+            asyncio.create_task(self._write_loop(), name="event-relay-writer"),
+            asyncio.create_task(self._tail_loop(), name="event-relay-tailer"),
+        ]
+        logger.info("Event relay started at journal id %d (pid %d)", self._last_id, self._origin)
+
+    def submit(self, event_type: str, data: Any) -> None:
+        """Queue one event for the journal (installed as the bus relay)."""
+        try:
+            payload = json.dumps(data)
+        except (TypeError, ValueError):
+            payload = json.dumps(data, default=str)
+        self._outbox.append((time.time(), event_type, payload))
+        if len(self._outbox) > _MAX_OUTBOX:
+            del self._outbox[0]
+            self.dropped += 1
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            # Published from a non-event-loop thread
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._pending.set)
+            return
+        self._pending.set()
+
+    async def _write_loop(self) -> None:
+        while True:
+            await self._pending.wait()
+            self._pending.clear()
+            batch, self._outbox = self._outbox, []
+            if not batch:
+                continue
+            try:
+                await asyncio.to_thread(self._journal.append, self._origin, batch)
+            except asyncio.CancelledError:
+                raise  # The thread still completes the append
+            except Exception:
+                logger.warning("Event journal write failed — retrying", exc_info=True)
+                self._outbox[:0] = batch
+                await asyncio.sleep(self._poll_interval)
+                self._pending.set()
+                continue
+            self.relayed += len(batch)
+            self._appended.set()
+
+    async def _tail_loop(self) -> None:
+        next_prune = time.monotonic() + _PRUNE_INTERVAL
+        while True:
+            try:
+                rows = await asyncio.to_thread(self._journal.read_after, self._last_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Event journal read failed", exc_info=True)
+                rows = []
+            for row_id, ts, origin, event_type, payload in rows:
+                self._last_id = row_id
+                data = json.loads(payload)
+                if origin != self._origin and self.on_peer_event is not None:
+                    try:
+                        self.on_peer_event(event_type, data)
+                    except Exception:
+                        logger.debug("Peer event hook failed for %s", event_type, exc_info=True)
+                self._bus.deliver(row_id, event_type, data, ts)
+                self.delivered += 1
+            if len(rows) >= _TAIL_BATCH:
+                continue
+            if time.monotonic() >= next_prune:
+                next_prune = time.monotonic() + _PRUNE_INTERVAL
+                try:
+                    await asyncio.to_thread(self._journal.prune, time.time() - self._retention)
+                except Exception:
+                    logger.debug("Event journal prune failed", exc_info=True)
+            self._appended.clear()
+            try:
+                await asyncio.wait_for(self._appended.wait(), timeout=self._poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def close(self) -> None:
+        """Flush queued events, stop both loops and detach from the bus."""
+        self._bus.detach_relay()
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._outbox:
+            batch, self._outbox = self._outbox, []
+            try:
+                await asyncio.to_thread(self._journal.append, self._origin, batch)
+            except Exception:
+                logger.warning("Event journal flush failed — %d events lost", len(batch))
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "journal_id": self._last_id,
+            "queued": len(self._outbox),
+            "relayed": self.relayed,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+
+class WorkerCoordinator:
+    """Role of this worker and the machinery that goes with it.
+
+    Roles: ``standalone`` (one worker — no lock, no relay), ``leader`` or
+    ``follower``. Leader-only work is gated with :meth:`wait_for_leadership`,
+    which returns at once for standalone and leader workers and blocks a
+    follower until it takes over the lock.
+    """
+
+    def __init__(
+        self,
+        data_dir: str | Path,
+        workers: int,
+        *,
+        poll_interval: float = 0.1,
+        retention_seconds: float = 600.0,
+    ) -> None:
+        self._data_dir = Path(data_dir)
+        self.workers = workers
+        self._poll_interval = poll_interval
+        self._retention = retention_seconds
+        self._lock = LeaderLock(self._data_dir / "taxonomy_leader.lock")
+        self._journal: EventJournal | None = None
+        self.relay: EventRelay | None = None
+        self._leadership = asyncio.Event()
+        self._campaign: asyncio.Task | None = None
+        self.role = ROLE_STANDALONE
+
+    @property
+    def is_leader(self) -> bool:
+        return self.role != ROLE_FOLLOWER
+
+    @property
+    def multi_worker(self) -> bool:
+        return self.role != ROLE_STANDALONE
+
+    async def start(
+        self,
+        bus: EventBus,
+        on_peer_event: Callable[[str, Any], None] | None = None,
+    ) -> None:
+        if self.workers <= 1:
+            self._leadership.set()
+            return
+        if fcntl is None:
+            logger.warning(
+                "API_WORKERS=%d but file locking is unavailable on this platform "
+                "— every worker would lead; running standalone", self.workers,
+            )
+            self._leadership.set()
+            return
+
+        self._journal = EventJournal(self._data_dir / "event_journal.db")
+        self.relay = EventRelay(
+            bus,
+            self._journal,
+            poll_interval=self._poll_interval,
+            retention_seconds=self._retention,
+            on_peer_event=on_peer_event,
+        )
+        await self.relay.start()
+
+        if self._lock.try_acquire():
+            self._become_leader()
+        else:
+            self.role = ROLE_FOLLOWER
+            logger.info("Worker %d is a taxonomy follower", os.getpid())
+            self._campaign = asyncio.create_task(self._campaign_loop(), name="leader-campaign")
+
+    def _become_leader(self) -> None:
+        self.role = ROLE_LEADER
+        self._leadership.set()
+        logger.info("Worker %d is the taxonomy leader", os.getpid())
+
+    async def _campaign_loop(self) -> None:
+        while not self._lock.held:
+            await asyncio.sleep(_LEADER_RETRY_SECONDS)
+            if self._lock.try_acquire():
+                logger.warning("Taxonomy leader gone — worker %d taking over", os.getpid())
+                self._become_leader()
+
+    async def wait_for_leadership(self) -> None:
+        """Return once this worker owns the taxonomy (immediately unless a follower)."""
+        await self._leadership.wait()
+
+    async def close(self) -> None:
+        if self._campaign is not None:
+            self._campaign.cancel()
+            await asyncio.gather(self._campaign, return_exceptions=True)
+            self._campaign = None
+        if self.relay is not None:
+            await self.relay.close()
+            self.relay = None
+        if self._journal is not None:
+            await asyncio.to_thread(self._journal.close)
+            self._journal = None
+        self._lock.release()
+
+    def stats(self) -> dict[str, Any]:
+        out: dict[str, Any] = {"role": self.role, "workers": self.workers, "pid": os.getpid()}
+        if self.relay is not None:
+            out["relay"] = self.relay.stats()
+        return out
@@ -14,6 +14,7 @@ from mcp.server.fastmcp import Context
 from app.config import PROMPTS_DIR
 from app.database import async_session_factory
 from app.models import Optimization
+from app.providers.base import call_provider_with_retry
 from app.schemas.mcp_models import AnalyzeOutput
 from app.schemas.pipeline_contracts import AnalysisResult, ScoreResult
 from app.services.event_notification import notify_event_bus
@@ -95,7 +96,8 @@ async def handle_analyze(
     })
 
     try:
-        analysis: AnalysisResult = await provider.complete_parsed(
+        analysis: AnalysisResult = await call_provider_with_retry(
+            provider,
             model=analyzer_model,
             system_prompt=system_prompt,
             user_message=analyze_msg,
@@ -121,7 +123,8 @@ async def handle_analyze(
     )
 
     try:
-        score_result: ScoreResult = await provider.complete_parsed(
+        score_result: ScoreResult = await call_provider_with_retry(
+            provider,
             model=scorer_model,
             system_prompt=scoring_system,
             user_message=scorer_msg,
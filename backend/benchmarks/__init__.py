@@ -0,0 +1,13 @@
+"""Offline end-to-end performance benchmarks.
+
+Run from ``backend/``::
+
+    python -m benchmarks --scale small                 # compare with baseline.json
+    python -m benchmarks --scale tiny,small --scenario pipeline
+    python -m benchmarks --scale small --update-baseline
+
+All data is synthetic and seeded, embeddings come from a hash encoder and
+LLM calls from :class:`benchmarks.stub_provider.StubProvider`, so runs need
+no network, model download or API key. A metric that is worse than the
+stored baseline by more than ``--tolerance`` makes the command exit 1.
+"""
@@ -0,0 +1,86 @@
+"""CLI entry point: ``python -m benchmarks``."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from benchmarks.harness import compare, format_report, load_baseline, python_info, write_baseline
+from benchmarks.scenarios import SCALES, SCENARIOS
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def _csv(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _parse(argv: list[str] | None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__)
+    p.add_argument("--scale", action="append", type=_csv,
+                   help=f"one or more of {', '.join(SCALES)} (default: small)")
+    p.add_argument("--scenario", action="append", type=_csv,
+                   help=f"subset of {', '.join(SCENARIOS)} (default: all)")
+    p.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    p.add_argument("--update-baseline", action="store_true",
+                   help="write these results into the baseline instead of comparing")
+    p.add_argument("--tolerance", type=float, default=0.25,
+                   help="allowed fractional slowdown before a metric fails (default: 0.25)")
+    p.add_argument("--provider-latency-ms", type=float, default=0.0,
+                   help="simulated latency per stub LLM call")
+    p.add_argument("--json", action="store_true", help="print results as JSON")
+    args = p.parse_args(argv)
+
+    args.scale = [s for group in (args.scale or [["small"]]) for s in group]
+    args.scenario = [s for group in (args.scenario or [list(SCENARIOS)]) for s in group]
+    for s in args.scale:
+        if s not in SCALES:
+            p.error(f"unknown scale {s!r}")
+    for s in args.scenario:
+        if s not in SCENARIOS:
+            p.error(f"unknown scenario {s!r}")
+    return args
+
+
+async def _run(args: argparse.Namespace) -> list:
+    results = []
+    for scale_name in args.scale:
+        for name in args.scenario:
+            print(f"running {name}@{scale_name} ...", file=sys.stderr, flush=True)
+            results.append(await SCENARIOS[name](SCALES[scale_name], args.provider_latency_ms))
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse(argv)
+    logging.basicConfig(level=logging.ERROR)
+    results = asyncio.run(_run(args))
+    baseline = load_baseline(args.baseline)
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        print(python_info())
+        print(format_report(results, baseline))
+
+    if args.update_baseline:
+        write_baseline(args.baseline, results)
+        print(f"baseline updated: {args.baseline}", file=sys.stderr)
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}:", file=sys.stderr)
+        for r in regressions:
+            print(f"  {r}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
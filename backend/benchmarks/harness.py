@@ -0,0 +1,192 @@
+"""Timing, memory and baseline comparison for benchmark scenarios."""
+
+from __future__ import annotations
+
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+# Metrics compared against the baseline: name -> (higher_is_worse, noise floor).
+# A change smaller than the floor never counts as a regression, however large
+# the ratio — sub-millisecond timings are dominated by scheduler noise.
+COMPARED: dict[str, tuple[bool, float]] = {
+    "p50_ms": (True, 1.0),
+    "p95_ms": (True, 2.0),
+    "throughput": (False, 0.0),
+    "peak_mem_mb": (True, 2.0),
+}
+
+
+@dataclass
+class ScenarioResult:
+    scenario: str
+    scale: str
+    ops: int
+    total_s: float
+    throughput: float  # ops per second
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    peak_mem_mb: float
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        return f"{self.scenario}@{self.scale}"
+
+
+@dataclass
+class Regression:
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        return (self.current - self.baseline) / self.baseline if self.baseline else math.inf
+
+    def __str__(self) -> str:
+        return (
+            f"{self.key} {self.metric}: {self.baseline:g} -> {self.current:g} "
+            f"({self.change:+.0%})"
+        )
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list (0 < q <= 100)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+async def measure(
+    scenario: str,
+    scale: str,
+    op: Callable[[int], Awaitable[Any]],
+    ops: int,
+    *,
+    warmup: int = 1,
+    extra: dict[str, Any] | None = None,
+) -> ScenarioResult:
+    """Run ``op(i)`` for *warmup* + *ops* iterations and summarize.
+
+    Latency comes from the timed iterations only. Peak memory is taken from
+    one further iteration run under ``tracemalloc``, so its overhead never
+    distorts the timings. It is the peak Python-heap growth during that
+    operation, numpy buffers included.
+    """
+    for i in range(warmup):
+        await op(i)
+
+    latencies: list[float] = []
+    t_start = time.perf_counter()
+    for i in range(warmup, warmup + ops):
+        t0 = time.perf_counter()
+        await op(i)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    total = time.perf_counter() - t_start
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        await op(warmup + ops)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    return ScenarioResult(
+        scenario=scenario,
+        scale=scale,
+        ops=ops,
+        total_s=round(total, 4),
+        throughput=round(ops / total, 3) if total > 0 else 0.0,
+        p50_ms=round(percentile(latencies, 50), 3),
+        p95_ms=round(percentile(latencies, 95), 3),
+        p99_ms=round(percentile(latencies, 99), 3),
+        max_ms=round(latencies[-1], 3) if latencies else 0.0,
+        peak_mem_mb=round((peak - base) / 2**20, 3),
+        extra=extra or {},
+    )
+
+
+# ---------------------------------------------------------------------------
+# Baseline
+# ---------------------------------------------------------------------------
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, Any]]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text()).get("results", {})
+
+
+def write_baseline(path: Path, results: list[ScenarioResult]) -> None:
+    """Merge *results* into the baseline file (other keys are kept)."""
+    merged = load_baseline(path)
+    for r in results:
+        merged[r.key] = {k: v for k, v in asdict(r).items() if k not in ("scenario", "scale")}
+    path.write_text(json.dumps({
+        "version": 1,
+        "python": platform.python_version(),
+        "machine": f"{platform.system()} {platform.machine()}",
+        "results": dict(sorted(merged.items())),
+    }, indent=2) + "\n")
+
+
+def compare(
+    results: list[ScenarioResult],
+    baseline: dict[str, dict[str, Any]],
+    tolerance: float,
+) -> list[Regression]:
+    """Metrics worse than the baseline by more than *tolerance* (a fraction)."""
+    regressions: list[Regression] = []
+    for r in results:
+        base = baseline.get(r.key)
+        if not base:
+            continue
+        for metric, (higher_is_worse, floor) in COMPARED.items():
+            b, cur = base.get(metric), getattr(r, metric)
+            if not b:
+                continue
+            if higher_is_worse:
+                worse = cur > b * (1 + tolerance) and cur - b > floor
+            else:
+                worse = cur < b / (1 + tolerance)
+            if worse:
+                regressions.append(Regression(r.key, metric, b, cur))
+    return regressions
+
+
+def format_report(results: list[ScenarioResult], baseline: dict[str, dict[str, Any]]) -> str:
+    header = (
+        f"{'scenario':<28}{'ops':>6}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'peak MB':>10}"
+        "  vs baseline"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        base = baseline.get(r.key)
+        delta = (
+            f"p95 {(r.p95_ms - base['p95_ms']) / base['p95_ms']:+.0%}"
+            if base and base.get("p95_ms") else "—"
+        )
+        lines.append(
+            f"{r.key:<28}{r.ops:>6}{r.throughput:>10.2f}{r.p50_ms:>10.2f}{r.p95_ms:>10.2f}"
+            f"{r.p99_ms:>10.2f}{r.peak_mem_mb:>10.2f}  {delta}"
+        )
+    return "\n".join(lines)
+
+
+def python_info() -> str:
+    return f"Python {platform.python_version()} ({sys.implementation.name}) on {platform.platform()}"
@@ -0,0 +1,265 @@
+"""Benchmark scenarios.
+
+Each scenario builds a fresh SQLite database in a temp directory, seeds it
+with synthetic data for the requested :class:`Scale`, and times one hot
+operation through :func:`benchmarks.harness.measure`. While a scenario runs,
+``DATA_DIR`` and ``async_session_factory`` are redirected into the temp
+directory, so traces, preferences and readiness snapshots never touch the
+developer's real ``data/``.
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from benchmarks.harness import ScenarioResult, measure
+from benchmarks.stub_provider import StubProvider
+from benchmarks.synthetic import (
+    HashEncoder,
+    SeededTaxonomy,
+    hash_embeddings,
+    make_corpus,
+    seed_repo_index,
+    seed_taxonomy,
+)
+
+
+@dataclass(frozen=True)
+class Scale:
+    name: str
+    clusters: int
+    members: int  # optimizations per cluster
+    repo_files: int
+    requests: int  # timed pipeline runs
+    cycles: int  # timed warm-path cycles
+    refits: int  # timed cold-path refits
+
+
+SCALES: dict[str, Scale] = {
+    s.name: s for s in (
+        Scale("tiny", clusters=12, members=3, repo_files=40, requests=4, cycles=1, refits=1),
+        Scale("small", clusters=60, members=5, repo_files=400, requests=20, cycles=3, refits=1),
+        Scale("medium", clusters=300, members=8, repo_files=2000, requests=40, cycles=3, refits=1),
+        Scale("large", clusters=1200, members=10, repo_files=8000, requests=60, cycles=2, refits=1),
+    )
+}
+
+_REPO = "bench/repo"
+_BRANCH = "main"
+
+
+@dataclass
+class BenchContext:
+    tmp: Path
+    session_factory: async_sessionmaker[AsyncSession]
+    encoder: HashEncoder
+    provider: StubProvider
+
+
+@contextmanager
+def _redirect(name: str, value: Any) -> Iterator[None]:
+    """Rebind module global *name* in every ``app`` module that imported it.
+
+    Modules use ``from app.config import DATA_DIR`` (and the same for
+    ``async_session_factory``), so patching only the defining module would
+    miss the copies already bound elsewhere.
+    """
+    patched: list[tuple[Any, Any]] = []
+    for mod_name, mod in list(sys.modules.items()):
+        if mod is None or not (mod_name == "app" or mod_name.startswith("app.")):
+            continue
+        if name in vars(mod):
+            patched.append((mod, getattr(mod, name)))
+            setattr(mod, name, value)
+    try:
+        yield
+    finally:
+        for mod, original in patched:
+            setattr(mod, name, original)
+
+
+@asynccontextmanager
+async def bench_context(provider_latency_ms: float = 0.0) -> AsyncIterator[BenchContext]:
+    """Temp database + isolated data dir + hash embeddings + stub provider."""
+    # Import every module that binds DATA_DIR / async_session_factory up
+    # front so _redirect sees them.
+    import app.services.pipeline  # noqa: F401
+    import app.services.taxonomy.readiness_history  # noqa: F401
+    from app.models import Base
+
+    with tempfile.TemporaryDirectory(prefix="pf-bench-") as tmp_str:
+        tmp = Path(tmp_str)
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp / 'bench.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        try:
+            with (
+                hash_embeddings() as encoder,
+                _redirect("DATA_DIR", tmp),
+                _redirect("async_session_factory", factory),
+            ):
+                yield BenchContext(tmp, factory, encoder, StubProvider(provider_latency_ms))
+        finally:
+            await engine.dispose()
+
+
+async def _engine_with(ctx: BenchContext, seeded: SeededTaxonomy) -> Any:
+    from app.services.embedding_service import EmbeddingService
+    from app.services.taxonomy.engine import TaxonomyEngine
+
+    engine = TaxonomyEngine(embedding_service=EmbeddingService(), provider=ctx.provider)
+    await engine.embedding_index.rebuild(seeded.centroids)
+    return engine
+
+
+async def _seed(ctx: BenchContext, scale: Scale) -> SeededTaxonomy:
+    async with ctx.session_factory() as db:
+        return await seed_taxonomy(db, ctx.encoder, scale.clusters, scale.members)
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+
+
+async def bench_pipeline(scale: Scale, provider_latency_ms: float = 0.0) -> ScenarioResult:
+    """``PipelineOrchestrator.run`` end to end: analyze → optimize → score → persist."""
+    from app.config import PROMPTS_DIR
+    from app.services.pipeline import PipelineOrchestrator
+    from app.services.trace_logger import TraceLogger
+
+    async with bench_context(provider_latency_ms) as ctx:
+        seeded = await _seed(ctx, scale)
+        engine = await _engine_with(ctx, seeded)
+        orch = PipelineOrchestrator(prompts_dir=PROMPTS_DIR)
+        orch.trace_logger = TraceLogger(ctx.tmp / "traces")
+        corpus = make_corpus(scale.requests + 2, seeded.topics)
+
+        async def op(i: int) -> None:
+            async with ctx.session_factory() as db:
+                async for event in orch.run(corpus[i], ctx.provider, db, taxonomy_engine=engine):
+                    if event.event == "error":
+                        raise RuntimeError(f"pipeline failed: {event.data}")
+
+        calls_before = ctx.provider.calls
+        result = await measure("pipeline", scale.name, op, scale.requests)
+        result.extra["llm_calls_per_run"] = round(
+            (ctx.provider.calls - calls_before) / (scale.requests + 2), 2,
+        )
+        return result
+
+
+async def bench_pattern_injection(scale: Scale, provider_latency_ms: float = 0.0) -> ScenarioResult:
+    """``auto_inject_patterns`` against a populated embedding index."""
+    from app.services.pattern_injection import auto_inject_patterns
+
+    async with bench_context(provider_latency_ms) as ctx:
+        seeded = await _seed(ctx, scale)
+        engine = await _engine_with(ctx, seeded)
+        ops = max(20, scale.requests * 5)
+        corpus = make_corpus(ops + 2, seeded.topics, seed=7)
+        injected: list[int] = []
+
+        async def op(i: int) -> None:
+            async with ctx.session_factory() as db:
+                patterns, _ = await auto_inject_patterns(corpus[i], engine, db, f"bench-{i}")
+                injected.append(len(patterns))
+
+        result = await measure("pattern_injection", scale.name, op, ops)
+        result.extra["avg_patterns"] = round(sum(injected) / len(injected), 2)
+        return result
+
+
+async def _repo_scenario(
+    name: str, scale: Scale, query: Callable[[Any, str], Awaitable[Any]],
+) -> ScenarioResult:
+    from app.services.embedding_service import EmbeddingService
+    from app.services.repo_index_service import RepoIndexService
+
+    async with bench_context() as ctx:
+        async with ctx.session_factory() as db:
+            await seed_repo_index(db, ctx.encoder, _REPO, _BRANCH, scale.repo_files)
+        topics = (await _seed(ctx, Scale("repo", 16, 1, 0, 0, 0, 0))).topics
+        ops = max(20, scale.requests * 5)
+        # Unique queries: the curated-context cache must not turn this
+        # into a dictionary lookup benchmark.
+        corpus = make_corpus(ops + 2, topics, seed=11)
+
+        async def op(i: int) -> None:
+            async with ctx.session_factory() as db:
+                await query(RepoIndexService(db, None, EmbeddingService()), corpus[i])  # type: ignore[arg-type]
+
+        return await measure(name, scale.name, op, ops)
+
+
+async def bench_repo_relevant_files(scale: Scale, provider_latency_ms: float = 0.0) -> ScenarioResult:
+    """``RepoIndexService.query_relevant_files`` — embed + cosine top-k."""
+    return await _repo_scenario(
+        "repo_relevant_files", scale,
+        lambda svc, q: svc.query_relevant_files(_REPO, _BRANCH, q),
+    )
+
+
+async def bench_repo_curated_context(scale: Scale, provider_latency_ms: float = 0.0) -> ScenarioResult:
+    """``RepoIndexService.query_curated_context`` — retrieval plus context assembly."""
+    return await _repo_scenario(
+        "repo_curated_context", scale,
+        lambda svc, q: svc.query_curated_context(_REPO, _BRANCH, q),
+    )
+
+
+async def bench_warm_path(scale: Scale, provider_latency_ms: float = 0.0) -> ScenarioResult:
+    """One warm-path cycle with every active cluster dirty."""
+    from app.models import PromptCluster
+
+    async with bench_context(provider_latency_ms) as ctx:
+        seeded = await _seed(ctx, scale)
+        engine = await _engine_with(ctx, seeded)
+
+        async def op(i: int) -> None:
+            async with ctx.session_factory() as db:
+                ids = (await db.execute(
+                    select(PromptCluster.id).where(PromptCluster.state == "active"),
+                )).scalars().all()
+            for cid in ids:
+                engine.mark_dirty(cid)
+            await engine.run_warm_path(ctx.session_factory)
+
+        result = await measure("warm_path", scale.name, op, scale.cycles)
+        result.extra["clusters"] = scale.clusters
+        return result
+
+
+async def bench_cold_path(scale: Scale, provider_latency_ms: float = 0.0) -> ScenarioResult:
+    """Full HDBSCAN refit. The warmup run absorbs numba JIT compilation."""
+    async with bench_context(provider_latency_ms) as ctx:
+        seeded = await _seed(ctx, scale)
+        engine = await _engine_with(ctx, seeded)
+
+        async def op(i: int) -> None:
+            async with ctx.session_factory() as db:
+                await engine.run_cold_path(db)
+
+        result = await measure("cold_path", scale.name, op, scale.refits)
+        result.extra["optimizations"] = scale.clusters * scale.members
+        return result
+
+
+SCENARIOS: dict[str, Callable[[Scale, float], Awaitable[ScenarioResult]]] = {
+    "pipeline": bench_pipeline,
+    "pattern_injection": bench_pattern_injection,
+    "repo_relevant_files": bench_repo_relevant_files,
+    "repo_curated_context": bench_repo_curated_context,
+    "warm_path": bench_warm_path,
+    "cold_path": bench_cold_path,
+}
@@ -0,0 +1,126 @@
+"""Deterministic offline LLM provider for benchmarks.
+
+``StubProvider`` answers every ``complete_parsed`` call by synthesizing a
+valid instance of the requested Pydantic schema from its field types and
+constraints. The output is seeded by the request (model + schema + user
+message), so the same input always produces the same output. Nothing leaves
+the process. An optional fixed latency simulates network time without
+burning CPU.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import random
+import types
+import typing
+from typing import Any, Literal, TypeVar, get_args, get_origin
+
+import annotated_types
+from pydantic import BaseModel
+
+from app.providers.base import LLMProvider, TokenUsage
+
+T = TypeVar("T")
+
+_VOCAB = (
+    "clarify", "scope", "constraints", "inputs", "outputs", "examples", "edge", "cases",
+    "format", "audience", "tone", "steps", "validate", "error", "handling", "context",
+    "requirements", "structure", "criteria", "performance", "latency", "schema", "tests",
+    "review", "deploy", "api", "query", "cache", "index", "retry", "budget", "metric",
+)
+
+
+def _words(rng: random.Random, lo: int, hi: int) -> str:
+    return " ".join(rng.choice(_VOCAB) for _ in range(rng.randint(lo, hi)))
+
+
+def _bounds(metadata: list[Any]) -> tuple[float | None, float | None]:
+    lo = hi = None
+    for m in metadata:
+        if isinstance(m, (annotated_types.Ge, annotated_types.Gt)):
+            lo = float(getattr(m, "ge", getattr(m, "gt", 0)))
+        elif isinstance(m, (annotated_types.Le, annotated_types.Lt)):
+            hi = float(getattr(m, "le", getattr(m, "lt", 0)))
+    return lo, hi
+
+
+def _value(tp: Any, metadata: list[Any], rng: random.Random, name: str, user_message: str) -> Any:
+    origin = get_origin(tp)
+    if origin is typing.Annotated:
+        inner, *extra = get_args(tp)
+        return _value(inner, metadata + list(extra), rng, name, user_message)
+    if origin is Literal:
+        return rng.choice(get_args(tp))
+    if origin in (typing.Union, types.UnionType):
+        return _value(next(a for a in get_args(tp) if a is not type(None)), metadata, rng, name, user_message)
+    if origin is list:
+        (item,) = get_args(tp) or (str,)
+        return [_value(item, [], rng, name, user_message) for _ in range(3)]
+    if origin is dict:
+        return {"text": _words(rng, 6, 14), "source": "stub"}
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        return _synthesize(tp, rng, user_message)
+    if tp is bool:
+        return False
+    if tp is int:
+        lo, hi = _bounds(metadata)
+        return int(lo if lo is not None else 1)
+    if tp is float:
+        lo, hi = _bounds(metadata)
+        lo = 1.0 if lo is None else lo
+        hi = 10.0 if hi is None else hi
+        return round(rng.uniform(lo, hi), 2)
+    if name == "optimized_prompt":
+        # Realistic length and structure for downstream heuristic scoring.
+        body = user_message.strip()[:1200]
+        return (
+            f"## Task\n{body}\n\n## Requirements\n- {_words(rng, 6, 10)}\n- {_words(rng, 6, 10)}\n\n"
+            f"## Output\n{_words(rng, 12, 20)}."
+        )
+    return _words(rng, 3, 12)
+
+
+def _synthesize(model: type[BaseModel], rng: random.Random, user_message: str) -> BaseModel:
+    values = {
+        name: _value(field.annotation, list(field.metadata), rng, name, user_message)
+        for name, field in model.model_fields.items()
+        if field.is_required()
+    }
+    return model.model_validate(values)
+
+
+class StubProvider(LLMProvider):
+    """Schema-driven fake provider — deterministic and fully offline."""
+
+    name = "benchmark_stub"
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        self.latency_ms = latency_ms
+        self.calls = 0
+
+    async def complete_parsed(
+        self,
+        model: str,
+        system_prompt: str,
+        user_message: str,
+        output_format: type[T],
+        max_tokens: int = 16384,
+        effort: str | None = None,
+        cache_ttl: str | None = None,
+    ) -> T:
+        self.calls += 1
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+        digest = hashlib.blake2b(
+            f"{model}\0{output_format.__name__}\0{user_message}".encode(), digest_size=8,
+        ).digest()
+        rng = random.Random(int.from_bytes(digest, "big"))
+        result = _synthesize(output_format, rng, user_message)  # type: ignore[arg-type]
+        self.last_usage = TokenUsage(
+            input_tokens=(len(system_prompt) + len(user_message)) // 4,
+            output_tokens=len(result.model_dump_json()) // 4,
+        )
+        self.last_model = model
+        return result  # type: ignore[return-value]
@@ -0,0 +1,253 @@
+"""Synthetic data for benchmarks: embeddings, prompt corpora, taxonomies, repo indexes.
+
+Everything is generated from a seed, so a scenario sees the same data on
+every run and on every machine.
+
+``HashEncoder`` stands in for the sentence-transformers model. A text's
+vector is the normalized sum of per-token pseudo-random vectors, so texts
+that share words are close in cosine space. That gives the clustering and
+retrieval code realistic structure to work on without a model download.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import random
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import MetaPattern, Optimization, PromptCluster, RepoFileIndex, RepoIndexMeta
+from app.services.embedding_service import EmbeddingService
+
+DIM = 384
+
+DOMAINS: tuple[str, ...] = (
+    "backend", "frontend", "database", "data", "devops", "security", "fullstack", "general",
+)
+TASK_TYPES: tuple[str, ...] = ("coding", "writing", "analysis", "creative", "data", "system", "general")
+
+_DOMAIN_WORDS: dict[str, tuple[str, ...]] = {
+    "backend": ("api", "endpoint", "service", "fastapi", "handler", "middleware", "queue", "worker"),
+    "frontend": ("component", "svelte", "react", "css", "layout", "state", "render", "form"),
+    "database": ("sql", "index", "migration", "schema", "query", "join", "transaction", "sqlite"),
+    "data": ("pipeline", "etl", "pandas", "dataset", "aggregate", "csv", "warehouse", "metric"),
+    "devops": ("docker", "deploy", "kubernetes", "ci", "terraform", "nginx", "monitoring", "helm"),
+    "security": ("auth", "token", "oauth", "encryption", "audit", "secret", "permission", "xss"),
+    "fullstack": ("app", "feature", "integration", "session", "upload", "dashboard", "search", "crud"),
+    "general": ("plan", "summary", "email", "outline", "explain", "compare", "list", "review"),
+}
+_FILLER = (
+    "please", "write", "build", "create", "improve", "a", "the", "for", "with", "that", "and",
+    "handles", "supports", "using", "clear", "robust", "simple", "fast", "small", "new",
+)
+
+
+class HashEncoder:
+    """Deterministic bag-of-words encoder with the SentenceTransformer ``encode`` API."""
+
+    def __init__(self, dim: int = DIM) -> None:
+        self.dim = dim
+        self._tokens: dict[str, np.ndarray] = {}
+
+    def _token(self, tok: str) -> np.ndarray:
+        vec = self._tokens.get(tok)
+        if vec is None:
+            seed = int.from_bytes(hashlib.blake2b(tok.encode(), digest_size=8).digest(), "big")
+            vec = np.random.default_rng(seed).standard_normal(self.dim).astype(np.float32)
+            self._tokens[tok] = vec
+        return vec
+
+    def _encode_one(self, text: str) -> np.ndarray:
+        toks = re.findall(r"[a-z0-9]+", text.lower())
+        if not toks:
+            return np.zeros(self.dim, dtype=np.float32)
+        vec = np.sum([self._token(t) for t in toks], axis=0)
+        return (vec / (np.linalg.norm(vec) + 1e-9)).astype(np.float32)
+
+    def encode(self, sentences: str | list[str], convert_to_numpy: bool = True, **_: Any) -> np.ndarray:
+        if isinstance(sentences, str):
+            return self._encode_one(sentences)
+        return np.vstack([self._encode_one(s) for s in sentences]) if sentences else np.empty((0, self.dim))
+
+
+@contextmanager
+def hash_embeddings(dim: int = DIM) -> Iterator[HashEncoder]:
+    """Swap ``EmbeddingService``'s shared model for a :class:`HashEncoder`."""
+    saved = (EmbeddingService._model, EmbeddingService._model_name, EmbeddingService._dimension)
+    encoder = HashEncoder(dim)
+    EmbeddingService._model = encoder
+    EmbeddingService._model_name = "benchmark-hash"
+    EmbeddingService._dimension = dim
+    try:
+        yield encoder
+    finally:
+        EmbeddingService._model, EmbeddingService._model_name, EmbeddingService._dimension = saved
+
+
+# ---------------------------------------------------------------------------
+# Prompt corpora
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Topic:
+    domain: str
+    task_type: str
+    words: tuple[str, ...]
+
+    @property
+    def label(self) -> str:
+        return " ".join(self.words).title()
+
+
+def make_topics(n: int, seed: int = 0) -> list[Topic]:
+    """*n* distinct topics, spread round-robin over the standard domains."""
+    rng = random.Random(seed)
+    topics: list[Topic] = []
+    seen: set[tuple[str, ...]] = set()
+    while len(topics) < n:
+        domain = DOMAINS[len(topics) % len(DOMAINS)]
+        words = tuple(sorted(rng.sample(_DOMAIN_WORDS[domain], 3))) + (f"t{len(topics)}",)
+        if words in seen:
+            continue
+        seen.add(words)
+        topics.append(Topic(domain, rng.choice(TASK_TYPES), words))
+    return topics
+
+
+def make_prompt(topic: Topic, rng: random.Random) -> str:
+    """One prompt about *topic*: its words plus filler, 25-60 words long."""
+    words = list(topic.words) * 2 + [rng.choice(_FILLER) for _ in range(rng.randint(17, 52))]
+    rng.shuffle(words)
+    return " ".join(words).capitalize() + "."
+
+
+def make_corpus(n: int, topics: list[Topic], seed: int = 1) -> list[str]:
+    rng = random.Random(seed)
+    return [make_prompt(rng.choice(topics), rng) for _ in range(n)]
+
+
+# ---------------------------------------------------------------------------
+# Database seeding
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class SeededTaxonomy:
+    topics: list[Topic]
+    domain_ids: dict[str, str] = field(default_factory=dict)
+    centroids: dict[str, np.ndarray] = field(default_factory=dict)
+
+
+async def seed_taxonomy(
+    db: AsyncSession,
+    encoder: HashEncoder,
+    n_clusters: int,
+    members_per_cluster: int,
+    seed: int = 0,
+) -> SeededTaxonomy:
+    """Domain nodes, active clusters with members and meta-patterns."""
+    rng = random.Random(seed)
+    seeded = SeededTaxonomy(topics=make_topics(n_clusters, seed))
+
+    for domain in DOMAINS:
+        node = PromptCluster(
+            label=domain, state="domain", domain=domain, task_type="general", persistence=1.0,
+        )
+        db.add(node)
+        await db.flush()
+        seeded.domain_ids[domain] = node.id
+
+    for topic in seeded.topics:
+        prompts = [make_prompt(topic, rng) for _ in range(members_per_cluster)]
+        vectors = encoder.encode(prompts)
+        centroid = vectors.mean(axis=0)
+        centroid = (centroid / (np.linalg.norm(centroid) + 1e-9)).astype(np.float32)
+        scores = [round(rng.uniform(5.5, 8.5), 2) for _ in prompts]
+        cluster = PromptCluster(
+            parent_id=seeded.domain_ids[topic.domain],
+            label=topic.label,
+            state="active",
+            domain=topic.domain,
+            task_type=topic.task_type,
+            centroid_embedding=centroid.tobytes(),
+            member_count=len(prompts),
+            scored_count=len(prompts),
+            avg_score=sum(scores) / len(scores),
+            coherence=0.8,
+        )
+        db.add(cluster)
+        await db.flush()
+        seeded.centroids[cluster.id] = centroid
+        for prompt, vec, score in zip(prompts, vectors, scores):
+            db.add(Optimization(
+                raw_prompt=prompt,
+                optimized_prompt=f"## Task\n{prompt}\n\n## Output\nA complete answer.",
+                task_type=topic.task_type,
+                domain=topic.domain,
+                strategy_used="chain-of-thought",
+                overall_score=score,
+                status="completed",
+                embedding=vec.astype(np.float32).tobytes(),
+                optimized_embedding=vec.astype(np.float32).tobytes(),
+                cluster_id=cluster.id,
+            ))
+        for i in range(2):
+            text = f"{topic.words[i]}: state {topic.words[i + 1]} requirements explicitly"
+            db.add(MetaPattern(
+                cluster_id=cluster.id,
+                pattern_text=text,
+                embedding=encoder.encode(text).tobytes(),
+                source_count=members_per_cluster,
+            ))
+    await db.commit()
+    return seeded
+
+
+_EXTENSIONS = ("py", "ts", "svelte", "md", "sql", "yaml")
+
+
+async def seed_repo_index(
+    db: AsyncSession,
+    encoder: HashEncoder,
+    repo_full_name: str,
+    branch: str,
+    n_files: int,
+    seed: int = 0,
+) -> list[str]:
+    """A ready ``RepoIndexMeta`` plus *n_files* indexed files; returns the paths."""
+    rng = random.Random(seed)
+    topics = make_topics(max(8, n_files // 20), seed)
+    paths: list[str] = []
+    for i in range(n_files):
+        topic = topics[i % len(topics)]
+        path = f"src/{topic.domain}/{topic.words[0]}_{i}.{rng.choice(_EXTENSIONS)}"
+        outline = f"{path}\n" + "\n".join(f"def {w}_{j}()" for j, w in enumerate(topic.words))
+        content = "\n".join(make_prompt(topic, rng) for _ in range(20))
+        db.add(RepoFileIndex(
+            repo_full_name=repo_full_name,
+            branch=branch,
+            file_path=path,
+            file_sha=hashlib.sha1(path.encode()).hexdigest(),
+            file_size_bytes=len(content),
+            content=content,
+            outline=outline,
+            embedding=encoder.encode(outline).tobytes(),
+        ))
+        paths.append(path)
+    db.add(RepoIndexMeta(
+        repo_full_name=repo_full_name,
+        branch=branch,
+        status="ready",
+        file_count=n_files,
+        head_sha="0" * 40,
+    ))
+    await db.commit()
+    return paths
+
@@ -0,0 +1,100 @@
+"""Verify the optimization-embedding split migration on an existing database.
+
+Bootstraps to ``d4e5f6a7b8c9`` (vectors still inline on ``optimizations``),
+seeds rows, then upgrades to head. Which vector columns exist inline depends
+on how the database was created (some were historically added by startup
+ALTERs), so seeding adds the missing ones first — the migration copies
+whatever it finds.
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, inspect, text
+
+from tests.migrations.test_template_migration import _alembic, _write_temp_ini
+
+_PRE_SPLIT_HEAD = "d4e5f6a7b8c9"
+_VECTOR_COLUMNS = (
+    "embedding",
+    "optimized_embedding",
+    "transformation_embedding",
+    "qualifier_embedding",
+)
+
+
+@pytest.fixture
+def pre_split_db(tmp_path):
+    db_path = tmp_path / "synthesis.db"
+    ini_path = _write_temp_ini(tmp_path, db_path)
+    try:
+        _alembic(["upgrade", _PRE_SPLIT_HEAD], ini_path)
+        engine = create_engine(f"sqlite:///{db_path}")
+        with engine.begin() as conn:
+            present = {c["name"] for c in inspect(conn).get_columns("optimizations")}
+            for name in _VECTOR_COLUMNS:
+                if name not in present:
+                    conn.execute(text(f"ALTER TABLE optimizations ADD COLUMN {name} BLOB"))
+        yield engine, ini_path
+        engine.dispose()
+    finally:
+        ini_path.unlink(missing_ok=True)
+
+
+def _seed(engine, opt_id: str, **vectors: bytes) -> None:
+    cols = ", ".join(["id", "raw_prompt", "created_at", "status", *vectors])
+    params = ", ".join([":id", "'raw'", "datetime('now')", "'completed'", *(f":{k}" for k in vectors)])
+    with engine.begin() as conn:
+        conn.execute(
+            text(f"INSERT INTO optimizations ({cols}) VALUES ({params})"),
+            {"id": opt_id, **vectors},
+        )
+
+
+def _upgrade(ini_path: Path) -> None:
+    _alembic(["upgrade", "head"], ini_path)
+
+
+def test_vectors_move_to_side_table(pre_split_db):
+    engine, ini_path = pre_split_db
+    _seed(engine, "o1", embedding=b"raw", optimized_embedding=b"opt",
+          qualifier_embedding=b"qual")
+    _seed(engine, "o2")  # no vectors → no side row
+    _upgrade(ini_path)
+
+    with engine.begin() as conn:
+        rows = conn.execute(text(
+            "SELECT optimization_id, embedding, optimized_embedding, "
+            "transformation_embedding, qualifier_embedding "
+            "FROM optimization_embeddings"
+        )).all()
+        columns = {c["name"] for c in inspect(conn).get_columns("optimizations")}
+        remaining = conn.execute(text("SELECT COUNT(*) FROM optimizations")).scalar()
+
+    assert rows == [("o1", b"raw", b"opt", None, b"qual")]
+    assert columns.isdisjoint(_VECTOR_COLUMNS)
+    assert remaining == 2
+
+
+def test_query_indexes_created_and_rerun_is_noop(pre_split_db):
+    engine, ini_path = pre_split_db
+    _seed(engine, "o1", embedding=b"raw")
+    _upgrade(ini_path)
+    _alembic(["stamp", _PRE_SPLIT_HEAD], ini_path)
+    _upgrade(ini_path)  # inspector guards make the second pass a no-op
+
+    with engine.begin() as conn:
+        indexes = {ix["name"] for ix in inspect(conn).get_indexes("optimizations")}
+        side_rows = conn.execute(text("SELECT COUNT(*) FROM optimization_embeddings")).scalar()
+
+    assert {
+        "ix_optimizations_created_at",
+        "ix_optimizations_status_created",
+        "ix_optimizations_cluster_created",
+        "ix_optimizations_cluster_score",
+        "ix_optimizations_project_created",
+        "ix_optimizations_trace_id",
+    } <= indexes
+    assert "ix_optimizations_project_id" not in indexes
+    assert side_rows == 1
@@ -0,0 +1,78 @@
+"""Optimization vectors stored in ``optimization_embeddings``."""
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import selectinload
+
+from app.models import Optimization, OptimizationEmbedding
+
+
+@pytest.mark.asyncio
+async def test_vector_attributes_round_trip_through_side_table(db_session):
+    db_session.add(Optimization(id="o1", raw_prompt="p", embedding=b"raw"))
+    db_session.add(Optimization(id="o2", raw_prompt="p"))
+    await db_session.commit()
+
+    side = (await db_session.execute(select(OptimizationEmbedding))).scalars().all()
+    assert [(v.optimization_id, v.embedding) for v in side] == [("o1", b"raw")]
+
+    o2 = await db_session.get(
+        Optimization, "o2", options=[selectinload(Optimization.vectors)],
+    )
+    assert o2.vectors is None and o2.embedding is None
+    o2.qualifier_embedding = b"qual"
+    await db_session.commit()
+    assert (await db_session.get(OptimizationEmbedding, "o2")).qualifier_embedding == b"qual"
+
+
+@pytest.mark.asyncio
+async def test_vector_attributes_work_in_column_queries(db_session):
+    db_session.add(Optimization(id="o1", raw_prompt="p", embedding=b"a", optimized_embedding=b"b"))
+    db_session.add(Optimization(id="o2", raw_prompt="p"))
+    await db_session.commit()
+
+    rows = (await db_session.execute(
+        select(Optimization.id, Optimization.embedding, Optimization.optimized_embedding)
+        .where(Optimization.embedding.isnot(None))
+    )).all()
+    assert [(r.id, r.embedding, r.optimized_embedding) for r in rows] == [("o1", b"a", b"b")]
+
+
+@pytest.mark.asyncio
+async def test_entity_queries_do_not_load_vectors_by_default(db_session):
+    db_session.add(Optimization(id="o1", raw_prompt="p", embedding=b"a"))
+    await db_session.commit()
+    db_session.expunge_all()
+
+    opt = (await db_session.execute(select(Optimization))).scalar_one()
+    with pytest.raises(InvalidRequestError):
+        opt.embedding  # noqa: B018
+
+    db_session.expunge_all()
+    opt = (await db_session.execute(
+        select(Optimization).options(selectinload(Optimization.vectors))
+    )).scalar_one()
+    assert opt.embedding == b"a"
+
+
+@pytest.mark.asyncio
+async def test_deleting_optimization_removes_vectors(db_session):
+    db_session.add(Optimization(id="o1", raw_prompt="p", embedding=b"a"))
+    await db_session.commit()
+
+    await db_session.delete(await db_session.get(Optimization, "o1"))
+    await db_session.commit()
+    assert (await db_session.execute(select(OptimizationEmbedding))).first() is None
+
+
+@pytest.mark.asyncio
+async def test_vectors_writable_after_flush_of_new_row(db_session):
+    opt = Optimization(id="o1", raw_prompt="p")
+    db_session.add(opt)
+    await db_session.flush()  # no lazy load of ``vectors`` under asyncio
+    assert opt.embedding is None
+    opt.embedding = b"late"
+    await db_session.commit()
+    assert (await db_session.get(OptimizationEmbedding, "o1")).embedding == b"late"
@@ -0,0 +1,222 @@
+"""Tests for assign_clusters_batch() — vectorized seed-batch assignment.
+
+The batch mode must reproduce what N sequential ``assign_cluster()`` calls
+would do (same grouping, same counts, centroids within float tolerance)
+while touching the DB once per cluster instead of once per item.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+
+import numpy as np
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Optimization, PromptCluster
+from app.services.taxonomy.family_ops import (
+    BatchAssignItem,
+    assign_cluster,
+    assign_clusters_batch,
+)
+
+EMBEDDING_DIM = 384
+
+
+def _unit(v: np.ndarray) -> np.ndarray:
+    return (v / np.linalg.norm(v)).astype(np.float32)
+
+
+def _items(seed: int = 3) -> list[BatchAssignItem]:
+    """Four tight topic groups across two domains, interleaved."""
+    rng = np.random.RandomState(seed)
+    centers = [_unit(rng.randn(EMBEDDING_DIM)) for _ in range(4)]
+    domains = ["backend", "backend", "frontend", "frontend"]
+    items = []
+    for i in range(24):
+        g = i % 4
+        emb = _unit(centers[g] + rng.randn(EMBEDDING_DIM).astype(np.float32) * 0.02)
+        items.append(BatchAssignItem(
+            embedding=emb,
+            label=f"topic-{g}",
+            domain=domains[g],
+            task_type="coding" if g % 2 == 0 else "writing",
+            overall_score=5.0 + (i % 5),
+        ))
+    return items
+
+
+@asynccontextmanager
+async def _fresh_db():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with maker() as session:
+        yield session
+    await engine.dispose()
+
+
+async def _seed_existing(db: AsyncSession, items: list[BatchAssignItem]) -> None:
+    """Pre-existing cluster close to group 0 so both merge and create paths run."""
+    db.add(PromptCluster(
+        label="existing",
+        domain="backend",
+        task_type="coding",
+        state="active",
+        centroid_embedding=items[0].embedding.tobytes(),
+        member_count=3,
+        weighted_member_sum=1.5,
+        scored_count=3,
+        avg_score=6.0,
+    ))
+    await db.flush()
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_sequential_assignment():
+    items = _items()
+
+    async with _fresh_db() as db:
+        await _seed_existing(db, items)
+        seq = [
+            await assign_cluster(
+                db, it.embedding, label=it.label, domain=it.domain,
+                task_type=it.task_type, overall_score=it.overall_score,
+            )
+            for it in items
+        ]
+        seq_groups = [c.label for c in seq]
+        seq_state = {
+            c.label: (c.member_count, np.frombuffer(c.centroid_embedding, dtype=np.float32))
+            for c in seq
+        }
+
+    async with _fresh_db() as db:
+        await _seed_existing(db, items)
+        result = await assign_clusters_batch(db, items)
+        batch_groups = [c.label for c in result.clusters]
+        batch_state = {
+            c.label: (c.member_count, np.frombuffer(c.centroid_embedding, dtype=np.float32))
+            for c in result.clusters
+        }
+        stored = (await db.execute(select(PromptCluster))).scalars().all()
+
+    assert batch_groups == seq_groups
+    assert batch_state.keys() == seq_state.keys()
+    for label, (count, centroid) in seq_state.items():
+        assert batch_state[label][0] == count
+        np.testing.assert_allclose(batch_state[label][1], centroid, atol=1e-5)
+    # Group 0 merged into the pre-existing cluster; three new clusters spawned.
+    assert "existing" in batch_groups
+    assert len(result.created) == 3
+    assert len(stored) == 4
+
+
+@pytest.mark.asyncio
+async def test_cross_domain_items_never_merge():
+    rng = np.random.RandomState(11)
+    emb = _unit(rng.randn(EMBEDDING_DIM))
+    items = [
+        BatchAssignItem(emb, "a", "backend", "coding", 7.0),
+        BatchAssignItem(emb, "b", "marketing", "coding", 7.0),
+    ]
+    async with _fresh_db() as db:
+        result = await assign_clusters_batch(db, items)
+    assert result.clusters[0] is not result.clusters[1]
+    assert len(result.created) == 2
+
+
+@pytest.mark.asyncio
+async def test_empty_batch():
+    async with _fresh_db() as db:
+        result = await assign_clusters_batch(db, [])
+    assert result.clusters == [] and result.created == []
+
+
+async def _seed_mixed_cluster(db: AsyncSession, centroid: np.ndarray) -> None:
+    """Existing cluster whose linked members hold a bare 'coding' majority."""
+    db.add(PromptCluster(
+        id="mixed",
+        label="existing",
+        domain="backend",
+        task_type="coding",
+        state="active",
+        centroid_embedding=centroid.tobytes(),
+        member_count=3,
+        weighted_member_sum=1.5,
+        scored_count=3,
+        avg_score=6.0,
+    ))
+    for i, ttype in enumerate(["coding", "coding", None]):
+        db.add(Optimization(id=f"m{i}", raw_prompt="p", task_type=ttype, cluster_id="mixed"))
+    await db.flush()
+
+
+@pytest.mark.asyncio
+async def test_mixed_task_types_match_sequential_assignment():
+    """Task-type majorities follow sequential assign_cluster() with write-back.
+
+    The sequential loop links each optimization to its cluster after the
+    call, so every recompute sees earlier items but not the current one.
+    """
+    rng = np.random.RandomState(5)
+    center = _unit(rng.randn(EMBEDDING_DIM))
+    types = ["writing", "writing", "writing"]
+    items = [
+        BatchAssignItem(
+            embedding=_unit(center + rng.randn(EMBEDDING_DIM).astype(np.float32) * 0.01),
+            label=f"item-{i}", domain="backend", task_type=t, overall_score=7.0,
+        )
+        for i, t in enumerate(types)
+    ]
+
+    async with _fresh_db() as db:
+        await _seed_mixed_cluster(db, center)
+        seq_groups = []
+        for i, it in enumerate(items):
+            opt = Optimization(id=f"o{i}", raw_prompt="p", task_type=it.task_type)
+            db.add(opt)
+            cluster = await assign_cluster(
+                db, it.embedding, label=it.label, domain=it.domain,
+                task_type=it.task_type, overall_score=it.overall_score,
+            )
+            opt.cluster_id = cluster.id
+            seq_groups.append(cluster.label)
+        seq_final = {c.label: c.task_type for c in (await db.execute(select(PromptCluster))).scalars()}
+
+    async with _fresh_db() as db:
+        await _seed_mixed_cluster(db, center)
+        for i, it in enumerate(items):
+            db.add(Optimization(id=f"o{i}", raw_prompt="p", task_type=it.task_type))
+        await db.flush()
+        result = await assign_clusters_batch(db, items)
+        batch_groups = [c.label for c in result.clusters]
+        batch_final = {c.label: c.task_type for c in (await db.execute(select(PromptCluster))).scalars()}
+
+    assert batch_groups == seq_groups == ["existing"] * 3
+    assert batch_final == seq_final
+    # The last recompute sees coding 2, NULL 1, writing 2: no majority.
+    assert batch_final["existing"] == "coding"
+
+
+@pytest.mark.asyncio
+async def test_bad_items_are_isolated():
+    items = _items()
+    bad = [
+        BatchAssignItem(np.full(EMBEDDING_DIM, np.nan, dtype=np.float32), "nan", "backend", "coding", 7.0),
+        BatchAssignItem(_unit(np.ones(16)), "short", "backend", "coding", 7.0),
+        BatchAssignItem(np.zeros(EMBEDDING_DIM, dtype=np.float32), "zero", "backend", "coding", 7.0),
+    ]
+
+    async with _fresh_db() as db:
+        clean = [c.label for c in (await assign_clusters_batch(db, items)).clusters]
+
+    async with _fresh_db() as db:
+        result = await assign_clusters_batch(db, [bad[0], *items[:12], bad[1], *items[12:], bad[2]])
+
+    labels = [c.label if c is not None else None for c in result.clusters]
+    assert labels[0] is None and labels[13] is None and labels[-1] is None
+    assert labels[1:13] + labels[14:-1] == clean
@@ -257,3 +257,42 @@ async def test_centroid_stays_normalized_after_multiple_merges(
     assert norm == pytest.approx(1.0, abs=1e-5), (
         f"Centroid norm drifted to {norm} after {family.member_count} merges"
     )
+
+
+@pytest.mark.asyncio
+async def test_process_optimization_spawned_by_listener_runs_at_background(
+    db, mock_embedding, mock_provider,
+):
+    """Provider calls inside listener-spawned extraction see BACKGROUND priority."""
+    from app.main import _spawn_background_task
+    from app.providers.concurrency import Priority, current_priority
+
+    seen: list[Priority] = []
+    default_result = mock_provider.complete_parsed.return_value
+
+    async def _record(**kwargs):
+        seen.append(current_priority())
+        return default_result
+
+    mock_provider.complete_parsed.side_effect = _record
+    engine = TaxonomyEngine(embedding_service=mock_embedding, provider=mock_provider)
+
+    opt = Optimization(
+        raw_prompt="Write unit tests for a Python service",
+        optimized_prompt="Write comprehensive unit tests...",
+        status="completed",
+        intent_label="Unit Testing",
+        domain="backend",
+        domain_raw="test automation",
+    )
+    db.add(opt)
+    await db.commit()
+
+    tasks: set = set()
+    await _spawn_background_task(
+        engine.process_optimization(opt.id, db), name="test-extract", tasks=tasks,
+    )
+
+    assert seen, "process_optimization made no provider call"
+    assert set(seen) == {Priority.BACKGROUND}
+    assert current_priority() == Priority.INTERACTIVE
@@ -0,0 +1,131 @@
+"""Tests for the incremental Q ledger behind the speculative-phase gates."""
+
+from __future__ import annotations
+
+import random
+from contextlib import asynccontextmanager
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import select, update
+
+from app.models import PromptCluster
+from app.services.taxonomy.q_ledger import QLedger
+from app.services.taxonomy.warm_path import _load_active_nodes, _run_speculative_phase
+from app.services.taxonomy.warm_phases import PhaseResult
+
+
+def _engine():
+    from app.services.taxonomy.engine import TaxonomyEngine
+
+    return TaxonomyEngine()
+
+
+async def _seed(db, n: int, rng: random.Random) -> list[PromptCluster]:
+    states = ["active", "active", "mature", "candidate", "archived", "domain"]
+    nodes = []
+    for i in range(n):
+        node = PromptCluster(
+            label=f"c{i}",
+            state=rng.choice(states),
+            coherence=rng.choice([None, float("nan"), rng.random()]),
+            separation=rng.choice([None, rng.random(), rng.random()]),
+        )
+        db.add(node)
+        nodes.append(node)
+    await db.commit()
+    return nodes
+
+
+async def _full_q(engine, db) -> float:
+    return engine._compute_q_from_nodes(
+        await _load_active_nodes(db, exclude_candidates=True)
+    )
+
+
+@asynccontextmanager
+async def _factory(db):
+    yield db
+
+
+@pytest.mark.asyncio
+async def test_ledger_q_is_bit_identical_to_full_recompute(db):
+    rng = random.Random(7)
+    engine = _engine()
+    nodes = await _seed(db, 60, rng)
+    ledger = QLedger()
+    ledger.rebuild(await _load_active_nodes(db))  # candidates filtered by the ledger
+    assert ledger.q_system() == await _full_q(engine, db)
+
+    for _ in range(20):
+        touched = rng.sample(nodes, 3)
+        for node in touched:
+            node.coherence = rng.random()
+            node.state = rng.choice(["active", "candidate", "archived", "mature"])
+        await db.commit()
+        await ledger.refresh(db, [n.id for n in touched])
+        assert ledger.q_system() == await _full_q(engine, db)
+
+
+@pytest.mark.asyncio
+async def test_speculative_phase_reprices_only_mutated_clusters(db):
+    rng = random.Random(11)
+    engine = _engine()
+    engine._warm_path_age = 1  # not a verify cycle
+    nodes = await _seed(db, 20, rng)
+    engine._q_ledger.rebuild(await _load_active_nodes(db))
+    target = next(n for n in nodes if n.state == "active")
+
+    async def nudge(eng, session, split_protected_ids, dirty_ids=None):
+        row = await session.get(PromptCluster, target.id)
+        row.coherence = 0.99
+        return PhaseResult(phase="nudge", q_before=0.0, q_after=0.0, accepted=False)
+
+    with patch(
+        "app.services.taxonomy.warm_path._load_active_nodes",
+        side_effect=AssertionError("full load on a non-verify cycle"),
+    ):
+        result = await _run_speculative_phase("nudge", nudge, engine, lambda: _factory(db))
+
+    assert result.mutated_cluster_ids == {target.id}
+    assert result.q_after == await _full_q(engine, db)
+
+
+@pytest.mark.asyncio
+async def test_rejected_phase_restores_ledger(db):
+    engine = _engine()
+    engine._warm_path_age = 1
+    db.add(PromptCluster(label="keep", state="active", coherence=0.9, separation=0.9))
+    await db.commit()
+    engine._q_ledger.rebuild(await _load_active_nodes(db))
+    q_start = engine._q_ledger.q_system()
+
+    async def archive_all(eng, session, split_protected_ids, dirty_ids=None):
+        for row in (await session.execute(select(PromptCluster))).scalars():
+            row.state = "archived"
+        return PhaseResult(phase="archive", q_before=0.0, q_after=0.0, accepted=False)
+
+    result = await _run_speculative_phase("archive", archive_all, engine, lambda: _factory(db))
+
+    assert result.accepted is False
+    assert engine._q_ledger.q_system() == q_start == await _full_q(engine, db)
+
+
+@pytest.mark.asyncio
+async def test_verify_cycle_catches_untracked_writes(db):
+    engine = _engine()
+    engine._warm_path_age = 0  # verify cycle
+    db.add(PromptCluster(label="a", state="active", coherence=0.9, separation=0.9))
+    await db.commit()
+    engine._q_ledger.rebuild(await _load_active_nodes(db))
+    # A writer the ledger can't see (Core UPDATE, another process).
+    await db.execute(update(PromptCluster).values(coherence=0.1))
+    await db.commit()
+
+    async def no_op(eng, session, split_protected_ids, dirty_ids=None):
+        return PhaseResult(phase="noop", q_before=0.0, q_after=0.0, accepted=False)
+
+    result = await _run_speculative_phase("noop", no_op, engine, lambda: _factory(db))
+
+    assert result.q_before == await _full_q(engine, db)
+    assert engine._q_ledger.synced is False  # rebuilt before next use
@@ -6,6 +6,7 @@ Covers:
 - Domain stability guards + dissolution risk
 - Engine ↔ readiness parity (same inputs ⇒ same decision)
 - TTL cache invalidation on member-count change
+- Incremental cascade counters (incremental result == full rebuild)
 
 Copyright 2025-2026 Project Synthesis contributors.
 """
@@ -684,3 +685,102 @@ class TestBatchAndParity:
         assert "auth" in created, (
             f"primitive reported ready but engine created {created!r}"
         )
+
+
+# ---------------------------------------------------------------------------
+# Incremental cascade counters
+# ---------------------------------------------------------------------------
+
+
+class TestIncrementalCascadeCounters:
+    @pytest.mark.asyncio
+    async def test_incremental_matches_full_rebuild(self, db):
+        """Inserts, moves, relabels, deletes and vocab edits stay exact."""
+        import random
+
+        from sqlalchemy import delete, select, update
+
+        from app.services.taxonomy import sub_domain_readiness as srv
+
+        rng = random.Random(11)
+        domain = await _seed_domain_with_opts(
+            db, "backend", [],
+            generated_qualifiers={"auth": ["oauth", "jwt"], "cache": ["redis"]},
+            signal_keywords=[["webhook", 0.9], ["queue", 0.6], ["rate limit", 0.7]],
+            cluster_count=3,
+        )
+        clusters_q = await db.execute(select(PromptCluster.id).where(PromptCluster.parent_id == domain.id))
+        cluster_ids = [r[0] for r in clusters_q.all()]
+        srv.clear_cache()
+
+        raws = [None, "backend: auth", "backend: cache", "backend: billing", "frontend"]
+        intents = [None, "Add OAuth JWT login", "Tune redis cache", "Misc"]
+        prompts = ["webhook queue", "a webhook", "rate limit the queue", "nothing here"]
+        opts: list[Optimization] = []
+        for step in range(5):
+            for _ in range(12):
+                opt = _make_opt(
+                    rng.choice(cluster_ids),
+                    domain_raw=rng.choice(raws),
+                    intent_label=rng.choice(intents),
+                    raw_prompt=rng.choice(prompts),
+                )
+                db.add(opt)
+                opts.append(opt)
+            await db.flush()
+            for opt in rng.sample(opts, 4):
+                await db.execute(
+                    update(Optimization).where(Optimization.id == opt.id).values(
+                        cluster_id=rng.choice(cluster_ids),
+                        intent_label=rng.choice(intents),
+                    )
+                )
+            for opt in rng.sample(opts, 2):
+                await db.execute(delete(Optimization).where(Optimization.id == opt.id))
+                opts.remove(opt)
+            if step == 3:
+                domain.cluster_metadata = write_meta(
+                    domain.cluster_metadata, signal_keywords=[["queue", 0.9]],
+                )
+            await db.flush()
+
+            incremental = await srv.compute_qualifier_cascade(db, domain)
+            srv.clear_cache()
+            rebuilt = await srv.compute_qualifier_cascade(db, domain)
+            assert incremental == rebuilt
+            assert incremental.total_opts == len(opts)
+            assert all(incremental.source_breakdown.values())
+
+    @pytest.mark.asyncio
+    async def test_only_changed_optimizations_are_rematched(self, db, monkeypatch):
+        from sqlalchemy import update
+
+        from app.services.taxonomy import sub_domain_readiness as srv
+
+        domain = await _seed_domain_with_opts(
+            db, "backend", [{"raw_prompt": "webhook retry"}] * 6,
+            signal_keywords=[["webhook", 0.9]],
+        )
+        srv.clear_cache()
+        first = await srv.compute_qualifier_cascade(db, domain)
+        assert first.qualifier_counts == {"webhook": 6}
+
+        matched: list[str | None] = []
+        original = srv._match_prompt
+        monkeypatch.setattr(
+            srv, "_match_prompt", lambda p, i, v: matched.append(p) or original(p, i, v),
+        )
+        again = await srv.compute_qualifier_cascade(db, domain)
+        assert again == first and matched == []
+
+        clusters = sorted(first.qualifier_to_cluster_ids["webhook"])
+        db.add(_make_opt(clusters[0], raw_prompt="plain prompt"))
+        await db.execute(
+            update(Optimization).where(Optimization.cluster_id == clusters[0]).values(cluster_id=clusters[1])
+        )
+        await db.flush()
+        moved = await srv.compute_qualifier_cascade(db, domain)
+
+        assert matched == ["plain prompt"]
+        assert moved.total_opts == 7
+        assert moved.qualifier_to_cluster_ids == {"webhook": {clusters[1]}}
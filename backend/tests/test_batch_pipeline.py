@@ -5,8 +5,9 @@ that the seed-alignment plan fixes:
     1. Resolved routing tier must be threaded end-to-end (not hardcoded).
     2. ContextEnrichmentService.enrich() is the single enrichment entry.
        The enrichment's divergence_alerts must reach the optimize render.
-    3. Each persisted row emits `optimization_created` on the event bus,
-       matching the regular pipeline's downstream contract.
+    3. Each bulk_persist call emits one aggregated
+       `optimization_batch_created` event carrying every inserted row's
+       `optimization_created`-shaped payload.
 """
 
 from __future__ import annotations
@@ -506,7 +507,7 @@ class TestContextEnrichmentIntegration:
 
 
 # ---------------------------------------------------------------------------
-# Tests — Fix 4: per-prompt optimization_created emission from bulk_persist
+# Tests — Fix 4: aggregated optimization_batch_created emission from bulk_persist
 # ---------------------------------------------------------------------------
 
 
@@ -587,16 +588,24 @@ async def real_session_factory() -> AsyncGenerator[Any, None]:
         await engine.dispose()
 
 
+def _drain(queue: asyncio.Queue) -> list[dict]:
+    captured: list[dict] = []
+    while not queue.empty():
+        captured.append(queue.get_nowait())
+    return captured
+
+
 class TestBulkPersistEvents:
-    """bulk_persist must emit an `optimization_created` event for every row
-    it actually inserts — matching the regular pipeline's contract so the
-    frontend history refresh and cross-process MCP bridge fire reliably."""
+    """bulk_persist must emit one `optimization_batch_created` event per call
+    whose `optimizations` list carries a payload for every row it actually
+    inserts — the same fields as the regular pipeline's
+    `optimization_created`, so listeners that need per-id data still get it."""
 
-    async def test_emits_one_event_per_inserted_row(
+    async def test_emits_one_batch_event_for_inserted_rows(
         self, real_session_factory: Any,
     ) -> None:
-        """Subscribe a queue to the event bus and assert N events fire for
-        N completed + quality-passing rows.
+        """Subscribe a queue to the event bus and assert a single batch event
+        carries N payloads for N completed + quality-passing rows.
         """
         from app.services.event_bus import event_bus
 
@@ -619,25 +628,22 @@ class TestBulkPersistEvents:
 
         assert inserted == 3
 
-        # Drain captured events
-        captured: list[dict] = []
-        while not queue.empty():
-            captured.append(queue.get_nowait())
-
-        opt_events = [e for e in captured if e["event"] == "optimization_created"]
-        assert len(opt_events) == 3, (
-            f"Expected 3 optimization_created events, got {len(opt_events)}: "
+        captured = _drain(queue)
+        assert not [e for e in captured if e["event"] == "optimization_created"]
+        batch_events = [e for e in captured if e["event"] == "optimization_batch_created"]
+        assert len(batch_events) == 1, (
+            f"Expected 1 optimization_batch_created event, got {len(batch_events)}: "
             f"{[e['event'] for e in captured]}"
         )
-
-        # Event data must carry the key fields consumers rely on
-        ids = {e["data"]["id"] for e in opt_events}
-        assert ids == {"opt-a", "opt-b", "opt-c"}
-
-        for evt in opt_events:
-            data = evt["data"]
-            assert data["batch_id"] == "batch-1"
-            assert data["source"] == "batch_seed"
+        batch = batch_events[0]["data"]
+        assert batch["batch_id"] == "batch-1"
+        assert batch["source"] == "batch_seed"
+        assert batch["count"] == 3
+
+        # Per-row payloads must carry the key fields consumers rely on
+        rows = batch["optimizations"]
+        assert {r["id"] for r in rows} == {"opt-a", "opt-b", "opt-c"}
+        for data in rows:
             assert data["routing_tier"] == "internal"
             assert data["task_type"] == "coding"
             assert data["status"] == "completed"
@@ -647,11 +653,44 @@ class TestBulkPersistEvents:
             assert data["domain"] == "backend"
             assert data["overall_score"] == 7.5
 
-    async def test_no_event_for_quality_rejected_rows(
+    async def test_seeded_rows_reach_taxonomy_listener(
+        self, real_session_factory: Any,
+    ) -> None:
+        """The app's taxonomy listener (promotion check, strategy affinity)
+        must dispatch every row announced by the batch event, exactly like
+        one ``optimization_created`` per row."""
+        from app.main import _created_optimization_ids
+        from app.services.event_bus import event_bus
+
+        pendings = [
+            _pending(pid="opt-a", trace_id="trace-a", batch_id="batch-1"),
+            _pending(pid="opt-b", trace_id="trace-b", batch_id="batch-1"),
+        ]
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=100)
+        event_bus._subscribers.add(queue)
+        try:
+            await bulk_persist(
+                results=pendings,
+                session_factory=real_session_factory,
+                batch_id="batch-1",
+            )
+        finally:
+            event_bus._subscribers.discard(queue)
+
+        dispatched = [
+            oid for e in _drain(queue) for oid in _created_optimization_ids(e)
+        ]
+        assert dispatched == ["opt-a", "opt-b"]
+        assert _created_optimization_ids(
+            {"event": "optimization_created", "data": {"id": "opt-x"}},
+        ) == ["opt-x"]
+
+    async def test_no_payload_for_quality_rejected_rows(
         self, real_session_factory: Any,
     ) -> None:
-        """Rows rejected by the quality gate (score < 5.0) must NOT emit
-        an optimization_created event — they never reach the DB."""
+        """Rows rejected by the quality gate (score < 5.0) must NOT appear in
+        the batch event — they never reach the DB."""
         from app.services.event_bus import event_bus
 
         # Two rejected, one accepted
@@ -683,12 +722,11 @@ class TestBulkPersistEvents:
 
         assert inserted == 1
 
-        captured: list[dict] = []
-        while not queue.empty():
-            captured.append(queue.get_nowait())
-        opt_events = [e for e in captured if e["event"] == "optimization_created"]
-        assert len(opt_events) == 1
-        assert opt_events[0]["data"]["id"] == "opt-ok"
+        batch_events = [
+            e for e in _drain(queue) if e["event"] == "optimization_batch_created"
+        ]
+        assert len(batch_events) == 1
+        assert [r["id"] for r in batch_events[0]["data"]["optimizations"]] == ["opt-ok"]
 
     async def test_idempotency_skips_re_emission(
         self, real_session_factory: Any,
@@ -723,14 +761,76 @@ class TestBulkPersistEvents:
 
         assert inserted_2 == 0
 
-        captured: list[dict] = []
-        while not queue.empty():
-            captured.append(queue.get_nowait())
-        opt_events = [e for e in captured if e["event"] == "optimization_created"]
-        assert len(opt_events) == 0, (
-            "Idempotent second run must not re-emit optimization_created"
+        batch_events = [
+            e for e in _drain(queue) if e["event"] == "optimization_batch_created"
+        ]
+        assert len(batch_events) == 0, (
+            "Idempotent second run must not re-emit optimization_batch_created"
         )
 
+    async def test_rows_committed_in_chunks(
+        self, real_session_factory: Any, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Rows are inserted in `_PERSIST_CHUNK_SIZE` chunks and all land."""
+        from sqlalchemy import func, select
+
+        from app.models import Optimization
+        from app.services import batch_pipeline
+
+        monkeypatch.setattr(batch_pipeline, "_PERSIST_CHUNK_SIZE", 2)
+        pendings = [
+            _pending(pid=f"opt-{i}", trace_id=f"trace-{i}", batch_id="batch-4")
+            for i in range(5)
+        ]
+        inserted = await bulk_persist(
+            results=pendings,
+            session_factory=real_session_factory,
+            batch_id="batch-4",
+        )
+        assert inserted == 5
+        async with real_session_factory() as db:
+            count = (await db.execute(select(func.count(Optimization.id)))).scalar()
+            row = (await db.execute(
+                select(Optimization).where(Optimization.id == "opt-3")
+            )).scalar_one()
+        assert count == 5
+        assert row.created_at is not None
+        assert row.context_sources == {"batch_id": "batch-4", "source": "batch_seed"}
+
+
+class TestBatchTaxonomyAssign:
+    async def test_writes_cluster_ids_and_join_rows_in_bulk(
+        self, real_session_factory: Any,
+    ) -> None:
+        """Cluster write-back and join rows come from the in-memory results."""
+        from sqlalchemy import select
+
+        from app.models import Optimization, OptimizationPattern
+        from app.services.batch_pipeline import batch_taxonomy_assign
+
+        rng = np.random.default_rng(7)
+        pendings = []
+        for i in range(3):
+            vec = rng.standard_normal(384).astype(np.float32)
+            vec /= np.linalg.norm(vec)
+            p = _pending(pid=f"opt-t{i}", trace_id=f"trace-t{i}", batch_id="batch-5")
+            p.embedding = vec.tobytes()
+            pendings.append(p)
+        await bulk_persist(
+            results=pendings, session_factory=real_session_factory, batch_id="batch-5",
+        )
+
+        summary = await batch_taxonomy_assign(pendings, real_session_factory, "batch-5")
+
+        assert summary["clusters_assigned"] == 3
+        async with real_session_factory() as db:
+            opts = (await db.execute(select(Optimization))).scalars().all()
+            links = (await db.execute(select(OptimizationPattern))).scalars().all()
+        assert all(o.cluster_id for o in opts)
+        assert {(lk.optimization_id, lk.cluster_id) for lk in links} == {
+            (o.id, o.cluster_id) for o in opts
+        }
+
 
 # ---------------------------------------------------------------------------
 # Tests — Fix 5: ClassificationAgreement recording
@@ -0,0 +1,93 @@
+"""Tests for the offline benchmark suite (``backend/benchmarks``)."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.schemas.pipeline_contracts import AnalysisResult, OptimizationResult, ScoreResult
+from benchmarks.__main__ import main
+from benchmarks.harness import ScenarioResult, compare, load_baseline, percentile, write_baseline
+from benchmarks.scenarios import SCALES, bench_pattern_injection, bench_pipeline
+from benchmarks.stub_provider import StubProvider
+from benchmarks.synthetic import HashEncoder, make_corpus, make_topics
+
+
+def _result(**overrides) -> ScenarioResult:
+    values = dict(
+        scenario="pipeline", scale="tiny", ops=10, total_s=1.0, throughput=10.0,
+        p50_ms=50.0, p95_ms=80.0, p99_ms=90.0, max_ms=95.0, peak_mem_mb=10.0,
+    )
+    values.update(overrides)
+    return ScenarioResult(**values)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("schema", [AnalysisResult, OptimizationResult, ScoreResult])
+async def test_stub_provider_is_deterministic_and_valid(schema) -> None:
+    provider = StubProvider()
+    a = await provider.complete_parsed("m", "sys", "Write a parser", schema)
+    b = await provider.complete_parsed("m", "sys", "Write a parser", schema)
+    c = await provider.complete_parsed("m", "sys", "Write a lexer", schema)
+    assert isinstance(a, schema)
+    assert a == b and a != c
+    assert provider.calls == 3 and provider.last_usage.output_tokens > 0
+
+
+def test_synthetic_data_is_seeded_and_clustered() -> None:
+    topics = make_topics(16)
+    assert make_corpus(5, topics) == make_corpus(5, topics)
+    enc = HashEncoder()
+    base = " ".join(topics[0].words)
+    same, other = enc.encode([base + " please", " ".join(topics[1].words)])
+    assert float(np.dot(enc.encode(base), same)) > float(np.dot(enc.encode(base), other))
+
+
+def test_percentile_nearest_rank() -> None:
+    values = [float(v) for v in range(1, 101)]
+    assert (percentile(values, 50), percentile(values, 95), percentile(values, 100)) == (50, 95, 100)
+    assert percentile([], 50) == 0.0
+
+
+def test_compare_flags_regressions_beyond_tolerance_and_noise_floor() -> None:
+    baseline = {"pipeline@tiny": {"p50_ms": 50.0, "p95_ms": 80.0, "throughput": 10.0, "peak_mem_mb": 10.0}}
+
+    assert compare([_result(p95_ms=95.0)], baseline, 0.25) == []
+    slow = compare([_result(p95_ms=120.0, throughput=7.0)], baseline, 0.25)
+    assert {r.metric for r in slow} == {"p95_ms", "throughput"}
+    # +100% but under the 1 ms floor: noise, not a regression.
+    tiny = {"pipeline@tiny": {"p50_ms": 0.4}}
+    assert compare([_result(p50_ms=0.8)], tiny, 0.25) == []
+    assert compare([_result(scale="small", p95_ms=999.0)], baseline, 0.25) == []
+
+
+def test_baseline_round_trip_merges(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    write_baseline(path, [_result()])
+    write_baseline(path, [_result(scenario="cold_path", p50_ms=7.0)])
+    stored = load_baseline(path)
+    assert set(stored) == {"pipeline@tiny", "cold_path@tiny"}
+    assert stored["cold_path@tiny"]["p50_ms"] == 7.0
+
+
+@pytest.mark.asyncio
+async def test_tiny_scenarios_run_offline() -> None:
+    pipeline = await bench_pipeline(SCALES["tiny"])
+    assert pipeline.ops == SCALES["tiny"].requests and pipeline.p50_ms > 0
+    assert pipeline.extra["llm_calls_per_run"] >= 3
+    injection = await bench_pattern_injection(SCALES["tiny"])
+    assert injection.extra["avg_patterns"] > 0
+
+
+def test_cli_fails_on_regression(tmp_path: Path, capsys) -> None:
+    baseline = tmp_path / "baseline.json"
+    argv = ["--scale", "tiny", "--scenario", "repo_relevant_files", "--baseline", str(baseline)]
+    assert main([*argv, "--update-baseline"]) == 0
+
+    stored = load_baseline(baseline)["repo_relevant_files@tiny"]
+    write_baseline(baseline, [_result(
+        scenario="repo_relevant_files",
+        **{**stored, "throughput": stored["throughput"] * 10},
+    )])
+    assert main(argv) == 1
+    assert "regression" in capsys.readouterr().err
@@ -341,6 +341,23 @@ class TestClusterRecluster:
         assert data["status"] == "completed"
         assert data["snapshot_id"] == "snap-1"
 
+    @pytest.mark.asyncio
+    async def test_recluster_on_follower_worker_is_forwarded(self, app_client, db_session, monkeypatch):
+        """A follower worker asks the taxonomy leader instead of running the cold path."""
+        from app.main import app
+
+        mock_engine = AsyncMock()
+        monkeypatch.setattr(app.state, "worker_coordinator", MagicMock(is_leader=False), raising=False)
+
+        with patch("app.routers.clusters._get_engine", return_value=mock_engine), \
+             patch("app.routers.clusters.event_bus") as bus:
+            resp = await app_client.post("/api/clusters/recluster")
+
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "queued"
+        bus.publish.assert_called_once_with("recluster_requested", {"trigger": "manual"})
+        mock_engine.run_cold_path.assert_not_called()
+
 
 class TestClusterTemplates:
     @pytest.mark.asyncio
@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import numpy as np
 import pytest
 
+from app.config import settings
 from app.services.codebase_explorer import CodebaseExplorer, ExploreOutput
 
 
@@ -251,6 +252,54 @@ async def test_explore_uses_cache(tmp_path):
     assert provider.complete_parsed.call_count == 2
 
 
+@pytest.mark.asyncio
+async def test_explore_semantic_cache_reuses_rephrased_prompt(tmp_path, monkeypatch):
+    """A rephrased prompt on the same HEAD reuses the prior synthesis."""
+    from app.services.codebase_explorer import ExploreOutput, _explore_cache
+
+    _explore_cache._store.clear()
+    monkeypatch.setattr(settings, "EXPLORE_SEMANTIC_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "EXPLORE_SEMANTIC_CACHE_THRESHOLD", 0.9)
+
+    loader = _make_prompt_loader(tmp_path)
+    gc = AsyncMock()
+    gc.get_branch_head_sha = AsyncMock(return_value="sha1")
+    gc.get_tree = AsyncMock(return_value=[
+        {"path": "src/main.py", "type": "blob", "sha": "a1", "size": 100},
+    ])
+    gc.get_file_content = AsyncMock(return_value="def main(): pass")
+
+    base = np.zeros(384, dtype=np.float32)
+    base[0] = 1.0
+    near = base.copy()
+    near[1] = 0.1
+    far = np.zeros(384, dtype=np.float32)
+    far[2] = 1.0
+    es = MagicMock()
+    es.aembed_single = AsyncMock(side_effect=[base, near, far])
+    es.aembed_texts = AsyncMock(return_value=[np.zeros(384)])
+    es.cosine_search = MagicMock(return_value=[(0, 0.9)])
+
+    provider = AsyncMock()
+    provider.complete_parsed = AsyncMock(
+        return_value=ExploreOutput(context="Synthesized context")
+    )
+    explorer = CodebaseExplorer(
+        prompt_loader=loader, github_client=gc, embedding_service=es, provider=provider,
+    )
+
+    await explorer.explore("Add retries to the client", "owner/repo", "main", "token")
+    result = await explorer.explore("Add retry logic to the client", "owner/repo", "main", "token")
+    assert result == "Synthesized context"
+    assert provider.complete_parsed.call_count == 1
+    # Prompt embedding is computed once per explore and reused for ranking
+    assert es.aembed_single.await_count == 2
+
+    await explorer.explore("Document the CLI flags", "owner/repo", "main", "token")
+    assert provider.complete_parsed.call_count == 2
+    assert _explore_cache.stats()["semantic_hits"] >= 1
+
+
 # ---------------------------------------------------------------------------
 # Test 5: explore logs per-call budget utilization before the LLM call
 # ---------------------------------------------------------------------------
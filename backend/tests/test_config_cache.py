@@ -0,0 +1,178 @@
+"""Tests for the in-memory config file cache and its invalidation paths."""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from watchfiles import Change
+
+from app.services import config_cache as config_cache_mod
+from app.services.config_cache import ConfigFileCache
+from app.services.file_watcher import _watch_config_root
+from app.services.preferences import PreferencesService
+from app.services.strategy_loader import StrategyLoader
+
+
+def _write_settled(path: Path, text: str, age_s: int = 60) -> None:
+    """Write *text* and backdate the mtime so the entry is not racy."""
+    path.write_text(text, encoding="utf-8")
+    past = path.stat().st_mtime_ns - age_s * 1_000_000_000
+    os.utime(path, ns=(past, past))
+
+
+@pytest.fixture
+def cache() -> ConfigFileCache:
+    return ConfigFileCache()
+
+
+@pytest.fixture
+def count_stats(monkeypatch):
+    calls: list[str] = []
+    original = config_cache_mod._stat
+    monkeypatch.setattr(config_cache_mod, "_stat", lambda p: calls.append(p) or original(p))
+    return calls
+
+
+class TestRead:
+    def test_parses_once_until_file_changes(self, cache, tmp_path):
+        path = tmp_path / "manifest.json"
+        _write_settled(path, '{"a": 1}')
+        parses: list[str] = []
+
+        def parse(text: str) -> dict:
+            parses.append(text)
+            return json.loads(text)
+
+        assert cache.read(path, parse) == {"a": 1}
+        assert cache.read(path, parse) == {"a": 1}
+        assert len(parses) == 1
+
+        _write_settled(path, '{"a": 22}', age_s=30)
+        assert cache.read(path, parse) == {"a": 22}
+        assert len(parses) == 2
+
+    def test_missing_file_is_cached_until_created(self, cache, tmp_path):
+        path = tmp_path / "optional.md"
+        assert cache.read(path) is None
+        assert cache.read(path) is None
+        _write_settled(path, "hello")
+        assert cache.read(path) == "hello"
+
+    def test_recently_modified_file_is_reread(self, cache, tmp_path):
+        path = tmp_path / "t.md"
+        path.write_text("aaaa", encoding="utf-8")
+        assert cache.read(path) == "aaaa"
+        # Same size and possibly the same coarse mtime — must still be seen
+        path.write_text("bbbb", encoding="utf-8")
+        assert cache.read(path) == "bbbb"
+
+    def test_parse_errors_are_not_cached(self, cache, tmp_path):
+        path = tmp_path / "bad.json"
+        _write_settled(path, "{not json")
+        with pytest.raises(json.JSONDecodeError):
+            cache.read(path, json.loads)
+        _write_settled(path, "[]", age_s=30)
+        assert cache.read(path, json.loads) == []
+
+    def test_watched_root_skips_stat_until_invalidated(self, cache, tmp_path, count_stats):
+        path = tmp_path / "t.md"
+        _write_settled(path, "v1")
+        cache.watch(tmp_path)
+        assert cache.read(path) == "v1"
+        count_stats.clear()
+
+        for _ in range(5):
+            assert cache.read(path) == "v1"
+        assert count_stats == []
+
+        _write_settled(path, "v2", age_s=30)
+        assert cache.read(path) == "v1"  # trusted until the watcher reports it
+        cache.invalidate(path)
+        assert cache.read(path) == "v2"
+
+        cache.unwatch(tmp_path)
+        count_stats.clear()
+        cache.read(path)
+        assert count_stats
+
+
+class TestListdir:
+    def test_follows_added_and_removed_files(self, cache, tmp_path):
+        (tmp_path / "b.md").write_text("b")
+        (tmp_path / "a.md").write_text("a")
+        (tmp_path / "notes.txt").write_text("x")
+        assert cache.listdir(tmp_path, ".md") == ["a", "b"]
+
+        (tmp_path / "c.md").write_text("c")
+        (tmp_path / "a.md").unlink()
+        assert cache.listdir(tmp_path, ".md") == ["b", "c"]
+
+    def test_missing_directory(self, cache, tmp_path):
+        assert cache.listdir(tmp_path / "nope", ".md") is None
+
+    def test_invalidating_a_file_drops_its_directory_listing(self, cache, tmp_path):
+        (tmp_path / "a.md").write_text("a")
+        cache.watch(tmp_path)
+        assert cache.listdir(tmp_path, ".md") == ["a"]
+        (tmp_path / "b.md").write_text("b")
+        cache.invalidate(tmp_path / "b.md")
+        assert cache.listdir(tmp_path, ".md") == ["a", "b"]
+
+
+class TestConsumers:
+    def test_strategy_file_read_once_for_body_and_metadata(self, tmp_path):
+        _write_settled(
+            tmp_path / "chain.md",
+            "---\ntagline: reasoning\ndescription: Think step by step.\n---\n\n# Chain\nBody.\n",
+        )
+        loader = StrategyLoader(tmp_path)
+        with patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as reads:
+            for _ in range(3):
+                assert loader.load("chain") == "# Chain\nBody."
+                assert loader.load_metadata("chain")["tagline"] == "reasoning"
+        assert reads.call_count == 1
+
+    def test_preferences_load_does_not_rewrite_unchanged_file(self, tmp_path):
+        svc = PreferencesService(data_dir=tmp_path)
+        svc.load()  # creates the file
+        with patch.object(PreferencesService, "_write") as write:
+            first = svc.load()
+            first["models"]["analyzer"] = "mutated"
+            assert svc.load()["models"]["analyzer"] == "sonnet"
+        write.assert_not_called()
+
+    def test_preferences_save_is_visible_to_next_load(self, tmp_path):
+        svc = PreferencesService(data_dir=tmp_path)
+        config_cache_mod.config_cache.watch(tmp_path / "preferences.json")
+        try:
+            svc.load()
+            svc.patch({"models": {"analyzer": "haiku"}})
+            assert svc.load()["models"]["analyzer"] == "haiku"
+        finally:
+            config_cache_mod.config_cache.unwatch(tmp_path / "preferences.json")
+
+
+@pytest.mark.asyncio
+async def test_watcher_trusts_root_only_while_live(tmp_path):
+    cache = ConfigFileCache()
+    states: list[int] = []
+
+    async def mock_awatch(*args, **kwargs):
+        states.append(cache.stats()["watched_roots"])
+        yield set()  # rust timeout — watcher is live
+        states.append(cache.stats()["watched_roots"])
+        yield {(Change.modified, str(tmp_path / "t.md"))}
+        raise asyncio.CancelledError()
+
+    with patch("app.services.file_watcher.config_cache", cache), \
+         patch("app.services.file_watcher.awatch", side_effect=mock_awatch), \
+         patch.object(cache, "invalidate", wraps=cache.invalidate) as invalidate:
+        with pytest.raises(asyncio.CancelledError):
+            await _watch_config_root(tmp_path, tmp_path, recursive=True)
+
+    assert states == [0, 1]
+    invalidate.assert_any_call(str(tmp_path / "t.md"))
+    assert cache.stats()["watched_roots"] == 0
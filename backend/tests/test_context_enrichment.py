@@ -1225,3 +1225,115 @@ class TestHybridRelevance:
         )
         assert info["reason"] == "domain_match"
         assert info["domain_overlap"] >= 1
+
+
+# ---------------------------------------------------------------------------
+# Concurrent sources with per-source budgets
+# ---------------------------------------------------------------------------
+
+
+class TestConcurrentSources:
+    """Independent enrichment sources run concurrently under their own deadlines."""
+
+    @pytest.mark.asyncio
+    async def test_source_timings_recorded(self, db, tmp_path):
+        for _ in range(10):
+            await _seed_optimization(db, "auto", "coding", "backend", 7.0)
+        await db.commit()
+
+        service = _build_service(tmp_path)
+        result = await service.enrich(
+            raw_prompt="Implement a REST API endpoint for user login",
+            tier="passthrough", db=db,
+        )
+        timings = dict(result.enrichment_meta)["source_timings"]
+        for name in ("heuristic_analysis", "optimization_count",
+                     "strategy_intelligence", "applied_patterns"):
+            assert timings[name]["status"] == "ok"
+            assert timings[name]["elapsed_ms"] >= 0
+        assert "sources_timed_out" not in result.enrichment_meta
+
+    @pytest.mark.asyncio
+    async def test_slow_source_times_out_gracefully(self, db, tmp_path, monkeypatch):
+        import asyncio
+
+        from app.config import settings
+
+        for _ in range(10):
+            await _seed_optimization(db, "auto", "coding", "backend", 7.0)
+        await db.commit()
+
+        monkeypatch.setitem(settings.ENRICHMENT_SOURCE_BUDGETS, "applied_patterns", 0.05)
+        service = _build_service(tmp_path)
+
+        async def _slow_patterns(*_a, **_kw):
+            await asyncio.sleep(5)
+            return "never", None
+
+        service._resolve_patterns = _slow_patterns
+
+        result = await service.enrich(
+            raw_prompt="Implement a REST API endpoint for user login",
+            tier="passthrough", db=db,
+        )
+        meta = dict(result.enrichment_meta)
+        assert result.applied_patterns is None
+        assert meta["source_timings"]["applied_patterns"]["status"] == "timeout"
+        assert meta["sources_timed_out"] == ["applied_patterns"]
+        # Other layers are unaffected by the timeout
+        assert result.strategy_intelligence is not None
+
+    @pytest.mark.asyncio
+    async def test_sources_overlap_with_session_factory(self, tmp_path, monkeypatch):
+        import asyncio
+        import time
+
+        from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+        from app.models import Base
+        from app.services import context_enrichment as ce
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'enrich.db'}")
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with factory() as seed_db:
+            for _ in range(10):
+                await _seed_optimization(seed_db, "auto", "coding", "backend", 7.0)
+            await seed_db.commit()
+
+        async def _slow_si(*_a, **_kw):
+            await asyncio.sleep(0.3)
+            return "intel", False
+
+        async def _slow_patterns(*_a, **_kw):
+            await asyncio.sleep(0.3)
+            return "patterns", None
+
+        monkeypatch.setattr(ce, "resolve_strategy_intelligence", _slow_si)
+        service = ContextEnrichmentService(
+            prompts_dir=tmp_path,
+            data_dir=tmp_path,
+            workspace_intel=WorkspaceIntelligence(),
+            embedding_service=AsyncMock(),
+            heuristic_analyzer=HeuristicAnalyzer(),
+            github_client=AsyncMock(),
+            session_factory=factory,
+        )
+        service._resolve_patterns = _slow_patterns
+
+        try:
+            async with factory() as db:
+                t0 = time.monotonic()
+                result = await service.enrich(
+                    raw_prompt="Implement a REST API endpoint for user login",
+                    tier="passthrough", db=db,
+                )
+                elapsed = time.monotonic() - t0
+        finally:
+            await engine.dispose()
+
+        assert result.strategy_intelligence == "intel"
+        assert result.applied_patterns == "patterns"
+        # Bounded by the slowest source, not the sum of both
+        assert elapsed < 0.55
@@ -217,3 +217,55 @@ def test_shutdown_suppresses_publish(bus: EventBus) -> None:
     bus.publish("after", {})
     # Sequence should not advance
     assert bus.current_sequence == 1
+
+
+def test_frame_rendered_once_at_publish(bus: EventBus) -> None:
+    """Every reader shares the same pre-rendered SSE frame."""
+    bus.publish("frame_test", {"n": 1})
+    a = bus.cursor(0).drain()
+    b = bus.cursor(0).drain()
+    assert a[0] is b[0]
+    assert a[0].frame == 'id: 1\nevent: frame_test\ndata: {"n": 1}\n\n'
+
+
+def test_frame_falls_back_to_str_for_unserializable(bus: EventBus) -> None:
+    from datetime import datetime
+
+    bus.publish("dt", {"at": datetime(2026, 1, 1)})
+    assert "2026-01-01 00:00:00" in bus.cursor(0).drain()[0].frame
+
+
+def test_cursor_skips_ahead_when_behind() -> None:
+    """A reader lapped by the ring resumes at the oldest retained event."""
+    from app.services.event_bus import _REPLAY_BUFFER_SIZE
+
+    bus = EventBus()
+    cursor = bus.cursor()
+    for i in range(_REPLAY_BUFFER_SIZE + 10):
+        bus.publish("x", {"i": i})
+    events = cursor.drain()
+    assert len(events) == _REPLAY_BUFFER_SIZE
+    assert events[0].seq == 11
+    assert cursor.drain() == []
+
+
+@pytest.mark.asyncio
+async def test_cursor_wait_wakes_on_publish_and_times_out(bus: EventBus) -> None:
+    cursor = bus.cursor()
+    assert await cursor.wait(timeout=0.01) is False
+
+    waiter = asyncio.create_task(cursor.wait(timeout=2.0))
+    await asyncio.sleep(0.01)
+    bus.publish("wake", {})
+    assert await waiter is True
+    assert [e.payload["event"] for e in cursor.drain()] == ["wake"]
+    assert not bus._waiters
+
+
+def test_reader_counts_as_subscriber_until_closed(bus: EventBus) -> None:
+    bus.publish("before", {})
+    assert bus.subscriber_count == 0
+    with bus.reader(0) as cursor:
+        assert bus.subscriber_count == 1
+        assert [e.payload["event"] for e in cursor.drain()] == ["before"]
+    assert bus.subscriber_count == 0
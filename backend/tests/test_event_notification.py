@@ -0,0 +1,140 @@
+"""Tests for the batched MCP → backend event forwarder."""
+
+import asyncio
+
+import pytest
+
+from app.services import event_notification
+from app.services.event_notification import EventForwarder
+
+
+class _RecordingForwarder(EventForwarder):
+    def __init__(self, fail_times: int = 0, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.batches: list[list[str]] = []
+        self._fail_times = fail_times
+
+    async def _send(self, batch):
+        if self._fail_times:
+            self._fail_times -= 1
+            raise ConnectionError("backend down")
+        self.batches.append([evt["data"]["i"] for evt in batch])
+
+
+@pytest.fixture(autouse=True)
+def _fast_retry(monkeypatch):
+    monkeypatch.setattr(event_notification, "_RETRY_BASE_SECONDS", 0.01)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_returns_immediately_and_batches_in_order():
+    fwd = _RecordingForwarder(max_batch=4)
+    for i in range(10):
+        fwd.enqueue("optimization_status", {"i": i})
+    assert fwd.stats()["buffered"] == 10
+
+    assert await fwd.flush(timeout=2.0)
+    assert [i for batch in fwd.batches for i in batch] == list(range(10))
+    assert all(len(batch) <= 4 for batch in fwd.batches)
+    assert len(fwd.batches) < 10
+    await fwd.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried_without_reordering():
+    fwd = _RecordingForwarder(fail_times=2)
+    for i in range(3):
+        fwd.enqueue("optimization_created", {"i": i})
+    await asyncio.sleep(0)
+    fwd.enqueue("optimization_created", {"i": 3})
+
+    assert await fwd.flush(timeout=2.0)
+    assert [i for batch in fwd.batches for i in batch] == [0, 1, 2, 3]
+    assert fwd.stats()["failed_attempts"] == 2
+    await fwd.close()
+
+
+class _PoisonForwarder(_RecordingForwarder):
+    """Rejects any batch containing ``{"bad": True}`` like json/422 would."""
+
+    async def _send(self, batch):
+        if any(evt["data"].get("bad") for evt in batch):
+            raise TypeError("Object of type set is not JSON serializable")
+        await super()._send(batch)
+
+
+@pytest.mark.asyncio
+async def test_permanent_failure_drops_only_the_bad_event():
+    fwd = _PoisonForwarder(max_batch=10, linger_seconds=0.05)
+    for i in range(5):
+        fwd.enqueue("optimization_created", {"i": i, "bad": i == 2})
+    assert await fwd.flush(timeout=2.0)
+
+    # Forwarding is not wedged: later events go out batched again.
+    for i in (5, 6):
+        fwd.enqueue("optimization_created", {"i": i})
+    assert await fwd.flush(timeout=2.0)
+
+    assert [i for batch in fwd.batches for i in batch] == [0, 1, 3, 4, 5, 6]
+    assert fwd.stats()["rejected"] == 1
+    assert fwd.stats()["buffered"] == 0
+    await fwd.close()
+
+
+def test_only_transport_errors_5xx_and_429_are_transient():
+    import httpx
+
+    def status_error(code: int) -> httpx.HTTPStatusError:
+        request = httpx.Request("POST", "http://127.0.0.1:8000/")
+        return httpx.HTTPStatusError(
+            "err", request=request, response=httpx.Response(code, request=request),
+        )
+
+    assert event_notification._is_transient(httpx.ConnectError("refused"))
+    assert event_notification._is_transient(ConnectionError("down"))
+    assert event_notification._is_transient(status_error(503))
+    assert event_notification._is_transient(status_error(429))
+    assert not event_notification._is_transient(status_error(422))
+    assert not event_notification._is_transient(TypeError("not serializable"))
+
+
+@pytest.mark.asyncio
+async def test_overflow_drops_non_critical_first():
+    fwd = _RecordingForwarder(fail_times=1_000, buffer_size=3)
+    fwd.enqueue("optimization_created", {"i": 0})
+    fwd.enqueue("optimization_status", {"i": 1})
+    fwd.enqueue("taxonomy_activity", {"i": 2})
+    fwd.enqueue("optimization_created", {"i": 3})
+
+    kept = [evt["data"]["i"] for evt in fwd._buffer]
+    assert kept == [0, 2, 3]
+    assert fwd.stats()["dropped"] == 1
+    assert not await fwd.flush(timeout=0.05)
+    await fwd.close(timeout=0.01)
+
+
+@pytest.mark.asyncio
+async def test_notify_event_bus_never_raises_when_backend_down(monkeypatch):
+    fwd = _RecordingForwarder(fail_times=1_000)
+    monkeypatch.setattr(event_notification, "_forwarder", fwd)
+
+    await asyncio.wait_for(
+        event_notification.notify_event_bus("optimization_created", {"i": 0}),
+        timeout=0.1,
+    )
+    assert fwd.stats()["buffered"] == 1
+    await event_notification.shutdown_event_forwarder(timeout=0.01)
+    assert event_notification._forwarder is None
+
+
+@pytest.mark.asyncio
+async def test_publish_batch_endpoint_publishes_in_order(app_client):
+    from app.services.event_bus import event_bus
+
+    start = event_bus.current_sequence
+    resp = await app_client.post("/api/events/_publish_batch", json={"events": [
+        {"event_type": "batch_a", "data": {"n": 1}},
+        {"event_type": "batch_b", "data": {"n": 2}},
+    ]})
+    assert resp.status_code == 200
+    assert [e["event"] for e in event_bus.replay_since(start)] == ["batch_a", "batch_b"]
@@ -3,19 +3,38 @@ import asyncio
 import pytest
 from httpx import AsyncClient
 
-from app.services.event_bus import event_bus
+from app.routers import events as events_router
+from app.services.event_bus import EventBus, EventCursor, event_bus
 
 
 @pytest.fixture
 def mock_event_bus():
     original_subscribers = event_bus._subscribers.copy()
     original_seq = event_bus._sequence
-    original_buffer = list(event_bus._replay_buffer)
+    original_ring = list(event_bus._ring)
     yield event_bus
     event_bus._subscribers = original_subscribers
     event_bus._sequence = original_seq
-    event_bus._replay_buffer.clear()
-    event_bus._replay_buffer.extend(original_buffer)
+    event_bus._ring[:] = original_ring
+
+
+@pytest.fixture
+def stream_bus(monkeypatch):
+    """Fresh bus behind the SSE endpoint; shutting it down ends the stream.
+
+    httpx's ASGI transport buffers the whole body, so each stream test
+    schedules ``bus.shutdown()`` to let the generator return.
+    """
+    bus = EventBus()
+    monkeypatch.setattr(events_router, "event_bus", bus)
+    return bus
+
+
+async def _stream_body(client: AsyncClient, url: str, headers: dict | None = None) -> tuple[int, str]:
+    async with client.stream("GET", url, headers=headers or {}) as response:
+        body = "".join([chunk async for chunk in response.aiter_text()])
+        return response.status_code, body
+
 
 @pytest.mark.asyncio
 async def test_publish_event(app_client: AsyncClient, mock_event_bus):
@@ -25,42 +44,24 @@ async def test_publish_event(app_client: AsyncClient, mock_event_bus):
     assert response.json() == {"ok": True}
 
 @pytest.mark.asyncio
-async def test_event_stream_timeout_and_disconnect(app_client: AsyncClient, mock_event_bus, monkeypatch):
-    from asyncio.exceptions import TimeoutError
-
-    original_queue = asyncio.Queue
+async def test_event_stream_timeout_and_disconnect(app_client: AsyncClient, stream_bus, monkeypatch):
+    monkeypatch.setattr(events_router, "_KEEPALIVE_SECONDS", 0.01)
+    original_wait = EventCursor.wait
 
-    class MockQueue(original_queue):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.call_count = 0
+    async def _shutdown_after_first_timeout(self, timeout=None):
+        # The endpoint yields the keepalive for this timeout, then sees the
+        # shutdown on its next loop — no race with startup or scheduling.
+        woke = await original_wait(self, timeout)
+        if not woke:
+            stream_bus.shutdown()
+        return woke
 
-        async def get(self):
-            self.call_count += 1
-            if self.call_count == 1:
-                raise TimeoutError()
-            else:
-                raise Exception("Stop stream")
+    monkeypatch.setattr(EventCursor, "wait", _shutdown_after_first_timeout)
 
-    monkeypatch.setattr(asyncio, "Queue", MockQueue)
-    # also we need to avoid wait_for raising another timeout
-
-    async def mock_wait_for(coro, timeout):
-        return await coro
-
-    monkeypatch.setattr(asyncio, "wait_for", mock_wait_for)
-
-    try:
-        async with app_client.stream("GET", "/api/events") as response:
-            assert response.status_code == 200
-            async for line in response.aiter_lines():
-                if ": keepalive" in line:
-                    break
-    except Exception as e:
-        if str(e) == "Stop stream":
-            pass
-        else:
-            raise
+    status, body = await _stream_body(app_client, "/api/events")
+    assert status == 200
+    assert ": keepalive" in body
+    assert stream_bus.subscriber_count == 0
 
 
 @pytest.mark.asyncio
@@ -75,9 +76,7 @@ async def test_event_stream_query_param_replay(mock_event_bus):
     for i in range(3):
         event_bus.publish(f"test_type_{i}", {"index": i})
 
-    buffer = list(event_bus._replay_buffer)
-    assert len(buffer) >= 3
-    seqs = [e["seq"] for e in buffer[-3:]]
+    seqs = [event_bus.current_sequence - 2, event_bus.current_sequence - 1, event_bus.current_sequence]
 
     # replay_since returns events AFTER the given seq
     missed = event_bus.replay_since(seqs[0])
@@ -89,69 +88,45 @@ async def test_event_stream_query_param_replay(mock_event_bus):
 
 
 @pytest.mark.asyncio
-async def test_event_stream_query_param_accepted(app_client: AsyncClient, mock_event_bus, monkeypatch):
+async def test_event_stream_query_param_accepted(app_client: AsyncClient, stream_bus):
     """The ``/api/events?last_event_id=`` query param is accepted (no 422)."""
-    original_queue = asyncio.Queue
-
-    class MockQueue(original_queue):
-        async def get(self):
-            raise Exception("Stop stream")
+    for i in range(3):
+        stream_bus.publish(f"test_type_{i}", {"index": i})
+    stream_bus.shutdown()
 
-    monkeypatch.setattr(asyncio, "Queue", MockQueue)
+    status, body = await _stream_body(app_client, "/api/events?last_event_id=1")
+    # Should accept the query param (200, not 422) and replay seq 2..3
+    assert status == 200
+    assert "event: test_type_0" not in body
+    assert "id: 2\nevent: test_type_1" in body
+    assert "id: 3\nevent: test_type_2" in body
+    assert body.index("test_type_2") < body.index("event: sync")
 
-    async def mock_wait_for(coro, timeout):
-        return await coro
 
-    monkeypatch.setattr(asyncio, "wait_for", mock_wait_for)
+@pytest.mark.asyncio
+async def test_event_stream_header_takes_priority(app_client: AsyncClient, stream_bus):
+    for i in range(3):
+        stream_bus.publish(f"test_type_{i}", {"index": i})
+    stream_bus.shutdown()
 
-    try:
-        async with app_client.stream(
-            "GET", "/api/events?last_event_id=42"
-        ) as response:
-            # Should accept the query param (200, not 422)
-            assert response.status_code == 200
-    except Exception as e:
-        if str(e) != "Stop stream":
-            raise
+    status, body = await _stream_body(
+        app_client, "/api/events?last_event_id=0", headers={"Last-Event-ID": "2"},
+    )
+    assert status == 200
+    assert "test_type_1" not in body
+    assert "event: test_type_2" in body
 
 
 @pytest.mark.asyncio
-async def test_event_stream_yield_event(app_client: AsyncClient, mock_event_bus, monkeypatch):
-    original_queue = asyncio.Queue
-
-    class MockQueue(original_queue):
-        def __init__(self, *args, **kwargs):
-            super().__init__(*args, **kwargs)
-            self.call_count = 0
-
-        async def get(self):
-            self.call_count += 1
-            if self.call_count == 1:
-                return {"event": "test_type", "data": {"hello": "world"}}
-            else:
-                raise Exception("Stop stream")
-
-    monkeypatch.setattr(asyncio, "Queue", MockQueue)
-
-    async def mock_wait_for(coro, timeout):
-        return await coro
-
-    monkeypatch.setattr(asyncio, "wait_for", mock_wait_for)
-
-    try:
-        lines = []
-        async with app_client.stream("GET", "/api/events") as response:
-            assert response.status_code == 200
-            async for line in response.aiter_lines():
-                lines.append(line)
-                if len(lines) >= 2:
-                    break
-        assert any("event: test_type" in line for line in lines)
-        assert any('data: {"hello": "world"}' in line for line in lines)
-    except Exception as e:
-        if str(e) == "Stop stream":
-            pass
-        else:
-            raise
-
-
+async def test_event_stream_yield_event(app_client: AsyncClient, stream_bus):
+    def _publish_then_stop():
+        stream_bus.publish("test_type", {"hello": "world"})
+        stream_bus.shutdown()
+
+    asyncio.get_running_loop().call_later(0.05, _publish_then_stop)
+
+    status, body = await _stream_body(app_client, "/api/events")
+    assert status == 200
+    assert "event: sync" in body
+    assert "event: test_type" in body
+    assert 'data: {"hello": "world"}' in body
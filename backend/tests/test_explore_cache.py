@@ -1,5 +1,7 @@
 import time
 
+import numpy as np
+
 from app.services.explore_cache import ExploreCache
 
 
@@ -76,3 +78,68 @@ class TestExploreCache:
         assert stats["hits"] == 1
         assert stats["misses"] == 1
         assert stats["size"] == 1
+
+
+class TestSemanticTier:
+    @staticmethod
+    def _vec(*head: float) -> np.ndarray:
+        v = np.zeros(8, dtype=np.float32)
+        v[: len(head)] = head
+        return v
+
+    def test_similar_prompt_hits_within_scope(self):
+        cache = ExploreCache(ttl_seconds=60, max_entries=10)
+        key = ExploreCache.build_key("o/r", "main", "sha1", "Add retries to client")
+        cache.set(key, "ctx", embedding=self._vec(1.0, 0.1))
+
+        scope = ExploreCache.build_scope("o/r", "main", "sha1")
+        hit = cache.get_similar(scope, self._vec(1.0, 0.12), threshold=0.9)
+        assert hit is not None
+        assert hit[0] == "ctx"
+        assert hit[1] > 0.99
+
+    def test_below_threshold_misses(self):
+        cache = ExploreCache(ttl_seconds=60, max_entries=10)
+        cache.set(ExploreCache.build_key("o/r", "main", "sha1", "a"), "ctx", embedding=self._vec(1.0))
+        scope = ExploreCache.build_scope("o/r", "main", "sha1")
+        assert cache.get_similar(scope, self._vec(0.0, 1.0), threshold=0.9) is None
+
+    def test_other_head_sha_misses(self):
+        cache = ExploreCache(ttl_seconds=60, max_entries=10)
+        cache.set(ExploreCache.build_key("o/r", "main", "sha1", "a"), "ctx", embedding=self._vec(1.0))
+        scope = ExploreCache.build_scope("o/r", "main", "sha2")
+        assert cache.get_similar(scope, self._vec(1.0), threshold=0.5) is None
+
+    def test_entries_without_embedding_ignored(self):
+        cache = ExploreCache(ttl_seconds=60, max_entries=10)
+        cache.set(ExploreCache.build_key("o/r", "main", "sha1", "a"), "ctx")
+        scope = ExploreCache.build_scope("o/r", "main", "sha1")
+        assert cache.get_similar(scope, self._vec(1.0), threshold=0.0) is None
+
+    def test_zero_query_vector_misses(self):
+        cache = ExploreCache(ttl_seconds=60, max_entries=10)
+        cache.set(ExploreCache.build_key("o/r", "main", "sha1", "a"), "ctx", embedding=self._vec(1.0))
+        scope = ExploreCache.build_scope("o/r", "main", "sha1")
+        assert cache.get_similar(scope, np.zeros(8), threshold=0.0) is None
+
+    def test_semantic_ttl_expiry(self):
+        cache = ExploreCache(ttl_seconds=0.1, max_entries=10)
+        cache.set(ExploreCache.build_key("o/r", "main", "sha1", "a"), "ctx", embedding=self._vec(1.0))
+        time.sleep(0.15)
+        scope = ExploreCache.build_scope("o/r", "main", "sha1")
+        assert cache.get_similar(scope, self._vec(1.0), threshold=0.5) is None
+        assert cache.stats()["size"] == 0
+
+    def test_separate_stats(self):
+        cache = ExploreCache(ttl_seconds=60, max_entries=10)
+        key = ExploreCache.build_key("o/r", "main", "sha1", "a")
+        cache.set(key, "ctx", embedding=self._vec(1.0))
+        scope = ExploreCache.build_scope("o/r", "main", "sha1")
+        cache.get(key)  # exact hit
+        cache.get("nope")  # exact miss
+        cache.get_similar(scope, self._vec(1.0), threshold=0.9)  # semantic hit
+        cache.get_similar(scope, self._vec(0.0, 1.0), threshold=0.9)  # semantic miss
+        cache.get_similar(scope, self._vec(0.0, 0.0, 1.0), threshold=0.9)  # semantic miss
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+        assert (stats["semantic_hits"], stats["semantic_misses"]) == (1, 2)
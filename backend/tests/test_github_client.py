@@ -178,3 +178,39 @@ async def test_get_file_content_no_encoding(github_client, mock_httpx_client):
     mock_httpx_client.get.return_value = make_mock_response(200, {"content": "default text"})
     res = await github_client.get_file_content("fake_token", "user/repo1", "path/to/file", "main")
     assert res == "default text"
+
+
+@pytest.mark.asyncio
+async def test_download_tarball_streams_to_dest():
+    import io
+
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "api.github.com":
+            assert request.url.path == "/repos/user/repo1/tarball/abc123"
+            return httpx.Response(302, headers={"Location": "https://codeload.github.com/x"})
+        return httpx.Response(200, content=b"tarball-bytes")
+
+    client = GitHubClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    dest = io.BytesIO()
+    written = await client.download_tarball("tok", "user/repo1", "abc123", dest)
+    assert written == len(b"tarball-bytes")
+    assert dest.getvalue() == b"tarball-bytes"
+
+
+@pytest.mark.asyncio
+async def test_download_tarball_raises_on_error():
+    import io
+
+    import httpx
+
+    from app.services.github_client import GitHubApiError
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(404, json={"message": "Not Found"})
+
+    client = GitHubClient(http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    with pytest.raises(GitHubApiError) as exc:
+        await client.download_tarball("tok", "user/repo1", "abc123", io.BytesIO())
+    assert exc.value.status_code == 404
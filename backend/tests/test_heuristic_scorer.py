@@ -320,3 +320,57 @@ class TestScoringValidationMatrix:
         dense = HeuristicScorer.heuristic_specificity(self.P3_DENSE)
         structured = HeuristicScorer.heuristic_specificity(self.P2_STRUCTURED)
         assert abs(dense - structured) < 2.5
+
+    def test_matrix_scores_pinned(self) -> None:
+        """Scores from before the single-pass feature extraction — must not drift."""
+        expected = {
+            "P1_VAGUE": (5.0, 4.0, 4.0, 5.87),
+            "P2_STRUCTURED": (7.5, 10.0, 9.5, 9.27),
+            "P3_DENSE": (5.5, 10.0, 4.0, 7.58),
+            "P5_XML": (7.0, 6.55, 9.5, 8.85),
+            "P6_CREATIVE": (5.0, 9.4, 4.0, 7.33),
+            "P8_FP_AMBIGUITY": (5.5, 10.0, 5.0, 7.32),
+        }
+        for name, dims in expected.items():
+            scores = HeuristicScorer.score_prompt(getattr(self, name))
+            got = tuple(scores[k] for k in ("clarity", "specificity", "structure", "conciseness"))
+            assert got == dims, name
+
+
+# ---------------------------------------------------------------------------
+# Single-pass feature extraction
+# ---------------------------------------------------------------------------
+
+
+def test_features_match_per_pattern_counts() -> None:
+    """Token-derived counts equal the regex ``findall`` counts they replace."""
+    import re
+
+    from app.services.heuristic_scorer import _extract_features
+
+    categories = [
+        (r"\b(?:must|shall|should|require[ds]?|ensure[ds]?)\b", re.IGNORECASE),
+        (r"\b(?:str|int|float|bool|list|dict|tuple|set)\b|->", 0),
+        (r"\bfor example\b|\be\.g\.\b|\bsuch as\b|\bexamples?\b", re.IGNORECASE),
+        (r"\b\d+(?:\.\d+)?\b", 0),
+        (r"\b\w+(?:Error|Exception)\b", 0),
+        (r"\b(?:never|exclude|except|without|avoid)\b|(?:do|must|should)\s+not\b", re.IGNORECASE),
+    ]
+    prompts = [
+        "For example, return JSON. Such as: at least 3.5 items, do not exceed 10. Raise ValueError.",
+        "MUST ensure the Key is valid; muſt not use stuff. undo not. Requires str -> int.",
+        "for examples: Example e.g.x MyException Error must_ shallé NEVER avoid x->y",
+    ]
+    for prompt in prompts:
+        hits = _extract_features(prompt).specificity_hits
+        got = (hits[0], hits[2], hits[4], hits[5], hits[6], hits[7])
+        assert got == tuple(len(re.findall(p, prompt, f)) for p, f in categories), prompt
+
+
+def test_features_are_cached_per_prompt() -> None:
+    from app.services.heuristic_scorer import _extract_features
+
+    _extract_features.cache_clear()
+    HeuristicScorer.score_prompt("Return a JSON list. Do not include nulls.")
+    info = _extract_features.cache_info()
+    assert (info.misses, info.hits) == (1, 3)
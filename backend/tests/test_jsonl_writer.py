@@ -0,0 +1,102 @@
+"""Tests for the background JSONL writer."""
+
+import json
+import threading
+from pathlib import Path
+
+from app.services import jsonl_writer
+from app.services.jsonl_writer import JsonlWriter
+
+
+def test_lines_written_in_order_per_file(tmp_path: Path) -> None:
+    writer = JsonlWriter()
+    a, b = tmp_path / "a.jsonl", tmp_path / "b.jsonl"
+    for i in range(200):
+        writer.write(a if i % 2 else b, json.dumps({"i": i}))
+    assert writer.flush()
+
+    assert [json.loads(x)["i"] for x in a.read_text().splitlines()] == list(range(1, 200, 2))
+    assert [json.loads(x)["i"] for x in b.read_text().splitlines()] == list(range(0, 200, 2))
+    assert writer.stats()["written"] == 200
+    assert writer.stats()["open_files"] == 2
+    writer.close()
+
+
+def test_handles_reused_across_writes(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    opens: list[str] = []
+    real_open = os.open
+
+    def counting_open(path, *args, **kwargs):
+        opens.append(str(path))
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(jsonl_writer.os, "open", counting_open)
+    writer = JsonlWriter()
+    path = tmp_path / "x.jsonl"
+    for i in range(5):
+        writer.write(path, str(i))
+        assert writer.flush()
+    assert opens == [str(path)]
+    writer.close()
+
+
+def test_index_sidecar_records_offsets(tmp_path: Path) -> None:
+    writer = JsonlWriter()
+    path = tmp_path / "x.jsonl"
+    path.write_text("pre-existing\n")
+    writer.write(path, "unindexed")
+    writer.write(path, '{"k": "é"}', index="a")
+    writer.write(path, '{"k": 2}', index="b")
+    assert writer.flush()
+
+    data = path.read_bytes()
+    for row in (tmp_path / "x.idx").read_text().splitlines():
+        key, offset, length = row.split("\t")
+        line = data[int(offset):int(offset) + int(length)]
+        assert line.endswith(b"\n")
+        assert json.loads(line)["k"] == {"a": "é", "b": 2}[key]
+    writer.close()
+
+
+def test_queue_overflow_drops_and_counts(tmp_path: Path, monkeypatch) -> None:
+    writer = JsonlWriter(max_queue=2)
+    gate = threading.Event()
+    real_append = writer._append
+
+    def blocked_append(path, line, index=None):
+        gate.wait(5)
+        real_append(path, line, index)
+
+    monkeypatch.setattr(writer, "_append", blocked_append)
+    path = tmp_path / "x.jsonl"
+    results = [writer.write(path, str(i)) for i in range(10)]
+    gate.set()
+    assert writer.flush()
+
+    assert not all(results)
+    assert writer.stats()["dropped"] == results.count(False)
+    assert len(path.read_text().splitlines()) == results.count(True)
+    writer.close()
+
+
+def test_close_drains_queue_and_rejects_later_writes(tmp_path: Path) -> None:
+    writer = JsonlWriter(fsync_interval=0)
+    path = tmp_path / "x.jsonl"
+    for i in range(50):
+        writer.write(path, str(i))
+    writer.close()
+
+    assert len(path.read_text().splitlines()) == 50
+    assert writer.stats()["open_files"] == 0
+    assert writer.write(path, "late") is False
+
+
+def test_shutdown_resets_singleton(tmp_path: Path) -> None:
+    writer = jsonl_writer.get_jsonl_writer()
+    assert jsonl_writer.get_jsonl_writer() is writer
+    writer.write(tmp_path / "x.jsonl", "1")
+    jsonl_writer.shutdown_jsonl_writer()
+    assert (tmp_path / "x.jsonl").read_text() == "1\n"
+    assert jsonl_writer.get_jsonl_writer() is not writer
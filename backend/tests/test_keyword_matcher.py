@@ -0,0 +1,76 @@
+"""Tests for the single-pass KeywordMatcher."""
+
+import random
+import re
+
+from app.services import heuristic_analyzer
+from app.services.domain_signal_loader import DomainSignalLoader
+from app.services.keyword_matcher import KeywordMatcher
+
+
+def _reference_score(prompt: str, first: str, keywords: list[tuple[str, float]]) -> float:
+    """The keyword-by-keyword loop the matcher replaces."""
+    score = 0.0
+    for keyword, weight in keywords:
+        kw = keyword.lower()
+        if " " in kw:
+            found, found_first = kw in prompt, kw in first
+        else:
+            pat = re.compile(r"\b" + re.escape(kw) + r"\b")
+            found, found_first = bool(pat.search(prompt)), bool(pat.search(first))
+        if found:
+            score += weight * (2.0 if found_first else 1.0)
+    return score
+
+
+SIGNALS = {
+    "coding": [("implement", 1.0), ("api", 0.8), ("system prompt", 0.9), ("c++", 0.7), ("API", 0.3)],
+    "analysis": [("compare", 0.9), ("api", 0.4), ("node.js", 0.6), ("data flow", 0.5)],
+    "empty": [],
+}
+
+
+def test_matches_reference_loop_on_random_prompts() -> None:
+    matcher = KeywordMatcher(SIGNALS)
+    vocab = ["implement", "api", "apis", "rapid", "system", "prompt", "c++", "c", "node.js", "nodejs",
+             "compare", "data", "flow", "classification", ".", "?", ",", "(api)", "api_key", "é"]
+    rng = random.Random(3)
+    for _ in range(300):
+        prompt = " ".join(rng.choice(vocab) for _ in range(rng.randint(0, 25)))
+        first = re.split(r"[.?!]", prompt, maxsplit=1)[0]
+        expected = {cat: _reference_score(prompt, first, kws) for cat, kws in SIGNALS.items()}
+        assert matcher.score(prompt, first) == expected, prompt
+
+
+def test_word_boundaries_and_first_sentence_boost() -> None:
+    matcher = KeywordMatcher(SIGNALS)
+    assert matcher.score("rapid apis", "rapid apis")["coding"] == 0.0
+    scores = matcher.score("compare x. now implement the api", "compare x")
+    assert scores["analysis"] == 0.9 * 2 + 0.4
+    # Duplicate keyword in one category counts once per entry, as before.
+    assert scores["coding"] == 1.0 + 0.8 + 0.3
+    assert list(scores) == ["coding", "analysis", "empty"]
+
+
+def test_domain_loader_score_uses_rebuilt_matcher() -> None:
+    loader = DomainSignalLoader()
+    loader._signals = {"backend": [("api", 0.8), ("server", 0.5)], "frontend": [("css", 0.9)]}
+    loader._precompile_patterns()
+    assert loader.score({"api", "server", "css,"}) == {"backend": 1.3}
+
+    loader.register_signals("frontend", [("css,", 0.4)])
+    assert loader.score({"api", "css,"}) == {"backend": 0.8, "frontend": 0.4}
+    loader.remove_domain("backend")
+    assert loader.score({"api"}) == {}
+
+
+def test_set_task_type_signals_rebuilds_matcher() -> None:
+    original = heuristic_analyzer._TASK_TYPE_SIGNALS
+    try:
+        heuristic_analyzer.set_task_type_signals({"coding": [("zorblax", 2.0)]})
+        scores = heuristic_analyzer._TASK_TYPE_MATCHER.score("use zorblax", "use zorblax")
+        assert scores["coding"] == 4.0
+        assert "coding" in heuristic_analyzer._DYNAMIC_SINGLE_TASK_TYPES
+    finally:
+        heuristic_analyzer._TASK_TYPE_SIGNALS = original
+        heuristic_analyzer._precompile_keyword_patterns()
@@ -59,7 +59,12 @@ async def test_synthesis_analyze_with_provider():
 
     mock_provider.complete_parsed.side_effect = side_effect
 
+    from app.providers.concurrency import AdaptiveConcurrencyController
+
+    ctrl = AdaptiveConcurrencyController(initial=4)
+
     with (
+        patch("app.providers.concurrency.get_concurrency_controller", return_value=ctrl),
         patch("app.tools._shared._routing", _mock_routing(
             "internal", provider=mock_provider, provider_name="mock_provider",
         )),
@@ -96,6 +101,8 @@ async def test_synthesis_analyze_with_provider():
         assert result.task_type == "coding"
         assert result.baseline_scores["clarity"] == 5.0
         assert mock_provider.complete_parsed.call_count == 2
+        # Both calls hold a slot of the shared concurrency controller.
+        assert sum(c["acquired"] for c in ctrl.stats()["classes"].values()) == 2
 
 
 async def test_synthesis_analyze_no_provider_but_sampling():
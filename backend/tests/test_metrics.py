@@ -0,0 +1,82 @@
+"""Tests for the streaming histograms and Prometheus export."""
+
+import random
+
+import pytest
+from httpx import AsyncClient
+
+from app.services.metrics import Histogram, MetricsRegistry, observe, registry, timed
+
+
+def test_quantiles_within_bucket_error() -> None:
+    rng = random.Random(7)
+    values = sorted(rng.lognormvariate(-1.0, 1.0) for _ in range(20_000))
+    hist = Histogram()
+    for v in values:
+        hist.observe(v)
+    for q in (0.5, 0.9, 0.99):
+        exact = values[int(q * len(values)) - 1]
+        assert hist.quantile(q) == pytest.approx(exact, rel=0.1)
+    assert Histogram().quantile(0.5) is None
+
+
+def test_render_prometheus_histogram() -> None:
+    reg = MetricsRegistry()
+    labels = (("phase", 'we"ird'),)
+    for v in (0.002, 0.05, 0.05, 3.0, 5000.0):
+        reg.observe("warm_phase_duration_seconds", v, labels)
+    text = reg.render()
+
+    assert "# TYPE warm_phase_duration_seconds histogram" in text
+    buckets = [
+        line for line in text.splitlines()
+        if line.startswith("warm_phase_duration_seconds_bucket")
+    ]
+    counts = [int(line.rsplit(" ", 1)[1]) for line in buckets]
+    assert counts == sorted(counts)  # cumulative
+    assert buckets[-1] == 'warm_phase_duration_seconds_bucket{phase="we\\"ird",le="+Inf"} 5'
+    assert counts[-2] == 4  # 5000 s lands only in +Inf
+    assert 'warm_phase_duration_seconds_count{phase="we\\"ird"} 5' in text
+    assert 'warm_phase_duration_seconds_sum{phase="we\\"ird"} 5003.102' in text
+
+
+def test_gauges_rendered_at_scrape_time() -> None:
+    reg = MetricsRegistry()
+    depth = {"v": 1}
+    reg.register_gauge("queue_depth", "Depth.", lambda: {(("q", "a"),): depth["v"]})
+    reg.register_gauge("broken", "Raises.", lambda: 1 / 0)
+    depth["v"] = 7
+    text = reg.render()
+    assert 'queue_depth{q="a"} 7' in text
+    assert "broken" not in text
+
+
+def test_timed_records_on_error() -> None:
+    before = registry.histogram("embedding_duration_seconds", (("op", "test"),)).count
+    with pytest.raises(RuntimeError), timed("embedding_duration_seconds", op="test"):
+        raise RuntimeError("boom")
+    assert registry.histogram("embedding_duration_seconds", (("op", "test"),)).count == before + 1
+
+
+def test_trace_logging_feeds_phase_histogram(tmp_path) -> None:
+    from app.services.jsonl_writer import JsonlWriter
+    from app.services.trace_logger import TraceLogger
+
+    key = (("phase", "metrics_test"), ("status", "ok"))
+    before = registry.histogram("pipeline_phase_duration_seconds", key).count
+    tl = TraceLogger(tmp_path, writer=JsonlWriter())
+    tl.log_phase("t", "metrics_test", 1200, 1, 1, "m", "p")
+    tl.log_phase("t", "metrics_test", 5, 1, 1, "m", "p", cached=True)  # not latency
+    assert registry.histogram("pipeline_phase_duration_seconds", key).count == before + 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(app_client: AsyncClient) -> None:
+    observe("provider_call_duration_seconds", 0.4, provider="mock", model="m", outcome="ok")
+    resp = await app_client.get("/api/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    body = resp.text
+    assert "# TYPE provider_call_duration_seconds histogram" in body
+    assert 'provider_call_duration_seconds_count{model="m",outcome="ok",provider="mock"}' in body
+    assert "# TYPE event_bus_subscribers gauge" in body
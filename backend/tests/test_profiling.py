@@ -0,0 +1,120 @@
+"""Tests for opt-in per-request profiling spans."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from app.config import settings
+from app.providers.base import LLMProvider
+from app.services import profiling
+from app.services.jsonl_writer import JsonlWriter
+from app.services.trace_logger import TraceLogger
+
+
+@pytest.fixture
+def enabled(monkeypatch):
+    monkeypatch.setattr(settings, "PROFILING_ENABLED", True)
+    yield
+    profiling.finish()
+
+
+def test_disabled_is_noop() -> None:
+    assert profiling.begin("req") is None
+    with profiling.span("x"):
+        profiling.count("embed_calls")
+    assert profiling.finish() is None
+
+
+def test_spans_aggregate_by_name_with_counter_deltas(enabled) -> None:
+    prof = profiling.begin("req")
+    assert prof is not None and profiling.begin("nested") is prof
+
+    profiling.count("db_statements")
+    for _ in range(3):
+        with profiling.span("embed"):
+            profiling.count("embed_calls")
+            profiling.count("embed_texts", 4)
+    with pytest.raises(RuntimeError), profiling.span("boom"):
+        raise RuntimeError
+
+    summary = profiling.finish()
+    assert profiling.current() is None
+    assert summary["db_statements"] == 1
+    assert summary["embed_texts"] == 12
+    embed = summary["spans"]["embed"]
+    assert embed["count"] == 3
+    assert (embed["embed_calls"], embed["embed_texts"], embed["db_statements"]) == (3, 12, 0)
+    assert summary["spans"]["boom"]["count"] == 1
+    assert summary["wall_ms"] >= embed["wall_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_traced_and_db_hook_follow_the_request(enabled, db_session) -> None:
+    profiling.install_db_hook(db_session.bind.sync_engine)
+
+    @profiling.traced("query")
+    async def query() -> None:
+        await db_session.execute(text("SELECT 1"))
+
+    prof = profiling.begin("req")
+    await asyncio.gather(query(), query())  # child tasks share the profile
+    await asyncio.to_thread(profiling.count, "embed_calls")
+    assert prof.counters["db_statements"] == 2
+    assert prof.counters["embed_calls"] == 1
+    assert prof.summary()["spans"]["query"]["count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_pipeline_writes_profile_to_trace(enabled, db_session, tmp_path) -> None:
+    from app.services.pipeline import PipelineOrchestrator
+    from tests.test_pipeline import _make_analysis, _make_optimization, _make_scores
+
+    prompts = tmp_path / "prompts"
+    (prompts / "strategies").mkdir(parents=True)
+    (prompts / "agent-guidance.md").write_text("System prompt.")
+    (prompts / "analyze.md").write_text("{{raw_prompt}}\n{{available_strategies}}")
+    (prompts / "optimize.md").write_text("{{raw_prompt}}\n{{analysis_summary}}\n{{strategy_instructions}}")
+    (prompts / "scoring.md").write_text("Score these prompts.")
+    (prompts / "strategies" / "chain-of-thought.md").write_text("Think step by step.")
+    (prompts / "strategies" / "auto.md").write_text("Auto-select.")
+    orch = PipelineOrchestrator(prompts_dir=prompts)
+    orch.trace_logger = TraceLogger(tmp_path / "traces", writer=JsonlWriter())
+
+    provider = AsyncMock(spec=LLMProvider)
+    provider.name = "mock"
+    provider.complete_parsed.side_effect = [_make_analysis(), _make_optimization(), _make_scores()]
+
+    async def _streaming(**kw):
+        return await provider.complete_parsed(**kw)
+
+    provider.complete_parsed_streaming.side_effect = _streaming
+
+    events = [e async for e in orch.run("Write a sort function", provider, db_session)]
+    trace_id = events[0].data["trace_id"]
+    assert events[-1].event == "optimization_complete"
+
+    entries = orch.trace_logger.read_trace(trace_id)
+    profile = [e for e in entries if e["phase"] == "profile"]
+    assert len(profile) == 1 and "duration_ms" not in profile[0]
+    spans = profile[0]["profile"]["spans"]
+    assert spans["provider.call"]["count"] == 3
+    for phase in ("pipeline.analyze", "pipeline.optimize", "pipeline.score", "pipeline.persist"):
+        assert spans[phase]["count"] == 1
+    assert profiling.current() is None
+
+
+@pytest.mark.asyncio
+async def test_trace_endpoint_separates_profile(app_client: AsyncClient, tmp_path, monkeypatch) -> None:
+    from app.routers import monitoring
+
+    monkeypatch.setattr(monitoring, "DATA_DIR", tmp_path)
+    tl = TraceLogger(tmp_path / "traces")
+    tl.log_phase("req-1", "analyze", 10, 1, 1, "m", "p")
+    tl.log_profile("req-1", {"wall_ms": 12.5, "spans": {}})
+
+    body = (await app_client.get("/api/monitoring/traces/req-1")).json()
+    assert [p["phase"] for p in body["phases"]] == ["analyze"]
+    assert body["profile"]["wall_ms"] == 12.5
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -247,6 +248,220 @@ class TestCallProviderWithRetryStreaming:
         provider.complete_parsed_streaming.assert_not_called()
 
 
+# ---------------------------------------------------------------------------
+# call_provider_with_retry — deterministic response cache
+# ---------------------------------------------------------------------------
+
+
+class TestResponseCache:
+    @staticmethod
+    def _provider(result):
+        from app.providers.base import LLMProvider
+
+        provider = MagicMock(spec=LLMProvider)
+        provider.name = "mock"
+        provider.complete_parsed = AsyncMock(return_value=result)
+        return provider
+
+    @staticmethod
+    async def _call(provider, cache, **overrides):
+        from app.providers.base import call_provider_with_retry
+
+        kwargs = {
+            "model": "claude-sonnet-4-6", "system_prompt": "sys",
+            "user_message": "msg", "output_format": AnalysisResult,
+        }
+        kwargs.update(overrides)
+        return await call_provider_with_retry(provider, response_cache=cache, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_identical_request_served_from_cache(self, tmp_path):
+        from app.providers.base import TokenUsage
+        from app.providers.response_cache import ResponseCache, last_call_cached
+
+        cache = ResponseCache(tmp_path / "cache.db")
+        analysis = _make_analysis_result()
+        provider = self._provider(analysis)
+
+        first = await self._call(provider, cache)
+        assert last_call_cached() is False
+        second = await self._call(provider, cache)
+
+        assert provider.complete_parsed.call_count == 1
+        assert last_call_cached() is True
+        assert second == first
+        assert provider.last_usage == TokenUsage()
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    @pytest.mark.asyncio
+    async def test_any_request_difference_misses(self, tmp_path):
+        from app.providers.response_cache import ResponseCache
+
+        cache = ResponseCache(tmp_path / "cache.db")
+        provider = self._provider(_make_analysis_result())
+
+        await self._call(provider, cache)
+        await self._call(provider, cache, user_message="other")
+        await self._call(provider, cache, model="claude-haiku-4-5")
+        await self._call(provider, cache, effort="high")
+        assert provider.complete_parsed.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_no_cache_never_marks_hit(self):
+        from app.providers.base import call_provider_with_retry
+        from app.providers.response_cache import last_call_cached
+
+        provider = self._provider(_make_analysis_result())
+        await call_provider_with_retry(
+            provider, model="m", system_prompt="s", user_message="u",
+            output_format=AnalysisResult,
+        )
+        assert last_call_cached() is False
+
+    def test_ttl_expiry(self, tmp_path):
+        from app.providers.response_cache import ResponseCache
+
+        cache = ResponseCache(tmp_path / "cache.db", ttl_seconds=1)
+        cache.set("k", "{}")
+        with patch("app.providers.response_cache.time.time", return_value=10**10):
+            assert cache.get("k") is None
+        assert cache.stats()["size"] == 0
+
+    def test_size_bound_evicts_least_recently_used(self, tmp_path):
+        from app.providers.response_cache import ResponseCache
+
+        cache = ResponseCache(tmp_path / "cache.db", ttl_seconds=10**12, max_entries=2)
+        with patch("app.providers.response_cache.time.time", side_effect=[1, 2, 3, 4]):
+            cache.set("a", "1")
+            cache.set("b", "2")
+            cache.get("a")  # refresh a
+            cache.set("c", "3")  # evicts b
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert cache.get("c") == "3"
+
+    def test_invalidate_by_model(self, tmp_path):
+        from app.providers.response_cache import ResponseCache
+
+        cache = ResponseCache(tmp_path / "cache.db")
+        cache.set("a", "1", model="m1")
+        cache.set("b", "2", model="m2")
+        assert cache.invalidate(model="m1") == 1
+        assert cache.get("a") is None
+        assert cache.invalidate() == 1
+        assert cache.stats()["size"] == 0
+
+    def test_disabled_by_default(self):
+        from app.providers.response_cache import get_response_cache
+
+        assert get_response_cache() is None
+
+
+# ---------------------------------------------------------------------------
+# Shared adaptive concurrency controller
+# ---------------------------------------------------------------------------
+
+
+class TestConcurrencyController:
+    @pytest.mark.asyncio
+    async def test_limit_bounds_in_flight(self):
+        from app.providers.concurrency import AdaptiveConcurrencyController
+
+        ctrl = AdaptiveConcurrencyController(initial=2, maximum=2)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with ctrl.slot():
+                peak = max(peak, ctrl.in_flight)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[work() for _ in range(6)])
+        assert peak == 2
+        assert ctrl.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_higher_priority_waiter_served_first(self):
+        from app.providers.concurrency import AdaptiveConcurrencyController, Priority
+
+        ctrl = AdaptiveConcurrencyController(initial=1, maximum=1)
+        order: list[str] = []
+        await ctrl.acquire(Priority.INTERACTIVE)
+
+        async def waiter(name, prio):
+            async with ctrl.slot(prio):
+                order.append(name)
+
+        tasks = [
+            asyncio.create_task(waiter("background", Priority.BACKGROUND)),
+            asyncio.create_task(waiter("batch", Priority.BATCH)),
+            asyncio.create_task(waiter("interactive", Priority.INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        ctrl.release()
+        await asyncio.gather(*tasks)
+        assert order == ["interactive", "batch", "background"]
+        stats = ctrl.stats()
+        assert stats["classes"]["background"]["acquired"] == 1
+        assert stats["classes"]["interactive"]["acquired"] == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        from app.providers.concurrency import AdaptiveConcurrencyController
+
+        ctrl = AdaptiveConcurrencyController(initial=1, maximum=1)
+        await ctrl.acquire()
+        task = asyncio.create_task(ctrl.acquire())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        ctrl.release()
+        assert ctrl.in_flight == 0
+        assert ctrl.stats()["classes"]["interactive"]["queued"] == 0
+
+    def test_aimd_increase_and_decrease(self):
+        from app.providers.concurrency import AdaptiveConcurrencyController
+
+        ctrl = AdaptiveConcurrencyController(initial=4, minimum=1, maximum=8)
+        # +1/limit per success: roughly +1 per window of ``limit`` calls.
+        for _ in range(5):
+            ctrl.on_success()
+        assert ctrl.limit == 5
+        ctrl.on_overload()
+        assert ctrl.limit == 2
+        # Second overload inside the cooldown window is ignored.
+        ctrl.on_overload()
+        assert ctrl.limit == 2
+        assert ctrl.stats()["overloads"] == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_reports_overload_and_success(self):
+        from app.providers.base import LLMProvider, ProviderRateLimitError, call_provider_with_retry
+        from app.providers.concurrency import AdaptiveConcurrencyController, Priority, llm_priority
+
+        ctrl = AdaptiveConcurrencyController(initial=8, maximum=16)
+        provider = MagicMock(spec=LLMProvider)
+        analysis = _make_analysis_result()
+        provider.complete_parsed = AsyncMock(
+            side_effect=[ProviderRateLimitError("slow down"), analysis],
+        )
+        with (
+            patch("app.providers.concurrency.get_concurrency_controller", return_value=ctrl),
+            llm_priority(Priority.BATCH),
+        ):
+            result = await call_provider_with_retry(
+                provider, model="m", system_prompt="s", user_message="u",
+                output_format=AnalysisResult, retry_delay=0,
+            )
+        assert result is analysis
+        stats = ctrl.stats()
+        assert stats["overloads"] == 1
+        assert stats["limit"] == 4
+        assert stats["classes"]["batch"]["acquired"] == 2
+        assert stats["in_flight"] == 0
+
+
 # ---------------------------------------------------------------------------
 # ClaudeCLIProvider
 # ---------------------------------------------------------------------------
@@ -514,6 +729,97 @@ class TestClaudeCLIProvider:
         assert "Rate limit" in str(excinfo.value) or "429" in str(excinfo.value)
 
 
+class TestCLIWorkerPool:
+    @staticmethod
+    def _proc(returncode=None):
+        proc = MagicMock()
+        proc.returncode = returncode
+        proc.wait = AsyncMock(return_value=0)
+        return proc
+
+    @pytest.mark.asyncio
+    async def test_second_call_takes_warm_worker(self):
+        from app.providers.claude_cli_pool import CLIWorkerPool
+
+        procs = [self._proc(), self._proc()]
+        pool = CLIWorkerPool(size=2)
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
+            mock_exec.side_effect = procs
+            first = await pool.acquire(["claude", "-p"])
+            await asyncio.gather(*list(pool._refills))
+            assert pool.warm_count() == 1
+            mock_exec.side_effect = [procs[1], self._proc()]
+            second = await pool.acquire(["claude", "-p"])
+            await pool.close()
+        assert first is procs[0]
+        assert second is procs[1]
+        stats = pool.stats()
+        assert stats["hits"] == 1 and stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_exited_worker_is_replaced(self):
+        from app.providers.claude_cli_pool import CLIWorkerPool
+
+        dead, fresh = self._proc(returncode=1), self._proc()
+        pool = CLIWorkerPool(size=1)
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
+            mock_exec.side_effect = [self._proc(), dead]
+            await pool.acquire(["claude"])
+            await asyncio.gather(*list(pool._refills))
+            mock_exec.side_effect = [fresh, self._proc()]
+            got = await pool.acquire(["claude"])
+            await pool.close()
+        assert got is fresh
+        assert pool.stats()["discarded"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_size_bounds_warm_workers_and_discard_kills(self):
+        from app.providers.claude_cli_pool import CLIWorkerPool
+
+        pool = CLIWorkerPool(size=1)
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
+            mock_exec.side_effect = lambda *a, **k: self._proc()
+            await pool.acquire(["claude", "a"])
+            await pool.acquire(["claude", "b"])
+            await asyncio.gather(*list(pool._refills))
+            assert pool.warm_count() == 1
+            pool.discard(["claude", "b"])
+            assert pool.warm_count() == 0
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_one_off_command_lines_do_not_churn_the_pool(self):
+        from app.providers.claude_cli_pool import CLIWorkerPool
+
+        pool = CLIWorkerPool(size=4, max_commands=1)
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
+            mock_exec.side_effect = lambda *a, **k: self._proc()
+            await pool.acquire(["claude", "--system-prompt", "hot"])
+            await asyncio.gather(*list(pool._refills))
+            # A never-seen system prompt while the only slot is taken: no prespawn.
+            await pool.acquire(["claude", "--system-prompt", "one-off"])
+            assert not pool._refills
+            assert mock_exec.call_count == 3
+            # Seen before: it now replaces the least recently used command line.
+            await pool.acquire(["claude", "--system-prompt", "one-off"])
+            await asyncio.gather(*list(pool._refills))
+            stats = pool.stats()
+            await pool.close()
+        assert stats["commands"] == 1 and stats["warm"] == 1
+        assert stats["not_admitted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disabled_pool_never_prespawns(self):
+        from app.providers.claude_cli_pool import CLIWorkerPool
+
+        pool = CLIWorkerPool(size=0)
+        with patch("asyncio.create_subprocess_exec", new_callable=AsyncMock) as mock_exec:
+            mock_exec.return_value = self._proc()
+            await pool.acquire(["claude"])
+        assert mock_exec.call_count == 1
+        assert not pool._refills
+
+
 # ---------------------------------------------------------------------------
 # Detector
 # ---------------------------------------------------------------------------
@@ -1,5 +1,6 @@
 """Tests for the refinement service."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -351,3 +352,104 @@ class TestRefinementPerformanceParams:
         assert score_call.kwargs["effort"] == "low"
         assert score_call.kwargs["max_tokens"] == 4096
         assert score_call.kwargs["cache_ttl"] == "1h"
+
+
+class TestRefinementSpeculation:
+    """Next-turn speculation and result reuse via RefinementSpeculator."""
+
+    @staticmethod
+    def _route_by_format(mock_provider):
+        """Answer each call by output format so call order does not matter."""
+        responses = {
+            AnalysisResult: _make_analysis,
+            OptimizationResult: _make_optimization,
+            ScoreResult: _make_scores,
+            SuggestionsOutput: _make_suggestions,
+        }
+
+        async def _complete(**kw):
+            return responses[kw["output_format"]]()
+
+        mock_provider.complete_parsed.side_effect = _complete
+
+    @staticmethod
+    def _formats(mock_provider):
+        return [c.kwargs["output_format"] for c in mock_provider.complete_parsed.call_args_list]
+
+    async def _run_turn(self, service, opt_id, branch_id, request):
+        async for _ in service.create_refinement_turn(
+            optimization_id=opt_id, branch_id=branch_id, refinement_request=request,
+        ):
+            pass
+
+    async def test_applying_top_suggestion_reuses_speculated_calls(
+        self, db_session, mock_provider, prompts_dir, sample_opt,
+    ):
+        from app.services.refinement_speculation import RefinementSpeculator
+
+        speculator = RefinementSpeculator(speculate=True)
+        service = RefinementService(
+            db=db_session, provider=mock_provider, prompts_dir=prompts_dir,
+            speculator=speculator,
+        )
+        self._route_by_format(mock_provider)
+        turn1 = await service.create_initial_turn(
+            sample_opt.id, sample_opt.optimized_prompt, {"clarity": 7.0}, "chain-of-thought",
+        )
+
+        await self._run_turn(service, sample_opt.id, turn1.branch_id, "Improve clarity")
+        assert speculator.stats()["speculated"] == 2
+        await asyncio.gather(*speculator._inflight.values())
+        mock_provider.complete_parsed.reset_mock()
+
+        # "Add error handling" is the first suggestion of the previous turn
+        await self._run_turn(service, sample_opt.id, turn1.branch_id, "Add error handling")
+
+        assert self._formats(mock_provider) == [ScoreResult, SuggestionsOutput]
+        versions = await service.get_versions(sample_opt.id, branch_id=turn1.branch_id)
+        assert versions[-1].version == 3
+        assert versions[-1].prompt == _make_optimization().optimized_prompt
+        await speculator.close()
+
+    async def test_other_request_reuses_only_the_analysis(
+        self, db_session, mock_provider, prompts_dir, sample_opt,
+    ):
+        from app.services.refinement_speculation import RefinementSpeculator
+
+        speculator = RefinementSpeculator(speculate=True)
+        service = RefinementService(
+            db=db_session, provider=mock_provider, prompts_dir=prompts_dir,
+            speculator=speculator,
+        )
+        self._route_by_format(mock_provider)
+        turn1 = await service.create_initial_turn(
+            sample_opt.id, sample_opt.optimized_prompt, {"clarity": 7.0}, "chain-of-thought",
+        )
+        await self._run_turn(service, sample_opt.id, turn1.branch_id, "Improve clarity")
+        await asyncio.gather(*speculator._inflight.values())
+        mock_provider.complete_parsed.reset_mock()
+
+        await self._run_turn(service, sample_opt.id, turn1.branch_id, "Make it shorter")
+
+        assert self._formats(mock_provider) == [OptimizationResult, ScoreResult, SuggestionsOutput]
+        await speculator.close()
+
+    async def test_no_speculation_when_disabled(
+        self, db_session, mock_provider, prompts_dir, sample_opt,
+    ):
+        from app.services.refinement_speculation import RefinementSpeculator
+
+        speculator = RefinementSpeculator(speculate=False)
+        service = RefinementService(
+            db=db_session, provider=mock_provider, prompts_dir=prompts_dir,
+            speculator=speculator,
+        )
+        self._route_by_format(mock_provider)
+        turn1 = await service.create_initial_turn(
+            sample_opt.id, sample_opt.optimized_prompt, {"clarity": 7.0}, "chain-of-thought",
+        )
+        await self._run_turn(service, sample_opt.id, turn1.branch_id, "Improve clarity")
+
+        assert speculator.stats()["speculated"] == 0
+        assert speculator.stats()["inflight"] == 0
+        assert mock_provider.complete_parsed.call_count == 4
@@ -0,0 +1,132 @@
+"""Tests for RefinementSpeculator — refinement result reuse and prefetch."""
+
+import asyncio
+
+import pytest
+
+from app.providers.concurrency import Priority, current_priority
+from app.services.refinement_speculation import RefinementSpeculator, speculation_key
+
+
+def test_speculation_key_is_stable_and_input_sensitive():
+    assert speculation_key("analyze", "m", {"b": 1, "a": 2}) == speculation_key("analyze", "m", {"a": 2, "b": 1})
+    assert speculation_key("analyze", "m", "x") != speculation_key("analyze", "m", "y")
+    assert speculation_key("analyze", "x") != speculation_key("refine", "x")
+
+
+async def test_get_or_run_stores_results_until_ttl():
+    spec = RefinementSpeculator(ttl_seconds=10)
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        return {"n": calls}
+
+    assert await spec.get_or_run("k", factory) == {"n": 1}
+    assert await spec.get_or_run("k", factory) == {"n": 1}
+    assert calls == 1
+
+    spec._results["k"] = (0.0, {"n": 1})  # expired
+    assert await spec.get_or_run("k", factory) == {"n": 2}
+
+
+async def test_lru_bound():
+    spec = RefinementSpeculator(max_entries=2)
+    for key in ("a", "b", "c"):
+        spec.put(key, key)
+    assert spec.get("a") is None
+    assert spec.get("c") == "c"
+
+
+async def test_request_joins_inflight_prefetch_at_background_priority():
+    spec = RefinementSpeculator(speculate=True)
+    release = asyncio.Event()
+    seen: list[Priority] = []
+
+    async def slow():
+        seen.append(current_priority())
+        await release.wait()
+        return "speculated"
+
+    async def inline():
+        raise AssertionError("should have joined the prefetch")
+
+    assert spec.prefetch("k", slow)
+    assert not spec.prefetch("k", slow)  # already running
+    waiter = asyncio.create_task(spec.get_or_run("k", inline))
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiter == "speculated"
+    assert seen == [Priority.BACKGROUND]
+    assert spec.stats()["joined"] == 1
+
+
+async def test_failed_prefetch_falls_back_to_inline_call():
+    spec = RefinementSpeculator(speculate=True)
+
+    async def broken():
+        raise RuntimeError("provider down")
+
+    async def inline():
+        return "inline"
+
+    spec.prefetch("k", broken)
+    assert await spec.get_or_run("k", inline) == "inline"
+
+
+@pytest.mark.parametrize("speculate", [False, True])
+async def test_prefetch_respects_flag_and_close_cancels(speculate):
+    spec = RefinementSpeculator(speculate=speculate)
+
+    async def forever():
+        await asyncio.Event().wait()
+
+    assert spec.prefetch("k", forever) is speculate
+    await spec.close()
+    assert spec.stats()["inflight"] == 0
+
+
+async def test_take_or_run_reuses_only_prefetched_results_once():
+    spec = RefinementSpeculator(speculate=True)
+    calls = 0
+
+    async def factory():
+        nonlocal calls
+        calls += 1
+        return f"inline-{calls}"
+
+    # Inline LLM results are never stored: a repeated request runs again.
+    assert await spec.take_or_run("k", factory) == "inline-1"
+    assert await spec.take_or_run("k", factory) == "inline-2"
+
+    async def speculated():
+        return "speculated"
+
+    assert spec.prefetch("k", speculated)
+    await asyncio.gather(*spec._inflight.values())
+    assert await spec.take_or_run("k", factory) == "speculated"
+    assert await spec.take_or_run("k", factory) == "inline-3"
+
+
+async def test_joined_prefetch_is_consumed_by_first_request_only():
+    spec = RefinementSpeculator(speculate=True)
+    release = asyncio.Event()
+
+    async def slow():
+        await release.wait()
+        return "speculated"
+
+    async def inline():
+        return "inline"
+
+    spec.prefetch("k", slow)
+    first = asyncio.create_task(spec.take_or_run("k", inline))
+    await asyncio.sleep(0)
+    assert await spec.take_or_run("k", inline) == "inline"
+    release.set()
+
+    assert await first == "speculated"
+    assert await spec.take_or_run("k", inline) == "inline"
+    assert spec.stats()["entries"] == 0
@@ -18,7 +18,9 @@ from app.services.repo_index_service import (
     _compute_source_weight,
     _extract_markdown_references,
     _extract_structured_outline,
+    _vector_indexes,
     invalidate_curated_cache,
+    invalidate_vector_index,
 )
 
 
@@ -28,6 +30,14 @@ def _make_svc(db, github_client=None, embedding_service=None):
     return RepoIndexService(db=db, github_client=gc, embedding_service=es)
 
 
+@pytest.fixture(autouse=True)
+def _clear_vector_indexes():
+    """Tests reuse repo/branch/head_sha triples across fresh databases."""
+    invalidate_vector_index()
+    yield
+    invalidate_vector_index()
+
+
 # ---------------------------------------------------------------------------
 # Test 1: get_index_status returns None when no meta exists
 # ---------------------------------------------------------------------------
@@ -820,6 +830,195 @@ class TestCuratedCacheInvalidation:
         assert len(_curated_cache) == 0
 
 
+class TestVectorIndex:
+    async def _seed(self, db_session, paths, head_sha="abc"):
+        db_session.add(RepoIndexMeta(
+            repo_full_name="o/r", branch="main", status="ready",
+            file_count=len(paths), head_sha=head_sha,
+        ))
+        for i, path in enumerate(paths):
+            db_session.add(RepoFileIndex(
+                repo_full_name="o/r", branch="main", file_path=path,
+                file_sha=f"sha{i}", content=f"body {i}", outline=f"outline {i}",
+                embedding=(np.ones(384, dtype=np.float32) * (i + 1)).tobytes(),
+            ))
+        await db_session.commit()
+
+    def _svc(self, db_session, ranked):
+        es = MagicMock()
+        es.aembed_single = AsyncMock(return_value=np.ones(384, dtype=np.float32))
+        es.cosine_search = MagicMock(return_value=ranked)
+        return RepoIndexService(db_session, AsyncMock(), es)
+
+    @pytest.mark.asyncio
+    async def test_index_cached_per_head_sha(self, db_session):
+        await self._seed(db_session, ["a.py", "b.py"])
+        svc = self._svc(db_session, [(1, 0.9)])
+
+        first = await svc.query_relevant_files("o/r", "main", "q", top_k=1)
+        index = _vector_indexes[("o/r", "main")]
+        assert index.matrix.shape == (2, 384)
+        second = await svc.query_relevant_files("o/r", "main", "q", top_k=1)
+
+        assert first == second
+        assert _vector_indexes[("o/r", "main")] is index
+        # Search runs against the stacked matrix, not a per-call list
+        assert svc._es.cosine_search.call_args[0][1] is index.matrix
+
+    @pytest.mark.asyncio
+    async def test_index_rebuilt_when_head_moves(self, db_session):
+        await self._seed(db_session, ["a.py"])
+        svc = self._svc(db_session, [(0, 0.9)])
+        await svc.query_relevant_files("o/r", "main", "q")
+        stale = _vector_indexes[("o/r", "main")]
+
+        meta = await svc.get_index_status("o/r", "main")
+        meta.head_sha = "def"
+        await db_session.commit()
+        await svc.query_relevant_files("o/r", "main", "q")
+
+        rebuilt = _vector_indexes[("o/r", "main")]
+        assert rebuilt is not stale
+        assert rebuilt.head_sha == "def"
+
+    @pytest.mark.asyncio
+    async def test_only_selected_bodies_loaded(self, db_session):
+        await self._seed(db_session, ["a.py", "b.py", "c.py"])
+        svc = self._svc(db_session, [(2, 0.9)])
+        loaded: list[list[str]] = []
+        real_load = svc._load_file_bodies
+
+        async def _spy(repo, branch, paths):
+            loaded.append(list(paths))
+            return await real_load(repo, branch, paths)
+
+        svc._load_file_bodies = _spy
+        results = await svc.query_relevant_files("o/r", "main", "q", top_k=1)
+
+        assert results == [{"file_path": "c.py", "outline": "outline 2", "score": 0.9}]
+        assert loaded == [["c.py"]]
+
+    @pytest.mark.asyncio
+    async def test_invalidate_index_drops_entry(self, db_session):
+        await self._seed(db_session, ["a.py"])
+        svc = self._svc(db_session, [(0, 0.9)])
+        await svc.query_relevant_files("o/r", "main", "q")
+        assert ("o/r", "main") in _vector_indexes
+
+        await svc.invalidate_index("o/r", "main")
+        assert ("o/r", "main") not in _vector_indexes
+
+    def test_invalidate_scoped_to_repo(self):
+        idx = MagicMock()
+        _vector_indexes[("o/r", "main")] = idx
+        _vector_indexes[("o/r", "dev")] = idx
+        _vector_indexes[("x/y", "main")] = idx
+
+        assert invalidate_vector_index("o/r", "main") == 1
+        assert invalidate_vector_index("o/r") == 1
+        assert list(_vector_indexes) == [("x/y", "main")]
+
+
+class TestBulkIngest:
+    @pytest.mark.asyncio
+    async def test_build_index_from_local_checkout(self, db_session, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "main.py").write_text("def main():\n    pass\n")
+        (tmp_path / "README.md").write_text("# Demo\n")
+
+        gc = AsyncMock()
+        es = MagicMock()
+        es.aembed_texts = AsyncMock(
+            side_effect=lambda texts: [np.ones(384, dtype=np.float32) for _ in texts]
+        )
+        svc = RepoIndexService(db=db_session, github_client=gc, embedding_service=es)
+        await svc.build_index("local/demo", "main", None, local_path=str(tmp_path))
+
+        meta = await svc.get_index_status("local/demo", "main")
+        assert meta.status == "ready"
+        assert meta.file_count == 2
+        assert meta.head_sha.startswith("local-")
+        gc.get_branch_head_sha.assert_not_called()
+        gc.get_file_content.assert_not_called()
+        rows = (await db_session.execute(select(RepoFileIndex.file_path))).scalars().all()
+        assert sorted(rows) == ["README.md", "src/main.py"]
+
+    @pytest.mark.asyncio
+    async def test_large_tree_uses_tarball(self, db_session, monkeypatch):
+        import io
+        import tarfile
+
+        monkeypatch.setattr(settings, "INDEX_BULK_INGEST_MIN_FILES", 2)
+        files = {"a.py": b"def a(): pass\n", "b.py": b"def b(): pass\n", "c.py": b"def c(): pass\n"}
+        raw = io.BytesIO()
+        with tarfile.open(fileobj=raw, mode="w:gz") as tar:
+            for path, data in files.items():
+                if path == "c.py":
+                    continue  # missing from archive -> per-file fallback
+                info = tarfile.TarInfo(f"o-r-sha/{path}")
+                info.size = len(data)
+                tar.addfile(info, io.BytesIO(data))
+
+        async def _download(token, repo, ref, dest):
+            assert ref == "head1"
+            dest.write(raw.getvalue())
+            return len(raw.getvalue())
+
+        gc = AsyncMock()
+        gc.get_branch_head_sha.return_value = "head1"
+        tree = [{"path": p, "sha": f"s{p}", "size": len(d)} for p, d in files.items()]
+        gc.get_tree_with_cache = AsyncMock(return_value=(tree, None))
+        gc.download_tarball = AsyncMock(side_effect=_download)
+        gc.get_file_content = AsyncMock(return_value="def c(): pass\n")
+        es = MagicMock()
+        es.aembed_texts = AsyncMock(
+            side_effect=lambda texts: [np.ones(384, dtype=np.float32) for _ in texts]
+        )
+
+        svc = RepoIndexService(db=db_session, github_client=gc, embedding_service=es)
+        await svc.build_index("o/r", "main", "tok")
+
+        meta = await svc.get_index_status("o/r", "main")
+        assert meta.file_count == 3
+        gc.download_tarball.assert_awaited_once()
+        assert gc.get_file_content.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_tarball_failure_falls_back(self, db_session, monkeypatch):
+        monkeypatch.setattr(settings, "INDEX_BULK_INGEST_MIN_FILES", 1)
+        gc = AsyncMock()
+        gc.download_tarball = AsyncMock(side_effect=GitHubApiError(502, "bad gateway"))
+        gc.get_file_content = AsyncMock(return_value="x = 1\n")
+        es = MagicMock()
+        es.aembed_texts = AsyncMock(return_value=[np.zeros(384, dtype=np.float32)])
+        svc = RepoIndexService(db=db_session, github_client=gc, embedding_service=es)
+
+        processed, read_failures, _ = await svc._read_and_embed_files(
+            [{"path": "a.py", "sha": "s1", "size": 6}], "tok", "o/r", "main",
+        )
+        assert len(processed) == 1
+        assert read_failures == 0
+        gc.get_file_content.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_embeds_in_batches(self, db_session, monkeypatch):
+        monkeypatch.setattr(settings, "INDEX_EMBED_BATCH_SIZE", 2)
+        es = MagicMock()
+        es.aembed_texts = AsyncMock(
+            side_effect=lambda texts: [np.ones(384, dtype=np.float32) for _ in texts]
+        )
+        svc = RepoIndexService(db=db_session, github_client=AsyncMock(), embedding_service=es)
+        items = [{"path": f"m{i}.py", "sha": f"s{i}", "size": 10} for i in range(5)]
+        prefetched = {it["path"]: f"def f{i}(): pass\n" for i, it in enumerate(items)}
+
+        processed, _, embed_failures = await svc._read_and_embed_files(
+            items, None, "o/r", "main", prefetched=prefetched,
+        )
+        assert len(processed) == 5
+        assert embed_failures == 0
+        assert [len(c.args[0]) for c in es.aembed_texts.await_args_list] == [2, 2, 1]
+
+
 # ---------------------------------------------------------------------------
 # GitHub error classification
 # ---------------------------------------------------------------------------
@@ -0,0 +1,93 @@
+"""Tests for repo_snapshot — tarball and local checkout readers."""
+
+import io
+import subprocess
+import tarfile
+
+import pytest
+
+from app.services.repo_snapshot import git_blob_sha, read_tarball, scan_local_checkout
+
+
+def _tarball(files: dict[str, bytes], prefix: str = "owner-repo-abc123") -> io.BytesIO:
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        for path, data in files.items():
+            info = tarfile.TarInfo(f"{prefix}/{path}")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    buf.seek(0)
+    return buf
+
+
+class TestReadTarball:
+    def test_strips_prefix_and_filters(self):
+        buf = _tarball({
+            "src/main.py": b"def main(): pass\n",
+            "tests/test_main.py": b"def test(): pass\n",
+            "logo.png": b"\x89PNG",
+        })
+        out = read_tarball(buf)
+        assert out == {"src/main.py": "def main(): pass\n"}
+
+    def test_wanted_limits_extraction(self):
+        buf = _tarball({"a.py": b"a", "b.py": b"b"})
+        assert read_tarball(buf, wanted={"b.py"}) == {"b.py": "b"}
+
+    def test_skips_oversized(self):
+        buf = _tarball({"big.py": b"x" * 200_000, "ok.py": b"ok"})
+        assert read_tarball(buf, wanted={"big.py", "ok.py"}) == {"ok.py": "ok"}
+
+
+class TestScanLocalCheckout:
+    def test_walk_non_git_tree(self, tmp_path):
+        (tmp_path / "src").mkdir()
+        (tmp_path / "src" / "app.py").write_text("print('hi')\n")
+        (tmp_path / "node_modules").mkdir()
+        (tmp_path / "node_modules" / "dep.js").write_text("x")
+        (tmp_path / "image.png").write_bytes(b"\x89PNG")
+
+        snap = scan_local_checkout(tmp_path)
+        assert [it["path"] for it in snap.tree] == ["src/app.py"]
+        assert snap.contents["src/app.py"] == "print('hi')\n"
+        assert snap.tree[0]["sha"] == git_blob_sha(b"print('hi')\n")
+        assert snap.head_sha.startswith("local-")
+
+    def test_digest_changes_with_content(self, tmp_path):
+        f = tmp_path / "a.py"
+        f.write_text("one")
+        first = scan_local_checkout(tmp_path).head_sha
+        f.write_text("two")
+        assert scan_local_checkout(tmp_path).head_sha != first
+
+    def test_missing_root_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            scan_local_checkout(tmp_path / "nope")
+
+    def test_clean_git_checkout_uses_head(self, tmp_path):
+        def git(*args):
+            subprocess.run(
+                ["git", "-C", str(tmp_path), *args], check=True, capture_output=True,
+            )
+
+        try:
+            git("init", "-q")
+        except (OSError, subprocess.CalledProcessError):
+            pytest.skip("git not available")
+        (tmp_path / "main.py").write_text("x = 1\n")
+        (tmp_path / "untracked.py").write_text("y = 2\n")
+        git("add", "main.py")
+        git("-c", "user.email=t@t", "-c", "user.name=t", "commit", "-qm", "init")
+        head = subprocess.run(
+            ["git", "-C", str(tmp_path), "rev-parse", "HEAD"],
+            check=True, capture_output=True, text=True,
+        ).stdout.strip()
+        blob = subprocess.run(
+            ["git", "-C", str(tmp_path), "rev-parse", "HEAD:main.py"],
+            check=True, capture_output=True, text=True,
+        ).stdout.strip()
+
+        snap = scan_local_checkout(tmp_path)
+        assert snap.head_sha == head
+        # Only tracked files; blob SHA matches git's object id
+        assert snap.tree == [{"path": "main.py", "sha": blob, "size": 6}]
@@ -0,0 +1,120 @@
+"""Tests for the incremental term index behind TF-IDF signal extraction."""
+
+from __future__ import annotations
+
+import random
+from collections import Counter
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models import Base, Optimization, SignalTermCount
+from app.services import signal_term_index
+from app.services.signal_term_index import rank_terms, sync_term_counts, tokenize
+
+VOCAB = ["webhook", "endpoint", "blog", "article", "kubernetes", "helm", "the", "please", "ci-cd", "api"]
+
+
+@pytest_asyncio.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_session() as session:
+        yield session
+    await engine.dispose()
+
+
+async def _stored(db: AsyncSession) -> Counter:
+    rows = await db.execute(select(SignalTermCount))
+    return Counter({(r.scope, r.key, r.term): r.doc_count for r in rows.scalars()})
+
+
+async def _recomputed(db: AsyncSession) -> Counter:
+    """Counts rebuilt from scratch, the way the extractors used to."""
+    expected: Counter = Counter()
+    rows = await db.execute(select(Optimization))
+    for opt in rows.scalars():
+        terms = ["", *tokenize(opt.raw_prompt)]
+        groups = [("global", "")]
+        if opt.status == "completed" and opt.task_type:
+            groups.append(("task_type", opt.task_type))
+        if opt.cluster_id:
+            groups.append(("cluster", opt.cluster_id))
+        for scope, key in groups:
+            for term in terms:
+                expected[(scope, key, term)] += 1
+    return expected
+
+
+@pytest.mark.asyncio
+async def test_incremental_counts_match_full_recount(db):
+    rng = random.Random(7)
+    ids: list[str] = []
+    for step in range(6):
+        for i in range(15):
+            opt_id = f"opt-{step}-{i}"
+            db.add(Optimization(
+                id=opt_id,
+                raw_prompt=" ".join(rng.choice(VOCAB) for _ in range(rng.randint(1, 8))),
+                task_type=rng.choice(["coding", "writing", None]),
+                status=rng.choice(["completed", "completed", "failed"]),
+                cluster_id=rng.choice(["c1", "c2", None]),
+            ))
+            ids.append(opt_id)
+        await db.flush()
+        for opt_id in rng.sample(ids, 5):
+            await db.execute(
+                update(Optimization).where(Optimization.id == opt_id).values(
+                    task_type=rng.choice(["coding", "analysis", None]),
+                    status=rng.choice(["completed", "failed"]),
+                    cluster_id=rng.choice(["c1", "c3", None]),
+                )
+            )
+        gone = rng.sample(ids, 3)
+        await db.execute(delete(Optimization).where(Optimization.id.in_(gone)))
+        ids = [i for i in ids if i not in gone]
+
+        await sync_term_counts(db)
+        await db.commit()
+        assert await _stored(db) == await _recomputed(db)
+
+
+@pytest.mark.asyncio
+async def test_sync_tokenizes_only_new_prompts(db, monkeypatch):
+    for i in range(10):
+        db.add(Optimization(id=f"a{i}", raw_prompt="webhook endpoint", task_type="coding"))
+    await db.commit()
+    assert (await sync_term_counts(db))["added"] == 10
+
+    seen: list[str] = []
+    original = signal_term_index.tokenize
+    monkeypatch.setattr(signal_term_index, "tokenize", lambda p: seen.append(p) or original(p))
+
+    db.add(Optimization(id="b0", raw_prompt="blog article", task_type="writing"))
+    await db.execute(update(Optimization).where(Optimization.id == "a0").values(task_type="writing"))
+    await db.commit()
+    stats = await sync_term_counts(db)
+
+    assert stats == {"added": 1, "removed": 0, "moved": 1}
+    assert seen == ["blog article"]
+    counts = await _stored(db)
+    assert counts[("task_type", "coding", "webhook")] == 9
+    assert counts[("task_type", "writing", "webhook")] == 1
+    assert await sync_term_counts(db) == {"added": 0, "removed": 0, "moved": 0}
+
+
+def test_rank_terms_filters_and_normalizes():
+    ranked, passed = rank_terms(
+        {"webhook": 9, "endpoint": 6, "common": 10, "rare": 1, "best": 8},
+        10,
+        {"webhook": 9, "endpoint": 30, "common": 90, "rare": 1, "best": 8},
+        100,
+        min_group_freq=0.3, max_global_freq=0.7, top_k=5, exclude=frozenset({"best"}),
+    )
+    assert passed == 2
+    assert ranked == [("webhook", 1.0), ("endpoint", 0.5)]
@@ -19,6 +19,7 @@ class TestLogDecision:
             path="hot", op="assign", decision="merge_into",
             cluster_id="c1", context={"raw_score": 0.72},
         )
+        assert logger.flush()
         files = list(tmp_path.glob("decisions-*.jsonl"))
         assert len(files) == 1
         line = files[0].read_text().strip()
@@ -69,6 +70,16 @@ class TestGetRecent:
         assert len(logger.get_recent(limit=3)) == 3
 
 
+    def test_record_external_only_fills_ring_buffer(
+        self, logger: TaxonomyEventLogger, tmp_path: Path,
+    ) -> None:
+        """Relayed events are visible to get_recent but not re-logged."""
+        logger.record_external({"ts": "now", "path": "hot", "op": "assign", "decision": "create_new"})
+        assert [e["op"] for e in logger.get_recent()] == ["assign"]
+        assert logger.flush()
+        assert not list(tmp_path.glob("decisions-*.jsonl"))
+
+
 class TestGetHistory:
     def test_reads_from_jsonl(self, logger: TaxonomyEventLogger) -> None:
         logger.log_decision(path="cold", op="refit", decision="accepted", context={})
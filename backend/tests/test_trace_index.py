@@ -0,0 +1,137 @@
+"""Tests for TraceIndex — sidecar-backed trace_id and time-window lookup."""
+
+import json
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+
+from app.services.jsonl_writer import JsonlWriter
+from app.services.trace_index import TraceIndex
+from app.services.trace_logger import TraceLogger
+
+
+def _log(tl: TraceLogger, trace_id: str, phase: str, ms: int = 10) -> None:
+    tl.log_phase(trace_id, phase, ms, 1, 1, "m", "p")
+
+
+def _legacy_file(traces_dir: Path, day: str, entries: list[tuple[str, str, str]]) -> Path:
+    """A pre-index daily file: (trace_id, phase, iso timestamp) rows, no sidecar."""
+    path = traces_dir / f"traces-{day}.jsonl"
+    path.write_text("".join(
+        json.dumps({"trace_id": t, "phase": p, "timestamp": ts, "duration_ms": 5}) + "\n"
+        for t, p, ts in entries
+    ))
+    return path
+
+
+def test_lookup_uses_sidecar_offsets(tmp_path: Path) -> None:
+    tl = TraceLogger(tmp_path, writer=JsonlWriter())
+    for i in range(20):
+        _log(tl, f"t{i % 4}", f"phase{i}")
+    assert tl.flush()
+
+    sidecars = list(tmp_path.glob("traces-*.idx"))
+    assert len(sidecars) == 1
+    assert len(sidecars[0].read_text().splitlines()) == 20
+
+    phases = [e["phase"] for e in TraceIndex(tmp_path).get("t1")]
+    assert phases == ["phase1", "phase5", "phase9", "phase13", "phase17"]
+    assert TraceIndex(tmp_path).get("missing") == []
+
+
+def test_index_picks_up_appends_incrementally(tmp_path: Path) -> None:
+    tl = TraceLogger(tmp_path, writer=JsonlWriter())
+    idx = TraceIndex(tmp_path)
+    _log(tl, "a", "analyze")
+    tl.flush()
+    assert len(idx.get("a")) == 1
+
+    _log(tl, "a", "optimize")
+    _log(tl, "b", "analyze")
+    tl.flush()
+    assert [e["phase"] for e in idx.get("a")] == ["analyze", "optimize"]
+    assert len(idx.get("b")) == 1
+
+
+def test_legacy_files_are_scanned_and_backfilled(tmp_path: Path) -> None:
+    _legacy_file(tmp_path, "2020-01-01", [
+        ("old", "analyze", "2020-01-01T10:00:00+00:00"),
+        ("old", "score", "2020-01-01T10:00:05+00:00"),
+        ("other", "analyze", "2020-01-01T11:00:00+00:00"),
+    ])
+    idx = TraceIndex(tmp_path)
+    assert [e["phase"] for e in idx.get("old")] == ["analyze", "score"]
+    # Past day → sidecar written so the next process skips the scan.
+    assert (tmp_path / "traces-2020-01-01.idx").exists()
+    assert [e["phase"] for e in TraceIndex(tmp_path).get("old")] == ["analyze", "score"]
+
+
+def test_time_window_spans_days(tmp_path: Path) -> None:
+    _legacy_file(tmp_path, "2020-01-01", [
+        ("a", "p1", "2020-01-01T22:00:00+00:00"),
+        ("b", "p2", "2020-01-01T23:30:00+00:00"),
+    ])
+    _legacy_file(tmp_path, "2020-01-02", [
+        ("c", "p3", "2020-01-02T00:30:00+00:00"),
+        ("d", "p4", "2020-01-02T05:00:00+00:00"),
+    ])
+    idx = TraceIndex(tmp_path)
+    since = datetime(2020, 1, 1, 23, tzinfo=UTC)
+    until = since + timedelta(hours=2)
+    assert [e["phase"] for e in idx.window(since, until)] == ["p2", "p3"]
+    assert [e["phase"] for e in idx.window(since, None, limit=1)] == ["p2"]
+    assert idx.day_bounds()["2020-01-02"] == (
+        datetime(2020, 1, 2, 0, 30, tzinfo=UTC).timestamp(),
+        datetime(2020, 1, 2, 5, tzinfo=UTC).timestamp(),
+    )
+
+
+def test_rotation_removes_sidecar_and_index_entries(tmp_path: Path) -> None:
+    _legacy_file(tmp_path, "2020-01-01", [("gone", "p", "2020-01-01T10:00:00+00:00")])
+    tl = TraceLogger(tmp_path, writer=JsonlWriter())
+    idx = tl.index
+    assert len(idx.get("gone")) == 1
+
+    assert tl.rotate(retention_days=30) == 1
+    assert not (tmp_path / "traces-2020-01-01.idx").exists()
+    assert idx.get("gone") == []
+
+
+@pytest.mark.asyncio
+async def test_trace_endpoints(app_client: AsyncClient, tmp_path: Path, monkeypatch) -> None:
+    from app.routers import monitoring
+
+    monkeypatch.setattr(monitoring, "DATA_DIR", tmp_path)
+    tl = TraceLogger(tmp_path / "traces")
+    _log(tl, "req-1", "analyze")
+    _log(tl, "req-1", "optimize")
+
+    resp = await app_client.get("/api/monitoring/traces/req-1")
+    assert resp.status_code == 200
+    assert [p["phase"] for p in resp.json()["phases"]] == ["analyze", "optimize"]
+
+    assert (await app_client.get("/api/monitoring/traces/nope")).status_code == 404
+
+    resp = await app_client.get("/api/monitoring/traces", params={"limit": 1})
+    body = resp.json()
+    assert body["count"] == 1 and body["truncated"] is True
+    assert body["entries"][0]["phase"] == "analyze"
+
+
+def test_latency_scan_is_incremental(tmp_path: Path) -> None:
+    from app.routers import monitoring
+
+    path = tmp_path / "traces-2099-01-01.jsonl"
+    path.write_text(json.dumps({"phase": "analyze", "duration_ms": 100}) + "\n")
+    monitoring._latency_files.pop(path, None)
+    assert monitoring._scan_trace_durations(path) == {"analyze": [100]}
+
+    with path.open("a") as fh:
+        fh.write(json.dumps({"phase": "analyze", "duration_ms": 200}) + "\n")
+        fh.write('{"phase": "score", "dur')  # partial line — not consumed yet
+    assert monitoring._scan_trace_durations(path) == {"analyze": [100, 200]}
+    consumed, _ = monitoring._latency_files[path]
+    assert consumed == len(path.read_bytes()) - len('{"phase": "score", "dur')
+    monitoring._latency_files.pop(path, None)
@@ -104,6 +104,7 @@ def test_jsonl_format(tmp_path: Path) -> None:
         )
 
     # Find the written file(s)
+    assert logger.flush()
     jsonl_files = list(tmp_path.glob("traces-*.jsonl"))
     assert len(jsonl_files) >= 1, "Expected at least one .jsonl file to be created"
 
@@ -145,3 +146,35 @@ class TestTraceRotation:
 
         deleted = tl.rotate(retention_days=30)
         assert deleted == 0
+
+
+def test_cached_flag(tmp_path: Path) -> None:
+    """Phases served from the LLM response cache are tagged."""
+    logger = TraceLogger(traces_dir=tmp_path)
+    logger.log_phase("t", "analyze", 5, 0, 0, "m", "p", cached=True)
+    logger.log_phase("t", "score", 900, 10, 10, "m", "p")
+
+    entries = logger.read_trace("t")
+    assert [e["cached"] for e in entries] == [True, False]
+
+
+async def test_aread_trace_does_not_block_the_event_loop(tmp_path: Path) -> None:
+    """The flush before a read waits on the writer thread, not the loop."""
+    import asyncio
+    import threading
+
+    release = threading.Event()
+
+    class _SlowWriter:
+        def write(self, *args, **kwargs) -> bool:
+            return True
+
+        def flush(self, timeout: float = 5.0) -> bool:
+            return release.wait(timeout)
+
+    tl = TraceLogger(traces_dir=tmp_path, writer=_SlowWriter())
+    read = asyncio.create_task(tl.aread_trace("t"))
+    await asyncio.sleep(0.05)
+    assert not read.done()  # still flushing, yet this coroutine ran
+    release.set()
+    assert await read == []
@@ -0,0 +1,126 @@
+"""Tests for multi-worker coordination — leader lock, event journal relay."""
+
+import asyncio
+
+import pytest
+
+from app.services import worker_coordination as wc
+from app.services.event_bus import EventBus
+from app.services.worker_coordination import (
+    EventJournal,
+    EventRelay,
+    LeaderLock,
+    WorkerCoordinator,
+)
+
+
+async def _until(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not reached"
+        await asyncio.sleep(0.01)
+
+
+def test_leader_lock_is_exclusive_until_released(tmp_path):
+    first = LeaderLock(tmp_path / "leader.lock")
+    second = LeaderLock(tmp_path / "leader.lock")
+
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    first.release()
+    assert second.try_acquire()
+    second.release()
+
+
+def test_event_bus_deliver_never_reuses_a_sequence():
+    bus = EventBus()
+    bus.publish("local", {})
+    bus.publish("local", {})
+    bus.deliver(1, "relayed", {}, 0.0)  # behind the local counter
+    assert bus.current_sequence == 3
+    bus.deliver(10, "relayed", {}, 0.0)
+    assert [e["seq"] for e in bus.replay_since(0)] == [1, 2, 3, 10]
+
+
+async def test_relay_delivers_to_every_worker_with_shared_sequence(tmp_path):
+    path = tmp_path / "journal.db"
+    buses = [EventBus(), EventBus()]
+    peer_events: list[tuple[str, dict]] = []
+    relays = [
+        EventRelay(buses[0], EventJournal(path), poll_interval=0.01, origin=1),
+        EventRelay(
+            buses[1], EventJournal(path), poll_interval=0.01, origin=2,
+            on_peer_event=lambda t, d: peer_events.append((t, d)),
+        ),
+    ]
+    for relay in relays:
+        await relay.start()
+    try:
+        buses[0].publish("optimization_created", {"id": "a"})
+        buses[1].publish("taxonomy_changed", {"trigger": "hot_path"})
+        buses[0].publish("optimization_created", {"id": "b"})
+        assert buses[0].current_sequence == 0  # not delivered until journaled
+
+        await _until(lambda: all(b.current_sequence >= 3 for b in buses))
+        seen = [
+            [(e["seq"], e["event"], e["data"]) for e in bus.replay_since(0)]
+            for bus in buses
+        ]
+        assert seen[0] == seen[1]
+        assert [s for s, _, _ in seen[0]] == [1, 2, 3]
+        assert peer_events == [
+            ("optimization_created", {"id": "a"}),
+            ("optimization_created", {"id": "b"}),
+        ]
+    finally:
+        for relay in relays:
+            await relay.close()
+
+
+async def test_relay_starts_after_existing_journal_rows(tmp_path):
+    journal = EventJournal(tmp_path / "journal.db")
+    journal.append(1, [(0.0, "old", "{}"), (0.0, "old", "{}")])
+    bus = EventBus()
+    relay = EventRelay(bus, journal, poll_interval=0.01)
+    await relay.start()
+    try:
+        bus.publish("new", {"n": 1})
+        await _until(lambda: bus.current_sequence == 3)
+        assert [e["event"] for e in bus.replay_since(0)] == ["new"]
+    finally:
+        await relay.close()
+
+
+async def test_single_worker_is_standalone(tmp_path):
+    bus = EventBus()
+    coordinator = WorkerCoordinator(tmp_path, workers=1)
+    await coordinator.start(bus)
+
+    assert coordinator.role == wc.ROLE_STANDALONE
+    assert coordinator.is_leader and not coordinator.multi_worker
+    await asyncio.wait_for(coordinator.wait_for_leadership(), timeout=1)
+    bus.publish("x", {})
+    assert bus.current_sequence == 1  # delivered in-process, no relay
+    assert not (tmp_path / "event_journal.db").exists()
+    await coordinator.close()
+
+
+@pytest.mark.skipif(wc.fcntl is None, reason="requires flock")
+async def test_follower_takes_over_when_leader_exits(tmp_path, monkeypatch):
+    monkeypatch.setattr(wc, "_LEADER_RETRY_SECONDS", 0.01)
+    leader = WorkerCoordinator(tmp_path, workers=2, poll_interval=0.01)
+    follower = WorkerCoordinator(tmp_path, workers=2, poll_interval=0.01)
+    await leader.start(EventBus())
+    await follower.start(EventBus())
+    try:
+        assert leader.role == wc.ROLE_LEADER
+        assert follower.role == wc.ROLE_FOLLOWER
+        waiter = asyncio.create_task(follower.wait_for_leadership())
+        await asyncio.sleep(0.05)
+        assert not waiter.done()
+
+        await leader.close()
+        await asyncio.wait_for(waiter, timeout=2)
+        assert follower.role == wc.ROLE_LEADER
+    finally:
+        await follower.close()
@@ -42,11 +42,13 @@ if ! python -m alembic upgrade head 2>&1; then
 fi
 echo "[entrypoint] Migrations complete."
 
-# Start backend (uvicorn)
-echo "[entrypoint] Starting backend on :8000..."
+# Start backend (uvicorn). With API_WORKERS > 1 the workers elect one
+# taxonomy leader among themselves and relay events via data/event_journal.db.
+echo "[entrypoint] Starting backend on :8000 (${API_WORKERS:-1} worker(s))..."
 python -m uvicorn app.main:asgi_app \
     --host 127.0.0.1 \
     --port 8000 \
+    --workers "${API_WORKERS:-1}" \
     --log-level info \
     --no-access-log &
 PIDS+=($!)
@@ -696,7 +696,7 @@ describe('connectEventStream', () => {
     };
 
     const eventTypes = [
-      'optimization_created', 'optimization_analyzed',
+      'optimization_created', 'optimization_batch_created', 'optimization_analyzed',
       'feedback_submitted', 'refinement_turn',
       'optimization_failed', 'strategy_changed',
       'taxonomy_changed', 'routing_state_changed',
@@ -581,7 +581,7 @@ export function connectEventStream(
     const es = new EventSource(url);
 
     const eventTypes = [
-        'optimization_created', 'optimization_analyzed',
+        'optimization_created', 'optimization_batch_created', 'optimization_analyzed',
         'optimization_failed', 'optimization_status',
         'optimization_score_card', 'optimization_start',
         'feedback_submitted', 'refinement_turn',
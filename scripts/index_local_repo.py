@@ -0,0 +1,67 @@
+"""Index a local git checkout into the repo file index — fully offline.
+
+Reads every indexable file from disk in one pass (``git ls-files`` when
+available, a filtered walk otherwise), embeds them in batches, and writes
+``RepoFileIndex`` rows under the given ``owner/repo`` + branch, exactly as a
+GitHub-backed ``build_index`` would. Rows carry git blob SHAs, so a later
+GitHub incremental refresh only re-fetches files that actually differ.
+
+Usage:
+    source backend/.venv/bin/activate
+    python scripts/index_local_repo.py owner/repo ~/src/repo --branch main
+
+Copyright 2026 Project Synthesis contributors.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "backend"))
+
+from app.database import async_session_factory  # noqa: E402
+from app.services.embedding_service import EmbeddingService  # noqa: E402
+from app.services.github_client import GitHubClient  # noqa: E402
+from app.services.repo_index_service import RepoIndexService  # noqa: E402
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%H:%M:%S",
+)
+logger = logging.getLogger("index_local_repo")
+
+
+async def _run(repo_full_name: str, path: str, branch: str) -> int:
+    async with async_session_factory() as db:
+        svc = RepoIndexService(
+            db=db, github_client=GitHubClient(), embedding_service=EmbeddingService(),
+        )
+        await svc.build_index(repo_full_name, branch, None, local_path=path)
+        meta = await svc.get_index_status(repo_full_name, branch)
+    if meta is None or meta.status != "ready":
+        logger.error("Indexing failed: %s", meta.error_message if meta else "no meta row")
+        return 1
+    logger.info(
+        "Indexed %s@%s from %s: %d files (head=%s)",
+        repo_full_name, branch, path, meta.file_count, (meta.head_sha or "")[:14],
+    )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("repo", help="Repository name to index under, e.g. owner/repo")
+    parser.add_argument("path", help="Path to the local checkout")
+    parser.add_argument("--branch", default="main", help="Branch label (default: main)")
+    args = parser.parse_args()
+    return asyncio.run(_run(args.repo, args.path, args.branch))
+
+
+if __name__ == "__main__":
+    sys.exit(main())